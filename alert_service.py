@@ -1,10 +1,10 @@
 import streamlit as st
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy import desc, and_
+import numpy as np
 
-from database import get_engine, AlertRule, AlertEvent, User
+from database import get_engine, get_session_factory, AlertRule, AlertEvent, User
 
 class AlertService:
     """
@@ -30,6 +30,19 @@ class AlertService:
         'neq': 'Not Equal'
     }
     
+    # Vectorised counterparts of COMPARATORS (NaN compares False everywhere)
+    VECTOR_COMPARATORS = {
+        'gt': np.greater,
+        'gte': np.greater_equal,
+        'lt': np.less,
+        'lte': np.less_equal,
+        'eq': lambda vals, thresholds: np.abs(vals - thresholds) < 0.0001,
+        'neq': lambda vals, thresholds: np.abs(vals - thresholds) >= 0.0001
+    }
+    
+    # Minimum seconds between evaluations of the same rule
+    EVALUATION_INTERVAL_SECONDS = 5
+    
     SEVERITY_LEVELS = ['info', 'warning', 'error', 'critical']
     
     def __init__(self, session_factory=None, test_mode=False):
@@ -47,7 +60,7 @@ class AlertService:
             self.SessionLocal = session_factory
         else:
             self.engine = get_engine()
-            self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
+            self.SessionLocal = get_session_factory(expire_on_commit=False)
         
         self._test_mode = test_mode
     
@@ -149,10 +162,50 @@ class AlertService:
         except (ValueError, TypeError):
             return False
     
+    def evaluate_rules_batch(self, rules: List[AlertRule], current_metrics: Dict[str, Any]) -> np.ndarray:
+        """
+        Evaluate many rules against one metrics vector.
+        
+        Same semantics as evaluate_rule (missing, None or non-numeric metric
+        values and unknown comparators never trigger), but each comparator is
+        applied once to the whole vector of rules that use it.
+        
+        Args:
+            rules: Rules to evaluate
+            current_metrics: Current metric values
+            
+        Returns:
+            Boolean array, True where the rule's alert condition is met
+        """
+        values = np.full(len(rules), np.nan)
+        thresholds = np.full(len(rules), np.nan)
+        comparators = np.empty(len(rules), dtype=object)
+        
+        for i, rule in enumerate(rules):
+            comparators[i] = rule.comparator
+            try:
+                values[i] = float(current_metrics.get(rule.metric_key))
+                thresholds[i] = float(rule.threshold)
+            except (ValueError, TypeError):
+                pass
+        
+        triggered = np.zeros(len(rules), dtype=bool)
+        with np.errstate(invalid='ignore'):
+            for comparator, compare in self.VECTOR_COMPARATORS.items():
+                mask = comparators == comparator
+                if mask.any():
+                    triggered[mask] = compare(values[mask], thresholds[mask])
+        return triggered
+    
     def evaluate_all_rules(self, current_metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Evaluate all active rules and trigger alerts as needed.
         
+        Rules are evaluated as one batch: one query loads the active rules,
+        one query finds rules that already have an active event, new events
+        are inserted together and last_evaluated_at is set with a single
+        bulk UPDATE.
+        
         Args:
             current_metrics: Current metric values
             
@@ -163,51 +216,57 @@ class AlertService:
         triggered_alerts = []
         
         try:
+            now = datetime.utcnow()
             active_rules = db.query(AlertRule).filter(AlertRule.is_active == True).all()
             
-            for rule in active_rules:
-                now = datetime.utcnow()
-                last_eval = rule.last_evaluated_at
-                
-                if last_eval is not None:
-                    time_since_eval = (now - last_eval).total_seconds()
-                    if time_since_eval < 5:
-                        continue
-                
-                is_triggered = self.evaluate_rule(rule, current_metrics)
-                
-                if is_triggered:
-                    existing_active = db.query(AlertEvent).filter(
+            due_rules = [
+                rule for rule in active_rules
+                if rule.last_evaluated_at is None
+                or (now - rule.last_evaluated_at).total_seconds() >= self.EVALUATION_INTERVAL_SECONDS
+            ]
+            if not due_rules:
+                return triggered_alerts
+            
+            triggered_mask = self.evaluate_rules_batch(due_rules, current_metrics)
+            fired_rules = [rule for rule, hit in zip(due_rules, triggered_mask) if hit]
+            
+            if fired_rules:
+                already_active = {
+                    rule_id for (rule_id,) in db.query(AlertEvent.rule_id).filter(
                         and_(
-                            AlertEvent.rule_id == rule.id,
+                            AlertEvent.rule_id.in_([rule.id for rule in fired_rules]),
                             AlertEvent.status == 'active'
                         )
-                    ).first()
-                    
-                    if not existing_active:
-                        threshold_value = rule.threshold
-                        event = AlertEvent(
-                            rule_id=rule.id,
-                            triggered_at=now,
-                            status='active',
-                            payload={
-                                'metric_key': rule.metric_key,
-                                'metric_value': current_metrics.get(rule.metric_key),
-                                'threshold': float(threshold_value),
-                                'comparator': rule.comparator,
-                                'severity': rule.severity
-                            }
-                        )
-                        db.add(event)
-                        db.flush()
-                        
-                        triggered_alerts.append({
-                            'rule': rule,
-                            'event': event,
-                            'metric_value': current_metrics.get(rule.metric_key)
-                        })
+                    ).distinct()
+                }
                 
-                db.query(AlertRule).filter(AlertRule.id == rule.id).update({'last_evaluated_at': now})
+                for rule in fired_rules:
+                    if rule.id in already_active:
+                        continue
+                    metric_value = current_metrics.get(rule.metric_key)
+                    event = AlertEvent(
+                        rule_id=rule.id,
+                        triggered_at=now,
+                        status='active',
+                        payload={
+                            'metric_key': rule.metric_key,
+                            'metric_value': metric_value,
+                            'threshold': float(rule.threshold),
+                            'comparator': rule.comparator,
+                            'severity': rule.severity
+                        }
+                    )
+                    db.add(event)
+                    triggered_alerts.append({
+                        'rule': rule,
+                        'event': event,
+                        'metric_value': metric_value
+                    })
+                db.flush()
+            
+            db.query(AlertRule).filter(
+                AlertRule.id.in_([rule.id for rule in due_rules])
+            ).update({'last_evaluated_at': now}, synchronize_session='evaluate')
             
             db.commit()
             
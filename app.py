@@ -25,38 +25,8 @@ Central hub providing access to all NexusOS modules:
 
 import streamlit as st
 
-# Import all dashboard modules
-from civilization_dashboard import main as civilization_main
-from web3_wallet_dashboard import render_web3_wallet_dashboard
-from wnsp_dashboard_v2 import render_wnsp_v2_dashboard
-from wnsp_v3_dashboard import render_wnsp_v3_dashboard
-from wavelength_economics_dashboard import render_wavelength_economics_dashboard
-from nexus_consensus_dashboard import render_nexus_consensus_dashboard
-from mobile_connectivity_dashboard import show_mobile_connectivity_dashboard
-from longterm_supply_dashboard import render_longterm_supply_dashboard
-from mobile_dag_messaging import render_mobile_dag_messaging
-from blockchain_viz import render_blockchain_dashboard
-from dex_page import render_dex_page
-from ghostdag_page import render_ghostdag_system
-from payment_layer_page import render_payment_layer_page
-from proof_of_spectrum_page import render_proof_of_spectrum
-from validator_economics_page import render_validator_economics_page
-from ai_management_dashboard import render_ai_management_dashboard
-from nexus_ai_chat import render_nexus_ai_chat
-from offline_mesh_dashboard import render_offline_mesh_dashboard
-from wavelength_code_interface import render_wavelength_code_interface
-from wavelang_ai_teacher import render_wavelang_ai_teacher
-from wavelang_compiler import render_wavelang_compiler_dashboard
-from quantum_wavelang_analyzer import render_quantum_wavelang_analyzer
-from civic_governance_dashboard import main as civic_governance_main
-from mobile_blockchain_hub import render_mobile_blockchain_hub
-from economic_loop_dashboard import render_economic_loop_dashboard
-from avogadro_economics_dashboard import main as avogadro_economics_main
-from napp_deployment_center import render_napp_deployment_center
-from transaction_search_explorer import render_transaction_search_explorer
-from sybil_dashboard import render_sybil_detection_dashboard
-from ai_arbitration_dashboard import render_arbitration_dashboard
-from security_dashboard import security_dashboard
+# Dashboards are imported lazily when selected (see dashboard_registry)
+from dashboard_registry import get_dashboard_registry
 
 
 def main():
@@ -495,6 +465,8 @@ def main():
         st.session_state.module_selector = st.session_state.nav_request
         st.session_state.nav_request = None  # Clear the request
     
+    registry = get_dashboard_registry()
+    
     # Sidebar - Module Selector
     with st.sidebar:
         st.title("🌍 NexusOS")
@@ -504,40 +476,7 @@ def main():
         # Module selector - clean and simple
         module = st.selectbox(
             "**Select Dashboard**",
-            [
-                "🏠 Home",
-                "📱 Mobile Blockchain Hub",
-                "💫 Economic Loop Dashboard",
-                "⚛️ Avogadro Economics",
-                "🌍 Civilization Dashboard",
-                "💎 Web3 Wallet",
-                "📡 WNSP Protocol v2.0",
-                "🚀 WNSP Protocol v3.0",
-                "💬 Mobile DAG Messaging",
-                "🔗 Blockchain Explorer",
-                "🔍 Transaction Search Explorer",
-                "🚀 Napp Deployment Center",
-                "💱 DEX (Token Exchange)",
-                "⚡ GhostDAG System",
-                "💰 Payment Layer",
-                "🌈 Proof of Spectrum",
-                "🏛️ Validator Economics",
-                "💵 Wavelength Economics",
-                "⚙️ Nexus Consensus",
-                "📱 Mobile Connectivity",
-                "📊 Long-term Supply",
-                "🤖 AI Management Control",
-                "💬 Talk to Nexus AI",
-                "🌐 Offline Mesh Network",
-                "🏛️ Civic Governance",
-                "🛡️ Sybil Detection System",
-                "⚖️ AI Arbitration & Moderation",
-                "🔒 Security Command Center",
-                "🌊 WaveLang Studio",
-                "🤖 WaveLang AI Teacher",
-                "💻 WaveLang Binary Compiler",
-                "⚛️ Quantum Analyzer"
-            ],
+            ["🏠 Home"] + registry.labels(),
             key="module_selector"
         )
         
@@ -776,130 +715,9 @@ def main():
                         st.session_state.nav_request = dash_name
                         st.rerun()
     
-    elif module == "📱 Mobile Blockchain Hub":
-        # Mobile blockchain hub - unified interface
-        render_mobile_blockchain_hub()
-    
-    elif module == "💫 Economic Loop Dashboard":
-        # Economic loop system
-        render_economic_loop_dashboard()
-    
-    elif module == "⚛️ Avogadro Economics":
-        # Avogadro statistical mechanics economics
-        avogadro_economics_main()
-    
-    elif module == "🌍 Civilization Dashboard":
-        # Full civilization dashboard with 7 tabs
-        civilization_main()
-    
-    elif module == "💎 Web3 Wallet":
-        # Native wallet interface
-        render_web3_wallet_dashboard()
-    
-    elif module == "📡 WNSP Protocol v2.0":
-        # WNSP protocol dashboard
-        render_wnsp_v2_dashboard()
-    
-    elif module == "🚀 WNSP Protocol v3.0":
-        # WNSP v3.0 - Hardware Abstraction + Adaptive Encoding
-        render_wnsp_v3_dashboard()
-    
-    elif module == "💬 Mobile DAG Messaging":
-        # Mobile blockchain messaging
-        render_mobile_dag_messaging()
-    
-    elif module == "🔗 Blockchain Explorer":
-        # Blockchain visualization
-        render_blockchain_dashboard()
-    
-    elif module == "🔍 Transaction Search Explorer":
-        # Transaction and address search (READ-ONLY)
-        render_transaction_search_explorer()
-    
-    elif module == "🚀 Napp Deployment Center":
-        # Napp deployment center - smart contract generator + explorer
-        render_napp_deployment_center()
-    
-    elif module == "💱 DEX (Token Exchange)":
-        # Decentralized Exchange
-        render_dex_page()
-    
-    elif module == "⚡ GhostDAG System":
-        # GhostDAG ecosystem
-        render_ghostdag_system()
-    
-    elif module == "💰 Payment Layer":
-        # Native token payment layer
-        render_payment_layer_page()
-    
-    elif module == "🌈 Proof of Spectrum":
-        # Proof of Spectrum consensus
-        render_proof_of_spectrum()
-    
-    elif module == "🏛️ Validator Economics":
-        # Validator staking and economics
-        render_validator_economics_page()
-    
-    elif module == "💵 Wavelength Economics":
-        # Economics dashboard
-        render_wavelength_economics_dashboard()
-    
-    elif module == "⚙️ Nexus Consensus":
-        # Consensus dashboard
-        render_nexus_consensus_dashboard()
-    
-    elif module == "📱 Mobile Connectivity":
-        # Mobile connectivity monitor
-        show_mobile_connectivity_dashboard()
-    
-    elif module == "📊 Long-term Supply":
-        # Long-term supply forecasting
-        render_longterm_supply_dashboard()
-    
-    elif module == "🤖 AI Management Control":
-        # AI management and governance dashboard
-        render_ai_management_dashboard()
-    
-    elif module == "💬 Talk to Nexus AI":
-        # Conversational interface to governance AI
-        render_nexus_ai_chat()
-    
-    elif module == "🌐 Offline Mesh Network":
-        # Offline peer-to-peer internet infrastructure
-        render_offline_mesh_dashboard()
-    
-    elif module == "🌊 WaveLang Studio":
-        # WaveLang visual interface
-        render_wavelength_code_interface()
-    
-    elif module == "🤖 WaveLang AI Teacher":
-        # WaveLang AI assistant
-        render_wavelang_ai_teacher()
-    
-    elif module == "💻 WaveLang Binary Compiler":
-        # WaveLang compilation pipeline
-        render_wavelang_compiler_dashboard()
-    
-    elif module == "⚛️ Quantum Analyzer":
-        # Quantum-level WaveLang analysis
-        render_quantum_wavelang_analyzer()
-    
-    elif module == "🏛️ Civic Governance":
-        # Civic governance innovation campaigns
-        civic_governance_main()
-    
-    elif module == "🛡️ Sybil Detection System":
-        # Multi-dimensional Sybil attack detection
-        render_sybil_detection_dashboard()
-    
-    elif module == "⚖️ AI Arbitration & Moderation":
-        # AI-powered dispute resolution and moderation
-        render_arbitration_dashboard()
-    
-    elif module == "🔒 Security Command Center":
-        # Comprehensive security monitoring and protection
-        security_dashboard()
-
+    else:
+        # Import the selected dashboard on first use, then render it
+        registry.render(module)
 
 if __name__ == "__main__":
     main()
@@ -6,8 +6,7 @@ from typing import Optional, List, Tuple
 import bcrypt as bcrypt_lib
 import streamlit as st
 from sqlalchemy.orm import Session as DBSession
-from database import User, Role, UserRole, Session, get_engine
-from sqlalchemy.orm import sessionmaker
+from database import User, Role, UserRole, Session, get_session_factory
 from db_error_handling import (
     DatabaseError, ConstraintViolationError, ConnectionError,
     TransactionError, ErrorMessageBuilder, safe_db_operation, db_transaction
@@ -260,9 +259,7 @@ class AuthManager:
             st.session_state.auth_bypass = True
             return
         
-        engine = get_engine()
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
+        db = get_session_factory()()
         
         try:
             init_roles(db)
@@ -297,9 +294,7 @@ class AuthManager:
                     st.error("❌ Missing credentials\nPlease enter both email and password\n💡 All fields are required to log in.")
                     return
                 
-                engine = get_engine()
-                SessionLocal = sessionmaker(bind=engine)
-                db = SessionLocal()
+                db = get_session_factory()()
                 
                 try:
                     result = authenticate_user(db, email, password)
@@ -374,9 +369,7 @@ class AuthManager:
                     st.error("❌ Passwords don't match\nPlease ensure both password fields are identical.")
                     return
                 
-                engine = get_engine()
-                SessionLocal = sessionmaker(bind=engine)
-                db = SessionLocal()
+                db = get_session_factory()()
                 
                 try:
                     user = create_user(db, email, password, [role_selection])
@@ -427,9 +420,7 @@ class AuthManager:
                 st.write(f"🎭 Roles: {', '.join(st.session_state.user_roles)}")
                 
                 if st.button("🚪 Logout", width="stretch"):
-                    engine = get_engine()
-                    SessionLocal = sessionmaker(bind=engine)
-                    db = SessionLocal()
+                    db = get_session_factory()()
                     
                     try:
                         if st.session_state.session_token:
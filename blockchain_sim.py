@@ -5,12 +5,15 @@ Comprehensive blockchain model demonstrating all features for a successful chain
 
 import time
 import hashlib
+import heapq
+import itertools
 import random
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
 from enum import Enum
 import numpy as np
 from collections import deque
+from collections.abc import MutableMapping
 
 class ConsensusType(Enum):
     """Consensus mechanism types"""
@@ -39,6 +42,14 @@ class Transaction:
     fee: float
     timestamp: float
     signature: str = ""
+    nonce: Optional[int] = None  # Per-sender ordering; None = arrival order
+    tx_hash: str = field(default="", repr=False, compare=False)  # Cached calculate_hash()
+    
+    def get_hash(self) -> str:
+        """Transaction hash, computed once"""
+        if not self.tx_hash:
+            self.tx_hash = self.calculate_hash()
+        return self.tx_hash
     
     def to_dict(self) -> dict:
         return {
@@ -56,6 +67,31 @@ class Transaction:
         return hashlib.sha256(tx_string.encode()).hexdigest()
 
 
+def merkle_root(tx_hashes: List[str]) -> str:
+    """
+    Merkle root over hex transaction hashes
+    
+    Pairs are hashed as sha256(left || right) over raw digests; an odd
+    node at any level is paired with itself.
+    
+    Args:
+        tx_hashes: Transaction hashes in block order
+    
+    Returns:
+        Hex root (sha256 of empty input for an empty block)
+    """
+    if not tx_hashes:
+        return hashlib.sha256(b"").hexdigest()
+    
+    level = [bytes.fromhex(h) for h in tx_hashes]
+    sha256 = hashlib.sha256
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+
 @dataclass
 class Block:
     """Blockchain block"""
@@ -69,11 +105,12 @@ class Block:
     state_root: str = ""
     gas_used: int = 0
     gas_limit: int = 8000000
+    tx_root: str = ""  # Merkle root of transaction hashes
     
     def calculate_hash(self) -> str:
-        """Calculate block hash"""
-        tx_data = "".join([tx.calculate_hash() for tx in self.transactions])
-        block_string = f"{self.height}{self.timestamp}{tx_data}{self.previous_hash}{self.nonce}"
+        """Calculate block hash (commits to transactions via their Merkle root)"""
+        self.tx_root = merkle_root([tx.get_hash() for tx in self.transactions])
+        block_string = f"{self.height}{self.timestamp}{self.tx_root}{self.previous_hash}{self.nonce}"
         return hashlib.sha256(block_string.encode()).hexdigest()
     
     def to_dict(self) -> dict:
@@ -132,6 +169,249 @@ class StressTestScenario:
     attack_type: str = "none"
 
 
+class Mempool:
+    """
+    Pending transactions ordered by fee, with per-sender nonce ordering
+    
+    Each sender's transactions wait in a queue sorted by (nonce, arrival);
+    only queue heads sit in a max-fee heap, so a block takes the highest-fee
+    transactions that are next in line for their sender. Adding and taking
+    a transaction is O(log senders). Transactions whose hash is pending or
+    was recently included are rejected as duplicates.
+    """
+    
+    def __init__(self, included_cache_size: int = 100_000):
+        self._queues: Dict[str, deque] = {}  # sender -> deque of (order key, seq, tx)
+        self._heap: List[Tuple[float, int, str]] = []  # (-fee, seq, sender) of queue heads
+        self._pending: set = set()
+        self._included: set = set()
+        self._included_order: deque = deque()
+        self._included_cache_size = included_cache_size
+        self._seq = itertools.count()
+    
+    def __len__(self) -> int:
+        return len(self._pending)
+    
+    def __contains__(self, tx_hash: str) -> bool:
+        return tx_hash in self._pending
+    
+    def __iter__(self) -> Iterator[Transaction]:
+        for queue in self._queues.values():
+            for _, _, tx in queue:
+                yield tx
+    
+    def add(self, tx: Transaction) -> bool:
+        """Queue a transaction; False if it is a duplicate"""
+        tx_hash = tx.get_hash()
+        if tx_hash in self._pending or tx_hash in self._included:
+            return False
+        
+        seq = next(self._seq)
+        entry = (tx.nonce if tx.nonce is not None else seq, seq, tx)
+        queue = self._queues.get(tx.sender)
+        if queue is None:
+            queue = self._queues[tx.sender] = deque()
+        
+        if not queue or entry[:2] > queue[-1][:2]:
+            queue.append(entry)
+        else:
+            # Out-of-order nonce (rare): insert in place
+            position = next(i for i, queued in enumerate(queue) if entry[:2] < queued[:2])
+            queue.insert(position, entry)
+        
+        if queue[0] is entry:
+            heapq.heappush(self._heap, (-tx.fee, seq, tx.sender))
+        self._pending.add(tx_hash)
+        return True
+    
+    def pop_batch(self, max_transactions: int) -> List[Transaction]:
+        """Remove and return up to max_transactions, highest fee first"""
+        batch = []
+        heap = self._heap
+        while heap and len(batch) < max_transactions:
+            _, seq, sender = heapq.heappop(heap)
+            queue = self._queues.get(sender)
+            if not queue or queue[0][1] != seq:
+                continue  # Stale: this sender's head changed
+            
+            _, _, tx = queue.popleft()
+            batch.append(tx)
+            self._mark_included(tx.tx_hash)
+            if queue:
+                _, head_seq, head = queue[0]
+                heapq.heappush(heap, (-head.fee, head_seq, sender))
+            else:
+                del self._queues[sender]
+        return batch
+    
+    def _mark_included(self, tx_hash: str):
+        self._pending.discard(tx_hash)
+        self._included.add(tx_hash)
+        self._included_order.append(tx_hash)
+        if len(self._included_order) > self._included_cache_size:
+            self._included.discard(self._included_order.popleft())
+
+
+class AccountState(MutableMapping):
+    """
+    Account balances keyed by address, stored in a dense NumPy array
+    
+    Each address gets a fixed index on creation, so a block's transfers can
+    be applied to the balance array in bulk. Behaves like Dict[str, float],
+    except that accounts cannot be removed.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        self.index: Dict[str, int] = {}
+        self.addresses: List[str] = []  # Index -> address
+        self._balances = np.zeros(max(1, capacity))  # Slots past len() stay zero
+    
+    @property
+    def balances(self) -> np.ndarray:
+        """Live view of balances, in index order"""
+        return self._balances[:len(self.addresses)]
+    
+    def __len__(self) -> int:
+        return len(self.addresses)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.addresses)
+    
+    def __contains__(self, address) -> bool:
+        return address in self.index
+    
+    def __getitem__(self, address: str) -> float:
+        return float(self._balances[self.index[address]])
+    
+    def __setitem__(self, address: str, balance: float):
+        i = self.index.get(address)
+        if i is None:
+            i = self._create(address)
+        self._balances[i] = balance
+    
+    def __delitem__(self, address: str):
+        raise TypeError("accounts cannot be removed")
+    
+    def get(self, address: str, default=None):
+        i = self.index.get(address)
+        return default if i is None else float(self._balances[i])
+    
+    def total(self) -> float:
+        """Sum of all balances"""
+        return float(self.balances.sum())
+    
+    def _reserve(self, extra: int):
+        needed = len(self.addresses) + extra
+        if needed > len(self._balances):
+            grown = np.zeros(max(needed, 2 * len(self._balances)))
+            grown[:len(self.addresses)] = self.balances
+            self._balances = grown
+    
+    def _create(self, address: str) -> int:
+        self._reserve(1)
+        i = len(self.addresses)
+        self.index[address] = i
+        self.addresses.append(address)
+        return i
+    
+    def apply_transfers(self, txs: List[Transaction]) -> np.ndarray:
+        """
+        Apply transfers as if one by one in order
+        
+        A transfer applies if its sender exists and holds amount + fee at that
+        point; the fee is removed from supply and an unknown recipient is
+        created on its first applied transfer. Credits only ever raise a
+        balance, so a sender whose total spend fits its opening balance
+        cannot fail. Only transfers touching a conflicting sender (one whose
+        spend may exceed its opening balance, or one created within the
+        block) are sequenced; the rest are applied with one vectorised pass.
+        
+        Args:
+            txs: Transfers in execution order
+        
+        Returns:
+            Boolean mask of applied transfers
+        """
+        n = len(txs)
+        if n == 0:
+            return np.zeros(0, dtype=bool)
+        
+        base = len(self.addresses)
+        index = self.index
+        new_recipients: Dict[str, int] = {}  # Provisional slots past base
+        
+        def recipient_index(address: str) -> int:
+            i = index.get(address)
+            if i is None:
+                i = new_recipients.setdefault(address, base + len(new_recipients))
+            return i
+        
+        recipient_idx = np.fromiter((recipient_index(tx.recipient) for tx in txs), dtype=np.int64, count=n)
+        # Unknown senders may be created by an earlier transfer in this block
+        sender_idx = np.fromiter(
+            (index.get(tx.sender, new_recipients.get(tx.sender, -1)) for tx in txs), dtype=np.int64, count=n
+        )
+        amounts = np.fromiter((tx.amount for tx in txs), dtype=float, count=n)
+        costs = amounts + np.fromiter((tx.fee for tx in txs), dtype=float, count=n)
+        
+        self._reserve(len(new_recipients))
+        size = base + len(new_recipients)
+        balances = self._balances
+        
+        # Conflicting senders; the margin keeps float-rounding borderline cases sequential
+        valid = sender_idx >= 0
+        spend = np.bincount(sender_idx[valid], weights=costs[valid], minlength=size)
+        opening = balances[:size]
+        conflicted = (spend > 0) & (spend > opening - 1e-9 * np.abs(opening))
+        # Senders created in this block exist only after their first credit
+        conflicted[sender_idx[sender_idx >= base]] = True
+        
+        sequenced = valid & (conflicted[np.maximum(sender_idx, 0)] | conflicted[recipient_idx])
+        bulk = valid & ~sequenced
+        
+        applied = bulk.copy()
+        if bulk.any():
+            balances[:size] -= np.bincount(sender_idx[bulk], weights=costs[bulk], minlength=size)
+            balances[:size] += np.bincount(recipient_idx[bulk], weights=amounts[bulk], minlength=size)
+        
+        positions = np.flatnonzero(sequenced)
+        if len(positions):
+            # Python floats for the scalar loop, written back once
+            touched = np.unique(np.concatenate([sender_idx[positions], recipient_idx[positions]]))
+            local = dict(zip(touched.tolist(), balances[touched].tolist()))
+            created = set()  # Provisional slots credited so far
+            for i, sender, recipient, amount, cost in zip(
+                positions.tolist(), sender_idx[positions].tolist(), recipient_idx[positions].tolist(),
+                amounts[positions].tolist(), costs[positions].tolist()
+            ):
+                if (sender < base or sender in created) and local[sender] >= cost:
+                    local[sender] -= cost
+                    local[recipient] += amount
+                    applied[i] = True
+                    if recipient >= base:
+                        created.add(recipient)
+            balances[touched] = [local[i] for i in touched.tolist()]
+        
+        if new_recipients:
+            self._adopt_recipients(recipient_idx, applied, base, len(new_recipients), new_recipients)
+        return applied
+    
+    def _adopt_recipients(self, recipient_idx: np.ndarray, applied: np.ndarray,
+                          base: int, count: int, provisional: Dict[str, int]):
+        """Turn credited provisional slots into accounts, in order of first credit"""
+        credited = recipient_idx[applied]
+        credited = credited[credited >= base]
+        balances = self._balances
+        held = balances[base:base + count].copy()
+        balances[base:base + count] = 0.0
+        
+        _, first = np.unique(credited, return_index=True)
+        slot_address = {slot: address for address, slot in provisional.items()}
+        for slot in credited[np.sort(first)].tolist():
+            i = self._create(slot_address[slot])
+            balances[i] = held[slot - base]
+
+
 class BlockchainSimulator:
     """Layer 1 Blockchain Simulator with Stress Testing"""
     
@@ -153,9 +433,12 @@ class BlockchainSimulator:
         
         # Blockchain state
         self.chain: List[Block] = []
-        self.mempool: List[Transaction] = []
+        self.mempool = Mempool()
         self.validators: Dict[str, Validator] = {}
-        self.accounts: Dict[str, float] = {}
+        self.accounts = AccountState()
+        
+        # Active validators with cumulative stakes; rebuilt after status changes
+        self._proposer_cache: Optional[Tuple[List[Validator], np.ndarray, List[Validator]]] = None
         
         # Performance metrics
         self.tps_history: List[float] = []
@@ -203,77 +486,101 @@ class BlockchainSimulator:
             )
             self.validators[address] = validator
             self.accounts[address] = stake
+        self.invalidate_validator_cache()
+    
+    def set_validator_status(self, address: str, status: ValidatorStatus):
+        """Change a validator's status (keeps proposer selection cache valid)"""
+        self.validators[address].status = status
+        self.invalidate_validator_cache()
+    
+    def invalidate_validator_cache(self):
+        """Call after changing validator status or stake directly"""
+        self._proposer_cache = None
     
     def generate_transaction(self) -> Transaction:
         """Generate a random transaction"""
-        active_accounts = list(self.accounts.keys())
+        active_accounts = self.accounts.addresses
         if len(active_accounts) < 2:
             # Create new accounts if needed
             for i in range(10):
                 addr = f"user_{i:04d}_{hashlib.sha256(str(random.random()).encode()).hexdigest()[:8]}"
                 self.accounts[addr] = random.uniform(100, 1000)
-            active_accounts = list(self.accounts.keys())
+            active_accounts = self.accounts.addresses
         
-        sender = random.choice(active_accounts)
-        recipient = random.choice([a for a in active_accounts if a != sender])
+        sender_idx = random.randrange(len(active_accounts))
+        # Any account but the sender, uniformly
+        recipient_idx = random.randrange(len(active_accounts) - 1)
+        if recipient_idx >= sender_idx:
+            recipient_idx += 1
+        sender = active_accounts[sender_idx]
+        recipient = active_accounts[recipient_idx]
         
         max_amount = self.accounts.get(sender, 100) * 0.1  # Max 10% of balance
         amount = random.uniform(0.1, max(0.1, max_amount))
         fee = amount * 0.001  # 0.1% fee
         
         tx = Transaction(
-            tx_id=hashlib.sha256(str(random.random()).encode()).hexdigest()[:16],
+            tx_id=f"{random.getrandbits(64):016x}",
             sender=sender,
             recipient=recipient,
             amount=amount,
             fee=fee,
             timestamp=time.time()
         )
-        tx.signature = tx.calculate_hash()
+        tx.signature = tx.get_hash()
         
         return tx
     
     def add_transaction(self, tx: Transaction) -> bool:
-        """Add transaction to mempool"""
+        """Add transaction to mempool (False if unfunded or a duplicate)"""
         # Validate transaction
         if tx.sender not in self.accounts:
             return False
         if self.accounts[tx.sender] < (tx.amount + tx.fee):
             return False
         
-        self.mempool.append(tx)
-        return True
+        return self.mempool.add(tx)
+    
+    def add_transactions(self, txs: Iterable[Transaction]) -> int:
+        """Add many transactions; returns how many were accepted"""
+        return sum(1 for tx in txs if self.add_transaction(tx))
+    
+    def _get_proposer_candidates(self) -> Tuple[List[Validator], np.ndarray, List[Validator]]:
+        """(active validators, cumulative stakes, active validators by stake desc)"""
+        if self._proposer_cache is None:
+            active = [v for v in self.validators.values() if v.status == ValidatorStatus.ACTIVE]
+            cumulative = np.cumsum([v.stake for v in active])
+            by_stake = sorted(active, key=lambda v: v.stake, reverse=True)
+            self._proposer_cache = (active, cumulative, by_stake)
+        return self._proposer_cache
     
     def select_block_proposer(self) -> Optional[Validator]:
         """Select next block proposer based on consensus"""
-        active_validators = [v for v in self.validators.values() 
-                           if v.status == ValidatorStatus.ACTIVE]
+        active_validators, cumulative_stake, by_stake = self._get_proposer_candidates()
         
         if not active_validators:
             return None
         
         if self.consensus_type == ConsensusType.PROOF_OF_STAKE:
-            # Stake-weighted random selection
-            total_stake = sum(v.stake for v in active_validators)
+            # Stake-weighted random selection: binary search in cumulative stakes
+            total_stake = cumulative_stake[-1]
             if total_stake == 0:
                 return random.choice(active_validators)
             
-            weights = [v.stake / total_stake for v in active_validators]
-            idx = np.random.choice(len(active_validators), p=weights)
-            return active_validators[idx]
+            idx = int(np.searchsorted(cumulative_stake, np.random.random() * total_stake, side='right'))
+            return active_validators[min(idx, len(active_validators) - 1)]
         
         elif self.consensus_type == ConsensusType.DELEGATED_POS:
             # Round-robin among top validators
-            active_validators.sort(key=lambda v: v.stake, reverse=True)
-            idx = self.total_blocks % len(active_validators)
-            return active_validators[idx]
+            idx = self.total_blocks % len(by_stake)
+            return by_stake[idx]
         
         else:
             # Random selection for others
             return random.choice(active_validators)
     
     def create_block(self, max_transactions: int = 100) -> Optional[Block]:
-        """Create new block from mempool"""
+        """Create new block from the highest-fee ready transactions in the mempool"""
         if not self.mempool:
             return None
         
@@ -282,8 +589,7 @@ class BlockchainSimulator:
             return None
         
         # Select transactions
-        selected_txs = self.mempool[:max_transactions]
-        self.mempool = self.mempool[max_transactions:]
+        selected_txs = self.mempool.pop_batch(max_transactions)
         
         # Create block
         previous_block = self.chain[-1]
@@ -306,21 +612,17 @@ class BlockchainSimulator:
     
     def execute_block(self, block: Block) -> bool:
         """Execute block transactions and update state"""
-        # Process transactions
-        for tx in block.transactions:
-            if tx.sender in self.accounts and self.accounts[tx.sender] >= (tx.amount + tx.fee):
-                # Deduct from sender
-                self.accounts[tx.sender] -= (tx.amount + tx.fee)
-                
-                # Add to recipient
-                if tx.recipient not in self.accounts:
-                    self.accounts[tx.recipient] = 0
-                self.accounts[tx.recipient] += tx.amount
-                
-                # Burn fees (deflationary mechanism)
-                self.total_fees_burned += tx.fee
-                self.total_value_transferred += tx.amount
-                self.total_transactions += 1
+        # Process transactions (unfunded ones are skipped)
+        applied = self.accounts.apply_transfers(block.transactions)
+        if applied.any():
+            txs = block.transactions
+            amounts = np.fromiter((tx.amount for tx in txs), dtype=float, count=len(txs))
+            fees = np.fromiter((tx.fee for tx in txs), dtype=float, count=len(txs))
+            
+            # Burn fees (deflationary mechanism)
+            self.total_fees_burned += float(fees[applied].sum())
+            self.total_value_transferred += float(amounts[applied].sum())
+            self.total_transactions += int(applied.sum())
         
         # Reward proposer
         proposer = self.validators.get(block.proposer)
@@ -357,6 +659,7 @@ class BlockchainSimulator:
             for validator in random.sample(active_validators, num_failures):
                 validator.status = ValidatorStatus.OFFLINE
                 validator.uptime *= 0.5
+            self.invalidate_validator_cache()
         
         # Apply network partition
         if random.random() < scenario.network_partition_prob:
@@ -375,6 +678,7 @@ class BlockchainSimulator:
             for addr in affected:
                 if self.validators[addr].status == ValidatorStatus.ACTIVE:
                     self.validators[addr].status = ValidatorStatus.FAULTY
+            self.invalidate_validator_cache()
     
     def recover_from_stress(self):
         """Recover from stress test"""
@@ -390,23 +694,31 @@ class BlockchainSimulator:
             
             if validator.status == ValidatorStatus.FAULTY:
                 validator.status = ValidatorStatus.ACTIVE
+        self.invalidate_validator_cache()
         
         # Clear network partitions
         self.network_partitions = []
     
-    def run_simulation(self, num_blocks: int = 10, transactions_per_block: int = 50):
-        """Run blockchain simulation"""
+    def run_simulation(self, num_blocks: int = 10, transactions_per_block: int = 50,
+                       block_delay: float = 0.01):
+        """
+        Run blockchain simulation
+        
+        Args:
+            num_blocks: Blocks to produce
+            transactions_per_block: Transactions generated and included per block
+            block_delay: Pause after each block for visualization (0 for stress runs)
+        """
         for _ in range(num_blocks):
             # Generate transactions
-            for _ in range(transactions_per_block):
-                tx = self.generate_transaction()
-                self.add_transaction(tx)
+            self.add_transactions(self.generate_transaction() for _ in range(transactions_per_block))
             
             # Create and execute block
             block = self.create_block(max_transactions=transactions_per_block)
             if block:
                 self.execute_block(block)
-                time.sleep(0.01)  # Small delay for visualization
+                if block_delay:
+                    time.sleep(block_delay)  # Small delay for visualization
     
     def get_network_health(self) -> dict:
         """Calculate network health metrics"""
@@ -433,7 +745,7 @@ class BlockchainSimulator:
     
     def get_chain_stats(self) -> dict:
         """Get blockchain statistics"""
-        total_supply = sum(self.accounts.values())
+        total_supply = self.accounts.total()
         
         return {
             'total_blocks': self.total_blocks,
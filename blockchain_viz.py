@@ -197,19 +197,20 @@ def create_dag_graph(wallet_system, tx_id=None, msg_id=None, depth=3):
     
     try:
         # Query DAG edges
-        if tx_id:
-            edges_query = wallet_system.db.query(DagEdge).filter(
-                (DagEdge.child_id == tx_id) | (DagEdge.parent_id == tx_id)
-            ).all()
-        elif msg_id:
-            edges_query = wallet_system.db.query(DagEdge).filter(
-                (DagEdge.child_id == msg_id) | (DagEdge.parent_id == msg_id)
-            ).all()
-        else:
-            # Get recent edges
-            edges_query = wallet_system.db.query(DagEdge).order_by(
-                DagEdge.timestamp.desc()
-            ).limit(50).all()
+        with wallet_system.read_session() as session:
+            if tx_id:
+                edges_query = session.query(DagEdge).filter(
+                    (DagEdge.child_id == tx_id) | (DagEdge.parent_id == tx_id)
+                ).all()
+            elif msg_id:
+                edges_query = session.query(DagEdge).filter(
+                    (DagEdge.child_id == msg_id) | (DagEdge.parent_id == msg_id)
+                ).all()
+            else:
+                # Get recent edges
+                edges_query = session.query(DagEdge).order_by(
+                    DagEdge.timestamp.desc()
+                ).limit(50).all()
         
         if not edges_query:
             fig = go.Figure()
@@ -315,7 +316,8 @@ def create_transaction_io_view(wallet_system, tx_id):
     from nexus_native_wallet import TransactionIO
     
     try:
-        io_records = wallet_system.db.query(TransactionIO).filter_by(tx_id=tx_id).all()
+        with wallet_system.read_session() as session:
+            io_records = session.query(TransactionIO).filter_by(tx_id=tx_id).all()
         
         if not io_records:
             return None
@@ -554,9 +556,10 @@ def render_blockchain_dashboard():
                         st.markdown("**Wavelength Validation Record**")
                         try:
                             from nexus_native_wallet import VerificationRecord
-                            verification = wallet_system.db.query(VerificationRecord).filter_by(
-                                tx_id=selected_tx_id
-                            ).first()
+                            with wallet_system.read_session() as session:
+                                verification = session.query(VerificationRecord).filter_by(
+                                    tx_id=selected_tx_id
+                                ).first()
                             
                             if verification:
                                 col1, col2, col3 = st.columns(3)
@@ -679,7 +682,8 @@ def render_blockchain_dashboard():
         # DAG statistics
         try:
             from nexus_native_wallet import DagEdge
-            all_edges = wallet_system.db.query(DagEdge).all()
+            with wallet_system.read_session() as session:
+                all_edges = session.query(DagEdge).all()
             
             if all_edges:
                 col1, col2, col3, col4 = st.columns(4)
@@ -133,6 +133,30 @@ class Campaign:
         return (self.votes_reject / self.total_voters) * 100
 
 
+@dataclass
+class ProposalTally:
+    """Running vote counts for one proposal, updated as votes are cast"""
+    votes_by_region: Dict[SpectralRegion, Dict[str, int]] = field(
+        default_factory=lambda: {
+            region: {"APPROVE": 0, "REJECT": 0, "ABSTAIN": 0} for region in SpectralRegion
+        }
+    )
+    voters: Set[str] = field(default_factory=set)
+    regions_approved: int = 0  # Regions with at least one APPROVE
+    regions_rejected: int = 0  # Regions with at least one REJECT
+    
+    def add(self, vote: Vote):
+        """Count one vote"""
+        counts = self.votes_by_region[vote.spectral_region]
+        counts[vote.choice.name] += 1
+        if counts[vote.choice.name] == 1:
+            if vote.choice == VoteChoice.APPROVE:
+                self.regions_approved += 1
+            elif vote.choice == VoteChoice.REJECT:
+                self.regions_rejected += 1
+        self.voters.add(vote.validator_id)
+
+
 @dataclass
 class CommunityVote:
     """Individual community member vote on a campaign"""
@@ -158,10 +182,12 @@ class CivicGovernance:
         # Proposals and votes
         self.proposals: Dict[str, Proposal] = {}
         self.votes: Dict[str, List[Vote]] = {}  # proposal_id -> votes
+        self.tallies: Dict[str, ProposalTally] = {}  # proposal_id -> running counts
         
         # Innovation campaigns (validators burn NXT to promote ideas)
         self.campaigns: Dict[str, Campaign] = {}
         self.community_votes: Dict[str, List[CommunityVote]] = {}  # campaign_id -> votes
+        self.campaign_voters: Dict[str, Set[str]] = {}  # campaign_id -> voter ids
         self.total_nxt_burned = 0.0  # Total NXT burned for campaigns
         
         # Governance parameters
@@ -175,6 +201,7 @@ class CivicGovernance:
         self.rejected_proposals = 0
         self.total_campaigns = 0
         self.successful_campaigns = 0
+        self.total_community_votes = 0
     
     def register_validator(self, validator_id: str, spectral_region: SpectralRegion, 
                           stake_amount: float) -> Validator:
@@ -204,6 +231,7 @@ class CivicGovernance:
         
         self.proposals[proposal.proposal_id] = proposal
         self.votes[proposal.proposal_id] = []
+        self.tallies[proposal.proposal_id] = ProposalTally()
         self.total_proposals += 1
         
         return proposal.proposal_id
@@ -223,8 +251,8 @@ class CivicGovernance:
             raise ValueError(f"Proposal {proposal_id} is not accepting votes")
         
         # Check if validator already voted
-        existing_votes = [v for v in self.votes[proposal_id] if v.validator_id == validator_id]
-        if existing_votes:
+        tally = self.tallies[proposal_id]
+        if validator_id in tally.voters:
             raise ValueError(f"Validator {validator_id} already voted on {proposal_id}")
         
         # Create vote with reputation weighting
@@ -237,6 +265,7 @@ class CivicGovernance:
         )
         
         self.votes[proposal_id].append(vote)
+        tally.add(vote)
         validator.votes_cast += 1
         
         # Check if voting is complete
@@ -245,21 +274,11 @@ class CivicGovernance:
     def _evaluate_proposal(self, proposal_id: str):
         """Evaluate if proposal has reached decision threshold"""
         proposal = self.proposals[proposal_id]
-        votes = self.votes[proposal_id]
+        tally = self.tallies[proposal_id]
         
-        # Count approvals by spectral region
-        region_approvals: Dict[SpectralRegion, int] = {region: 0 for region in SpectralRegion}
-        region_rejections: Dict[SpectralRegion, int] = {region: 0 for region in SpectralRegion}
-        
-        for vote in votes:
-            if vote.choice == VoteChoice.APPROVE:
-                region_approvals[vote.spectral_region] += 1
-            elif vote.choice == VoteChoice.REJECT:
-                region_rejections[vote.spectral_region] += 1
-        
-        # Count regions with majority approval
-        regions_approved = sum(1 for count in region_approvals.values() if count > 0)
-        regions_rejected = sum(1 for count in region_rejections.values() if count > 0)
+        # Regions with approvals/rejections, kept up to date by cast_vote
+        regions_approved = tally.regions_approved
+        regions_rejected = tally.regions_rejected
         
         # Check if proposal passes (only if still open)
         if proposal.status == "OPEN":
@@ -278,15 +297,7 @@ class CivicGovernance:
         
         proposal = self.proposals[proposal_id]
         votes = self.votes[proposal_id]
-        
-        # Count votes by region
-        votes_by_region: Dict[SpectralRegion, Dict[str, int]] = {
-            region: {"APPROVE": 0, "REJECT": 0, "ABSTAIN": 0} 
-            for region in SpectralRegion
-        }
-        
-        for vote in votes:
-            votes_by_region[vote.spectral_region][vote.choice.name] += 1
+        votes_by_region = self.tallies[proposal_id].votes_by_region
         
         # Regions that approved
         approving_regions = [
@@ -304,7 +315,7 @@ class CivicGovernance:
             "approving_regions": [r.value for r in approving_regions],
             "total_votes": len(votes),
             "votes_by_region": {
-                region.value: counts for region, counts in votes_by_region.items()
+                region.value: dict(counts) for region, counts in votes_by_region.items()
             },
             "is_active": proposal.is_active(),
             "deadline": proposal.voting_deadline.isoformat()
@@ -357,6 +368,7 @@ class CivicGovernance:
         # Store campaign
         self.campaigns[campaign.campaign_id] = campaign
         self.community_votes[campaign.campaign_id] = []
+        self.campaign_voters[campaign.campaign_id] = set()
         self.total_nxt_burned += campaign.nxt_burned
         self.total_campaigns += 1
         
@@ -380,8 +392,8 @@ class CivicGovernance:
             raise ValueError(f"Campaign {campaign_id} is not accepting votes")
         
         # Check if voter already voted
-        existing_votes = [v for v in self.community_votes[campaign_id] if v.voter_id == voter_id]
-        if existing_votes:
+        voters = self.campaign_voters[campaign_id]
+        if voter_id in voters:
             raise ValueError(f"Voter {voter_id} already voted on {campaign_id}")
         
         # Only APPROVE/REJECT allowed for campaigns (no ABSTAIN)
@@ -396,6 +408,8 @@ class CivicGovernance:
         )
         
         self.community_votes[campaign_id].append(vote)
+        voters.add(voter_id)
+        self.total_community_votes += 1
         
         # Update campaign tallies
         campaign.total_voters += 1
@@ -452,7 +466,6 @@ class CivicGovernance:
             raise ValueError(f"Campaign {campaign_id} not found")
         
         campaign = self.campaigns[campaign_id]
-        votes = self.community_votes[campaign_id]
         
         # Get proposer details
         proposer = self.validators.get(campaign.proposer_id)
@@ -476,7 +489,7 @@ class CivicGovernance:
             "approval_percentage": campaign.approval_percentage(),
             "rejection_percentage": campaign.rejection_percentage(),
             "ai_report_generated": campaign.ai_report_generated,
-            "total_votes_cast": len(votes)
+            "total_votes_cast": len(self.community_votes[campaign_id])
         }
     
     def get_campaign_stats(self) -> dict:
@@ -486,16 +499,13 @@ class CivicGovernance:
         # Calculate average burn amount
         avg_burn = (self.total_nxt_burned / max(1, self.total_campaigns))
         
-        # Total community participation
-        total_community_votes = sum(len(votes) for votes in self.community_votes.values())
-        
         return {
             "total_campaigns": self.total_campaigns,
             "active_campaigns": active_campaigns,
             "successful_campaigns": self.successful_campaigns,
             "total_nxt_burned": self.total_nxt_burned,
             "average_burn_per_campaign": avg_burn,
-            "total_community_votes": total_community_votes,
+            "total_community_votes": self.total_community_votes,
             "success_rate": (self.successful_campaigns / max(1, self.total_campaigns)) * 100
         }
 
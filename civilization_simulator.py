@@ -7,10 +7,21 @@ dN/dt = αC + βD + γE - δEntropy + PID
 """
 
 import numpy as np
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+import pandas as pd
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Optional, Tuple, Sequence
 from datetime import datetime, timedelta
 
+try:
+    from numba import jit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def jit(*args, **kwargs):
+        """Fallback: run the kernel as plain Python"""
+        return lambda func: func
+
 @dataclass
 class CivilizationState:
     """Complete state of the civilization at a point in time"""
@@ -38,6 +49,170 @@ class CivilizationState:
                 f"NXT={self.nxt_supply:,.0f}, stability={self.stability_index:.2f})")
 
 
+# Trajectory columns, in CivilizationState field order
+STATE_FIELDS = [f.name for f in fields(CivilizationState)]
+STATE_DTYPE = np.dtype([
+    (name, np.int64 if name in ('time_days', 'population') else np.float64)
+    for name in STATE_FIELDS
+])
+(_T, _POP, _SUPPLY, _FLOOR, _RECYCLING, _CONTRIB, _DISTRIB,
+ _GROWTH, _ENTROPY, _STABILITY, _DEBT, _CREDITS) = range(len(STATE_FIELDS))
+
+
+@jit(nopython=True, cache=True)
+def advance_paths(state, pid, contribution_noise, growth_noise, params,
+                  first_day, total_days, sample_every, out):
+    """
+    Advance K civilization paths through a chunk of days (Numba kernel)
+    
+    Same arithmetic as CivilizationSimulator.simulate_day, one path per row.
+    state and pid are updated in place so a long run can be fed its noise in
+    chunks.
+    
+    Args:
+        state: (K, len(STATE_FIELDS)) float64 current states
+        pid: (K, 2) PID integral and previous error
+        contribution_noise: (K, n) standard normals for contribution
+        growth_noise: (K, n) standard normals for economic growth
+        params: alpha, beta, gamma, delta, kp, ki, kd, setpoint, population
+            growth, debt growth, recycling participation, contribution
+            variance, initial population
+        first_day: Days already simulated before this chunk
+        total_days: Length of the whole run (its last day is always recorded)
+        sample_every: Record every n-th day
+        out: (K, samples, len(STATE_FIELDS)) recorded states; column 0 is the start
+    """
+    num_paths, num_days = contribution_noise.shape
+    alpha, beta, gamma, delta = params[0], params[1], params[2], params[3]
+    kp, ki, kd, setpoint = params[4], params[5], params[6], params[7]
+    population_growth_rate, debt_growth_rate = params[8], params[9]
+    recycling_participation_rate, contribution_variance = params[10], params[11]
+    initial_population = params[12]
+    
+    daily_pop_growth = population_growth_rate / 365
+    daily_debt_growth = debt_growth_rate / 365
+    recycling_effect = -0.0001 * recycling_participation_rate
+    
+    for k in range(num_paths):
+        time_days = state[k, 0]
+        population = state[k, 1]
+        nxt_supply = state[k, 2]
+        floor_reserve = state[k, 3]
+        recycling_liquidity = state[k, 4]
+        contribution = state[k, 5]
+        distribution = state[k, 6]
+        growth_rate = state[k, 7]
+        entropy = state[k, 8]
+        stability = state[k, 9]
+        global_debt = state[k, 10]
+        credits = state[k, 11]
+        integral_error = pid[k, 0]
+        previous_error = pid[k, 1]
+        
+        for j in range(num_days):
+            # PID controller and Nexus equation
+            error = setpoint - stability
+            integral_error += error * 1.0
+            derivative_error = (error - previous_error) / 1.0
+            pid_correction = kp * error + ki * integral_error + kd * derivative_error
+            previous_error = error
+            dN_dt = (alpha * contribution + beta * distribution + gamma * (growth_rate / 365)
+                     - delta * entropy + pid_correction)
+            
+            nxt_supply = nxt_supply * (1 + dN_dt / 100)
+            population = float(int(population * (1 + daily_pop_growth)))
+            global_debt = global_debt * (1 + daily_debt_growth)
+            
+            # Debt-backed floor credits
+            debt_backing_per_nxt = global_debt / nxt_supply if nxt_supply > 0 else 0.0
+            credits = population * (debt_backing_per_nxt * 0.01) * 0.01
+            
+            daily_recycling_revenue = population * 0.2
+            floor_reserve = (floor_reserve + population * 0.5 + daily_recycling_revenue
+                             + credits - population * 3.75)
+            recycling_liquidity = recycling_liquidity + daily_recycling_revenue * 2
+            
+            contribution = min(max(contribution + contribution_variance * contribution_noise[k, j], 0.3), 1.0)
+            distribution = min(max(distribution + 0.0001, 0.5), 1.0)
+            growth_rate = min(max(growth_rate + 0.5 * growth_noise[k, j], -5.0), 10.0)
+            population_effect = 0.00005 * (population / initial_population)
+            entropy = min(max(entropy + recycling_effect + population_effect, 0.05), 0.50)
+            
+            floor_stability = 1.0 if floor_reserve > 0 else 0.0
+            economic_stability = min(max(growth_rate / 10, 0.0), 1.0)
+            stability = (0.40 * floor_stability + 0.30 * contribution
+                         + 0.20 * economic_stability + 0.10 * (1.0 - entropy))
+            time_days += 1
+            
+            day = first_day + j + 1
+            if day % sample_every == 0 or day == total_days:
+                col = day // sample_every + (0 if day % sample_every == 0 else 1)
+                out[k, col, 0] = time_days
+                out[k, col, 1] = population
+                out[k, col, 2] = nxt_supply
+                out[k, col, 3] = floor_reserve
+                out[k, col, 4] = recycling_liquidity
+                out[k, col, 5] = contribution
+                out[k, col, 6] = distribution
+                out[k, col, 7] = growth_rate
+                out[k, col, 8] = entropy
+                out[k, col, 9] = stability
+                out[k, col, 10] = global_debt
+                out[k, col, 11] = credits
+        
+        state[k, 0] = time_days
+        state[k, 1] = population
+        state[k, 2] = nxt_supply
+        state[k, 3] = floor_reserve
+        state[k, 4] = recycling_liquidity
+        state[k, 5] = contribution
+        state[k, 6] = distribution
+        state[k, 7] = growth_rate
+        state[k, 8] = entropy
+        state[k, 9] = stability
+        state[k, 10] = global_debt
+        state[k, 11] = credits
+        pid[k, 0] = integral_error
+        pid[k, 1] = previous_error
+
+
+def trajectories_to_dataframe(trajectories: np.ndarray) -> pd.DataFrame:
+    """
+    Long-format DataFrame of ensemble trajectories
+    
+    Args:
+        trajectories: Structured array from CivilizationSimulator.simulate_ensemble
+    
+    Returns:
+        One row per (path, sample) with a 'path' column plus every state field
+    """
+    num_paths, num_samples = trajectories.shape
+    df = pd.DataFrame(trajectories.reshape(-1))
+    df.insert(0, 'path', np.repeat(np.arange(num_paths), num_samples))
+    return df
+
+
+def ensemble_bands(trajectories: np.ndarray, field_name: str,
+                   quantiles: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95)) -> pd.DataFrame:
+    """
+    Per-day quantile bands of one state field across paths (for fan charts)
+    
+    Args:
+        trajectories: Structured array from CivilizationSimulator.simulate_ensemble
+        field_name: CivilizationState field, e.g. 'stability_index'
+        quantiles: Quantile levels to compute
+    
+    Returns:
+        DataFrame indexed by time_days with 'mean' and one column per quantile
+    """
+    values = trajectories[field_name].astype(np.float64)
+    bands = np.quantile(values, quantiles, axis=0)
+    df = pd.DataFrame({f"q{q:g}": band for q, band in zip(quantiles, bands)},
+                      index=pd.Index(trajectories['time_days'][0], name='time_days'))
+    df.insert(0, 'mean', values.mean(axis=0))
+    return df
+
+
 class NexusEquationEngine:
     """
     Implements the Nexus differential equation for civilization metabolism:
@@ -252,19 +427,100 @@ class CivilizationSimulator:
         return new_state
     
     def simulate_days(self, days: int, verbose: bool = False):
-        """Simulate multiple days"""
-        for day in range(days):
-            state = self.simulate_day()
+        """
+        Simulate multiple days
+        
+        Runs the compiled kernel on a single path; draws the same np.random
+        stream as calling simulate_day() days times.
+        """
+        if days <= 0:
+            return self.current_state
+        
+        noise = np.random.standard_normal((days, 2))  # (contribution, growth) per day
+        chunk = (np.ascontiguousarray(noise[:, 0])[np.newaxis], np.ascontiguousarray(noise[:, 1])[np.newaxis])
+        trajectories, pid = self._run_paths([chunk], num_paths=1, days=days, sample_every=1)
+        self.nexus_engine.integral_error, self.nexus_engine.previous_error = pid[0].tolist()
+        
+        for day, row in enumerate(trajectories[0, 1:].tolist()):
+            state = CivilizationState(*row)
+            self.history.append(state)
             
             if verbose and (day % 30 == 0):  # Print monthly updates
                 print(f"Day {day:4d}: {state}")
         
+        self.current_state = self.history[-1]
         return self.current_state
     
     def simulate_years(self, years: int, verbose: bool = False):
         """Simulate multiple years"""
         return self.simulate_days(years * 365, verbose=verbose)
     
+    def simulate_ensemble(self, num_paths: int, days: int, sample_every: int = 1,
+                          seed: Optional[int] = None,
+                          noise: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                          chunk_days: int = 3650) -> np.ndarray:
+        """
+        Simulate independent paths from the current state without changing it
+        
+        Args:
+            num_paths: Number of paths (K)
+            days: Days to simulate (D)
+            sample_every: Record every n-th day (the last day is always recorded)
+            seed: Seed for the noise generator when noise is not given
+            noise: (contribution, growth) standard-normal arrays of shape (K, D)
+            chunk_days: Days of noise drawn per kernel call when generating it
+        
+        Returns:
+            Structured array (K, samples) with STATE_DTYPE fields; column 0 is
+            the current state
+        """
+        if noise is not None:
+            chunk = tuple(np.ascontiguousarray(n, dtype=np.float64) for n in noise)
+            if any(n.shape != (num_paths, days) for n in chunk):
+                raise ValueError(f"noise arrays must have shape ({num_paths}, {days})")
+            chunks = [chunk]
+        else:
+            rng = np.random.default_rng(seed)
+            chunks = (
+                (rng.standard_normal((num_paths, n)), rng.standard_normal((num_paths, n)))
+                for n in (min(chunk_days, days - start) for start in range(0, days, chunk_days))
+            )
+        
+        trajectories, _ = self._run_paths(chunks, num_paths, days, sample_every)
+        return trajectories
+    
+    def _run_paths(self, chunks, num_paths: int, days: int, sample_every: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Run the kernel from the current state; returns (trajectories, final PID state)"""
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        
+        engine = self.nexus_engine
+        params = np.array([
+            engine.alpha, engine.beta, engine.gamma, engine.delta,
+            engine.kp, engine.ki, engine.kd, engine.setpoint,
+            self.population_growth_rate, self.debt_growth_rate,
+            self.recycling_participation_rate, self.contribution_variance,
+            self.initial_population
+        ], dtype=np.float64)
+        
+        start = np.array([getattr(self.current_state, name) for name in STATE_FIELDS], dtype=np.float64)
+        state = np.tile(start, (num_paths, 1))
+        pid = np.tile([engine.integral_error, engine.previous_error], (num_paths, 1)).astype(np.float64)
+        num_samples = days // sample_every + (1 if days % sample_every else 0) + 1
+        out = np.empty((num_paths, num_samples, len(STATE_FIELDS)))
+        out[:, 0] = start
+        
+        first_day = 0
+        for contribution_chunk, growth_chunk in chunks:
+            advance_paths(state, pid, contribution_chunk, growth_chunk, params,
+                          first_day, days, sample_every, out)
+            first_day += contribution_chunk.shape[1]
+        
+        trajectories = np.empty((num_paths, num_samples), dtype=STATE_DTYPE)
+        for i, name in enumerate(STATE_FIELDS):
+            trajectories[name] = out[:, :, i]
+        return trajectories, pid
+    
     def get_summary_stats(self) -> dict:
         """Get summary statistics from simulation"""
         if not self.history:
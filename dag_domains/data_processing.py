@@ -4,9 +4,10 @@ Data Processing Domain Module
 Workflows for ETL, data transformations, ML pipelines, and report generation.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from task_orchestration import TaskOrchestrationDAG, TaskBuilder, TaskPriority
 from dag_domains import DomainModule, DomainRegistry
+from task_cache import TaskResultCache, get_shared_result_cache
 import json
 import pandas as pd
 from datetime import datetime
@@ -198,9 +199,14 @@ class DataProcessingHandlers:
 class DataProcessingDomain(DomainModule):
     """Data Processing domain with ETL, ML, and analytics workflows"""
     
-    def __init__(self):
+    def __init__(self, result_cache: Optional[TaskResultCache] = None):
         super().__init__()
         self.name = "data_processing"
+        
+        # Memoise pure pipeline stages so dashboard reruns only pay for changed
+        # stages; extracts (source data can change) and loads (side effects)
+        # are marked uncacheable and always run
+        self.result_cache = result_cache if result_cache is not None else get_shared_result_cache()
         self.description = "ETL, ML pipelines, and data analytics workflows"
         
         # Register handlers
@@ -227,7 +233,7 @@ class DataProcessingDomain(DomainModule):
         
         Flow: Extract → Validate → Transform → Load → Verify
         """
-        dag = TaskOrchestrationDAG()
+        dag = TaskOrchestrationDAG(result_cache=self.result_cache)
         self.register_handlers(dag)
         
         extract = (TaskBuilder('extract-data')
@@ -238,6 +244,7 @@ class DataProcessingDomain(DomainModule):
                 'query': 'SELECT * FROM sales'
             })
             .priority(TaskPriority.HIGH)
+            .cacheable(False)
             .build())
         
         validate = (TaskBuilder('validate-data')
@@ -265,6 +272,7 @@ class DataProcessingDomain(DomainModule):
                 'destination': 'data_warehouse'
             })
             .depends_on('transform-data')
+            .cacheable(False)
             .build())
         
         dag.add_task(extract)
@@ -280,13 +288,14 @@ class DataProcessingDomain(DomainModule):
         
         Flow: Extract data → Transform → Split → Train → Evaluate
         """
-        dag = TaskOrchestrationDAG()
+        dag = TaskOrchestrationDAG(result_cache=self.result_cache)
         self.register_handlers(dag)
         
         extract = (TaskBuilder('extract-training-data')
             .type('data')
             .operation('extract')
             .params({'source_type': 'database'})
+            .cacheable(False)
             .build())
         
         transform = (TaskBuilder('preprocess-data')
@@ -329,13 +338,14 @@ class DataProcessingDomain(DomainModule):
         
         Flow: Extract → Validate → Generate quality report
         """
-        dag = TaskOrchestrationDAG()
+        dag = TaskOrchestrationDAG(result_cache=self.result_cache)
         self.register_handlers(dag)
         
         extract = (TaskBuilder('extract-for-validation')
             .type('data')
             .operation('extract')
             .params({'source_type': 'production_db'})
+            .cacheable(False)
             .build())
         
         validate = (TaskBuilder('run-quality-checks')
@@ -0,0 +1,175 @@
+"""
+NexusOS Dashboard Registry
+==========================
+
+Maps launcher navigation entries to the module and render function that
+implement them. Dashboards are imported only when selected, so the launcher
+no longer pulls plotly, networkx, scipy, sklearn, numba and web3 in before
+the first page renders.
+
+Import cost is recorded per dashboard (wall time and number of newly loaded
+modules) and can be broken down with Python's ``-X importtime`` via
+profile_import().
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import importlib
+import re
+import subprocess
+import sys
+import threading
+import time
+
+
+# Navigation label -> (module path, render callable), in sidebar order
+DASHBOARD_MODULES: "OrderedDict[str, Tuple[str, str]]" = OrderedDict([
+    ("📱 Mobile Blockchain Hub", ("mobile_blockchain_hub", "render_mobile_blockchain_hub")),
+    ("💫 Economic Loop Dashboard", ("economic_loop_dashboard", "render_economic_loop_dashboard")),
+    ("⚛️ Avogadro Economics", ("avogadro_economics_dashboard", "main")),
+    ("🌍 Civilization Dashboard", ("civilization_dashboard", "main")),
+    ("💎 Web3 Wallet", ("web3_wallet_dashboard", "render_web3_wallet_dashboard")),
+    ("📡 WNSP Protocol v2.0", ("wnsp_dashboard_v2", "render_wnsp_v2_dashboard")),
+    ("🚀 WNSP Protocol v3.0", ("wnsp_v3_dashboard", "render_wnsp_v3_dashboard")),
+    ("💬 Mobile DAG Messaging", ("mobile_dag_messaging", "render_mobile_dag_messaging")),
+    ("🔗 Blockchain Explorer", ("blockchain_viz", "render_blockchain_dashboard")),
+    ("🔍 Transaction Search Explorer", ("transaction_search_explorer", "render_transaction_search_explorer")),
+    ("🚀 Napp Deployment Center", ("napp_deployment_center", "render_napp_deployment_center")),
+    ("💱 DEX (Token Exchange)", ("dex_page", "render_dex_page")),
+    ("⚡ GhostDAG System", ("ghostdag_page", "render_ghostdag_system")),
+    ("💰 Payment Layer", ("payment_layer_page", "render_payment_layer_page")),
+    ("🌈 Proof of Spectrum", ("proof_of_spectrum_page", "render_proof_of_spectrum")),
+    ("🏛️ Validator Economics", ("validator_economics_page", "render_validator_economics_page")),
+    ("💵 Wavelength Economics", ("wavelength_economics_dashboard", "render_wavelength_economics_dashboard")),
+    ("⚙️ Nexus Consensus", ("nexus_consensus_dashboard", "render_nexus_consensus_dashboard")),
+    ("📱 Mobile Connectivity", ("mobile_connectivity_dashboard", "show_mobile_connectivity_dashboard")),
+    ("📊 Long-term Supply", ("longterm_supply_dashboard", "render_longterm_supply_dashboard")),
+    ("🤖 AI Management Control", ("ai_management_dashboard", "render_ai_management_dashboard")),
+    ("💬 Talk to Nexus AI", ("nexus_ai_chat", "render_nexus_ai_chat")),
+    ("🌐 Offline Mesh Network", ("offline_mesh_dashboard", "render_offline_mesh_dashboard")),
+    ("🏛️ Civic Governance", ("civic_governance_dashboard", "main")),
+    ("🛡️ Sybil Detection System", ("sybil_dashboard", "render_sybil_detection_dashboard")),
+    ("⚖️ AI Arbitration & Moderation", ("ai_arbitration_dashboard", "render_arbitration_dashboard")),
+    ("🔒 Security Command Center", ("security_dashboard", "security_dashboard")),
+    ("🌊 WaveLang Studio", ("wavelength_code_interface", "render_wavelength_code_interface")),
+    ("🤖 WaveLang AI Teacher", ("wavelang_ai_teacher", "render_wavelang_ai_teacher")),
+    ("💻 WaveLang Binary Compiler", ("wavelang_compiler", "render_wavelang_compiler_dashboard")),
+    ("⚛️ Quantum Analyzer", ("quantum_wavelang_analyzer", "render_quantum_wavelang_analyzer")),
+])
+
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+class LazyDashboardRegistry:
+    """Resolves navigation entries to render functions on first use."""
+
+    def __init__(self, modules: Optional[Dict[str, Tuple[str, str]]] = None):
+        """
+        Initialize registry.
+
+        Args:
+            modules: Label -> (module path, callable name); defaults to DASHBOARD_MODULES
+        """
+        self.modules = OrderedDict(modules if modules is not None else DASHBOARD_MODULES)
+        self.import_stats: Dict[str, Dict[str, float]] = {}
+        self._resolved: Dict[str, Callable] = {}
+        self._lock = threading.Lock()
+
+    def labels(self) -> List[str]:
+        """Navigation labels in sidebar order."""
+        return list(self.modules)
+
+    def resolve(self, label: str) -> Callable:
+        """
+        Import a dashboard module (once) and return its render callable.
+
+        Args:
+            label: Navigation label
+
+        Returns:
+            Render function
+
+        Raises:
+            KeyError: Unknown navigation label
+        """
+        render = self._resolved.get(label)
+        if render is not None:
+            return render
+
+        module_path, attr = self.modules[label]
+        with self._lock:
+            render = self._resolved.get(label)
+            if render is None:
+                loaded_before = len(sys.modules)
+                start = time.perf_counter()
+                module = importlib.import_module(module_path)
+                elapsed = time.perf_counter() - start
+                render = getattr(module, attr)
+
+                self.import_stats[label] = {
+                    'module': module_path,
+                    'import_ms': elapsed * 1000,
+                    'modules_loaded': len(sys.modules) - loaded_before,
+                }
+                self._resolved[label] = render
+        return render
+
+    def render(self, label: str):
+        """Import (if needed) and render the selected dashboard."""
+        return self.resolve(label)()
+
+    def get_import_report(self) -> List[Dict[str, float]]:
+        """Recorded import costs, most expensive first."""
+        report = [dict(stats, label=label) for label, stats in self.import_stats.items()]
+        return sorted(report, key=lambda s: s['import_ms'], reverse=True)
+
+
+def profile_import(module_path: str, top: int = 15) -> Dict[str, object]:
+    """
+    Break down a cold import with ``python -X importtime``.
+
+    Runs in a fresh interpreter so already-loaded modules do not hide cost.
+
+    Args:
+        module_path: Module to import
+        top: Number of most expensive dependencies to return
+
+    Returns:
+        Dictionary with total cumulative microseconds and the top entries
+        as (module, self_us, cumulative_us)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_path}"],
+        capture_output=True, text=True
+    )
+
+    entries = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        entries.append((name, int(self_us), int(cumulative_us)))
+        if name == module_path and len(indent) <= 1:
+            total_us = int(cumulative_us)
+
+    entries.sort(key=lambda e: e[2], reverse=True)
+    return {
+        'module': module_path,
+        'ok': result.returncode == 0,
+        'total_us': total_us,
+        'top': entries[:top],
+    }
+
+
+_registry: Optional[LazyDashboardRegistry] = None
+
+
+def get_dashboard_registry() -> LazyDashboardRegistry:
+    """Process-wide registry (survives Streamlit reruns)."""
+    global _registry
+    if _registry is None:
+        _registry = LazyDashboardRegistry()
+    return _registry
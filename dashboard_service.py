@@ -1,12 +1,12 @@
 import streamlit as st
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy import desc, text
 import time
 
-from database import get_engine, MonitoringSnapshot, SimulationRun, User
-from oracle_sources import OracleManager
+from database import get_engine, get_session_factory, get_pool_metrics, MonitoringSnapshot, SimulationRun, User
+from oracle_sources import OracleManager, ORACLE_VARIABLES
+from metrics_store import MetricsStore, RAW_RESOLUTION, choose_resolution
 
 class DashboardDataService:
     """
@@ -16,10 +16,9 @@ class DashboardDataService:
     
     def __init__(self):
         self.engine = get_engine()
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        self.SessionLocal = get_session_factory()
+        self.metrics_store = MetricsStore(self.SessionLocal)
         self.oracle_manager = None
-        self._last_oracle_refresh = None
-        self._oracle_cache = {}
     
     def get_oracle_manager(self) -> OracleManager:
         """Get or create oracle manager instance."""
@@ -31,6 +30,10 @@ class DashboardDataService:
         """
         Capture and persist a monitoring snapshot.
         
+        Numeric metrics are also written to the metrics store (samples and
+        1m/1h rollups) in the same transaction; old samples are then pruned
+        at most once per the store's prune_interval.
+        
         Args:
             metrics: Dictionary of metric key-value pairs
             user_id: Optional user ID who triggered the snapshot
@@ -47,11 +50,13 @@ class DashboardDataService:
                 created_by=user_id
             )
             db.add(snapshot)
+            self.metrics_store.write(metrics, snapshot.captured_at, session=db)
             db.commit()
             db.refresh(snapshot)
-            return snapshot
         finally:
             db.close()
+        self.metrics_store.maybe_prune()
+        return snapshot
     
     def get_latest_metrics(self) -> Dict[str, Any]:
         """
@@ -101,7 +106,8 @@ class DashboardDataService:
         finally:
             db.close()
     
-    def get_metric_history(self, metric_key: str, hours: int = 24, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_metric_history(self, metric_key: str, hours: int = 24, limit: int = 100,
+                           resolution: str = RAW_RESOLUTION) -> List[Dict[str, Any]]:
         """
         Get historical values for a specific metric.
         
@@ -109,34 +115,40 @@ class DashboardDataService:
             metric_key: The metric to retrieve
             hours: How many hours of history to fetch
             limit: Maximum number of data points
+            resolution: 'raw' (default) for the last `limit` samples, or '1m'/'1h'
+                for bucket averages; choose_resolution(hours) suits long spans
             
         Returns:
-            List of {timestamp, value} dictionaries
+            List of {timestamp, value} dictionaries (rollup points carry the
+            bucket average plus min, max and count)
         """
-        db = self.SessionLocal()
-        try:
-            cutoff = datetime.utcnow() - timedelta(hours=hours)
-            
-            snapshots = db.query(MonitoringSnapshot).filter(
-                MonitoringSnapshot.captured_at >= cutoff
-            ).order_by(desc(MonitoringSnapshot.captured_at)).limit(limit).all()
-            
-            history = []
-            for snapshot in reversed(snapshots):
-                if metric_key in snapshot.metrics:
-                    history.append({
-                        'timestamp': snapshot.captured_at.isoformat(),
-                        'value': snapshot.metrics[metric_key]
-                    })
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        return self.metrics_store.get_history(metric_key, cutoff, resolution=resolution, limit=limit)
+    
+    def get_metric_summary(self, metric_key: str, hours: int = 24) -> Dict[str, Any]:
+        """
+        Get count/avg/min/max of a metric over the last hours, aggregated in SQL.
+        
+        Args:
+            metric_key: The metric to summarize
+            hours: Time span in hours
             
-            return history
-        finally:
-            db.close()
+        Returns:
+            Dictionary with count, avg, min and max
+        """
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        resolution = choose_resolution(hours)
+        return self.metrics_store.get_range_stats(metric_key, cutoff, resolution=resolution)
     
     @st.cache_data(ttl=10)
     def get_oracle_data(_self, refresh: bool = False) -> Dict[str, Any]:
         """
-        Get current oracle data with caching.
+        Get current oracle data.
+        
+        All sources are fetched concurrently by the oracle manager, which
+        also caches points (stale-while-revalidate) and skips sources whose
+        circuit is open, so this returns within the slowest healthy source's
+        deadline.
         
         Args:
             refresh: Force refresh from oracles
@@ -144,30 +156,14 @@ class DashboardDataService:
         Returns:
             Dictionary of oracle feed values
         """
-        current_time = time.time()
-        
-        if not refresh and _self._last_oracle_refresh:
-            time_since_refresh = current_time - _self._last_oracle_refresh
-            if time_since_refresh < 10:
-                return _self._oracle_cache
-        
         oracle_manager = _self.get_oracle_manager()
         oracle_data = {}
         
         try:
-            for source in oracle_manager.sources.values():
-                if source.is_connected:
-                    for var_name in ['H', 'M', 'D', 'E', 'C_cons', 'C_disp']:
-                        try:
-                            data_point = source.fetch_data(var_name)
-                            if data_point:
-                                oracle_data[f"{source.name}_{var_name}"] = data_point.value
-                        except:
-                            pass
-            
-            _self._oracle_cache = oracle_data
-            _self._last_oracle_refresh = current_time
-            
+            points = oracle_manager.fetch_all(ORACLE_VARIABLES, refresh=refresh)
+            for source_name, source_points in points.items():
+                for var_name, data_point in source_points.items():
+                    oracle_data[f"{source_name}_{var_name}"] = data_point.value
         except Exception as e:
             print(f"Oracle fetch error: {e}")
         
@@ -185,7 +181,8 @@ class DashboardDataService:
             'oracle_sources': {},
             'last_simulation': None,
             'total_simulations': 0,
-            'db_ping_ms': None
+            'db_ping_ms': None,
+            'db_pool': None
         }
         
         db = self.SessionLocal()
@@ -209,12 +206,19 @@ class DashboardDataService:
         finally:
             db.close()
         
+        try:
+            health['db_pool'] = get_pool_metrics()
+        except Exception as e:
+            print(f"Database pool metrics error: {e}")
+        
         oracle_manager = self.get_oracle_manager()
+        circuits = oracle_manager.get_circuit_status()
         for name, source in oracle_manager.sources.items():
             health['oracle_sources'][name] = {
                 'connected': source.is_connected,
                 'type': source.__class__.__name__,
-                'last_fetch': None
+                'last_fetch': source.last_update.isoformat() if source.last_update else None,
+                'circuit': circuits[name]['state']
             }
         
         return health
@@ -1,7 +1,12 @@
 import os
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, JSON, Text, Boolean, ForeignKey
+import threading
+import time
+from contextlib import contextmanager
+from sqlalchemy import create_engine, inspect, Column, Integer, Float, String, DateTime, JSON, Text, Boolean, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.exc import TimeoutError as SATimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.pool import QueuePool
 from datetime import datetime
 
 Base = declarative_base()
@@ -148,6 +153,35 @@ class MonitoringSnapshot(Base):
     metrics = Column(JSON, nullable=False)
     source_latency = Column(JSON, nullable=True)
     created_by = Column(Integer, ForeignKey('users.id'), nullable=True)
+
+class MetricSample(Base):
+    __tablename__ = 'metric_samples'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    ts = Column(DateTime, nullable=False)
+    key = Column(String(100), nullable=False)
+    value = Column(Float, nullable=False)
+    
+    __table_args__ = (
+        Index('ix_metric_samples_key_ts', 'key', 'ts'),
+    )
+
+class MetricRollup(Base):
+    __tablename__ = 'metric_rollups'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    resolution = Column(String(8), nullable=False)
+    key = Column(String(100), nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    count = Column(Integer, nullable=False)
+    sum = Column(Float, nullable=False)
+    min = Column(Float, nullable=False)
+    max = Column(Float, nullable=False)
+    last = Column(Float, nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint('resolution', 'key', 'bucket_start', name='uq_metric_rollups_bucket'),
+    )
     
 class AlertRule(Base):
     __tablename__ = 'alert_rules'
@@ -182,26 +216,186 @@ class AlertEvent(Base):
     
     rule = relationship("AlertRule", back_populates="alert_events")
 
-def get_engine():
-    database_url = os.getenv('DATABASE_URL')
+# Pool sizing (per process); override via environment for larger deployments
+POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout counts and time spent waiting for a connection."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+        self._metrics_lock = threading.Lock()
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except SATimeoutError:
+            with self._metrics_lock:
+                self.timeouts += 1
+            raise
+        waited = time.perf_counter() - start
+        with self._metrics_lock:
+            self.checkouts += 1
+            self.total_wait_seconds += waited
+            if waited > self.max_wait_seconds:
+                self.max_wait_seconds = waited
+        return connection
+    
+    def recreate(self):
+        pool = super().recreate()
+        pool.checkouts = self.checkouts
+        pool.total_wait_seconds = self.total_wait_seconds
+        pool.max_wait_seconds = self.max_wait_seconds
+        pool.timeouts = self.timeouts
+        return pool
+
+
+_engines = {}
+_session_factories = {}
+_initialized_urls = set()
+_registry_lock = threading.RLock()
+
+
+def get_database_url(database_url=None):
+    database_url = database_url or os.getenv('DATABASE_URL')
     if not database_url:
         raise ValueError("DATABASE_URL environment variable not set")
+    return database_url
+
+
+def _create_engine(database_url):
+    if database_url.startswith('sqlite'):
+        # SQLite connections are cheap and file-locked; keep SQLAlchemy's defaults
+        return create_engine(database_url, echo=False)
     
     return create_engine(
         database_url,
         echo=False,
+        poolclass=InstrumentedQueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
         pool_pre_ping=True,
-        pool_recycle=3600,
+        pool_recycle=POOL_RECYCLE,
+        pool_use_lifo=True,
         connect_args={
             'connect_timeout': 10,
             'options': '-c statement_timeout=30000'
         }
     )
 
-def init_db():
+
+def get_engine(database_url=None):
+    """
+    Process-wide engine for a database URL (default: DATABASE_URL).
+    
+    Engines and their connection pools are created lazily once per URL and
+    reused by every caller, so Streamlit reruns and Flask requests do not
+    repeat connection/TLS setup.
+    """
+    database_url = get_database_url(database_url)
+    engine = _engines.get(database_url)
+    if engine is None:
+        with _registry_lock:
+            engine = _engines.get(database_url)
+            if engine is None:
+                engine = _engines[database_url] = _create_engine(database_url)
+    return engine
+
+
+def get_session_factory(database_url=None, expire_on_commit=True):
+    """Shared sessionmaker bound to the registry engine for database_url."""
+    database_url = get_database_url(database_url)
+    key = (database_url, expire_on_commit)
+    factory = _session_factories.get(key)
+    if factory is None:
+        with _registry_lock:
+            factory = _session_factories.get(key)
+            if factory is None:
+                factory = _session_factories[key] = sessionmaker(
+                    bind=get_engine(database_url),
+                    expire_on_commit=expire_on_commit
+                )
+    return factory
+
+
+@contextmanager
+def session_scope(database_url=None):
+    """Transactional session: commit on success, roll back on error, always close."""
+    session = get_session_factory(database_url)()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def get_pool_metrics(database_url=None):
+    """
+    Connection pool metrics for monitoring.
+    
+    Returns:
+        Dictionary with pool size, checked-out/idle connections, overflow and
+        checkout wait statistics (zeros for pools without instrumentation)
+    """
+    engine = get_engine(database_url)
+    pool = engine.pool
+    checkouts = getattr(pool, 'checkouts', 0)
+    total_wait = getattr(pool, 'total_wait_seconds', 0.0)
+    
+    metrics = {
+        'pool_class': type(pool).__name__,
+        'checkouts': checkouts,
+        'avg_wait_ms': (total_wait / checkouts) * 1000 if checkouts else 0.0,
+        'max_wait_ms': getattr(pool, 'max_wait_seconds', 0.0) * 1000,
+        'timeouts': getattr(pool, 'timeouts', 0),
+    }
+    if isinstance(pool, QueuePool):
+        metrics.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            'overflow': max(pool.overflow(), 0),
+            'max_overflow': pool._max_overflow,
+        })
+    return metrics
+
+
+def dispose_engines():
+    """Close all pooled connections and clear the registry (tests, process shutdown)."""
+    with _registry_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _session_factories.clear()
+        _initialized_urls.clear()
+
+
+def init_db(database_url=None):
     try:
-        engine = get_engine()
-        Base.metadata.create_all(engine)
+        engine = get_engine(database_url)
+        url = get_database_url(database_url)
+        if url not in _initialized_urls:
+            new_metrics_store = not inspect(engine).has_table(MetricSample.__tablename__)
+            Base.metadata.create_all(engine)
+            if new_metrics_store:
+                # Chart history now comes from the metrics store; seed it with
+                # the snapshots captured before it existed
+                from metrics_store import MetricsStore
+                MetricsStore(get_session_factory(url)).backfill_from_snapshots()
+            _initialized_urls.add(url)
         return engine
     except Exception as e:
         print(f"Warning: Database initialization failed: {e}")
@@ -210,9 +404,7 @@ def init_db():
 
 def get_session():
     try:
-        engine = get_engine()
-        Session = sessionmaker(bind=engine)
-        return Session()
+        return get_session_factory()()
     except Exception as e:
         print(f"Warning: Could not create database session: {e}")
         return None
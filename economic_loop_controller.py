@@ -10,11 +10,17 @@ This is the central nervous system connecting all economic components.
 """
 
 import time
+import math
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+import numpy as np
+
 # Import existing components
 from orbital_transition_engine import (
     orbital_engine, OrbitalTransition, TransitionType
@@ -78,20 +84,162 @@ class OrbitalTransitionEvent:
     energy_nxt_units: int
 
 
+class LedgerSegment:
+    """
+    Columnar storage for the ledger entries of one time bucket.
+    
+    Appends go to per-column Python lists; seal() freezes the numeric
+    columns into NumPy arrays once the bucket has closed. Timestamps are
+    non-decreasing, so range lookups are binary searches.
+    """
+    
+    NUMERIC_COLUMNS = {
+        'timestamp': np.float64,
+        'delta_e_joules': np.float64,
+        'delta_e_nxt': np.float64,
+        'wavelength_nm': np.float64,
+        'spectral_region': np.int16,   # Index into SpectralRegion
+        'transition_type': np.int16,   # Index into TransitionType
+        'n_initial': np.int32,
+        'n_final': np.int32,
+    }
+    TEXT_COLUMNS = ('entry_id', 'sender_address', 'message_id')
+    
+    REGIONS = list(SpectralRegion)
+    TRANSITION_TYPES = list(TransitionType)
+    REGION_CODES = {region: i for i, region in enumerate(REGIONS)}
+    TRANSITION_TYPE_CODES = {transition_type: i for i, transition_type in enumerate(TRANSITION_TYPES)}
+    
+    def __init__(self, start: float, bucket_seconds: float):
+        self.start = start
+        self.end = start + bucket_seconds  # Exclusive bucket end
+        self.columns: Dict[str, Any] = {name: [] for name in (*self.NUMERIC_COLUMNS, *self.TEXT_COLUMNS)}
+        self.sealed = False
+    
+    def __len__(self) -> int:
+        return len(self.columns['timestamp'])
+    
+    def append(self, entry: TransitionReserveEntry):
+        """Append one entry (segment must not be sealed)"""
+        columns = self.columns
+        columns['timestamp'].append(entry.timestamp)
+        columns['delta_e_joules'].append(entry.delta_e_joules)
+        columns['delta_e_nxt'].append(entry.delta_e_nxt)
+        columns['wavelength_nm'].append(entry.wavelength_nm)
+        columns['spectral_region'].append(self.REGION_CODES[entry.spectral_region])
+        columns['transition_type'].append(self.TRANSITION_TYPE_CODES[entry.transition_type])
+        columns['n_initial'].append(entry.n_initial)
+        columns['n_final'].append(entry.n_final)
+        columns['entry_id'].append(entry.entry_id)
+        columns['sender_address'].append(entry.sender_address)
+        columns['message_id'].append(entry.message_id)
+    
+    def extend(self, entries: List[TransitionReserveEntry]):
+        """Append many entries column by column (segment must not be sealed)"""
+        columns = self.columns
+        columns['timestamp'].extend([e.timestamp for e in entries])
+        columns['delta_e_joules'].extend([e.delta_e_joules for e in entries])
+        columns['delta_e_nxt'].extend([e.delta_e_nxt for e in entries])
+        columns['wavelength_nm'].extend([e.wavelength_nm for e in entries])
+        columns['spectral_region'].extend([self.REGION_CODES[e.spectral_region] for e in entries])
+        columns['transition_type'].extend([self.TRANSITION_TYPE_CODES[e.transition_type] for e in entries])
+        columns['n_initial'].extend([e.n_initial for e in entries])
+        columns['n_final'].extend([e.n_final for e in entries])
+        columns['entry_id'].extend([e.entry_id for e in entries])
+        columns['sender_address'].extend([e.sender_address for e in entries])
+        columns['message_id'].extend([e.message_id for e in entries])
+    
+    def seal(self):
+        """Freeze numeric columns into NumPy arrays"""
+        if not self.sealed:
+            for name, dtype in self.NUMERIC_COLUMNS.items():
+                self.columns[name] = np.asarray(self.columns[name], dtype=dtype)
+            self.sealed = True
+    
+    def bounds(self, start_time: float, end_time: float) -> Tuple[int, int]:
+        """Row range [lo, hi) with start_time <= timestamp <= end_time"""
+        timestamps = self.columns['timestamp']
+        if self.sealed:
+            return (int(np.searchsorted(timestamps, start_time, side='left')),
+                    int(np.searchsorted(timestamps, end_time, side='right')))
+        return bisect_left(timestamps, start_time), bisect_right(timestamps, end_time)
+    
+    def entry(self, i: int) -> TransitionReserveEntry:
+        """Rebuild row i as a TransitionReserveEntry"""
+        columns = self.columns
+        return TransitionReserveEntry(
+            entry_id=columns['entry_id'][i],
+            timestamp=float(columns['timestamp'][i]),
+            transition_type=self.TRANSITION_TYPES[int(columns['transition_type'][i])],
+            spectral_region=self.REGIONS[int(columns['spectral_region'][i])],
+            delta_e_joules=float(columns['delta_e_joules'][i]),
+            delta_e_nxt=float(columns['delta_e_nxt'][i]),
+            wavelength_nm=float(columns['wavelength_nm'][i]),
+            sender_address=columns['sender_address'][i],
+            message_id=columns['message_id'][i],
+            n_initial=int(columns['n_initial'][i]),
+            n_final=int(columns['n_final'][i])
+        )
+    
+    def to_dict(self) -> Dict:
+        return {
+            'start': self.start,
+            'end': self.end,
+            'sealed': self.sealed,
+            'columns': {
+                name: values.tolist() if isinstance(values, np.ndarray) else list(values)
+                for name, values in self.columns.items()
+            }
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LedgerSegment':
+        segment = cls(data['start'], data['end'] - data['start'])
+        segment.columns = {name: list(values) for name, values in data['columns'].items()}
+        if data['sealed']:
+            segment.seal()
+        return segment
+
+
 class TransitionReserveLedger:
     """
     Ledger tracking all orbital transitions flowing into TRANSITION_RESERVE pool.
     
     Provides audit trail and energy accounting for the economic loop.
+    Entries live in time-bucketed columnar segments; totals per spectral
+    region are kept as they are added, so balance and distribution queries
+    do not depend on ledger size.
     """
     
-    def __init__(self):
-        """Initialize the transition reserve ledger"""
-        self.entries: List[TransitionReserveEntry] = []
+    SNAPSHOT_VERSION = 1
+    
+    def __init__(self, bucket_seconds: float = 3600.0):
+        """
+        Initialize the transition reserve ledger
+        
+        Args:
+            bucket_seconds: Time span covered by each segment
+        """
+        self.bucket_seconds = bucket_seconds
+        self.segments: List[LedgerSegment] = []
+        self._segment_starts: List[float] = []
         self.total_energy_joules = 0.0
         self.total_energy_nxt = 0.0
-        self.entries_by_spectral: Dict[SpectralRegion, List[TransitionReserveEntry]] = {}
-        
+        self.entry_count = 0         # All entries ever added, including compacted ones
+        self.compacted_entries = 0   # Entries dropped by compact()
+        self.region_entry_counts: Dict[SpectralRegion, int] = {}
+        self.region_energy_nxt: Dict[SpectralRegion, float] = {}
+        self._last_timestamp = 0.0
+    
+    def __len__(self) -> int:
+        """Entries still held in segments"""
+        return self.entry_count - self.compacted_entries
+    
+    @property
+    def entries(self) -> List[TransitionReserveEntry]:
+        """All retained entries in time order (materialised; O(n))"""
+        return [segment.entry(i) for segment in self.segments for i in range(len(segment))]
+    
     def add_entry(
         self,
         transition: OrbitalTransition,
@@ -109,11 +257,13 @@ class TransitionReserveLedger:
         Returns:
             TransitionReserveEntry
         """
-        entry_id = f"TRE_{int(time.time() * 1000)}_{len(self.entries)}"
+        # Keep timestamps non-decreasing so segments stay sorted
+        timestamp = max(time.time(), self._last_timestamp)
+        entry_id = f"TRE_{int(timestamp * 1000)}_{self.entry_count}"
         
         entry = TransitionReserveEntry(
             entry_id=entry_id,
-            timestamp=time.time(),
+            timestamp=timestamp,
             transition_type=transition.transition_type,
             spectral_region=transition.spectral_region,
             delta_e_joules=transition.delta_e_joules,
@@ -126,31 +276,107 @@ class TransitionReserveLedger:
         )
         
         # Add to ledger
-        self.entries.append(entry)
+        self._segment_for(timestamp).append(entry)
+        self._last_timestamp = timestamp
+        self.entry_count += 1
         
         # Update totals
         self.total_energy_joules += entry.delta_e_joules
         self.total_energy_nxt += entry.delta_e_nxt
         
-        # Index by spectral region
-        if entry.spectral_region not in self.entries_by_spectral:
-            self.entries_by_spectral[entry.spectral_region] = []
-        self.entries_by_spectral[entry.spectral_region].append(entry)
+        # Running totals by spectral region
+        region = entry.spectral_region
+        self.region_entry_counts[region] = self.region_entry_counts.get(region, 0) + 1
+        self.region_energy_nxt[region] = self.region_energy_nxt.get(region, 0.0) + entry.delta_e_nxt
         
         return entry
     
+    def add_entries(
+        self,
+        records: List[Tuple[OrbitalTransition, str, Optional[str]]]
+    ) -> List[TransitionReserveEntry]:
+        """
+        Add many orbital transitions under one timestamp.
+        
+        Entries, ids and totals are the same as calling add_entry for each
+        record at that instant; rows go into the open segment in one extend.
+        
+        Args:
+            records: (transition, sender_address, message_id) tuples, in order
+        
+        Returns:
+            TransitionReserveEntry per record
+        """
+        if not records:
+            return []
+        
+        timestamp = max(time.time(), self._last_timestamp)
+        timestamp_ms = int(timestamp * 1000)
+        entries = []
+        for i, (transition, sender_address, message_id) in enumerate(records, start=self.entry_count):
+            entries.append(TransitionReserveEntry(
+                entry_id=f"TRE_{timestamp_ms}_{i}",
+                timestamp=timestamp,
+                transition_type=transition.transition_type,
+                spectral_region=transition.spectral_region,
+                delta_e_joules=transition.delta_e_joules,
+                delta_e_nxt=transition.delta_e_nxt,
+                wavelength_nm=transition.wavelength_nm,
+                sender_address=sender_address,
+                message_id=message_id,
+                n_initial=transition.n_initial,
+                n_final=transition.n_final
+            ))
+        
+        self._segment_for(timestamp).extend(entries)
+        self._last_timestamp = timestamp
+        self.entry_count += len(entries)
+        
+        # Same accumulation order as add_entry, so totals agree exactly
+        for entry in entries:
+            self.total_energy_joules += entry.delta_e_joules
+            self.total_energy_nxt += entry.delta_e_nxt
+            region = entry.spectral_region
+            self.region_entry_counts[region] = self.region_entry_counts.get(region, 0) + 1
+            self.region_energy_nxt[region] = self.region_energy_nxt.get(region, 0.0) + entry.delta_e_nxt
+        
+        return entries
+    
+    def _segment_for(self, timestamp: float) -> LedgerSegment:
+        """Open segment for timestamp, sealing the previous one when its bucket closes"""
+        if self.segments and timestamp < self.segments[-1].end:
+            return self.segments[-1]
+        
+        if self.segments:
+            self.segments[-1].seal()
+        start = math.floor(timestamp / self.bucket_seconds) * self.bucket_seconds
+        segment = LedgerSegment(start, self.bucket_seconds)
+        self.segments.append(segment)
+        self._segment_starts.append(start)
+        return segment
+    
     def get_reserve_balance(self) -> Dict[str, Any]:
         """Get current reserve pool balance"""
         return {
             'total_energy_joules': self.total_energy_joules,
             'total_energy_nxt': self.total_energy_nxt,
-            'total_entries': len(self.entries),
+            'total_entries': self.entry_count,
             'spectral_distribution': {
-                region.name: len(entries) 
-                for region, entries in self.entries_by_spectral.items()
+                region.name: count
+                for region, count in self.region_entry_counts.items()
             }
         }
     
+    def _segments_in_range(self, start_time: float, end_time: float):
+        """Yield (segment, lo, hi) row ranges covering [start_time, end_time]"""
+        first = max(0, bisect_right(self._segment_starts, start_time) - 1)
+        for segment in islice(self.segments, first, None):
+            if segment.start > end_time:
+                break
+            lo, hi = segment.bounds(start_time, end_time)
+            if lo < hi:
+                yield segment, lo, hi
+    
     def get_entries_by_timerange(
         self, 
         start_time: float, 
@@ -158,17 +384,78 @@ class TransitionReserveLedger:
     ) -> List[TransitionReserveEntry]:
         """Get ledger entries within time range"""
         return [
-            entry for entry in self.entries
-            if start_time <= entry.timestamp <= end_time
+            segment.entry(i)
+            for segment, lo, hi in self._segments_in_range(start_time, end_time)
+            for i in range(lo, hi)
         ]
     
+    def count_entries_by_timerange(self, start_time: float, end_time: float) -> int:
+        """Number of retained entries within time range (no entries are built)"""
+        return sum(hi - lo for _, lo, hi in self._segments_in_range(start_time, end_time))
+    
     def get_spectral_energy_distribution(self) -> Dict[str, float]:
         """Get energy distribution across spectral regions"""
-        distribution = {}
-        for region, entries in self.entries_by_spectral.items():
-            total_nxt = sum(e.delta_e_nxt for e in entries)
-            distribution[region.name] = total_nxt
-        return distribution
+        return {region.name: total_nxt for region, total_nxt in self.region_energy_nxt.items()}
+    
+    def compact(self, before: float) -> int:
+        """
+        Drop segments whose bucket ends at or before a cutoff.
+        
+        Totals and per-region distributions still include compacted entries;
+        only their individual rows are released.
+        
+        Args:
+            before: Cutoff timestamp
+        
+        Returns:
+            Number of entries dropped
+        """
+        keep = bisect_right(self._segment_starts, before - self.bucket_seconds)
+        if keep and self.segments[keep - 1] is self.segments[-1] and self.segments[-1].end > before:
+            keep -= 1
+        dropped = sum(len(segment) for segment in self.segments[:keep])
+        del self.segments[:keep]
+        del self._segment_starts[:keep]
+        self.compacted_entries += dropped
+        return dropped
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serialisable copy of the ledger, for restore()"""
+        return {
+            'version': self.SNAPSHOT_VERSION,
+            'bucket_seconds': self.bucket_seconds,
+            'total_energy_joules': self.total_energy_joules,
+            'total_energy_nxt': self.total_energy_nxt,
+            'entry_count': self.entry_count,
+            'compacted_entries': self.compacted_entries,
+            'last_timestamp': self._last_timestamp,
+            'region_entry_counts': {r.name: n for r, n in self.region_entry_counts.items()},
+            'region_energy_nxt': {r.name: e for r, e in self.region_energy_nxt.items()},
+            'segments': [segment.to_dict() for segment in self.segments]
+        }
+    
+    @classmethod
+    def restore(cls, snapshot: Dict[str, Any]) -> 'TransitionReserveLedger':
+        """
+        Rebuild a ledger from snapshot()
+        
+        Raises:
+            ValueError: If the snapshot version is not supported
+        """
+        if snapshot.get('version') != cls.SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported ledger snapshot version: {snapshot.get('version')}")
+        
+        ledger = cls(bucket_seconds=snapshot['bucket_seconds'])
+        ledger.total_energy_joules = snapshot['total_energy_joules']
+        ledger.total_energy_nxt = snapshot['total_energy_nxt']
+        ledger.entry_count = snapshot['entry_count']
+        ledger.compacted_entries = snapshot['compacted_entries']
+        ledger._last_timestamp = snapshot['last_timestamp']
+        ledger.region_entry_counts = {SpectralRegion[r]: n for r, n in snapshot['region_entry_counts'].items()}
+        ledger.region_energy_nxt = {SpectralRegion[r]: e for r, e in snapshot['region_energy_nxt'].items()}
+        ledger.segments = [LedgerSegment.from_dict(data) for data in snapshot['segments']]
+        ledger._segment_starts = [segment.start for segment in ledger.segments]
+        return ledger
 
 
 class MessagingFlowController:
@@ -182,7 +469,8 @@ class MessagingFlowController:
     def __init__(
         self,
         token_system: NativeTokenSystem,
-        ledger: TransitionReserveLedger
+        ledger: TransitionReserveLedger,
+        max_events: int = 10_000
     ):
         """
         Initialize messaging flow controller.
@@ -190,10 +478,12 @@ class MessagingFlowController:
         Args:
             token_system: Native token system for NXT transfers
             ledger: Transition reserve ledger for accounting
+            max_events: Recent events kept in memory (the ledger keeps the full history)
         """
         self.token_system = token_system
         self.ledger = ledger
-        self.events: List[OrbitalTransitionEvent] = []
+        self.events: deque = deque(maxlen=max_events)
+        self.total_events = 0
         
     def process_message_burn(
         self,
@@ -265,7 +555,7 @@ class MessagingFlowController:
         
         # Create event for downstream consumers
         event = OrbitalTransitionEvent(
-            event_id=f"OTE_{int(time.time() * 1000)}_{len(self.events)}",
+            event_id=f"OTE_{int(time.time() * 1000)}_{self.total_events}",
             timestamp=time.time(),
             transition=transition,
             sender=sender_address,
@@ -276,6 +566,7 @@ class MessagingFlowController:
         )
         
         self.events.append(event)
+        self.total_events += 1
         
         return (
             True,
@@ -283,6 +574,99 @@ class MessagingFlowController:
             event
         )
     
+    def process_message_burns(
+        self,
+        messages: List[Tuple]
+    ) -> List[Tuple[bool, str, Optional[OrbitalTransitionEvent]]]:
+        """
+        Process many message burns in one pass.
+        
+        Equivalent to calling process_message_burn for each message in
+        order, but transitions are built once per transition type, all
+        burns settle through a single bulk transfer into TRANSITION_RESERVE,
+        and ledger entries are appended together.
+        
+        Args:
+            messages: (sender_address, message_id, burn_amount_nxt,
+                wavelength_nm[, message_type]) tuples
+        
+        Returns:
+            (success, message, event) per message, in order
+        """
+        if not messages:
+            return []
+        
+        # Map message types to transition types (once per distinct type)
+        transition_types: Dict[str, TransitionType] = {}
+        requests = []
+        for message in messages:
+            message_type = message[4] if len(message) > 4 else "standard"
+            if message_type not in transition_types:
+                transition_types[message_type] = self._map_message_to_transition(message_type)
+            requests.append((message[0], message[1], message[2], message_type))
+        
+        reserve_account = self.token_system.get_account("TRANSITION_RESERVE")
+        if reserve_account is None:
+            self.token_system.create_account("TRANSITION_RESERVE", initial_balance=0)
+            reserve_account = self.token_system.get_account("TRANSITION_RESERVE")
+        reserve_balance = int(reserve_account.balance)
+        
+        # 💰 PRODUCTION ATOMIC TRANSFER: one bulk transfer for every burn
+        units_per_nxt = self.token_system.UNITS_PER_NXT
+        burn_amounts_units = [int(burn_amount_nxt * units_per_nxt) for _, _, burn_amount_nxt, _ in requests]
+        transfers = self.token_system.transfer_atomic_batch(
+            [(sender_address, units) for (sender_address, _, _, _), units in zip(requests, burn_amounts_units)],
+            to_address="TRANSITION_RESERVE",
+            fee=0,  # No fee for orbital transitions (physics-based pricing)
+            reasons=[f"Orbital transition: {message_id} ({message_type})"
+                     for _, message_id, _, message_type in requests]
+        )
+        
+        # Reserve balance each message would have seen before its own transfer
+        transition_requests = []
+        for (sender_address, _, _, message_type), units, (success, _, _) in zip(requests, burn_amounts_units, transfers):
+            transition_requests.append((transition_types[message_type], sender_address, reserve_balance))
+            if success:
+                reserve_balance += units
+        transitions = orbital_engine.execute_transitions(transition_requests)
+        
+        # Record successful burns in ledger
+        entries = iter(self.ledger.add_entries([
+            (transition, sender_address, message_id)
+            for (sender_address, message_id, _, _), (transition, _), (success, _, _)
+            in zip(requests, transitions, transfers) if success
+        ]))
+        
+        now = time.time()
+        now_ms = int(now * 1000)
+        results: List[Tuple[bool, str, Optional[OrbitalTransitionEvent]]] = []
+        for (sender_address, _, burn_amount_nxt, _), (transition, nxt_units), (success, _, msg) in zip(
+            requests, transitions, transfers
+        ):
+            if not success:
+                results.append((False, f"Atomic transfer failed: {msg}", None))
+                continue
+            
+            event = OrbitalTransitionEvent(
+                event_id=f"OTE_{now_ms}_{self.total_events}",
+                timestamp=now,
+                transition=transition,
+                sender=sender_address,
+                reserve_entry_id=next(entries).entry_id,
+                spectral_region=transition.spectral_region,
+                energy_joules=transition.delta_e_joules,
+                energy_nxt_units=nxt_units
+            )
+            self.events.append(event)
+            self.total_events += 1
+            results.append((
+                True,
+                f"Message burn processed: {burn_amount_nxt:.6f} NXT → TRANSITION_RESERVE",
+                event
+            ))
+        
+        return results
+    
     def _map_message_to_transition(self, message_type: str) -> TransitionType:
         """Map message type to orbital transition type"""
         mapping = {
@@ -294,19 +678,19 @@ class MessagingFlowController:
         return mapping.get(message_type.lower(), TransitionType.STANDARD_MESSAGE)
     
     def get_recent_events(self, limit: int = 100) -> List[OrbitalTransitionEvent]:
-        """Get recent orbital transition events"""
-        return self.events[-limit:]
+        """Get recent orbital transition events (oldest first, at most max_events)"""
+        recent = list(islice(reversed(self.events), max(0, limit)))
+        recent.reverse()
+        return recent
     
     def get_flow_statistics(self) -> Dict[str, Any]:
         """Get messaging flow statistics"""
+        now = time.time()
         return {
-            'total_events': len(self.events),
+            'total_events': self.total_events,
             'reserve_balance': self.ledger.get_reserve_balance(),
             'spectral_distribution': self.ledger.get_spectral_energy_distribution(),
-            'recent_activity': len([
-                e for e in self.events
-                if e.timestamp > time.time() - 3600  # Last hour
-            ])
+            'recent_activity': self.ledger.count_entries_by_timerange(now - 3600, now)  # Last hour
         }
 
 
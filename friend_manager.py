@@ -11,165 +11,207 @@ import json
 from datetime import datetime
 from typing import List, Dict, Optional
 
+from pg_pool import get_pg_pool, pooled_connection, execute_prepared
+
+FRIEND_COLUMNS = "id, friend_name, friend_contact, device_id, added_at"
+
+# Prepared statements ($n placeholders), prepared once per pooled connection
+STATEMENTS = {
+    'friends_insert': """
+        INSERT INTO friends (user_id, friend_name, friend_contact, device_id)
+        VALUES ($1, $2, $3, $4)
+        RETURNING id, added_at
+    """,
+    'friends_by_user': f"""
+        SELECT {FRIEND_COLUMNS}
+        FROM friends
+        WHERE user_id = $1
+        ORDER BY added_at DESC
+    """,
+    'friends_by_users': f"""
+        SELECT user_id, {FRIEND_COLUMNS}
+        FROM friends
+        WHERE user_id = ANY($1::varchar[])
+        ORDER BY added_at DESC
+    """,
+    'friends_delete': """
+        DELETE FROM friends
+        WHERE id = $1 AND user_id = $2
+    """,
+    'friends_by_contact': f"""
+        SELECT {FRIEND_COLUMNS}
+        FROM friends
+        WHERE user_id = $1 AND friend_contact = $2
+    """,
+}
+
+
+def _row_to_friend(row) -> Dict:
+    """Convert a (id, name, contact, device_id, added_at) row to a friend dict"""
+    return {
+        'id': row[0],
+        'name': row[1],
+        'contact': row[2],
+        'device_id': row[3],
+        'added_at': row[4].isoformat() if row[4] else None
+    }
+
+
 class FriendManager:
     """Manages friend relationships for WNSP users"""
     
-    def __init__(self):
-        """Initialize database connection"""
-        self.db_url = os.environ.get('DATABASE_URL')
-        if not self.db_url:
+    def __init__(self, database_url: Optional[str] = None, pool=None):
+        """
+        Initialize friend manager on the shared connection pool
+        
+        Args:
+            database_url: Database URL (default: DATABASE_URL)
+            pool: Optional psycopg2 pool to use instead of the shared one
+        """
+        self.db_url = database_url or os.environ.get('DATABASE_URL')
+        if not self.db_url and pool is None:
             raise ValueError("DATABASE_URL environment variable not set")
         
+        self.pool = pool or get_pg_pool(self.db_url)
         self._init_database()
     
     def _get_connection(self):
-        """Get database connection"""
-        return psycopg2.connect(self.db_url)
+        """Borrow a pooled database connection (context manager)"""
+        return pooled_connection(pool=self.pool)
+    
+    def _execute(self, cur, name: str, params=()):
+        execute_prepared(cur, name, STATEMENTS[name], params)
     
     def _init_database(self):
         """Create friends table if it doesn't exist"""
-        conn = self._get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS friends (
-                        id SERIAL PRIMARY KEY,
-                        user_id VARCHAR(255) NOT NULL,
-                        friend_name VARCHAR(255) NOT NULL,
-                        friend_contact VARCHAR(255) NOT NULL,
-                        device_id VARCHAR(255),
-                        added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(user_id, friend_contact)
-                    )
-                """)
-                conn.commit()
-                print("✅ Friends table initialized")
-        except Exception as e:
-            print(f"❌ Database initialization error: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
+        with self._get_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        CREATE TABLE IF NOT EXISTS friends (
+                            id SERIAL PRIMARY KEY,
+                            user_id VARCHAR(255) NOT NULL,
+                            friend_name VARCHAR(255) NOT NULL,
+                            friend_contact VARCHAR(255) NOT NULL,
+                            device_id VARCHAR(255),
+                            added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            UNIQUE(user_id, friend_contact)
+                        )
+                    """)
+                    conn.commit()
+                    print("✅ Friends table initialized")
+            except Exception as e:
+                print(f"❌ Database initialization error: {e}")
+                conn.rollback()
     
     def add_friend(self, user_id: str, friend_name: str, friend_contact: str, device_id: Optional[str] = None) -> Dict:
         """Add a new friend"""
-        conn = self._get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO friends (user_id, friend_name, friend_contact, device_id)
-                    VALUES (%s, %s, %s, %s)
-                    RETURNING id, added_at
-                """, (user_id, friend_name, friend_contact, device_id))
-                
-                result = cur.fetchone()
-                conn.commit()
-                
-                if not result:
+        with self._get_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    self._execute(cur, 'friends_insert', (user_id, friend_name, friend_contact, device_id))
+                    
+                    result = cur.fetchone()
+                    conn.commit()
+                    
+                    if not result:
+                        return {
+                            'success': False,
+                            'error': 'Failed to add friend'
+                        }
+                    
                     return {
-                        'success': False,
-                        'error': 'Failed to add friend'
+                        'success': True,
+                        'friend': {
+                            'id': result[0],
+                            'name': friend_name,
+                            'contact': friend_contact,
+                            'device_id': device_id,
+                            'added_at': result[1].isoformat()
+                        }
                     }
-                
+            except psycopg2.IntegrityError:
+                conn.rollback()
                 return {
-                    'success': True,
-                    'friend': {
-                        'id': result[0],
-                        'name': friend_name,
-                        'contact': friend_contact,
-                        'device_id': device_id,
-                        'added_at': result[1].isoformat()
-                    }
+                    'success': False,
+                    'error': 'Friend already exists'
+                }
+            except Exception as e:
+                conn.rollback()
+                return {
+                    'success': False,
+                    'error': str(e)
                 }
-        except psycopg2.IntegrityError:
-            conn.rollback()
-            return {
-                'success': False,
-                'error': 'Friend already exists'
-            }
-        except Exception as e:
-            conn.rollback()
-            return {
-                'success': False,
-                'error': str(e)
-            }
-        finally:
-            conn.close()
     
     def get_friends(self, user_id: str) -> List[Dict]:
         """Get all friends for a user"""
-        conn = self._get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT id, friend_name, friend_contact, device_id, added_at
-                    FROM friends
-                    WHERE user_id = %s
-                    ORDER BY added_at DESC
-                """, (user_id,))
-                
-                friends = []
-                for row in cur.fetchall():
-                    friends.append({
-                        'id': row[0],
-                        'name': row[1],
-                        'contact': row[2],
-                        'device_id': row[3],
-                        'added_at': row[4].isoformat() if row[4] else None
-                    })
-                
+        with self._get_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    self._execute(cur, 'friends_by_user', (user_id,))
+                    friends = [_row_to_friend(row) for row in cur.fetchall()]
+                conn.commit()
                 return friends
-        except Exception as e:
-            print(f"❌ Get friends error: {e}")
-            return []
-        finally:
-            conn.close()
+            except Exception as e:
+                print(f"❌ Get friends error: {e}")
+                conn.rollback()
+                return []
+    
+    def get_friends_many(self, user_ids: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Get friends for several users in one round trip (broadcast fan-out)
+        
+        Args:
+            user_ids: User IDs to look up
+        
+        Returns:
+            Mapping of every requested user ID to its friends (newest first)
+        """
+        unique_ids = list(dict.fromkeys(user_ids))
+        friends_by_user: Dict[str, List[Dict]] = {uid: [] for uid in unique_ids}
+        if not unique_ids:
+            return friends_by_user
+        
+        with self._get_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    self._execute(cur, 'friends_by_users', (unique_ids,))
+                    for row in cur.fetchall():
+                        friends_by_user[row[0]].append(_row_to_friend(row[1:]))
+                conn.commit()
+            except Exception as e:
+                print(f"❌ Get friends (batch) error: {e}")
+                conn.rollback()
+        
+        return friends_by_user
     
     def remove_friend(self, user_id: str, friend_id: int) -> bool:
         """Remove a friend"""
-        conn = self._get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    DELETE FROM friends
-                    WHERE id = %s AND user_id = %s
-                """, (friend_id, user_id))
-                
-                deleted = cur.rowcount > 0
-                conn.commit()
-                return deleted
-        except Exception as e:
-            print(f"❌ Remove friend error: {e}")
-            conn.rollback()
-            return False
-        finally:
-            conn.close()
+        with self._get_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    self._execute(cur, 'friends_delete', (friend_id, user_id))
+                    deleted = cur.rowcount > 0
+                    conn.commit()
+                    return deleted
+            except Exception as e:
+                print(f"❌ Remove friend error: {e}")
+                conn.rollback()
+                return False
     
     def get_friend_by_contact(self, user_id: str, friend_contact: str) -> Optional[Dict]:
         """Get friend by contact"""
-        conn = self._get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT id, friend_name, friend_contact, device_id, added_at
-                    FROM friends
-                    WHERE user_id = %s AND friend_contact = %s
-                """, (user_id, friend_contact))
-                
-                row = cur.fetchone()
-                if row:
-                    return {
-                        'id': row[0],
-                        'name': row[1],
-                        'contact': row[2],
-                        'device_id': row[3],
-                        'added_at': row[4].isoformat() if row[4] else None
-                    }
+        with self._get_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    self._execute(cur, 'friends_by_contact', (user_id, friend_contact))
+                    row = cur.fetchone()
+                conn.commit()
+                return _row_to_friend(row) if row else None
+            except Exception as e:
+                print(f"❌ Get friend by contact error: {e}")
+                conn.rollback()
                 return None
-        except Exception as e:
-            print(f"❌ Get friend by contact error: {e}")
-            return None
-        finally:
-            conn.close()
 
 
 # Global instance
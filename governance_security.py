@@ -16,6 +16,9 @@ from dataclasses import dataclass
 from collections import defaultdict
 import math
 
+import numpy as np
+from scipy import sparse
+
 # Active intervention integration
 try:
     from active_intervention_engine import get_intervention_engine
@@ -377,6 +380,96 @@ class ValidatorCollisionDetection:
         
         return is_collusion, correlation
     
+    def _vote_matrices(self, validators: List[str]) -> Tuple[sparse.csr_matrix, sparse.csr_matrix]:
+        """
+        Sparse (validator x proposal) participation and (validator x
+        proposal/direction) choice matrices. A validator's last vote on a
+        proposal wins, as in detect_voting_collusion.
+        """
+        proposal_index: Dict[str, int] = {}
+        choice_index: Dict[Tuple[str, str], int] = {}
+        rows, proposal_cols, choice_cols = [], [], []
+        for row, validator in enumerate(validators):
+            latest = {pid: direction for pid, direction in self.voting_patterns.get(validator, ())}
+            for pid, direction in latest.items():
+                rows.append(row)
+                proposal_cols.append(proposal_index.setdefault(pid, len(proposal_index)))
+                choice_cols.append(choice_index.setdefault((pid, direction), len(choice_index)))
+        
+        data = np.ones(len(rows), dtype=np.int32)
+        shape = (len(validators), len(proposal_index))
+        participation = sparse.csr_matrix((data, (rows, proposal_cols)), shape=shape)
+        choices = sparse.csr_matrix((data, (rows, choice_cols)), shape=(len(validators), len(choice_index)))
+        return participation, choices
+    
+    def scan_voting_collusion(
+        self,
+        top_k: int = 50,
+        validators: Optional[List[str]] = None,
+        min_common_votes: int = 5,
+        threshold: Optional[float] = None,
+        block_size: int = 512
+    ) -> List[Tuple[str, str, float, int]]:
+        """
+        Score every validator pair at once and return the most suspicious.
+        
+        Common-vote and agreement counts for all pairs come from sparse
+        matrix products (participation @ participation.T and
+        choices @ choices.T), computed one block of rows at a time so memory
+        stays at block_size x V. Scores equal detect_voting_collusion for
+        each pair.
+        
+        Args:
+            top_k: Maximum number of pairs returned
+            validators: Validators to scan (defaults to all with recorded votes)
+            min_common_votes: Pairs sharing fewer proposals are skipped
+            threshold: Minimum agreement rate (defaults to voting_correlation_threshold)
+            block_size: Rows of the pair matrix evaluated per step
+        
+        Returns:
+            (validator1, validator2, correlation, common_votes) tuples, highest
+            correlation first, then most common votes
+        """
+        if threshold is None:
+            threshold = self.voting_correlation_threshold
+        if validators is None:
+            validators = list(self.voting_patterns)
+        if top_k <= 0 or len(validators) < 2:
+            return []
+        
+        participation, choices = self._vote_matrices(validators)
+        participation_t, choices_t = participation.T.tocsr(), choices.T.tocsr()
+        
+        # Candidate columns: (correlation, common, row, col)
+        best = (np.empty(0), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+        for start in range(0, len(validators), block_size):
+            stop = min(start + block_size, len(validators))
+            common = (participation[start:stop] @ participation_t).tocoo()
+            
+            # Upper triangle only, with enough shared proposals
+            keep = (common.col > common.row + start) & (common.data >= min_common_votes)
+            rows, cols, common_votes = common.row[keep], common.col[keep], common.data[keep].astype(np.int64)
+            if rows.size == 0:
+                continue
+            
+            agreements = np.asarray((choices[start:stop] @ choices_t)[rows, cols]).ravel()
+            correlation = agreements / common_votes
+            suspicious = correlation >= threshold
+            
+            best = tuple(np.concatenate(pair) for pair in zip(best, (
+                correlation[suspicious], common_votes[suspicious],
+                rows[suspicious].astype(np.int64) + start, cols[suspicious].astype(np.int64)
+            )))
+            if best[0].size > top_k:
+                order = np.lexsort((best[3], best[2], -best[1], -best[0]))[:top_k]
+                best = tuple(column[order] for column in best)
+        
+        order = np.lexsort((best[3], best[2], -best[1], -best[0]))[:top_k]
+        return [
+            (validators[best[2][i]], validators[best[3][i]], float(best[0][i]), int(best[1][i]))
+            for i in order
+        ]
+    
     def detect_synchronized_staking(
         self,
         validators: List[str]
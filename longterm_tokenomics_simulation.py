@@ -11,10 +11,11 @@ Supply Model:
 - Target: Sustainable circulating supply for 100+ years
 """
 
+import itertools
 import numpy as np
 import pandas as pd
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass, fields, replace
+from typing import Dict, List, Tuple, Optional, Sequence
 from enum import Enum
 
 
@@ -56,6 +57,65 @@ class NetworkMetrics:
     sustainability_score: float    # 0-100 health score
 
 
+GRID_METRICS = [f.name for f in fields(NetworkMetrics) if f.name != 'year']
+
+
+@dataclass
+class TokenomicsGridResult:
+    """
+    Columnar output of LongTermTokenomicsSimulator.simulate_grid
+    
+    One row per run (adoption scenario x burn parameter set), one column
+    per recorded step. Runs that deplete their supply hold at zero supply
+    with no further burns.
+    """
+    scenarios: np.ndarray              # (runs,) AdoptionScenario value
+    burn_params: Dict[str, np.ndarray] # BurnParameters field -> (runs,)
+    years: np.ndarray                  # (samples,) elapsed years at each recorded step
+    metrics: Dict[str, np.ndarray]     # NetworkMetrics field -> (runs, samples)
+    depletion_year: np.ndarray         # (runs,) elapsed years when supply ran out, NaN if never
+    
+    @property
+    def num_runs(self) -> int:
+        return len(self.scenarios)
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """Long format: one row per run and recorded step"""
+        num_samples = len(self.years)
+        data = {'run': np.repeat(np.arange(self.num_runs), num_samples),
+                'scenario': np.repeat(self.scenarios, num_samples)}
+        for name, values in self.burn_params.items():
+            data[name] = np.repeat(values, num_samples)
+        data['year'] = np.tile(self.years, self.num_runs)
+        for name, values in self.metrics.items():
+            data[name] = values.reshape(-1)
+        return pd.DataFrame(data)
+    
+    def surface(self, metric: str, row_param: str, col_param: str,
+                scenario: AdoptionScenario, year: Optional[float] = None) -> pd.DataFrame:
+        """
+        Sensitivity surface of one metric over two burn parameters
+        
+        Args:
+            metric: NetworkMetrics field, e.g. 'circulating_supply'
+            row_param: BurnParameters field for the index
+            col_param: BurnParameters field for the columns
+            scenario: Adoption scenario to slice
+            year: Recorded step closest to this year (default: last)
+        
+        Returns:
+            Pivot table of the metric (mean over any other varied parameters)
+        """
+        col = len(self.years) - 1 if year is None else int(np.argmin(np.abs(self.years - year)))
+        runs = self.scenarios == scenario.value
+        df = pd.DataFrame({
+            row_param: self.burn_params[row_param][runs],
+            col_param: self.burn_params[col_param][runs],
+            metric: self.metrics[metric][runs, col],
+        })
+        return df.pivot_table(index=row_param, columns=col_param, values=metric, aggfunc='mean')
+
+
 class LongTermTokenomicsSimulator:
     """
     Simulates NXT tokenomics over 50-100 years.
@@ -268,6 +328,210 @@ class LongTermTokenomicsSimulator:
         self.metrics_history = metrics
         return metrics
     
+    def estimate_active_users_array(self, years: np.ndarray, scenario: AdoptionScenario) -> np.ndarray:
+        """Vectorised estimate_active_users over (fractional) years"""
+        years = np.asarray(years, dtype=np.float64)
+        if scenario == AdoptionScenario.CONSERVATIVE:
+            users = 1_000 + (990 * years)
+        elif scenario == AdoptionScenario.MODERATE:
+            users = 1_000_000 / (1 + np.exp(-0.15 * (years - 25)))
+        elif scenario == AdoptionScenario.AGGRESSIVE:
+            users = np.minimum(np.floor(1_000 * (2 ** (years / 2.5))), 10_000_000)
+        else:  # VIRAL
+            users = np.minimum(np.floor(1_000 * (1.4 ** years)), 50_000_000)
+        return np.floor(users)
+    
+    def burn_parameter_grid(self, burn_grid: Optional[Dict[str, Sequence[float]]] = None) -> List[BurnParameters]:
+        """
+        Cartesian product of burn parameter values over this simulator's burn_params
+        
+        Args:
+            burn_grid: BurnParameters field -> values to try
+        
+        Returns:
+            One BurnParameters per combination (just burn_params if no grid)
+        """
+        burn_grid = burn_grid or {}
+        valid = {f.name for f in fields(BurnParameters)}
+        unknown = set(burn_grid) - valid
+        if unknown:
+            raise ValueError(f"Unknown burn parameters: {sorted(unknown)}")
+        
+        names = list(burn_grid)
+        return [
+            replace(self.burn_params, **dict(zip(names, combo)))
+            for combo in itertools.product(*(burn_grid[name] for name in names))
+        ]
+    
+    def simulate_grid(
+        self,
+        years: int,
+        scenarios: Optional[Sequence[AdoptionScenario]] = None,
+        burn_grid: Optional[Dict[str, Sequence[float]]] = None,
+        steps_per_year: int = 365,
+        sample_every: Optional[int] = None,
+        dynamic_burn: bool = False,
+        validator_inflation: bool = False,
+        max_burn_pct: Optional[float] = None
+    ) -> TokenomicsGridResult:
+        """
+        Simulate every scenario x burn parameter combination in one vectorised pass.
+        
+        Each step advances 365 / steps_per_year days with user counts taken at
+        the step's end time, so steps_per_year=1 reproduces simulate().
+        Without balancing, a run's burns are its per-message burn times the
+        scenario's cumulative message count, so only recorded steps are
+        evaluated. With balancing, steps run in sequence over all runs at once.
+        
+        Args:
+            years: Years to simulate
+            scenarios: Adoption scenarios (default: all)
+            burn_grid: BurnParameters field -> values, expanded as a cartesian product
+            steps_per_year: Time resolution (365 = daily)
+            sample_every: Record every n-th step (default: yearly); the last step is always recorded
+            dynamic_burn: Scale burns by sqrt(supply / INITIAL_SUPPLY)
+            validator_inflation: Mint validator rewards at the halving schedule rate
+            max_burn_pct: Cap burns at this % of supply per year
+        
+        Returns:
+            TokenomicsGridResult
+        """
+        scenarios = list(scenarios or AdoptionScenario)
+        param_sets = self.burn_parameter_grid(burn_grid)
+        total_steps = years * steps_per_year
+        sample_every = sample_every or steps_per_year
+        
+        # Runs are scenario-major: run = scenario index * len(param_sets) + parameter set index
+        scenario_of_run = np.repeat(np.arange(len(scenarios)), len(param_sets))
+        params = {
+            f.name: np.tile([getattr(p, f.name) for p in param_sets], len(scenarios)).astype(np.float64)
+            for f in fields(BurnParameters)
+        }
+        per_message_burn = (  # calculate_daily_burn per message
+            params['message_ratio'] * params['message_burn'] +
+            params['link_ratio'] * params['link_burn'] +
+            params['video_ratio'] * params['video_burn']
+        )
+        
+        step_years = np.arange(1, total_steps + 1) / steps_per_year
+        users = np.stack([self.estimate_active_users_array(step_years, sc) for sc in scenarios])
+        messages = np.floor(users * 7.5 * 1.2)  # estimate_daily_messages, per scenario and step
+        
+        sample_steps = np.arange(sample_every, total_steps + 1, sample_every)
+        if total_steps and (not len(sample_steps) or sample_steps[-1] != total_steps):
+            sample_steps = np.append(sample_steps, total_steps)
+        sample_idx = sample_steps - 1
+        
+        if dynamic_burn or validator_inflation or max_burn_pct is not None:
+            supply, burned, rate, depletion_idx = self._run_with_balancing(
+                messages, scenario_of_run, per_message_burn, steps_per_year, sample_idx,
+                dynamic_burn, validator_inflation, max_burn_pct
+            )
+        else:
+            supply, burned, rate, depletion_idx = self._run_cumulative(
+                messages, scenario_of_run, per_message_burn, steps_per_year, sample_idx
+            )
+        
+        metrics = self._grid_metrics(
+            users[:, sample_idx][scenario_of_run], messages[:, sample_idx][scenario_of_run],
+            supply, burned, rate
+        )
+        return TokenomicsGridResult(
+            scenarios=np.array([scenarios[i].value for i in scenario_of_run]),
+            burn_params=params,
+            years=sample_steps / steps_per_year,
+            metrics=metrics,
+            depletion_year=np.where(depletion_idx < total_steps, (depletion_idx + 1) / steps_per_year, np.nan),
+        )
+    
+    def _run_cumulative(self, messages, scenario_of_run, per_message_burn, steps_per_year, sample_idx):
+        """Closed form without balancing: burned = per-run scale x cumulative messages, frozen at depletion"""
+        total_steps = messages.shape[1]
+        cumulative = np.cumsum(messages, axis=1)
+        scale = per_message_burn * (365 / steps_per_year)
+        
+        # First step whose cumulative burn reaches the genesis supply
+        with np.errstate(divide='ignore'):
+            threshold = np.where(scale > 0, self.GENESIS_SUPPLY / scale, np.inf)
+        depletion_idx = np.full(len(scale), total_steps)
+        for sc in range(len(cumulative)):
+            runs = scenario_of_run == sc
+            depletion_idx[runs] = np.searchsorted(cumulative[sc], threshold[runs], side='left')
+        
+        last_burning = np.minimum(sample_idx[None, :], depletion_idx[:, None])
+        burned = scale[:, None] * cumulative[scenario_of_run[:, None], np.minimum(last_burning, total_steps - 1)]
+        supply = np.maximum(self.GENESIS_SUPPLY - burned, 0.0)
+        rate = np.where(
+            sample_idx[None, :] > depletion_idx[:, None], 0.0,
+            messages[:, sample_idx][scenario_of_run] * per_message_burn[:, None]
+        )
+        return supply, burned, rate, depletion_idx
+    
+    def _run_with_balancing(self, messages, scenario_of_run, per_message_burn, steps_per_year,
+                            sample_idx, dynamic_burn, validator_inflation, max_burn_pct):
+        """One vectorised update per step across all runs, applying EconomicBalancingMechanism rules"""
+        num_runs, total_steps = len(scenario_of_run), messages.shape[1]
+        days_per_step = 365 / steps_per_year
+        supply = np.full(num_runs, self.GENESIS_SUPPLY)
+        total_burned = np.zeros(num_runs)
+        depleted = np.zeros(num_runs, dtype=bool)
+        depletion_idx = np.full(num_runs, total_steps)
+        
+        recorded = np.zeros((3, num_runs, len(sample_idx)))
+        sample_col = {int(step): col for col, step in enumerate(sample_idx)}
+        
+        for step in range(total_steps):
+            rate = messages[scenario_of_run, step] * per_message_burn
+            if dynamic_burn:
+                rate = EconomicBalancingMechanism.dynamic_burn_adjustment(rate, supply, self.INITIAL_SUPPLY)
+            if max_burn_pct is not None:
+                rate = np.minimum(rate, supply * (max_burn_pct / 100) / 365)
+            rate = np.where(depleted, 0.0, rate)
+            
+            burn = rate * days_per_step
+            supply -= burn
+            total_burned += burn
+            if validator_inflation:
+                inflation = EconomicBalancingMechanism.calculate_validator_inflation(step // steps_per_year)
+                supply += np.where(depleted, 0.0, supply * (inflation / 100) / steps_per_year)
+            
+            newly = (supply <= 0) & ~depleted
+            depletion_idx[newly] = step
+            depleted |= newly
+            np.maximum(supply, 0.0, out=supply)
+            
+            col = sample_col.get(step)
+            if col is not None:
+                recorded[:, :, col] = supply, total_burned, rate
+        return recorded[0], recorded[1], recorded[2], depletion_idx
+    
+    def _grid_metrics(self, users, messages, supply, burned, rate) -> Dict[str, np.ndarray]:
+        """Derived metrics for recorded steps, mirroring simulate()"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            years_remaining = np.where(
+                supply <= 0, 0.0,
+                np.where(rate > 0, supply / rate / 365, 999.0)
+            )
+        
+        # calculate_sustainability_score
+        supply_score = np.minimum(50, supply / self.INITIAL_SUPPLY * 100)
+        velocity_score = np.maximum(0, 30 - (rate / np.maximum(supply, 1) * 10000))
+        time_score = np.select(
+            [years_remaining >= 100, years_remaining >= 50, years_remaining >= 25, years_remaining >= 10],
+            [20, 15, 10, 5], default=0
+        )
+        
+        return {
+            'active_users': users,
+            'daily_messages': messages,
+            'circulating_supply': supply,
+            'total_burned': burned,
+            'burn_rate_daily': rate,
+            'supply_velocity': rate * 365 / np.maximum(supply, 1),
+            'years_until_depletion': years_remaining,
+            'sustainability_score': np.clip(supply_score + velocity_score + time_score, 0, 100),
+        }
+    
     def get_critical_years(
         self,
         metrics: List[NetworkMetrics]
@@ -403,5 +667,7 @@ __all__ = [
     'AdoptionScenario',
     'BurnParameters',
     'NetworkMetrics',
-    'EconomicBalancingMechanism'
+    'EconomicBalancingMechanism',
+    'TokenomicsGridResult',
+    'GRID_METRICS'
 ]
@@ -0,0 +1,313 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+import math
+import threading
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from database import get_session_factory, MetricSample, MetricRollup, MonitoringSnapshot
+
+# Rollup resolution -> datetime fields zeroed to find a sample's bucket
+ROLLUP_RESOLUTIONS = {
+    '1m': {'second': 0, 'microsecond': 0},
+    '1h': {'minute': 0, 'second': 0, 'microsecond': 0},
+}
+
+RAW_RESOLUTION = 'raw'
+
+
+def bucket_start(ts: datetime, resolution: str) -> datetime:
+    """Start of the rollup bucket containing ts."""
+    return ts.replace(**ROLLUP_RESOLUTIONS[resolution])
+
+
+def numeric_metrics(metrics: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Numeric, finite metric values from a snapshot dictionary.
+    
+    Strings, None, nested structures and NaN/inf are skipped; booleans are
+    stored as 0/1.
+    """
+    values = {}
+    for key, value in metrics.items():
+        if isinstance(value, (int, float)) and len(key) <= 100:
+            value = float(value)
+            if math.isfinite(value):
+                values[key] = value
+    return values
+
+
+def choose_resolution(hours: float) -> str:
+    """Coarsest resolution that still gives a useful chart for a time span."""
+    if hours <= 6:
+        return RAW_RESOLUTION
+    if hours <= 72:
+        return '1m'
+    return '1h'
+
+
+class MetricsStore:
+    """
+    Time-series store for monitoring metrics.
+    
+    Each numeric metric of a snapshot becomes one (ts, key, value) row in
+    metric_samples, and is folded into 1-minute and 1-hour rollups
+    (count/sum/min/max/last) in metric_rollups with an upsert. History and
+    range queries filter and aggregate in SQL instead of loading whole JSON
+    snapshot blobs. Writers call maybe_prune() to apply retention.
+    """
+    
+    def __init__(self, session_factory=None, prune_interval: timedelta = timedelta(hours=1)):
+        """
+        Initialize MetricsStore.
+        
+        Args:
+            session_factory: Optional sessionmaker for dependency injection.
+                           If None, uses the shared production sessionmaker.
+            prune_interval: Minimum time between retention passes in maybe_prune()
+        """
+        self.SessionLocal = session_factory or get_session_factory()
+        self.prune_interval = prune_interval
+        self._last_prune: Optional[datetime] = None
+        self._prune_lock = threading.Lock()
+    
+    def _run(self, session, work):
+        """Run work(session) in the caller's session, or in a new committed one."""
+        if session is not None:
+            return work(session)
+        
+        db = self.SessionLocal()
+        try:
+            result = work(db)
+            db.commit()
+            return result
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    
+    def write(self, metrics: Dict[str, Any], captured_at: Optional[datetime] = None,
+              session=None) -> int:
+        """
+        Store one snapshot's metrics.
+        
+        Args:
+            metrics: Metric key-value pairs (non-numeric values are skipped)
+            captured_at: Sample timestamp (default: now, UTC)
+            session: Optional session to join (caller commits)
+        
+        Returns:
+            Number of samples written
+        """
+        values = numeric_metrics(metrics)
+        if not values:
+            return 0
+        ts = captured_at or datetime.utcnow()
+        
+        def work(db):
+            db.execute(insert(MetricSample.__table__),
+                       [{'ts': ts, 'key': key, 'value': value} for key, value in values.items()])
+            self._upsert_rollups(db, values, ts)
+            return len(values)
+        
+        return self._run(session, work)
+    
+    def _upsert_rollups(self, db, values: Dict[str, float], ts: datetime):
+        rows = [
+            {'resolution': resolution, 'key': key, 'bucket_start': bucket_start(ts, resolution),
+             'count': 1, 'sum': value, 'min': value, 'max': value, 'last': value}
+            for resolution in ROLLUP_RESOLUTIONS
+            for key, value in values.items()
+        ]
+        
+        dialect = db.get_bind().dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            table = MetricRollup.__table__
+            if dialect == 'postgresql':
+                stmt, least, greatest = pg_insert(table), func.least, func.greatest
+            else:
+                # SQLite's two-argument min()/max() are scalar functions
+                stmt, least, greatest = sqlite_insert(table), func.min, func.max
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['resolution', 'key', 'bucket_start'],
+                set_={
+                    'count': table.c['count'] + excluded['count'],
+                    'sum': table.c['sum'] + excluded['sum'],
+                    'min': least(table.c['min'], excluded['min']),
+                    'max': greatest(table.c['max'], excluded['max']),
+                    'last': excluded['last'],
+                }
+            )
+            db.execute(stmt, rows)
+            return
+        
+        # Other dialects: read-modify-write within the caller's transaction
+        for row in rows:
+            rollup = db.query(MetricRollup).filter_by(
+                resolution=row['resolution'], key=row['key'], bucket_start=row['bucket_start']
+            ).first()
+            if rollup is None:
+                db.add(MetricRollup(**row))
+            else:
+                rollup.count += 1
+                rollup.sum += row['sum']
+                rollup.min = min(rollup.min, row['min'])
+                rollup.max = max(rollup.max, row['max'])
+                rollup.last = row['last']
+    
+    def get_history(self, key: str, start: datetime, end: Optional[datetime] = None,
+                    resolution: str = RAW_RESOLUTION, limit: Optional[int] = None,
+                    session=None) -> List[Dict[str, Any]]:
+        """
+        Values of one metric over a time range, oldest first.
+        
+        Args:
+            key: Metric key
+            start: Inclusive range start
+            end: Exclusive range end (default: open-ended)
+            resolution: 'raw', '1m' or '1h'
+            limit: Keep only the most recent N points
+            session: Optional session to use
+        
+        Returns:
+            List of {timestamp, value} dictionaries; rollup points use the
+            bucket average as value and also carry min, max and count
+        """
+        if resolution != RAW_RESOLUTION and resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        
+        def work(db):
+            if resolution == RAW_RESOLUTION:
+                ts_col = MetricSample.ts
+                query = select(MetricSample.ts, MetricSample.value).where(MetricSample.key == key)
+            else:
+                ts_col = MetricRollup.bucket_start
+                query = select(
+                    MetricRollup.bucket_start, MetricRollup.sum, MetricRollup.count,
+                    MetricRollup.min, MetricRollup.max
+                ).where(MetricRollup.resolution == resolution, MetricRollup.key == key)
+            
+            query = query.where(ts_col >= start)
+            if end is not None:
+                query = query.where(ts_col < end)
+            query = query.order_by(ts_col.desc())
+            if limit is not None:
+                query = query.limit(limit)
+            return db.execute(query).all()
+        
+        rows = self._run(session, work)
+        
+        if resolution == RAW_RESOLUTION:
+            return [{'timestamp': ts.isoformat(), 'value': value} for ts, value in reversed(rows)]
+        return [
+            {'timestamp': ts.isoformat(), 'value': total / count, 'min': low, 'max': high, 'count': count}
+            for ts, total, count, low, high in reversed(rows)
+        ]
+    
+    def get_range_stats(self, key: str, start: datetime, end: Optional[datetime] = None,
+                        resolution: str = RAW_RESOLUTION, session=None) -> Dict[str, Any]:
+        """
+        Aggregate one metric over a time range in SQL.
+        
+        Rollup resolutions answer long ranges from far fewer rows; bucket
+        boundaries then round the range to whole buckets.
+        
+        Returns:
+            Dictionary with count, avg, min and max (None values when empty)
+        """
+        def work(db):
+            if resolution == RAW_RESOLUTION:
+                ts_col = MetricSample.ts
+                query = select(
+                    func.count(MetricSample.value), func.sum(MetricSample.value),
+                    func.min(MetricSample.value), func.max(MetricSample.value)
+                ).where(MetricSample.key == key)
+            else:
+                ts_col = MetricRollup.bucket_start
+                query = select(
+                    func.sum(MetricRollup.count), func.sum(MetricRollup.sum),
+                    func.min(MetricRollup.min), func.max(MetricRollup.max)
+                ).where(MetricRollup.resolution == resolution, MetricRollup.key == key)
+            
+            query = query.where(ts_col >= start)
+            if end is not None:
+                query = query.where(ts_col < end)
+            return db.execute(query).one()
+        
+        count, total, low, high = self._run(session, work)
+        count = int(count or 0)
+        return {
+            'key': key,
+            'count': count,
+            'avg': total / count if count else None,
+            'min': low,
+            'max': high,
+        }
+    
+    def prune(self, raw_retention: timedelta = timedelta(days=7),
+              minute_retention: timedelta = timedelta(days=30),
+              now: Optional[datetime] = None, session=None) -> Dict[str, int]:
+        """
+        Drop raw samples and 1-minute rollups past their retention.
+        
+        Hourly rollups are kept indefinitely.
+        
+        Returns:
+            Number of deleted rows per tier
+        """
+        now = now or datetime.utcnow()
+        
+        def work(db):
+            raw = db.execute(delete(MetricSample).where(MetricSample.ts < now - raw_retention))
+            minute = db.execute(delete(MetricRollup).where(
+                MetricRollup.resolution == '1m',
+                MetricRollup.bucket_start < now - minute_retention
+            ))
+            return {'raw': raw.rowcount, '1m': minute.rowcount}
+        
+        return self._run(session, work)
+    
+    def maybe_prune(self, now: Optional[datetime] = None) -> Optional[Dict[str, int]]:
+        """
+        Run prune() with default retention at most once per prune_interval.
+        
+        Returns:
+            Deleted rows per tier, or None if a pass ran too recently
+        """
+        now = now or datetime.utcnow()
+        with self._prune_lock:
+            if self._last_prune is not None and now - self._last_prune < self.prune_interval:
+                return None
+            self._last_prune = now
+        return self.prune(now=now)
+    
+    def backfill_from_snapshots(self, since: Optional[datetime] = None,
+                                batch_size: int = 500) -> int:
+        """
+        Load existing MonitoringSnapshot rows into the store.
+        
+        init_db runs this once, when it creates the metrics tables.
+        
+        Returns:
+            Number of samples written
+        """
+        db = self.SessionLocal()
+        try:
+            query = db.query(MonitoringSnapshot).order_by(MonitoringSnapshot.captured_at)
+            if since is not None:
+                query = query.filter(MonitoringSnapshot.captured_at >= since)
+            
+            written = 0
+            for snapshot in query.yield_per(batch_size):
+                written += self.write(snapshot.metrics or {}, snapshot.captured_at, session=db)
+            db.commit()
+            return written
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
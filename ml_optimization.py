@@ -234,7 +234,16 @@ class BayesianOptimizer:
 class HistoricalAnalyzer:
     @staticmethod
     def get_best_runs_from_db(session, objective_type: str, top_n: int = 5) -> List[Tuple[Dict, float]]:
-        from database import SimulationRun, SimulationConfig
+        """
+        Score historical runs for an objective.
+        
+        Pass session=None to borrow a session from the shared engine pool.
+        """
+        from database import SimulationRun, SimulationConfig, get_session_factory
+        
+        owns_session = session is None
+        if owns_session:
+            session = get_session_factory()()
         
         try:
             runs = session.query(SimulationRun, SimulationConfig).join(
@@ -295,3 +304,7 @@ class HistoricalAnalyzer:
         except Exception as e:
             print(f"Error querying database: {e}")
             return []
+        
+        finally:
+            if owns_session:
+                session.close()
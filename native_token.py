@@ -22,7 +22,7 @@ NexusToken (NXT): The native currency powering the entire ecosystem
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 import time
 import hashlib
@@ -140,9 +140,85 @@ class NativeTokenSystem:
         self.total_minted: int = self.TOTAL_SUPPLY  # All tokens minted at genesis
         self.tx_counter: int = 0
         
+        # Optional durability (see open_durable / native_token_wal)
+        self.store = None
+        
         # Genesis account
         self._create_genesis_accounts()
     
+    @classmethod
+    def open_durable(cls, data_dir: str, sync_every: int = 64, sync_interval: float = 0.05,
+                     snapshot_every: Optional[int] = 100_000) -> "NativeTokenSystem":
+        """
+        Open a token system backed by a write-ahead log and snapshots.
+        
+        Recovers state from data_dir (latest snapshot + WAL tail) and logs
+        every subsequent transaction before returning it.
+        
+        Args:
+            data_dir: Directory for snapshot.bin and WAL segments
+            sync_every: Max WAL records per fsync batch
+            sync_interval: Max seconds between fsyncs while appending
+            snapshot_every: Automatic snapshot after this many WAL records
+                (None disables automatic snapshots)
+        
+        Returns:
+            Recovered NativeTokenSystem
+        """
+        from native_token_wal import TokenLedgerStore
+        
+        system = cls()
+        store = TokenLedgerStore(data_dir, sync_every=sync_every, sync_interval=sync_interval,
+                                 snapshot_every=snapshot_every)
+        store.recover(system)
+        system.store = store
+        return system
+    
+    def snapshot(self) -> Optional[dict]:
+        """Write a balance/nonce snapshot and truncate the WAL (durable systems only)"""
+        if self.store is None:
+            return None
+        return self.store.snapshot(self)
+    
+    def close(self):
+        """Flush and close the WAL (durable systems only)"""
+        if self.store is not None:
+            self.store.close()
+    
+    def _append_transaction(self, tx: TokenTransaction):
+        """Record a committed transaction (and log it when durable)"""
+        self.tx_counter += 1
+        self.transactions.append(tx)
+        if self.store is not None:
+            self.store.append_transaction(tx)
+            if self.store.snapshot_due():
+                self.store.snapshot(self)
+    
+    def replay_transaction(self, tx: TokenTransaction):
+        """
+        Re-apply a logged transaction's balance effects during WAL recovery.
+        
+        Mirrors transfer/burn/mint_reward/pay_for_* without rate limiting or
+        re-running orbital transitions (the logged amount is authoritative).
+        """
+        from_account = self.get_or_create_account(tx.from_address)
+        from_account.balance -= tx.amount + tx.fee
+        if tx.tx_type != TransactionType.REWARD:
+            from_account.nonce += 1
+        
+        self.get_or_create_account(tx.to_address).balance += tx.amount
+        
+        if tx.fee > 0:
+            validator_pool = self.get_account("VALIDATOR_POOL")
+            if validator_pool:
+                validator_pool.balance += tx.fee
+        
+        if tx.tx_type == TransactionType.BURN:
+            self.total_burned += tx.amount
+        
+        self.tx_counter += 1
+        self.transactions.append(tx)
+    
     def _create_genesis_accounts(self):
         """Create initial accounts with genesis distribution"""
         # Main treasury account
@@ -168,6 +244,9 @@ class NativeTokenSystem:
         
         account = Account(address=address, balance=initial_balance)
         self.accounts[address] = account
+        # Empty accounts are recreated on demand by WAL replay
+        if self.store is not None and initial_balance:
+            self.store.append_account(account)
         return account
     
     def get_account(self, address: str) -> Optional[Account]:
@@ -223,8 +302,7 @@ class NativeTokenSystem:
             amount=amount,
             fee=fee
         )
-        self.tx_counter += 1
-        self.transactions.append(tx)
+        self._append_transaction(tx)
         
         return tx
     
@@ -312,8 +390,7 @@ class NativeTokenSystem:
                 fee=fee,
                 data={"reason": reason} if reason else {}
             )
-            self.tx_counter += 1
-            self.transactions.append(tx)
+            self._append_transaction(tx)
             
             return (True, tx, f"Transfer successful: {amount} units → {to_address}")
             
@@ -331,6 +408,124 @@ class NativeTokenSystem:
                 f"Transfer failed and rolled back: {str(e)}"
             )
     
+    def transfer_atomic_batch(
+        self,
+        transfers: List[Tuple[str, int]],
+        to_address: str,
+        fee: Optional[int] = None,
+        reasons: Optional[List[str]] = None
+    ) -> List[Tuple[bool, Optional[TokenTransaction], str]]:
+        """
+        Many transfer_atomic calls into one recipient, settled with a single
+        balance update per account.
+        
+        Outcomes, balances, nonces and transaction records are the same as
+        calling transfer_atomic for each (from_address, amount) in order:
+        rate limits are taken per sender in one lock, each sender's balance
+        is checked against a running total, and only then are sender, recipient
+        and VALIDATOR_POOL balances written once each.
+        
+        Args:
+            transfers: (from_address, amount in units) pairs, in order
+            to_address: Receiver account address for every transfer
+            fee: Optional per-transfer fee (defaults to BASE_TRANSFER_FEE)
+            reasons: Optional per-transfer reason strings
+        
+        Returns:
+            One (success, transaction, message) per transfer, in order
+        """
+        if fee is None:
+            fee = self.BASE_TRANSFER_FEE
+        if reasons is None:
+            reasons = [""] * len(transfers)
+        
+        # Senders that are also credited need the sequential path
+        if any(sender in (to_address, "VALIDATOR_POOL") for sender, _ in transfers):
+            return [
+                self.transfer_atomic(sender, to_address, amount, fee=fee, reason=reason)
+                for (sender, amount), reason in zip(transfers, reasons)
+            ]
+        
+        # 🔒 SECURITY: Rate limiting, one batched check per sender
+        rate_limiter = get_rate_limiter()
+        requests_by_sender: Dict[str, int] = {}
+        for sender, _ in transfers:
+            requests_by_sender[sender] = requests_by_sender.get(sender, 0) + 1
+        rate_limits = {
+            sender: rate_limiter.check_rate_limit_batch(sender, "transfer", count)
+            for sender, count in requests_by_sender.items()
+        }
+        
+        # Validate against running balances before any mutation
+        running_balance: Dict[str, int] = {}
+        debits: Dict[str, Tuple[int, int]] = {}   # sender -> (total deducted, transfers)
+        outcomes: List[Tuple[bool, str]] = []
+        for sender, amount in transfers:
+            granted, rate_reason = rate_limits[sender]
+            if granted == 0:
+                outcomes.append((False, f"🔒 Rate limit: {rate_reason}"))
+                continue
+            rate_limits[sender] = (granted - 1, rate_reason)
+            
+            if sender not in running_balance:
+                account = self.get_account(sender)
+                if not account:
+                    outcomes.append((False, f"Sender account '{sender}' not found"))
+                    continue
+                running_balance[sender] = account.balance
+            
+            total_deduct = amount + fee
+            balance = running_balance[sender]
+            if balance < total_deduct:
+                outcomes.append((
+                    False,
+                    f"Insufficient balance: need {total_deduct} units, have {balance} units"
+                ))
+                continue
+            
+            running_balance[sender] = balance - total_deduct
+            deducted, count = debits.get(sender, (0, 0))
+            debits[sender] = (deducted + total_deduct, count + 1)
+            outcomes.append((True, ""))
+        
+        if not debits:
+            return [(ok, None, msg) for ok, msg in outcomes]
+        
+        # Single write per account
+        credited = 0
+        for sender, (deducted, count) in debits.items():
+            account = self.accounts[sender]
+            account.balance -= deducted
+            account.nonce += count
+            credited += deducted - count * fee
+        
+        self.get_or_create_account(to_address).balance += credited
+        
+        validator_pool = self.get_account("VALIDATOR_POOL")
+        applied = sum(count for _, count in debits.values())
+        if fee > 0 and validator_pool:
+            validator_pool.balance += fee * applied
+        
+        # Transaction records in submission order
+        results: List[Tuple[bool, Optional[TokenTransaction], str]] = []
+        for (sender, amount), reason, (ok, msg) in zip(transfers, reasons, outcomes):
+            if not ok:
+                results.append((False, None, msg))
+                continue
+            tx = TokenTransaction(
+                tx_id=f"TX{self.tx_counter:08d}",
+                tx_type=TransactionType.TRANSFER,
+                from_address=sender,
+                to_address=to_address,
+                amount=amount,
+                fee=fee,
+                data={"reason": reason} if reason else {}
+            )
+            self._append_transaction(tx)
+            results.append((True, tx, f"Transfer successful: {amount} units → {to_address}"))
+        
+        return results
+    
     def burn(self, from_address: str, amount: int, reason: str = "") -> Optional[TokenTransaction]:
         """Burn tokens (deflationary mechanism)"""
         from_account = self.get_account(from_address)
@@ -358,8 +553,7 @@ class NativeTokenSystem:
             amount=amount,
             data={"reason": reason}
         )
-        self.tx_counter += 1
-        self.transactions.append(tx)
+        self._append_transaction(tx)
         
         return tx
     
@@ -386,8 +580,7 @@ class NativeTokenSystem:
             amount=amount,
             data={"reason": reason}
         )
-        self.tx_counter += 1
-        self.transactions.append(tx)
+        self._append_transaction(tx)
         
         return tx
     
@@ -444,8 +637,7 @@ class NativeTokenSystem:
                     "delta_e_nxt": transition.delta_e_nxt
                 }
             )
-            self.tx_counter += 1
-            self.transactions.append(tx)
+            self._append_transaction(tx)
             
             return tx
         else:
@@ -512,8 +704,7 @@ class NativeTokenSystem:
                     "delta_e_nxt": transition.delta_e_nxt
                 }
             )
-            self.tx_counter += 1
-            self.transactions.append(tx)
+            self._append_transaction(tx)
             
             return tx
         else:
@@ -580,8 +771,7 @@ class NativeTokenSystem:
                     "delta_e_nxt": transition.delta_e_nxt
                 }
             )
-            self.tx_counter += 1
-            self.transactions.append(tx)
+            self._append_transaction(tx)
             
             return tx
         else:
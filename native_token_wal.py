@@ -0,0 +1,452 @@
+"""
+Write-Ahead Log and Snapshots for NativeTokenSystem
+===================================================
+
+Durability layer for the in-memory NXT ledger (native_token.NativeTokenSystem).
+
+Every TokenTransaction (and every account opened with an initial balance)
+is appended to a binary write-ahead log before the call returns. Records
+are written to the OS immediately, so they survive a process crash. fsync
+is batched (group commit) every `sync_every` records or `sync_interval`
+seconds, which bounds what a power failure can lose.
+
+Periodic snapshots store only account balances/nonces and supply counters.
+Recovery loads the latest snapshot and replays the WAL tail:
+
+    data_dir/
+        snapshot.bin          compact binary snapshot (atomic replace)
+        wal-00000001.log      WAL segments; a snapshot starts a new segment
+
+WAL record layout (little-endian):
+    header:  payload length (u32) | crc32 of payload (u32) | kind (u8)
+    payload: transaction or account fields (see encode_transaction)
+
+A torn record at the end of the last segment (crash mid-write) fails its
+length/CRC check and is truncated away on recovery.
+
+Balance changes made by assigning Account.balance directly (outside the
+NativeTokenSystem methods) are not logged; they are captured by the next
+snapshot only.
+"""
+
+import json
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+from native_token import Account, NativeTokenSystem, TokenTransaction, TransactionType
+
+
+RECORD_TRANSACTION = 1
+RECORD_ACCOUNT = 2
+
+SNAPSHOT_MAGIC = b"NXTSNAP1"
+SNAPSHOT_FILE = "snapshot.bin"
+
+_RECORD_HEADER = struct.Struct("<IIB")       # payload length, crc32, kind
+_TX_FIELDS = struct.Struct("<BqqdHHHHI")     # type, amount, fee, timestamp, 4 string lengths, data length
+_ACCOUNT_FIELDS = struct.Struct("<qQdH")     # balance, nonce, created_at, address length
+_SNAPSHOT_HEADER = struct.Struct("<8sIQqqI")  # magic, wal segment, tx counter, burned, minted, accounts
+
+_SEGMENT_NAME = re.compile(r"^wal-(\d{8})\.log$")
+
+# Stable on-disk codes for transaction types (append new types at the end)
+_TX_TYPES: List[TransactionType] = list(TransactionType)
+_TX_TYPE_CODES: Dict[TransactionType, int] = {tx_type: i for i, tx_type in enumerate(_TX_TYPES)}
+
+
+# ============================================================================
+# Record encoding
+# ============================================================================
+
+def encode_transaction(tx: TokenTransaction) -> bytes:
+    """Serialize a TokenTransaction into a WAL payload"""
+    tx_id = tx.tx_id.encode("utf-8")
+    from_address = tx.from_address.encode("utf-8")
+    to_address = tx.to_address.encode("utf-8")
+    signature = tx.signature.encode("utf-8")
+    data = json.dumps(tx.data, separators=(",", ":"), default=str).encode("utf-8") if tx.data else b""
+
+    return b"".join((
+        _TX_FIELDS.pack(_TX_TYPE_CODES[tx.tx_type], tx.amount, tx.fee, tx.timestamp,
+                        len(tx_id), len(from_address), len(to_address), len(signature), len(data)),
+        tx_id, from_address, to_address, signature, data
+    ))
+
+
+def decode_transaction(payload: bytes) -> TokenTransaction:
+    """Deserialize a WAL payload written by encode_transaction"""
+    (type_code, amount, fee, timestamp,
+     n_id, n_from, n_to, n_sig, n_data) = _TX_FIELDS.unpack_from(payload)
+
+    offset = _TX_FIELDS.size
+    fields = []
+    for length in (n_id, n_from, n_to, n_sig, n_data):
+        fields.append(payload[offset:offset + length])
+        offset += length
+    tx_id, from_address, to_address, signature, data = fields
+
+    return TokenTransaction(
+        tx_id=tx_id.decode("utf-8"),
+        tx_type=_TX_TYPES[type_code],
+        from_address=from_address.decode("utf-8"),
+        to_address=to_address.decode("utf-8"),
+        amount=amount,
+        fee=fee,
+        timestamp=timestamp,
+        data=json.loads(data) if data else {},
+        signature=signature.decode("utf-8")
+    )
+
+
+def encode_account(account: Account) -> bytes:
+    """Serialize an Account (balance, nonce, creation time) into a WAL/snapshot entry"""
+    address = account.address.encode("utf-8")
+    return _ACCOUNT_FIELDS.pack(account.balance, account.nonce, account.created_at, len(address)) + address
+
+
+def decode_account(payload: bytes, offset: int = 0) -> Tuple[Account, int]:
+    """Deserialize an Account entry; returns (account, offset after entry)"""
+    balance, nonce, created_at, n_address = _ACCOUNT_FIELDS.unpack_from(payload, offset)
+    start = offset + _ACCOUNT_FIELDS.size
+    address = payload[start:start + n_address].decode("utf-8")
+    return Account(address=address, balance=balance, nonce=nonce, created_at=created_at), start + n_address
+
+
+# ============================================================================
+# WAL segments
+# ============================================================================
+
+def read_wal(path: str) -> Tuple[List[Tuple[int, bytes]], int]:
+    """
+    Read all intact records of a WAL segment.
+
+    Args:
+        path: Segment file
+
+    Returns:
+        ([(kind, payload), ...], byte offset of the end of the last intact record)
+    """
+    with open(path, "rb") as f:
+        buffer = f.read()
+
+    records = []
+    offset = 0
+    header_size = _RECORD_HEADER.size
+    while offset + header_size <= len(buffer):
+        length, crc, kind = _RECORD_HEADER.unpack_from(buffer, offset)
+        end = offset + header_size + length
+        if end > len(buffer):
+            break
+        payload = buffer[offset + header_size:end]
+        if zlib.crc32(payload) != crc:
+            break
+        records.append((kind, payload))
+        offset = end
+    return records, offset
+
+
+class TokenWAL:
+    """
+    Append-only WAL segment writer with batched fsync (group commit).
+
+    Each append is handed to the OS straight away; fsync runs once
+    `sync_every` records are pending or `sync_interval` seconds have passed
+    since the last one.
+    """
+
+    def __init__(self, path: str, sync_every: int = 64, sync_interval: float = 0.05,
+                 clock: Callable[[], float] = time.monotonic):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.clock = clock
+
+        self.records_written = 0
+        self.bytes_written = 0
+        self.fsyncs = 0
+        self._pending = 0
+        self._last_sync = clock()
+        self._file = open(path, "ab", buffering=0)
+        self._lock = threading.Lock()
+
+    def append(self, kind: int, payload: bytes):
+        """Append one record; fsyncs when the batch is full or the interval elapsed"""
+        record = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload), kind) + payload
+        with self._lock:
+            self._file.write(record)
+            self.records_written += 1
+            self.bytes_written += len(record)
+            self._pending += 1
+            if self._pending >= self.sync_every or self.clock() - self._last_sync >= self.sync_interval:
+                self._sync_locked()
+
+    def sync(self):
+        """Force pending records to stable storage"""
+        with self._lock:
+            if self._pending:
+                self._sync_locked()
+
+    def _sync_locked(self):
+        os.fsync(self._file.fileno())
+        self.fsyncs += 1
+        self._pending = 0
+        self._last_sync = self.clock()
+
+    def close(self):
+        """Sync and close the segment"""
+        with self._lock:
+            if self._file.closed:
+                return
+            if self._pending:
+                self._sync_locked()
+            self._file.close()
+
+
+# ============================================================================
+# Ledger store (snapshot + WAL)
+# ============================================================================
+
+class TokenLedgerStore:
+    """
+    Snapshot + WAL persistence for one NativeTokenSystem.
+
+    Use NativeTokenSystem.open_durable(data_dir) rather than constructing
+    this directly.
+    """
+
+    def __init__(self, data_dir: str, sync_every: int = 64, sync_interval: float = 0.05,
+                 snapshot_every: Optional[int] = 100_000):
+        """
+        Initialize store.
+
+        Args:
+            data_dir: Directory holding snapshot.bin and WAL segments
+            sync_every: Max records per fsync batch
+            sync_interval: Max seconds between fsyncs while appending
+            snapshot_every: Take a snapshot after this many WAL records
+                (None disables automatic snapshots)
+        """
+        self.data_dir = data_dir
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+
+        self.segment = 1
+        self.wal: Optional[TokenWAL] = None
+        self.records_since_snapshot = 0
+        self.snapshots_taken = 0
+        self.last_recovery: Dict[str, float] = {}
+
+        os.makedirs(data_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.data_dir, f"wal-{segment:08d}.log")
+
+    def _snapshot_path(self) -> str:
+        return os.path.join(self.data_dir, SNAPSHOT_FILE)
+
+    def _list_segments(self) -> List[int]:
+        segments = []
+        for name in os.listdir(self.data_dir):
+            match = _SEGMENT_NAME.match(name)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+
+    def recover(self, system: NativeTokenSystem) -> Dict[str, float]:
+        """
+        Load the latest snapshot into `system`, replay the WAL tail and
+        open the active segment for appending.
+
+        Args:
+            system: Freshly constructed (genesis) token system
+
+        Returns:
+            Recovery statistics
+
+        Raises:
+            ValueError: If the snapshot or a non-final WAL segment is corrupt
+        """
+        start = time.perf_counter()
+
+        snapshot_segment = self._load_snapshot(system) if os.path.exists(self._snapshot_path()) else 1
+        segments = [s for s in self._list_segments() if s >= snapshot_segment]
+
+        replayed = 0
+        truncated_bytes = 0
+        for i, segment in enumerate(segments):
+            path = self._segment_path(segment)
+            records, valid_end = read_wal(path)
+            size = os.path.getsize(path)
+            if valid_end < size:
+                if i != len(segments) - 1:
+                    raise ValueError(f"Corrupt WAL segment {path} at byte {valid_end}")
+                # Torn write at the tail: drop the partial record
+                with open(path, "r+b") as f:
+                    f.truncate(valid_end)
+                    os.fsync(f.fileno())
+                truncated_bytes = size - valid_end
+
+            for kind, payload in records:
+                if kind == RECORD_TRANSACTION:
+                    system.replay_transaction(decode_transaction(payload))
+                elif kind == RECORD_ACCOUNT:
+                    account, _ = decode_account(payload)
+                    system.accounts.setdefault(account.address, account)
+                replayed += 1
+
+        # Segments already folded into the snapshot
+        for segment in self._list_segments():
+            if segment < snapshot_segment:
+                os.remove(self._segment_path(segment))
+
+        self.segment = segments[-1] if segments else snapshot_segment
+        self.records_since_snapshot = replayed
+        self.wal = TokenWAL(self._segment_path(self.segment), self.sync_every, self.sync_interval)
+
+        self.last_recovery = {
+            'snapshot_segment': snapshot_segment,
+            'segments_replayed': len(segments),
+            'records_replayed': replayed,
+            'truncated_bytes': truncated_bytes,
+            'accounts': len(system.accounts),
+            'recovery_ms': (time.perf_counter() - start) * 1000,
+        }
+        return self.last_recovery
+
+    def _load_snapshot(self, system: NativeTokenSystem) -> int:
+        with open(self._snapshot_path(), "rb") as f:
+            buffer = f.read()
+
+        body, (crc,) = buffer[:-4], struct.unpack("<I", buffer[-4:])
+        if zlib.crc32(body) != crc:
+            raise ValueError(f"Corrupt snapshot {self._snapshot_path()}")
+
+        magic, segment, tx_counter, total_burned, total_minted, n_accounts = \
+            _SNAPSHOT_HEADER.unpack_from(body)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a token ledger snapshot: {self._snapshot_path()}")
+
+        accounts = {}
+        offset = _SNAPSHOT_HEADER.size
+        for _ in range(n_accounts):
+            account, offset = decode_account(body, offset)
+            accounts[account.address] = account
+
+        system.accounts = accounts
+        system.transactions = []
+        system.tx_counter = tx_counter
+        system.total_burned = total_burned
+        system.total_minted = total_minted
+        return segment
+
+    # ------------------------------------------------------------------
+    # Logging
+    # ------------------------------------------------------------------
+
+    def append_transaction(self, tx: TokenTransaction):
+        """Log a committed transaction"""
+        self.wal.append(RECORD_TRANSACTION, encode_transaction(tx))
+        self.records_since_snapshot += 1
+
+    def append_account(self, account: Account):
+        """Log a newly opened account (needed when it starts with a balance)"""
+        self.wal.append(RECORD_ACCOUNT, encode_account(account))
+        self.records_since_snapshot += 1
+
+    def snapshot_due(self) -> bool:
+        return self.snapshot_every is not None and self.records_since_snapshot >= self.snapshot_every
+
+    def sync(self):
+        """Force buffered WAL records to disk"""
+        if self.wal:
+            self.wal.sync()
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self, system: NativeTokenSystem) -> Dict[str, float]:
+        """
+        Write a snapshot of `system` and start a new WAL segment.
+
+        Order matters for crash safety: the new segment is opened first, the
+        snapshot (pointing at it) is atomically renamed into place, and only
+        then are older segments deleted.
+        """
+        start = time.perf_counter()
+
+        old_segment = self.segment
+        self.wal.close()
+        self.segment += 1
+        self.wal = TokenWAL(self._segment_path(self.segment), self.sync_every, self.sync_interval)
+
+        parts = [_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, self.segment, system.tx_counter,
+                                       system.total_burned, system.total_minted, len(system.accounts))]
+        parts.extend(encode_account(account) for account in system.accounts.values())
+        body = b"".join(parts)
+
+        tmp_path = self._snapshot_path() + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+            f.write(struct.pack("<I", zlib.crc32(body)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._snapshot_path())
+        self._fsync_dir()
+
+        for segment in self._list_segments():
+            if segment <= old_segment:
+                os.remove(self._segment_path(segment))
+
+        self.records_since_snapshot = 0
+        self.snapshots_taken += 1
+        return {
+            'segment': self.segment,
+            'accounts': len(system.accounts),
+            'bytes': len(body) + 4,
+            'snapshot_ms': (time.perf_counter() - start) * 1000,
+        }
+
+    def _fsync_dir(self):
+        """Make the snapshot rename durable (no-op where directories cannot be opened)"""
+        try:
+            fd = os.open(self.data_dir, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def close(self):
+        """Sync and close the active WAL segment"""
+        if self.wal:
+            self.wal.close()
+
+    def get_stats(self) -> Dict[str, float]:
+        """WAL and snapshot statistics"""
+        return {
+            'segment': self.segment,
+            'records_written': self.wal.records_written if self.wal else 0,
+            'bytes_written': self.wal.bytes_written if self.wal else 0,
+            'fsyncs': self.wal.fsyncs if self.wal else 0,
+            'records_since_snapshot': self.records_since_snapshot,
+            'snapshots_taken': self.snapshots_taken,
+            'last_recovery': dict(self.last_recovery),
+        }
@@ -15,6 +15,7 @@ Philosophy:
 """
 
 import hashlib
+import heapq
 import time
 import numpy as np
 from typing import List, Dict, Set, Tuple, Optional
@@ -172,6 +173,19 @@ class NexusConsensusEngine:
         self.validators: Dict[str, SpectralValidator] = {}
         self.contributions: Dict[str, ContributionScore] = {}
         
+        # Validators whose contribution-based stake must be pushed to the spectrum index
+        self._stale_stakes: Set[str] = set()
+        
+        # Running H/M/D totals over all contributors (kept by record_contribution)
+        self.total_human: float = 0.0
+        self.total_machine: float = 0.0
+        self.total_data: float = 0.0
+        
+        # Lazy max-heap of (-total_contribution, registration order, validator_id);
+        # entries whose total no longer matches are dropped when they surface
+        self._contributor_heap: List[Tuple[float, int, str]] = []
+        self._registration_order: Dict[str, int] = {}
+        
         # Network state
         self.current_system_health: float = 0.5  # S(t)
         self.current_issuance: float = 0.0       # I(t)
@@ -195,10 +209,20 @@ class NexusConsensusEngine:
         self.spectrum.register_validator(validator)
         self.validators[validator.validator_id] = validator
         
+        # Re-registering resets the validator's scores
+        previous = self.contributions.get(validator.validator_id)
+        if previous:
+            self.total_human -= previous.human_score
+            self.total_machine -= previous.machine_score
+            self.total_data -= previous.data_score
+        
         # Initialize contribution tracking
         self.contributions[validator.validator_id] = ContributionScore(
             validator_id=validator.validator_id
         )
+        self._stale_stakes.add(validator.validator_id)
+        self._registration_order.setdefault(validator.validator_id, len(self._registration_order))
+        self._push_contributor(validator.validator_id)
     
     def record_contribution(
         self,
@@ -221,10 +245,13 @@ class NexusConsensusEngine:
         
         if contribution_type == ContributionType.HUMAN_INTERACTION:
             score.human_score += amount
+            self.total_human += amount
         elif contribution_type == ContributionType.MACHINE_COMPUTATION:
             score.machine_score += amount
+            self.total_machine += amount
         elif contribution_type == ContributionType.DATA_PROVISION:
             score.data_score += amount
+            self.total_data += amount
         elif contribution_type == ContributionType.DEVELOPMENT:
             score.development_score += amount
         elif contribution_type == ContributionType.GOVERNANCE:
@@ -232,8 +259,23 @@ class NexusConsensusEngine:
         
         # Recalculate total
         score.calculate_total(self.nexus_engine)
+        self._stale_stakes.add(validator_id)
+        self._push_contributor(validator_id)
         self.total_contributions_recorded += 1
     
+    def _push_contributor(self, validator_id: str):
+        """Index a validator's current total, compacting the heap when stale entries pile up"""
+        score = self.contributions[validator_id]
+        heapq.heappush(self._contributor_heap, (
+            -score.total_contribution, self._registration_order[validator_id], validator_id
+        ))
+        if len(self._contributor_heap) > 2 * len(self.contributions) + 64:
+            self._contributor_heap = [
+                (-s.total_contribution, self._registration_order[vid], vid)
+                for vid, s in self.contributions.items()
+            ]
+            heapq.heapify(self._contributor_heap)
+    
     def calculate_system_health(self) -> float:
         """
         Calculate current system health S(t) based on contributions
@@ -241,10 +283,10 @@ class NexusConsensusEngine:
         Uses Nexus equation: S(t) = λ_E*E + λ_N*(N/N₀) + λ_H*(H/H₀) + λ_M*(M/M₀)
         Note: We extend this to include D (data) contribution in the weighted calculation
         """
-        # Aggregate contributions across all validators
-        total_H = sum(c.human_score for c in self.contributions.values())
-        total_M = sum(c.machine_score for c in self.contributions.values())
-        total_D = sum(c.data_score for c in self.contributions.values())
+        # Aggregate contributions across all validators (running totals)
+        total_H = self.total_human
+        total_M = self.total_machine
+        total_D = self.total_data
         
         # Normalize to reference values
         H_0 = self.nexus_engine.H_0
@@ -288,10 +330,10 @@ class NexusConsensusEngine:
         
         Returns: (issuance_rate, burn_rate)
         """
-        # Get aggregate metrics
-        total_H = sum(c.human_score for c in self.contributions.values())
-        total_M = sum(c.machine_score for c in self.contributions.values())
-        total_D = sum(c.data_score for c in self.contributions.values())
+        # Get aggregate metrics (running totals)
+        total_H = self.total_human
+        total_M = self.total_machine
+        total_D = self.total_data
         
         # Calculate issuance I(t)
         E = 0.8  # External factor
@@ -331,19 +373,20 @@ class NexusConsensusEngine:
         2. Contribution-weighted selection (rewards ecosystem builders)
         
         Strategy:
-        - Update validator stakes based on contribution scores
+        - Update stakes of validators whose contribution changed since the
+          last selection (stake = 100 + 1000 * total contribution)
         - Use spectral validator selection (which uses stake-weighted probabilities)
         - This combines spectral diversity with contribution weighting
         """
-        # First, update validator stakes based on contribution scores
-        for validator_id, validator in self.validators.items():
+        # Only validators registered or credited since the last block need a new stake
+        for validator_id in self._stale_stakes:
             contribution = self.contributions.get(validator_id)
             if contribution:
-                # Set stake = base_stake + contribution bonus
                 # Higher contribution = higher stake = higher selection probability
                 base_stake = 100.0
                 contribution_bonus = contribution.total_contribution * 1000.0  # Scale up for weight
-                validator.stake = base_stake + contribution_bonus
+                self.spectrum.update_validator_stake(validator_id, base_stake + contribution_bonus)
+        self._stale_stakes.clear()
         
         # Now use spectral selection which will weight by stake
         # This ensures both spectral diversity AND contribution weighting
@@ -592,13 +635,28 @@ class NexusConsensusEngine:
         }
     
     def get_top_contributors(self, limit: int = 10) -> List[Tuple[str, ContributionScore]]:
-        """Get top contributors by total contribution score"""
-        sorted_contributors = sorted(
-            self.contributions.items(),
-            key=lambda x: x[1].total_contribution,
-            reverse=True
-        )
-        return sorted_contributors[:limit]
+        """
+        Get top contributors by total contribution score
+        
+        Pops live entries off the contributor heap (discarding stale ones)
+        and pushes them back, so cost is O(limit * log n) plus stale entries
+        rather than a full sort. Ties keep registration order.
+        """
+        heap = self._contributor_heap
+        top = []
+        seen = set()
+        while heap and len(top) < limit:
+            entry = heapq.heappop(heap)
+            neg_total, _, validator_id = entry
+            score = self.contributions.get(validator_id)
+            if score is None or validator_id in seen or -neg_total != score.total_contribution:
+                continue
+            seen.add(validator_id)
+            top.append(entry)
+        
+        for entry in top:
+            heapq.heappush(heap, entry)
+        return [(validator_id, self.contributions[validator_id]) for _, _, validator_id in top]
 
 
 # Global consensus engine instance
@@ -190,11 +190,7 @@ def render_top_contributors(consensus: NexusConsensusEngine):
         st.info("No contribution data yet.")
         return
     
-    sorted_contributors = sorted(
-        consensus.contributions.items(),
-        key=lambda x: x[1].calculate_total(consensus.nexus_engine),
-        reverse=True
-    )[:10]
+    sorted_contributors = consensus.get_top_contributors(10)
     
     df = pd.DataFrame([
         {
@@ -305,9 +301,9 @@ def render_reward_distribution(consensus: NexusConsensusEngine):
 
 
 def render_system_health_breakdown(consensus: NexusConsensusEngine):
-    total_H = sum(s.human_score for s in consensus.contributions.values())
-    total_M = sum(s.machine_score for s in consensus.contributions.values())
-    total_D = sum(s.data_score for s in consensus.contributions.values())
+    total_H = consensus.total_human
+    total_M = consensus.total_machine
+    total_D = consensus.total_data
     
     # Calculate contributions (simplified)
     H_contribution = total_H / 10.0 if total_H > 0 else 0
@@ -499,9 +495,9 @@ def render_simulation_results():
     with col1:
         st.subheader("Contribution Distribution")
         
-        total_H = sum(s.human_score for s in consensus.contributions.values())
-        total_M = sum(s.machine_score for s in consensus.contributions.values())
-        total_D = sum(s.data_score for s in consensus.contributions.values())
+        total_H = consensus.total_human
+        total_M = consensus.total_machine
+        total_D = consensus.total_data
         
         fig = go.Figure(data=[
             go.Pie(
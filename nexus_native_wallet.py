@@ -17,8 +17,9 @@ import hashlib
 import secrets
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
+from contextlib import contextmanager
 
 # NexusOS core components
 from native_token import NativeTokenSystem, Account, TokenTransaction
@@ -38,12 +39,13 @@ from cryptography.hazmat.backends import default_backend
 
 # Database
 import sqlalchemy as sa
-from sqlalchemy import create_engine, Column, String, Float, Integer, BigInteger, DateTime, Text, Boolean
+from sqlalchemy import Column, String, Float, Integer, BigInteger, DateTime, Text, Boolean
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import OperationalError, DBAPIError
+from sqlalchemy.exc import OperationalError, DBAPIError, IntegrityError
 from functools import wraps
 
+from database import get_engine, get_session_factory
+
 # ============================================================================
 # CRITICAL: Unified Unit Conversion Constant
 # ============================================================================
@@ -57,7 +59,8 @@ UNITS_PER_NXT = 100_000_000  # 100 million units per NXT
 def retry_on_connection_error(max_retries=2):
     """
     Decorator to retry database operations on connection errors.
-    Automatically refreshes the database session and retries.
+    Each attempt runs in a fresh unit-of-work session, so a retry simply
+    checks out another pooled connection.
     """
     def decorator(func):
         @wraps(func)
@@ -73,8 +76,7 @@ def retry_on_connection_error(max_retries=2):
                     # Check if it's a connection-related error
                     if any(err in error_msg for err in ['ssl', 'connection', 'closed', 'timeout']):
                         if attempt < max_retries:
-                            # Refresh session and retry
-                            self._refresh_session()
+                            # Retry on a fresh pooled connection
                             continue
                     # Not a connection error or max retries reached, re-raise
                     raise
@@ -241,72 +243,84 @@ class NexusNativeWallet:
     - Wavelength-based signatures
     - Mobile-first DAG communication
     - Multi-spectral quantum resistance
+    
+    Every public operation runs in its own short-lived session (unit of
+    work) checked out from the shared engine pool, so one wallet instance
+    can be shared safely between Streamlit users and Flask threads.
     """
     
+    FALLBACK_DATABASE_URL = 'sqlite:///nexus_native_wallet.db'
+    
     def __init__(self, database_url: Optional[str] = None):
         """Initialize wallet with NexusOS core systems"""
         # Database setup with fallback to SQLite
-        db_url = database_url or os.getenv('DATABASE_URL', 'sqlite:///nexus_native_wallet.db')
+        db_url = database_url or os.getenv('DATABASE_URL', self.FALLBACK_DATABASE_URL)
         self._fallback_attempted = False
         
         try:
-            # Try to connect to the specified database with robust pooling
-            self.engine = create_engine(
-                db_url, 
-                pool_pre_ping=True,  # Test connections before using
-                pool_recycle=3600,   # Recycle connections after 1 hour
-                pool_size=5,          # Connection pool size
-                max_overflow=10       # Max overflow connections
-            )
+            # Shared, pooled engine for this URL (see database.get_engine)
+            self.engine = get_engine(db_url)
             Base.metadata.create_all(self.engine)
             
-            # Store SessionMaker instead of single session
-            self.SessionMaker = sessionmaker(bind=self.engine)
-            
             # Test connection with a simple query
-            test_session = self.SessionMaker()
-            try:
-                test_session.execute(sa.text("SELECT 1"))
-                test_session.commit()
-            finally:
-                test_session.close()
+            with self.engine.connect() as conn:
+                conn.execute(sa.text("SELECT 1"))
             
             # Log connection success WITHOUT exposing credentials
             db_type = "PostgreSQL" if db_url.startswith('postgresql') else "SQLite"
             print(f"✅ Database connected: {db_type}")
-            
+        
         except Exception as e:
             # If PostgreSQL fails, fall back to SQLite
-            if db_url != 'sqlite:///nexus_native_wallet.db':
+            if db_url != self.FALLBACK_DATABASE_URL:
                 print(f"⚠️  PostgreSQL connection failed ({str(e)[:50]}...)")
                 print("📂 Falling back to SQLite for data persistence")
                 
                 self._fallback_attempted = True
-                db_url = 'sqlite:///nexus_native_wallet.db'
-                self.engine = create_engine(db_url)
+                db_url = self.FALLBACK_DATABASE_URL
+                self.engine = get_engine(db_url)
                 Base.metadata.create_all(self.engine)
-                self.SessionMaker = sessionmaker(bind=self.engine)
             else:
                 # SQLite also failed - this is a critical error
                 raise RuntimeError(f"Failed to initialize database: {e}")
         
-        # NexusOS core components  
+        self.database_url = db_url
+        # Objects returned from a unit of work stay readable after it closes
+        self.SessionMaker = get_session_factory(db_url, expire_on_commit=False)
+        
+        # NexusOS core components
         self.wavelength_validator = WavelengthValidator()
         self.wnsp_encoder = WnspEncoderV2()
         
-        # Create initial session
-        self.db = self.SessionMaker()
-        
         # Initialize persistent accounts (instead of in-memory NativeTokenSystem)
         self._init_genesis_accounts()
     
-    def _refresh_session(self):
-        """Recreate the database session (call this when connection errors occur)"""
+    @contextmanager
+    def _session_scope(self):
+        """Unit of work: commit on success, roll back on error, always close"""
+        session = self.SessionMaker()
         try:
-            self.db.close()
-        except:
-            pass
-        self.db = self.SessionMaker()
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    @contextmanager
+    def read_session(self):
+        """
+        Short-lived session for ad-hoc read queries (explorer dashboards).
+        
+        The connection goes back to the pool when the block exits; rows
+        loaded inside it stay readable afterwards.
+        """
+        session = self.SessionMaker()
+        try:
+            yield session
+        finally:
+            session.close()
     
     # ========================================================================
     # Database Token System (Replaces in-memory NativeTokenSystem)
@@ -320,25 +334,45 @@ class NexusNativeWallet:
             ("ECOSYSTEM_FUND", 200_000 * UNITS_PER_NXT)  # 200K NXT in smallest units
         ]
         
-        for address, balance in genesis_accounts:
-            existing = self.db.query(TokenAccount).filter_by(address=address).first()
-            if not existing:
-                account = TokenAccount(address=address, balance=balance)
-                self.db.add(account)
-        
-        self.db.commit()
+        with self._session_scope() as session:
+            existing = {
+                address for (address,) in session.query(TokenAccount.address).filter(
+                    TokenAccount.address.in_([address for address, _ in genesis_accounts])
+                )
+            }
+            for address, balance in genesis_accounts:
+                if address not in existing:
+                    session.add(TokenAccount(address=address, balance=balance))
     
-    def _get_token_account(self, address: str) -> Optional[TokenAccount]:
-        """Get persistent token account"""
-        return self.db.query(TokenAccount).filter_by(address=address).first()
+    def _get_token_account(self, address: str, session, lock: bool = False) -> Optional[TokenAccount]:
+        """Get persistent token account (row-locked with SELECT ... FOR UPDATE if lock)"""
+        query = session.query(TokenAccount).filter_by(address=address)
+        if lock:
+            query = query.with_for_update()
+        return query.first()
     
-    def _get_or_create_token_account(self, address: str, initial_balance: int = 0) -> TokenAccount:
-        """Get or create persistent token account"""
-        account = self._get_token_account(address)
+    def _get_or_create_token_account(self, address: str, initial_balance: int = 0,
+                                     session=None, lock: bool = False) -> TokenAccount:
+        """
+        Get or create persistent token account
+        
+        Args:
+            address: Account address
+            initial_balance: Balance (smallest units) for a new account
+            session: Unit-of-work session; the new account is flushed but left
+                for the caller to commit. Without a session the account is
+                fetched or created in its own unit of work.
+            lock: Lock an existing account row until the session commits, for
+                read-modify-write balance updates
+        """
+        if session is None:
+            with self._session_scope() as own_session:
+                return self._get_or_create_token_account(address, initial_balance, own_session, lock)
+        account = self._get_token_account(address, session, lock=lock)
         if not account:
-            account = TokenAccount(address=address, balance=initial_balance)
-            self.db.add(account)
-            self.db.commit()
+            account = TokenAccount(address=address, balance=initial_balance, nonce=0)
+            session.add(account)
+            session.flush()
         return account
     
     def _format_transaction_response(self, tx_record: WalletTransaction, status: str = 'new_commit') -> Dict[str, Any]:
@@ -395,21 +429,22 @@ class NexusNativeWallet:
         # Generate multi-spectral signature
         spectral_sig = self._generate_spectral_signature(address)
         
-        # Create persistent token account
-        token_account = self._get_or_create_token_account(
-            address,
-            initial_balance=int(initial_balance * UNITS_PER_NXT)  # Convert to smallest units
-        )
-        
-        # Save wallet to database
-        wallet = NexusWallet(
-            address=address,
-            public_key=json.dumps(public_key),
-            encrypted_private_key=encrypted_key,
-            spectral_signature=json.dumps(spectral_sig)
-        )
-        self.db.add(wallet)
-        self.db.commit()
+        with self._session_scope() as session:
+            # Create persistent token account
+            token_account = self._get_or_create_token_account(
+                address,
+                initial_balance=int(initial_balance * UNITS_PER_NXT),  # Convert to smallest units
+                session=session
+            )
+            
+            # Save wallet to database (same commit as the token account)
+            wallet = NexusWallet(
+                address=address,
+                public_key=json.dumps(public_key),
+                encrypted_private_key=encrypted_key,
+                spectral_signature=json.dumps(spectral_sig)
+            )
+            session.add(wallet)
         
         return {
             'address': address,
@@ -422,32 +457,32 @@ class NexusNativeWallet:
     @retry_on_connection_error(max_retries=2)
     def import_wallet(self, address: str, private_key: str, password: str) -> Dict[str, Any]:
         """Import existing wallet with quantum encryption layer"""
-        # Check if already exists
-        existing = self.db.query(NexusWallet).filter_by(address=address).first()
-        if existing:
-            raise ValueError(f"Wallet {address} already exists")
-        
-        # Generate quantum public key
-        _, public_key = self._generate_quantum_keypair(address)
-        
-        # Encrypt private key
-        encrypted_key = self._encrypt_private_key(private_key, password, public_key)
-        
-        # Generate spectral signature
-        spectral_sig = self._generate_spectral_signature(address)
-        
-        # Get or create persistent token account
-        token_account = self._get_or_create_token_account(address)
-        
-        # Save wallet
-        wallet = NexusWallet(
-            address=address,
-            public_key=json.dumps(public_key),
-            encrypted_private_key=encrypted_key,
-            spectral_signature=json.dumps(spectral_sig)
-        )
-        self.db.add(wallet)
-        self.db.commit()
+        with self._session_scope() as session:
+            # Check if already exists
+            existing = session.query(NexusWallet).filter_by(address=address).first()
+            if existing:
+                raise ValueError(f"Wallet {address} already exists")
+            
+            # Generate quantum public key
+            _, public_key = self._generate_quantum_keypair(address)
+            
+            # Encrypt private key
+            encrypted_key = self._encrypt_private_key(private_key, password, public_key)
+            
+            # Generate spectral signature
+            spectral_sig = self._generate_spectral_signature(address)
+            
+            # Get or create persistent token account
+            token_account = self._get_or_create_token_account(address, session=session)
+            
+            # Save wallet
+            wallet = NexusWallet(
+                address=address,
+                public_key=json.dumps(public_key),
+                encrypted_private_key=encrypted_key,
+                spectral_signature=json.dumps(spectral_sig)
+            )
+            session.add(wallet)
         
         return {
             'address': address,
@@ -458,26 +493,29 @@ class NexusNativeWallet:
     @retry_on_connection_error(max_retries=2)
     def unlock_wallet(self, address: str, password: str) -> bool:
         """Verify password can unlock wallet"""
-        wallet = self.db.query(NexusWallet).filter_by(address=address).first()
-        if not wallet:
-            return False
-        
-        try:
-            self._decrypt_private_key(
-                wallet.encrypted_private_key,
-                password,
-                json.loads(wallet.public_key)
-            )
+        with self._session_scope() as session:
+            wallet = session.query(NexusWallet).filter_by(address=address).first()
+            if not wallet:
+                return False
+            
+            try:
+                self._decrypt_private_key(
+                    wallet.encrypted_private_key,
+                    password,
+                    json.loads(wallet.public_key)
+                )
+            except:
+                return False
+            
             wallet.last_used = datetime.utcnow()
-            self.db.commit()
             return True
-        except:
-            return False
     
     @retry_on_connection_error(max_retries=2)
     def get_balance(self, address: str) -> Dict[str, Any]:
         """Get NXT balance for address"""
-        account = self._get_token_account(address)
+        with self._session_scope() as session:
+            account = self._get_token_account(address, session)
+        
         if not account:
             return {
                 'address': address,
@@ -497,6 +535,30 @@ class NexusNativeWallet:
     # NXT Token Transfers
     # ========================================================================
     
+    @staticmethod
+    def _validate_transfer_amounts(amount_nxt: float, fee_nxt: Optional[float]):
+        """Input validation - prevent negative amount exploit"""
+        if amount_nxt <= 0:
+            raise ValueError(f"Invalid amount: {amount_nxt}. Amount must be positive.")
+        if fee_nxt is not None and fee_nxt < 0:
+            raise ValueError(f"Invalid fee: {fee_nxt}. Fee must be non-negative.")
+        if amount_nxt > 1e12:  # Sanity check: max 1 trillion NXT
+            raise ValueError(f"Amount too large: {amount_nxt}")
+    
+    @staticmethod
+    def _require_idempotency_key(idempotency_key: Optional[str]):
+        # ═══════════════════════════════════════════════════════════════
+        # DAG-BASED IDEMPOTENCY: REQUIRE client-provided key (Stripe-style)
+        # ═══════════════════════════════════════════════════════════════
+        # Industry best practice: Clients MUST provide an idempotency key
+        # Without it, we CANNOT prevent double-execution on post-commit retries
+        if not idempotency_key:
+            raise ValueError(
+                "idempotency_key is REQUIRED to prevent double-execution. "
+                "Provide a stable unique string (e.g., UUID) that remains "
+                "the same across retries. Example: uuid.uuid4().hex"
+            )
+    
     @retry_on_connection_error(max_retries=2)
     def send_nxt(
         self,
@@ -513,7 +575,7 @@ class NexusNativeWallet:
         
         Args:
             from_address: Sender wallet address
-            to_address: Recipient address  
+            to_address: Recipient address
             amount_nxt: Amount in NXT
             password: Sender wallet password
             fee_nxt: Optional custom fee (uses default if None)
@@ -523,110 +585,214 @@ class NexusNativeWallet:
         
         Returns:
             Transaction details with quantum proofs
-            
+        
         Raises:
             ValueError: If idempotency_key is not provided
         """
-        # Input validation - prevent negative amount exploit
-        if amount_nxt <= 0:
-            raise ValueError(f"Invalid amount: {amount_nxt}. Amount must be positive.")
-        if fee_nxt is not None and fee_nxt < 0:
-            raise ValueError(f"Invalid fee: {fee_nxt}. Fee must be non-negative.")
-        if amount_nxt > 1e12:  # Sanity check: max 1 trillion NXT
-            raise ValueError(f"Amount too large: {amount_nxt}")
+        self._validate_transfer_amounts(amount_nxt, fee_nxt)
+        self._require_idempotency_key(idempotency_key)
         
-        # ═══════════════════════════════════════════════════════════════
-        # DAG-BASED IDEMPOTENCY: REQUIRE client-provided key (Stripe-style)
-        # ═══════════════════════════════════════════════════════════════
-        # Industry best practice: Clients MUST provide an idempotency key
-        # Without it, we CANNOT prevent double-execution on post-commit retries
-        import time
-        import uuid
+        # Generate stable transaction ID from idempotency key
+        tx_id = hashlib.sha256(f"{from_address}:{idempotency_key}".encode()).hexdigest()[:32]
         
-        if not idempotency_key:
-            # STRICT ENFORCEMENT: Idempotency key is REQUIRED for safety
-            # Without it, we CANNOT prevent double-execution on post-commit retries
-            raise ValueError(
-                "idempotency_key is REQUIRED to prevent double-execution. "
-                "Provide a stable unique string (e.g., UUID) that remains "
-                "the same across retries. Example: uuid.uuid4().hex"
+        return self._execute_transfers(
+            from_address, [(tx_id, to_address, amount_nxt)], password, fee_nxt
+        )[0]
+    
+    @retry_on_connection_error(max_retries=2)
+    def send_many(
+        self,
+        from_address: str,
+        payouts: List[Tuple[str, float]],
+        password: str,
+        fee_nxt: Optional[float] = None,
+        idempotency_key: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send a batch of NXT payouts from one wallet in a single DB transaction.
+        
+        Either every payout commits or none does. Balances are locked and
+        updated once for the whole batch and all ledger rows (transactions,
+        IO, DAG edges, verification records) are bulk-inserted.
+        
+        Args:
+            from_address: Sender wallet address
+            payouts: (to_address, amount_nxt) pairs
+            password: Sender wallet password
+            fee_nxt: Optional custom fee per payout (uses default if None)
+            idempotency_key: REQUIRED client-provided key for the whole batch;
+                            payout i gets a tx_id derived from key and i
+        
+        Returns:
+            Transaction details for each payout, in payout order
+        
+        Raises:
+            ValueError: On an empty batch, invalid amounts, missing
+                idempotency_key or insufficient balance for the whole batch
+        """
+        if not payouts:
+            raise ValueError("send_many requires at least one payout")
+        for _, amount_nxt in payouts:
+            self._validate_transfer_amounts(amount_nxt, fee_nxt)
+        self._require_idempotency_key(idempotency_key)
+        
+        transfers = [
+            (hashlib.sha256(f"{from_address}:{idempotency_key}:{i}".encode()).hexdigest()[:32],
+             to_address, amount_nxt)
+            for i, (to_address, amount_nxt) in enumerate(payouts)
+        ]
+        return self._execute_transfers(from_address, transfers, password, fee_nxt)
+    
+    def _execute_transfers(
+        self,
+        from_address: str,
+        transfers: List[Tuple[str, str, float]],
+        password: str,
+        fee_nxt: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run (tx_id, to_address, amount_nxt) transfers as one unit of work.
+        
+        Returns cached results when the tx_ids were already committed
+        (idempotent retry), otherwise applies and commits all transfers.
+        """
+        tx_ids = [tx_id for tx_id, _, _ in transfers]
+        
+        with self._session_scope() as session:
+            # Check if these transaction DAG nodes already exist (idempotent check)
+            # Use FOR UPDATE lock to prevent concurrent race between SELECT and INSERT
+            existing = self._load_transactions(session, tx_ids, lock=True)
+            if existing is not None:
+                return [self._format_transaction_response(tx, status='idempotent_cached') for tx in existing]
+            
+            # Get wallet
+            wallet = session.query(NexusWallet).filter_by(address=from_address).first()
+            if not wallet:
+                raise ValueError("Wallet not found")
+            
+            # Unlock wallet (before touching balances to avoid holding locks during crypto)
+            private_key = self._decrypt_private_key(
+                wallet.encrypted_private_key,
+                password,
+                json.loads(wallet.public_key)
             )
+            
+            try:
+                # SINGLE ATOMIC COMMIT: Balances + Transactions + IO + DAG + Verification
+                # Either ALL succeed or ALL roll back (prevents partial states)
+                records = self._apply_transfers(session, from_address, transfers, fee_nxt, private_key)
+                session.commit()
+            except IntegrityError as e:
+                # Unique constraint violation on tx_id - transaction already exists!
+                # This happens when concurrent retries pass the SELECT check simultaneously
+                session.rollback()
+                existing = self._load_transactions(session, tx_ids)
+                if existing is not None:
+                    return [
+                        self._format_transaction_response(tx, status='idempotent_collision_detected')
+                        for tx in existing
+                    ]
+                raise ValueError(f"IntegrityError on tx_ids {tx_ids} but no transactions found!") from e
+        
+        # Success! Return normalized responses
+        return [self._format_transaction_response(record, status='new_commit') for record in records]
+    
+    @staticmethod
+    def _load_transactions(session, tx_ids: List[str], lock: bool = False) -> Optional[List[WalletTransaction]]:
+        """
+        Committed transactions for tx_ids in the given order, or None if none exist.
         
-        # Generate stable transaction ID from idempotency key
-        tx_id = hashlib.sha256(f"{from_address}:{idempotency_key}".encode()).hexdigest()[:32]
+        Raises:
+            ValueError: If only part of a batch exists (should be impossible,
+                batches commit atomically)
+        """
+        query = session.query(WalletTransaction).filter(WalletTransaction.tx_id.in_(tx_ids))
+        if lock:
+            query = query.with_for_update()
+        found = {tx.tx_id: tx for tx in query.all()}
+        if not found:
+            return None
+        if len(found) != len(set(tx_ids)):
+            raise ValueError(f"Partially committed batch: {len(found)} of {len(tx_ids)} transactions exist")
+        return [found[tx_id] for tx_id in tx_ids]
+    
+    def _apply_transfers(
+        self,
+        session,
+        from_address: str,
+        transfers: List[Tuple[str, str, float]],
+        fee_nxt: Optional[float],
+        private_key: str
+    ) -> List[WalletTransaction]:
+        """
+        Debit/credit balances and bulk-insert ledger rows for a batch of transfers.
         
-        # Check if this transaction DAG node already exists (idempotent check)
-        # Use FOR UPDATE lock to prevent concurrent race between SELECT and INSERT
-        # Note: Removed skip_locked for SQLite compatibility - we WANT to wait for lock
-        existing_tx = self.db.query(WalletTransaction).filter_by(tx_id=tx_id).with_for_update().first()
-        if existing_tx:
-            # Transaction already committed! Return cached result with FULL schema parity
-            return self._format_transaction_response(existing_tx, status='idempotent_cached')
-        
-        # Get wallet
-        wallet = self.db.query(NexusWallet).filter_by(address=from_address).first()
-        if not wallet:
-            raise ValueError("Wallet not found")
-        
-        # Unlock wallet (before transaction to avoid holding locks during crypto)
-        private_key = self._decrypt_private_key(
-            wallet.encrypted_private_key,
-            password,
-            json.loads(wallet.public_key)
-        )
+        Caller commits. Returns transient WalletTransaction records for the
+        response (the rows themselves are written with bulk INSERTs).
+        """
+        from native_token import TokenTransaction, TransactionType
         
         # Convert to smallest units
-        amount_units = int(amount_nxt * UNITS_PER_NXT)
         fee_units = int(fee_nxt * UNITS_PER_NXT) if fee_nxt else 1  # Default 0.00000001 NXT fee
+        amounts_units = [int(amount_nxt * UNITS_PER_NXT) for _, _, amount_nxt in transfers]
+        total_units = sum(amounts_units) + fee_units * len(transfers)
         
         # ═══════════════════════════════════════════════════════════════
-        # ATOMIC TRANSACTION: All changes in ONE commit with row locks
+        # Lock every touched account in one SELECT ... FOR UPDATE
         # ═══════════════════════════════════════════════════════════════
-        # Use row-level locking (SELECT ... FOR UPDATE) to prevent concurrent modifications
+        addresses = {from_address, "VALIDATOR_POOL"} | {to for _, to, _ in transfers}
+        accounts = {
+            account.address: account
+            for account in session.query(TokenAccount).filter(
+                TokenAccount.address.in_(addresses)
+            ).with_for_update().all()
+        }
         
-        from sqlalchemy.exc import IntegrityError
+        from_account = accounts.get(from_address)
+        if not from_account:
+            raise ValueError("Sender account not found")
         
-        try:
-            # Lock sender account (prevents concurrent spends)
-            from_account = self.db.query(TokenAccount).filter_by(
-                address=from_address
-            ).with_for_update().first()
-            
-            if not from_account:
-                raise ValueError("Sender account not found")
-            
-            # Check sufficient balance
-            if from_account.balance < (amount_units + fee_units):
-                raise ValueError(f"Insufficient balance: have {from_account.balance}, need {amount_units + fee_units}")
-            
-            # Deduct from sender
-            from_account.balance -= (amount_units + fee_units)
-            from_account.nonce += 1
-            
-            # Lock receiver account
-            to_account = self.db.query(TokenAccount).filter_by(
-                address=to_address
-            ).with_for_update().first()
-            
-            if not to_account:
-                # Create new account if doesn't exist
-                to_account = TokenAccount(address=to_address, balance=0, nonce=0)
-                self.db.add(to_account)
-                self.db.flush()  # Flush to get the account in the session
-            
-            # Add to receiver
+        # Check sufficient balance for the whole batch
+        if from_account.balance < total_units:
+            raise ValueError(f"Insufficient balance: have {from_account.balance}, need {total_units}")
+        
+        # Deduct from sender
+        from_account.balance -= total_units
+        from_account.nonce += len(transfers)
+        
+        # Add to receivers (creating new accounts as needed)
+        for (_, to_address, _), amount_units in zip(transfers, amounts_units):
+            to_account = accounts.get(to_address)
+            if to_account is None:
+                to_account = accounts[to_address] = TokenAccount(address=to_address, balance=0, nonce=0)
+                session.add(to_account)
             to_account.balance += amount_units
-            
-            # Lock validator pool
-            validator_pool = self.db.query(TokenAccount).filter_by(
-                address="VALIDATOR_POOL"
-            ).with_for_update().first()
-            
-            if validator_pool:
-                validator_pool.balance += fee_units
-            
-            # Create transaction record
-            from native_token import TokenTransaction, TransactionType
+        
+        validator_pool = accounts.get("VALIDATOR_POOL")
+        if validator_pool:
+            validator_pool.balance += fee_units * len(transfers)
+        
+        # ═══════════════════════════════════════════════════════════════
+        # DAG parents: the sender's two most recent transactions
+        # ═══════════════════════════════════════════════════════════════
+        recent = [
+            tx_id for (tx_id,) in session.query(WalletTransaction.tx_id).filter(
+                (WalletTransaction.from_address == from_address) |
+                (WalletTransaction.to_address == from_address)
+            ).order_by(WalletTransaction.timestamp.desc()).limit(2)
+        ]
+        depths = dict(
+            session.query(DagEdge.child_id, sa.func.max(DagEdge.depth)).filter(
+                DagEdge.child_id.in_(recent)
+            ).group_by(DagEdge.child_id).all()
+        ) if recent else {}
+        
+        tx_rows, io_rows, edge_rows, verification_rows = [], [], [], []
+        now = datetime.utcnow()
+        
+        for i, ((tx_id, to_address, amount_nxt), amount_units) in enumerate(zip(transfers, amounts_units)):
+            # Strictly increasing timestamps keep batch order in history queries
+            timestamp = now + timedelta(microseconds=i)
             
             tx = TokenTransaction(
                 tx_id=tx_id,
@@ -636,148 +802,79 @@ class NexusNativeWallet:
                 amount=amount_units,
                 fee=fee_units
             )
+            fee_amount_nxt = tx.fee / UNITS_PER_NXT
             
             # Add quantum security layer
             quantum_proof = self._generate_quantum_proof(tx, private_key)
             
-            # Save transaction record in same atomic transaction
-            db_tx = WalletTransaction(
-                tx_id=tx_id,  # DAG node ID with unique constraint
-                from_address=from_address,
-                to_address=to_address,
-                amount_nxt=amount_nxt,
-                fee_nxt=(tx.fee / UNITS_PER_NXT),
-                status='confirmed',
-                wave_signature=json.dumps(quantum_proof['wave_signature']),
-                spectral_proof=json.dumps(quantum_proof['spectral_signatures']),
-                interference_hash=quantum_proof['interference_hash'],
-                energy_cost=quantum_proof['energy_cost']
-            )
-            self.db.add(db_tx)
-            
-            # ═══════════════════════════════════════════════════════════════
-            # DAG LEDGER MECHANICS: Bitcoin-style UTXO + DAG structure
-            # ═══════════════════════════════════════════════════════════════
+            tx_rows.append({
+                'tx_id': tx_id,  # DAG node ID with unique constraint
+                'from_address': from_address,
+                'to_address': to_address,
+                'amount_nxt': amount_nxt,
+                'fee_nxt': fee_amount_nxt,
+                'timestamp': timestamp,
+                'status': 'confirmed',
+                'wave_signature': json.dumps(quantum_proof['wave_signature']),
+                'spectral_proof': json.dumps(quantum_proof['spectral_signatures']),
+                'interference_hash': quantum_proof['interference_hash'],
+                'energy_cost': quantum_proof['energy_cost']
+            })
             
             # 1. Transaction Input/Output (UTXO model)
-            tx_input = TransactionIO(
-                tx_id=tx_id,
-                io_type='input',
-                address=from_address,
-                amount_nxt=amount_nxt + (tx.fee / UNITS_PER_NXT),
-                sequence=0,
-                is_spent=True,
-                spent_in_tx=tx_id
-            )
-            self.db.add(tx_input)
-            
-            tx_output = TransactionIO(
-                tx_id=tx_id,
-                io_type='output',
-                address=to_address,
-                amount_nxt=amount_nxt,
-                sequence=0,
-                is_spent=False
-            )
-            self.db.add(tx_output)
-            
-            # 2. DAG Edge: Link to parent transactions
-            parent_txs = self.db.query(WalletTransaction).filter(
-                (WalletTransaction.from_address == from_address) | 
-                (WalletTransaction.to_address == from_address)
-            ).order_by(WalletTransaction.timestamp.desc()).limit(2).all()
+            io_rows.append({
+                'tx_id': tx_id, 'io_type': 'input', 'address': from_address,
+                'amount_nxt': amount_nxt + fee_amount_nxt, 'sequence': 0,
+                'is_spent': True, 'spent_in_tx': tx_id, 'timestamp': timestamp
+            })
+            io_rows.append({
+                'tx_id': tx_id, 'io_type': 'output', 'address': to_address,
+                'amount_nxt': amount_nxt, 'sequence': 0,
+                'is_spent': False, 'spent_in_tx': None, 'timestamp': timestamp
+            })
             
+            # 2. DAG Edge: Link to parent transactions (earlier payouts in
+            #    the batch count as the sender's most recent transactions)
             depth = 0
-            for parent_tx in parent_txs:
-                # Get parent depth
-                parent_edge = self.db.query(DagEdge).filter_by(
-                    child_id=parent_tx.tx_id
-                ).order_by(DagEdge.depth.desc()).first()
-                parent_depth = parent_edge.depth if parent_edge else 0
-                depth = max(depth, parent_depth + 1)
-                
-                # Create DAG edge
-                dag_edge = DagEdge(
-                    child_id=tx_id,
-                    parent_id=parent_tx.tx_id,
-                    edge_type='transaction',
-                    depth=depth
-                )
-                self.db.add(dag_edge)
+            for parent_id in recent[:2]:
+                depth = max(depth, depths.get(parent_id, 0) + 1)
+                edge_rows.append({
+                    'child_id': tx_id, 'parent_id': parent_id,
+                    'edge_type': 'transaction', 'depth': depth, 'timestamp': timestamp
+                })
             
             # If no parents found (first transaction), create genesis edge
-            if not parent_txs:
+            if not recent:
                 depth = 1
-                genesis_edge = DagEdge(
-                    child_id=tx_id,
-                    parent_id='GENESIS',
-                    edge_type='transaction',
-                    depth=depth
-                )
-                self.db.add(genesis_edge)
-            
-            # 3. Verification Record: Wavelength validation proof
-            verification = VerificationRecord(
-                tx_id=tx_id,
-                verifier_type='wavelength',
-                wavelength_nm=quantum_proof['wave_signature'].get('wavelength', 0),
-                spectral_region=quantum_proof['wave_signature'].get('spectral_region', 'BLUE'),
-                interference_pattern=quantum_proof['interference_hash'],
-                signature_hash=quantum_proof['interference_hash'],
-                is_valid=True,
-                validator_address=from_address,
-                full_proof=json.dumps(quantum_proof)
-            )
-            self.db.add(verification)
-            
-            # SINGLE ATOMIC COMMIT: Balances + Transaction + IO + DAG + Verification
-            # Either ALL succeed or ALL roll back (prevents partial states)
-            self.db.commit()
-            
-        except IntegrityError as e:
-            # Unique constraint violation on tx_id - transaction already exists!
-            # This happens when concurrent retries pass the SELECT check simultaneously
-            # Roll back and return cached result (idempotent)
-            self.db.rollback()
+                edge_rows.append({
+                    'child_id': tx_id, 'parent_id': 'GENESIS',
+                    'edge_type': 'transaction', 'depth': depth, 'timestamp': timestamp
+                })
             
-            # Refresh ALL accounts to clear any in-memory state changes
-            try:
-                if 'from_account' in locals():
-                    self.db.refresh(from_account)
-                if 'to_account' in locals():
-                    self.db.refresh(to_account)
-                if 'validator_pool' in locals() and validator_pool:
-                    self.db.refresh(validator_pool)
-            except:
-                pass  # Account might not be in session anymore
+            recent.insert(0, tx_id)
+            depths[tx_id] = depth
             
-            # Fetch the existing transaction (it must exist now)
-            existing_tx = self.db.query(WalletTransaction).filter_by(tx_id=tx_id).first()
-            if existing_tx:
-                return self._format_transaction_response(existing_tx, status='idempotent_collision_detected')
-            else:
-                # This should never happen, but raise if it does
-                raise ValueError(f"IntegrityError on tx_id {tx_id} but no transaction found!") from e
+            # 3. Verification Record: Wavelength validation proof
+            verification_rows.append({
+                'tx_id': tx_id,
+                'verifier_type': 'wavelength',
+                'wavelength_nm': quantum_proof['wave_signature'].get('wavelength', 0),
+                'spectral_region': quantum_proof['wave_signature'].get('spectral_region', 'BLUE'),
+                'interference_pattern': quantum_proof['interference_hash'],
+                'signature_hash': quantum_proof['interference_hash'],
+                'is_valid': True,
+                'validation_timestamp': timestamp,
+                'validator_address': from_address,
+                'full_proof': json.dumps(quantum_proof)
+            })
         
-        except Exception as e:
-            # Other errors: Roll back and refresh ALL account state
-            self.db.rollback()
-            
-            # Refresh ALL accounts to clear any in-memory state changes (including nonce)
-            try:
-                if 'from_account' in locals():
-                    self.db.refresh(from_account)
-                if 'to_account' in locals():
-                    self.db.refresh(to_account)
-                if 'validator_pool' in locals() and validator_pool:
-                    self.db.refresh(validator_pool)
-            except:
-                pass  # Account might not be in session anymore
-            
-            raise
+        # Flush balance updates, then one executemany INSERT per ledger table
+        session.flush()
+        for model, rows in ((WalletTransaction, tx_rows), (TransactionIO, io_rows),
+                            (DagEdge, edge_rows), (VerificationRecord, verification_rows)):
+            session.execute(sa.insert(model.__table__), rows)
         
-        # Success! Return normalized response
-        return self._format_transaction_response(db_tx, status='new_commit')
+        return [WalletTransaction(**row) for row in tx_rows]
     
     # ========================================================================
     # WNSP Messaging
@@ -807,112 +904,100 @@ class NexusNativeWallet:
         Returns:
             Message details with quantum encoding
         """
-        # Get wallet
-        wallet = self.db.query(NexusWallet).filter_by(address=from_address).first()
-        if not wallet:
-            raise ValueError("Wallet not found")
-        
-        # Unlock wallet
-        private_key = self._decrypt_private_key(
-            wallet.encrypted_private_key,
-            password,
-            json.loads(wallet.public_key)
-        )
-        
-        # Create wavelength-encoded message
-        wave_msg = self.wavelength_validator.create_message_wave(
-            content, spectral_region, ModulationType.PSK
-        )
-        
-        # Calculate E=hf cost
-        energy_cost = self._calculate_message_cost(wave_msg)
-        cost_nxt = energy_cost * 1e-17  # Scale to NXT
-        
-        # Deduct cost from sender
-        cost_units = int(cost_nxt * UNITS_PER_NXT)
-        account = self._get_token_account(from_address)
-        if not account or account.balance < cost_units:
-            raise ValueError("Insufficient balance for message cost")
-        
-        account.balance -= cost_units
-        # Add to validator pool
-        validator_pool = self._get_token_account("VALIDATOR_POOL")
-        if validator_pool:
-            validator_pool.balance += cost_units
-        
-        self.db.commit()
-        
-        # Generate message ID
-        message_id = self._generate_message_id(from_address, content, wave_msg.wavelength)
-        
-        # Save message
-        msg = WalletMessage(
-            message_id=message_id,
-            from_address=from_address,
-            to_address=to_address,
-            content=content,
-            spectral_region=spectral_region.display_name,
-            wavelength=wave_msg.wavelength,
-            cost_nxt=cost_nxt,
-            dag_parents=json.dumps(parent_messages) if parent_messages else None
-        )
-        self.db.add(msg)
-        
-        # Create DAG edges for message parents
-        depth = 0
-        if parent_messages:
-            for parent_id in parent_messages:
-                # Get parent depth
-                parent_edge = self.db.query(DagEdge).filter_by(
-                    child_id=parent_id
-                ).order_by(DagEdge.depth.desc()).first()
-                parent_depth = parent_edge.depth if parent_edge else 0
-                depth = max(depth, parent_depth + 1)
-                
-                # Create DAG edge
-                dag_edge = DagEdge(
-                    child_id=message_id,
-                    parent_id=parent_id,
-                    edge_type='message',
-                    depth=depth
-                )
-                self.db.add(dag_edge)
-        else:
-            # Link to genesis or previous messages
-            prev_messages = self.db.query(WalletMessage).filter_by(
-                from_address=from_address
-            ).order_by(WalletMessage.timestamp.desc()).limit(1).all()
+        with self._session_scope() as session:
+            # Get wallet
+            wallet = session.query(NexusWallet).filter_by(address=from_address).first()
+            if not wallet:
+                raise ValueError("Wallet not found")
             
-            if prev_messages:
-                parent_msg = prev_messages[0]
-                parent_edge = self.db.query(DagEdge).filter_by(
-                    child_id=parent_msg.message_id
-                ).order_by(DagEdge.depth.desc()).first()
-                depth = (parent_edge.depth if parent_edge else 0) + 1
-                
-                dag_edge = DagEdge(
-                    child_id=message_id,
-                    parent_id=parent_msg.message_id,
-                    edge_type='message',
-                    depth=depth
+            # Unlock wallet
+            private_key = self._decrypt_private_key(
+                wallet.encrypted_private_key,
+                password,
+                json.loads(wallet.public_key)
+            )
+            
+            # Create wavelength-encoded message
+            wave_msg = self.wavelength_validator.create_message_wave(
+                content, spectral_region, ModulationType.PSK
+            )
+            
+            # Calculate E=hf cost
+            energy_cost = self._calculate_message_cost(wave_msg)
+            cost_nxt = energy_cost * 1e-17  # Scale to NXT
+            
+            # Deduct cost from sender (committed together with the message)
+            cost_units = int(cost_nxt * UNITS_PER_NXT)
+            account = self._get_token_account(from_address, session)
+            if not account or account.balance < cost_units:
+                raise ValueError("Insufficient balance for message cost")
+            
+            account.balance -= cost_units
+            # Add to validator pool
+            validator_pool = self._get_token_account("VALIDATOR_POOL", session)
+            if validator_pool:
+                validator_pool.balance += cost_units
+            
+            # Generate message ID
+            message_id = self._generate_message_id(from_address, content, wave_msg.wavelength)
+            
+            # Save message
+            msg = WalletMessage(
+                message_id=message_id,
+                from_address=from_address,
+                to_address=to_address,
+                content=content,
+                spectral_region=spectral_region.display_name,
+                wavelength=wave_msg.wavelength,
+                cost_nxt=cost_nxt,
+                dag_parents=json.dumps(parent_messages) if parent_messages else None
+            )
+            
+            # Create DAG edges for message parents
+            depth = 0
+            if parent_messages:
+                parent_depths = dict(
+                    session.query(DagEdge.child_id, sa.func.max(DagEdge.depth)).filter(
+                        DagEdge.child_id.in_(parent_messages)
+                    ).group_by(DagEdge.child_id).all()
                 )
-                self.db.add(dag_edge)
+                for parent_id in parent_messages:
+                    depth = max(depth, parent_depths.get(parent_id, 0) + 1)
+                    session.add(DagEdge(
+                        child_id=message_id,
+                        parent_id=parent_id,
+                        edge_type='message',
+                        depth=depth
+                    ))
             else:
-                # First message - link to genesis
-                depth = 1
-                genesis_edge = DagEdge(
-                    child_id=message_id,
-                    parent_id='GENESIS',
-                    edge_type='message',
-                    depth=depth
-                )
-                self.db.add(genesis_edge)
-        
-        try:
-            self.db.commit()
-        except Exception as e:
-            self.db.rollback()
-            raise e
+                # Link to genesis or previous messages
+                parent_msg = session.query(WalletMessage).filter_by(
+                    from_address=from_address
+                ).order_by(WalletMessage.timestamp.desc()).first()
+                
+                if parent_msg:
+                    parent_edge = session.query(DagEdge).filter_by(
+                        child_id=parent_msg.message_id
+                    ).order_by(DagEdge.depth.desc()).first()
+                    depth = (parent_edge.depth if parent_edge else 0) + 1
+                    
+                    session.add(DagEdge(
+                        child_id=message_id,
+                        parent_id=parent_msg.message_id,
+                        edge_type='message',
+                        depth=depth
+                    ))
+                else:
+                    # First message - link to genesis
+                    depth = 1
+                    session.add(DagEdge(
+                        child_id=message_id,
+                        parent_id='GENESIS',
+                        edge_type='message',
+                        depth=depth
+                    ))
+            
+            session.add(msg)
         
         return {
             'message_id': message_id,
@@ -934,19 +1019,20 @@ class NexusNativeWallet:
         received: bool = True
     ) -> List[Dict[str, Any]]:
         """Get message history for address"""
-        query = self.db.query(WalletMessage)
-        
-        if sent and received:
-            query = query.filter(
-                (WalletMessage.from_address == address) |
-                (WalletMessage.to_address == address)
-            )
-        elif sent:
-            query = query.filter(WalletMessage.from_address == address)
-        elif received:
-            query = query.filter(WalletMessage.to_address == address)
-        
-        messages = query.order_by(WalletMessage.timestamp.desc()).limit(limit).all()
+        with self._session_scope() as session:
+            query = session.query(WalletMessage)
+            
+            if sent and received:
+                query = query.filter(
+                    (WalletMessage.from_address == address) |
+                    (WalletMessage.to_address == address)
+                )
+            elif sent:
+                query = query.filter(WalletMessage.from_address == address)
+            elif received:
+                query = query.filter(WalletMessage.to_address == address)
+            
+            messages = query.order_by(WalletMessage.timestamp.desc()).limit(limit).all()
         
         return [
             {
@@ -973,10 +1059,11 @@ class NexusNativeWallet:
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get NXT transaction history"""
-        transactions = self.db.query(WalletTransaction).filter(
-            (WalletTransaction.from_address == address) |
-            (WalletTransaction.to_address == address)
-        ).order_by(WalletTransaction.timestamp.desc()).limit(limit).all()
+        with self._session_scope() as session:
+            transactions = session.query(WalletTransaction).filter(
+                (WalletTransaction.from_address == address) |
+                (WalletTransaction.to_address == address)
+            ).order_by(WalletTransaction.timestamp.desc()).limit(limit).all()
         
         return [
             {
@@ -999,9 +1086,10 @@ class NexusNativeWallet:
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get message history for wallet"""
-        messages = self.db.query(WalletMessage).filter_by(
-            from_address=address
-        ).order_by(WalletMessage.timestamp.desc()).limit(limit).all()
+        with self._session_scope() as session:
+            messages = session.query(WalletMessage).filter_by(
+                from_address=address
+            ).order_by(WalletMessage.timestamp.desc()).limit(limit).all()
         
         return [
             {
@@ -1024,23 +1112,26 @@ class NexusNativeWallet:
     @retry_on_connection_error(max_retries=2)
     def list_wallets(self) -> List[Dict[str, Any]]:
         """List all wallets"""
-        wallets = self.db.query(NexusWallet).filter_by(is_active=True).all()
-        result = []
-        for w in wallets:
-            account = self._get_token_account(w.address)
-            balance_nxt = account.balance / UNITS_PER_NXT if account else 0.0
-            result.append({
+        with self._session_scope() as session:
+            rows = session.query(NexusWallet, TokenAccount.balance).outerjoin(
+                TokenAccount, TokenAccount.address == NexusWallet.address
+            ).filter(NexusWallet.is_active == True).all()
+        
+        return [
+            {
                 'address': w.address,
-                'balance_nxt': balance_nxt,
+                'balance_nxt': balance / UNITS_PER_NXT if balance is not None else 0.0,
                 'created_at': w.created_at.isoformat(),
                 'last_used': w.last_used.isoformat() if w.last_used else None
-            })
-        return result
+            }
+            for w, balance in rows
+        ]
     
     @retry_on_connection_error(max_retries=2)
     def export_quantum_proof(self, tx_id: str) -> Dict[str, Any]:
         """Export quantum security proof for transaction"""
-        tx = self.db.query(WalletTransaction).filter_by(tx_id=tx_id).first()
+        with self._session_scope() as session:
+            tx = session.query(WalletTransaction).filter_by(tx_id=tx_id).first()
         if not tx:
             raise ValueError("Transaction not found")
         
@@ -1058,9 +1149,10 @@ class NexusNativeWallet:
         Get ALL transactions from blockchain (for explorer/analytics)
         READ-ONLY bulk query - much more efficient than per-wallet queries
         """
-        transactions = self.db.query(WalletTransaction).order_by(
-            WalletTransaction.timestamp.desc()
-        ).limit(limit).all()
+        with self._session_scope() as session:
+            transactions = session.query(WalletTransaction).order_by(
+                WalletTransaction.timestamp.desc()
+            ).limit(limit).all()
         
         return [
             {
@@ -1084,9 +1176,10 @@ class NexusNativeWallet:
         Get ALL messages from blockchain (for explorer/analytics)
         READ-ONLY bulk query - much more efficient than per-wallet queries
         """
-        messages = self.db.query(WalletMessage).order_by(
-            WalletMessage.timestamp.desc()
-        ).limit(limit).all()
+        with self._session_scope() as session:
+            messages = session.query(WalletMessage).order_by(
+                WalletMessage.timestamp.desc()
+            ).limit(limit).all()
         
         return [
             {
@@ -1311,54 +1404,55 @@ class NexusNativeWallet:
         }
         
         try:
-            # 1. Verify DAG structure
-            dag_check = self._verify_dag_structure()
-            audit_report['dag_structure'] = dag_check
-            if not dag_check['is_valid']:
-                audit_report['status'] = 'fail'
-                audit_report['errors'].extend(dag_check['errors'])
-            
-            # 2. Verify transaction balances
-            balance_check = self._verify_transaction_balances()
-            audit_report['balance_integrity'] = balance_check
-            if not balance_check['is_valid']:
-                audit_report['status'] = 'fail'
-                audit_report['errors'].extend(balance_check['errors'])
-            
-            # 3. Verify all transactions have verification records
-            verification_check = self._verify_all_transactions_validated()
-            audit_report['verification_coverage'] = verification_check
-            if not verification_check['is_complete']:
-                audit_report['warnings'].append(f"{verification_check['missing_count']} transactions without verification records")
-            
-            # 4. Verify IO records match transactions
-            io_check = self._verify_io_consistency()
-            audit_report['io_consistency'] = io_check
-            if not io_check['is_valid']:
-                audit_report['status'] = 'fail'
-                audit_report['errors'].extend(io_check['errors'])
-            
-            # 5. Compute statistics
-            audit_report['statistics'] = {
-                'total_transactions': self.db.query(WalletTransaction).count(),
-                'total_messages': self.db.query(WalletMessage).count(),
-                'total_dag_edges': self.db.query(DagEdge).count(),
-                'total_verification_records': self.db.query(VerificationRecord).count(),
-                'total_io_records': self.db.query(TransactionIO).count(),
-                'genesis_blocks': self.db.query(DagEdge).filter_by(parent_id='GENESIS').count()
-            }
-            
-            return audit_report
+            with self._session_scope() as session:
+                # 1. Verify DAG structure
+                dag_check = self._verify_dag_structure(session)
+                audit_report['dag_structure'] = dag_check
+                if not dag_check['is_valid']:
+                    audit_report['status'] = 'fail'
+                    audit_report['errors'].extend(dag_check['errors'])
+                
+                # 2. Verify transaction balances
+                balance_check = self._verify_transaction_balances(session)
+                audit_report['balance_integrity'] = balance_check
+                if not balance_check['is_valid']:
+                    audit_report['status'] = 'fail'
+                    audit_report['errors'].extend(balance_check['errors'])
+                
+                # 3. Verify all transactions have verification records
+                verification_check = self._verify_all_transactions_validated(session)
+                audit_report['verification_coverage'] = verification_check
+                if not verification_check['is_complete']:
+                    audit_report['warnings'].append(f"{verification_check['missing_count']} transactions without verification records")
+                
+                # 4. Verify IO records match transactions
+                io_check = self._verify_io_consistency(session)
+                audit_report['io_consistency'] = io_check
+                if not io_check['is_valid']:
+                    audit_report['status'] = 'fail'
+                    audit_report['errors'].extend(io_check['errors'])
+                
+                # 5. Compute statistics
+                audit_report['statistics'] = {
+                    'total_transactions': session.query(WalletTransaction).count(),
+                    'total_messages': session.query(WalletMessage).count(),
+                    'total_dag_edges': session.query(DagEdge).count(),
+                    'total_verification_records': session.query(VerificationRecord).count(),
+                    'total_io_records': session.query(TransactionIO).count(),
+                    'genesis_blocks': session.query(DagEdge).filter_by(parent_id='GENESIS').count()
+                }
+                
+                return audit_report
             
         except Exception as e:
             audit_report['status'] = 'error'
             audit_report['errors'].append(f"Audit failed: {str(e)}")
             return audit_report
     
-    def _verify_dag_structure(self) -> Dict[str, Any]:
+    def _verify_dag_structure(self, session) -> Dict[str, Any]:
         """Verify DAG is acyclic and properly formed"""
         try:
-            all_edges = self.db.query(DagEdge).all()
+            all_edges = session.query(DagEdge).all()
             
             # Build adjacency list
             graph = {}
@@ -1404,10 +1498,10 @@ class NexusNativeWallet:
                 'errors': [f'DAG verification failed: {str(e)}']
             }
     
-    def _verify_transaction_balances(self) -> Dict[str, Any]:
+    def _verify_transaction_balances(self, session) -> Dict[str, Any]:
         """Verify all account balances match transaction history"""
         try:
-            all_accounts = self.db.query(TokenAccount).all()
+            all_accounts = session.query(TokenAccount).all()
             errors = []
             
             # Handle empty database gracefully
@@ -1424,12 +1518,12 @@ class NexusNativeWallet:
                     continue
                 
                 # Calculate balance from transactions
-                incoming = self.db.query(WalletTransaction).filter_by(
+                incoming = session.query(WalletTransaction).filter_by(
                     to_address=account.address,
                     status='confirmed'
                 ).all()
                 
-                outgoing = self.db.query(WalletTransaction).filter_by(
+                outgoing = session.query(WalletTransaction).filter_by(
                     from_address=account.address,
                     status='confirmed'
                 ).all()
@@ -1455,11 +1549,11 @@ class NexusNativeWallet:
                 'errors': [f'Balance verification failed: {str(e)}']
             }
     
-    def _verify_all_transactions_validated(self) -> Dict[str, Any]:
+    def _verify_all_transactions_validated(self, session) -> Dict[str, Any]:
         """Check all transactions have verification records"""
         try:
-            total_txs = self.db.query(WalletTransaction).count()
-            verified_txs = self.db.query(VerificationRecord).count()
+            total_txs = session.query(WalletTransaction).count()
+            verified_txs = session.query(VerificationRecord).count()
             
             missing = total_txs - verified_txs
             
@@ -1476,14 +1570,14 @@ class NexusNativeWallet:
                 'error': str(e)
             }
     
-    def _verify_io_consistency(self) -> Dict[str, Any]:
+    def _verify_io_consistency(self, session) -> Dict[str, Any]:
         """Verify IO records match transaction amounts"""
         try:
-            all_txs = self.db.query(WalletTransaction).all()
+            all_txs = session.query(WalletTransaction).all()
             errors = []
             
             for tx in all_txs:
-                io_records = self.db.query(TransactionIO).filter_by(tx_id=tx.tx_id).all()
+                io_records = session.query(TransactionIO).filter_by(tx_id=tx.tx_id).all()
                 
                 if not io_records:
                     continue  # Older transactions before IO tracking
@@ -419,11 +419,15 @@ class NexusWalletAdapter:
                 # Apply the actual deduction by creating internal transfer
                 # (This simulates the energy cost payment)
                 if actual_amount_units > 0:
-                    # Deduct from token account
-                    token_account = self.nexus_wallet._get_or_create_token_account(nexus_address)
-                    if token_account.balance >= int(amount_nxt * 100):
-                        token_account.balance -= int(amount_nxt * 100)
-                        final_balance_units = token_account.balance * 1_000_000
+                    # Deduct from token account under a row lock so concurrent
+                    # transfers cannot interleave with the read-modify-write
+                    with self.nexus_wallet._session_scope() as session:
+                        token_account = self.nexus_wallet._get_or_create_token_account(
+                            nexus_address, session=session, lock=True
+                        )
+                        if token_account.balance >= int(amount_nxt * 100):
+                            token_account.balance -= int(amount_nxt * 100)
+                            final_balance_units = token_account.balance * 1_000_000
                 
                 return {
                     'success': True,
@@ -514,11 +518,14 @@ class NexusWalletAdapter:
                 
                 # Add to token account
                 amount_nxt = amount_units / UNITS_PER_NXT
-                token_account = self.nexus_wallet._get_or_create_token_account(nexus_address)
-                token_account.balance += int(amount_nxt * 100)
-                
-                # Get new balance
-                new_balance_units = token_account.balance * 1_000_000
+                with self.nexus_wallet._session_scope() as session:
+                    token_account = self.nexus_wallet._get_or_create_token_account(
+                        nexus_address, session=session, lock=True
+                    )
+                    token_account.balance += int(amount_nxt * 100)
+                    
+                    # Get new balance
+                    new_balance_units = token_account.balance * 1_000_000
                 
                 return {
                     'success': True,
@@ -345,7 +345,7 @@ class NexusWNSPWallet(NexusNativeWallet):
             nexus_address = mapping.nexus_address
             
             # Add to token account (already in correct units)
-            token_account = self._get_or_create_token_account(nexus_address)
+            token_account = self._get_or_create_token_account(nexus_address, session=session)
             token_account.balance += amount_units
             
             session.commit()
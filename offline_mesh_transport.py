@@ -25,6 +25,10 @@ from datetime import datetime
 # Import existing WNSP infrastructure
 from wnsp_protocol_v2 import WnspMessageV2, WnspEncoderV2, SpectralRegion
 from wavelength_validator import ModulationType
+from wnsp_wire_codec import (
+    WnspWireCodec, FragmentReassembler, WireCodecError,
+    fragment_payload, is_fragment, is_wire_payload
+)
 
 
 class TransportProtocol(Enum):
@@ -35,6 +39,15 @@ class TransportProtocol(Enum):
     INTERNET = "internet"              # Fallback: when offline fails
 
 
+# Usable payload bytes per link-layer packet
+TRANSPORT_MTU = {
+    TransportProtocol.BLUETOOTH_LE: 20,    # Default ATT MTU (23) minus 3-byte header
+    TransportProtocol.WIFI_DIRECT: 1400,   # UDP payload within a 1500-byte frame
+    TransportProtocol.NFC: 244,            # Conservative NDEF record size
+    TransportProtocol.INTERNET: 1400,
+}
+
+
 class ConnectionStatus(Enum):
     """Connection state for offline peers."""
     DISCOVERING = "discovering"
@@ -87,6 +100,7 @@ class OfflineMeshStats:
     messages_received_offline: int = 0
     messages_relayed: int = 0  # Messages forwarded through this node
     bytes_transferred: int = 0
+    packets_transferred: int = 0  # Link-layer packets after MTU fragmentation
     avg_latency_ms: float = 0.0
     mesh_diameter: int = 0     # Maximum hop count in network
     uptime_seconds: float = 0.0
@@ -147,6 +161,10 @@ class OfflineMeshTransport:
         # WNSP encoder for creating messages
         self.wnsp_encoder = WnspEncoderV2()
         
+        # Binary wire codec and per-peer fragment reassembly
+        self.wire_codec = WnspWireCodec()
+        self.reassembler = FragmentReassembler()
+        
         # Message history (prevent duplicate forwarding)
         self.seen_message_ids: set = set()
         
@@ -341,20 +359,25 @@ class OfflineMeshTransport:
         # Send via best available protocol for each peer
         successful_sends = 0
         total_targets = len(targets)
+        message_bytes = self._serialize_wnsp_message(message)
         
         for peer in targets:
-            success = self._transmit_to_peer(peer, message)
+            success = self._transmit_to_peer(peer, message, message_bytes)
             if success:
                 successful_sends += 1
         
         # Update statistics
         self.stats.messages_sent_offline += successful_sends
-        self.stats.bytes_transferred += len(json.dumps(message.__dict__).encode('utf-8'))
         
         status = f"Sent offline ({transmission_mode}): {successful_sends}/{total_targets} peers"
         return (successful_sends > 0, status)
     
-    def _transmit_to_peer(self, peer: OfflinePeer, message: WnspMessageV2) -> bool:
+    def _transmit_to_peer(
+        self,
+        peer: OfflinePeer,
+        message: WnspMessageV2,
+        message_bytes: Optional[bytes] = None
+    ) -> bool:
         """
         Physically transmit WNSP message to a single peer.
         
@@ -363,30 +386,41 @@ class OfflineMeshTransport:
         - WiFi Direct: Send over socket connection
         - NFC: Write NDEF record
         
+        The binary payload is split into packets that fit the peer link's MTU.
+        
         Args:
             peer: Target peer
             message: WNSP message to send
+            message_bytes: Pre-serialized payload (avoids re-encoding per peer)
         
         Returns:
             True if transmission succeeded
         """
-        # Serialize WNSP message to bytes
-        message_bytes = self._serialize_wnsp_message(message)
+        if message_bytes is None:
+            message_bytes = self._serialize_wnsp_message(message)
+        
+        mtu = TRANSPORT_MTU.get(peer.transport_protocol, TRANSPORT_MTU[TransportProtocol.WIFI_DIRECT])
+        packets = fragment_payload(message_bytes, mtu)
         
         try:
             if peer.transport_protocol == TransportProtocol.BLUETOOTH_LE:
-                return self._transmit_bluetooth_le(peer, message_bytes)
+                success = self._transmit_bluetooth_le(peer, packets)
             elif peer.transport_protocol == TransportProtocol.WIFI_DIRECT:
-                return self._transmit_wifi_direct(peer, message_bytes)
+                success = self._transmit_wifi_direct(peer, packets)
             elif peer.transport_protocol == TransportProtocol.NFC:
-                return self._transmit_nfc(peer, message_bytes)
+                success = self._transmit_nfc(peer, packets)
             else:
                 return False
         except Exception as e:
             print(f"❌ Transmission failed to {peer.device_name}: {e}")
             return False
+        
+        if success:
+            self.stats.bytes_transferred += sum(len(p) for p in packets)
+            self.stats.packets_transferred += len(packets)
+        return success
     
-    def _transmit_bluetooth_le(self, peer: OfflinePeer, data: bytes) -> bool:
+    def _transmit_bluetooth_le(self, peer: OfflinePeer, packets: List[bytes]) -> bool:
         """
         Transmit data via Bluetooth LE GATT.
         
@@ -405,11 +439,12 @@ class OfflineMeshTransport:
         success = random.random() < success_probability
         
         if success:
-            print(f"  📡 Bluetooth LE → {peer.device_name} ({len(data)} bytes)")
+            print(f"  📡 Bluetooth LE → {peer.device_name} "
+                  f"({sum(len(p) for p in packets)} bytes, {len(packets)} packets)")
         
         return success
     
-    def _transmit_wifi_direct(self, peer: OfflinePeer, data: bytes) -> bool:
+    def _transmit_wifi_direct(self, peer: OfflinePeer, packets: List[bytes]) -> bool:
         """
         Transmit data via WiFi Direct socket.
         
@@ -426,11 +461,12 @@ class OfflineMeshTransport:
         success = random.random() < 0.98
         
         if success:
-            print(f"  📶 WiFi Direct → {peer.device_name} ({len(data)} bytes)")
+            print(f"  📶 WiFi Direct → {peer.device_name} "
+                  f"({sum(len(p) for p in packets)} bytes, {len(packets)} packets)")
         
         return success
     
-    def _transmit_nfc(self, peer: OfflinePeer, data: bytes) -> bool:
+    def _transmit_nfc(self, peer: OfflinePeer, packets: List[bytes]) -> bool:
         """
         Transmit data via NFC (for pairing/key exchange only).
         
@@ -447,7 +483,8 @@ class OfflineMeshTransport:
         success = random.random() < 0.99
         
         if success:
-            print(f"  📲 NFC → {peer.device_name} ({len(data)} bytes)")
+            print(f"  📲 NFC → {peer.device_name} "
+                  f"({sum(len(p) for p in packets)} bytes, {len(packets)} packets)")
         
         return success
     
@@ -455,26 +492,10 @@ class OfflineMeshTransport:
         """
         Serialize WNSP message to bytes for transmission.
         
-        Uses JSON encoding with message metadata.
-        Real implementation might use more efficient binary encoding.
-        """
-        message_dict = {
-            'message_id': message.message_id,
-            'sender_id': message.sender_id,
-            'recipient_id': message.recipient_id,
-            'content': message.content,
-            'spectral_region': message.spectral_region.name,
-            'modulation_type': message.modulation_type.name,
-            'frequency_thz': message.frequency_thz,
-            'quantum_energy': message.quantum_energy,
-            'cost_nxt': message.cost_nxt,
-            'parent_message_ids': message.parent_message_ids,
-            'interference_hash': message.interference_hash,
-            'created_at': message.created_at,
-            'frames': [f.__dict__ for f in message.frames] if hasattr(message, 'frames') else []
-        }
-        
-        return json.dumps(message_dict).encode('utf-8')
+        Uses the versioned binary wire codec (wnsp_wire_codec): column-packed
+        frames, varint enums/IDs and optional body compression.
+        """
+        return self.wire_codec.encode(message)
     
     # ========================================================================
     # MULTI-HOP ROUTING (Messages through mesh)
@@ -551,6 +572,27 @@ class OfflineMeshTransport:
     # MESSAGE RECEPTION (Incoming from offline peers)
     # ========================================================================
     
+    def receive_packet_offline(self, packet: bytes, from_peer_id: str) -> Optional[WnspMessageV2]:
+        """
+        Receive one link-layer packet, reassembling fragmented messages.
+        
+        Args:
+            packet: Packet bytes as delivered by the radio
+            from_peer_id: Device ID of sender
+        
+        Returns:
+            The WNSP message once its final fragment arrives, else None
+        """
+        try:
+            payload = self.reassembler.add_fragment(packet, from_peer_id)
+        except WireCodecError as e:
+            print(f"❌ Dropped corrupt fragment from {from_peer_id}: {e}")
+            return None
+        
+        if payload is None:
+            return None
+        return self.receive_message_offline(payload, from_peer_id)
+    
     def receive_message_offline(self, message_bytes: bytes, from_peer_id: str) -> Optional[WnspMessageV2]:
         """
         Receive and deserialize WNSP message from offline peer.
@@ -559,6 +601,9 @@ class OfflineMeshTransport:
         - Bluetooth LE: Triggered by GATT characteristic notification
         - WiFi Direct: Received via socket listener
         
+        Accepts binary wire payloads and, for peers still running the
+        previous release, legacy JSON payloads.
+        
         Args:
             message_bytes: Serialized WNSP message
             from_peer_id: Device ID of sender
@@ -567,25 +612,13 @@ class OfflineMeshTransport:
             Deserialized WNSP message, or None if invalid
         """
         try:
-            message_dict = json.loads(message_bytes.decode('utf-8'))
+            if is_fragment(message_bytes):
+                return self.receive_packet_offline(message_bytes, from_peer_id)
             
-            # Reconstruct WNSP message
-            # (Simplified - real implementation would fully reconstruct all fields)
-            message = WnspMessageV2(
-                message_id=message_dict['message_id'],
-                sender_id=message_dict['sender_id'],
-                recipient_id=message_dict['recipient_id'],
-                content=message_dict['content'],
-                spectral_region=SpectralRegion[message_dict['spectral_region']],
-                modulation_type=ModulationType[message_dict['modulation_type']],
-                frequency_thz=message_dict['frequency_thz'],
-                quantum_energy=message_dict['quantum_energy'],
-                cost_nxt=message_dict['cost_nxt'],
-                parent_message_ids=message_dict.get('parent_message_ids', []),
-                interference_hash=message_dict['interference_hash'],
-                created_at=message_dict['created_at'],
-                frames=[]  # Frames would be reconstructed here
-            )
+            if is_wire_payload(message_bytes):
+                message = self.wire_codec.decode(message_bytes)
+            else:
+                message = self._deserialize_legacy_json(message_bytes)
             
             self.stats.messages_received_offline += 1
             
@@ -599,6 +632,27 @@ class OfflineMeshTransport:
             print(f"❌ Failed to deserialize message: {e}")
             return None
     
+    @staticmethod
+    def _deserialize_legacy_json(message_bytes: bytes) -> WnspMessageV2:
+        """Decode the pre-binary JSON wire format (metadata only, no frames)."""
+        message_dict = json.loads(message_bytes.decode('utf-8'))
+        
+        return WnspMessageV2(
+            message_id=message_dict['message_id'],
+            sender_id=message_dict['sender_id'],
+            recipient_id=message_dict['recipient_id'],
+            content=message_dict['content'],
+            spectral_region=SpectralRegion[message_dict['spectral_region']],
+            modulation_type=ModulationType[message_dict['modulation_type']],
+            frequency_thz=message_dict['frequency_thz'],
+            quantum_energy=message_dict['quantum_energy'],
+            cost_nxt=message_dict['cost_nxt'],
+            parent_message_ids=message_dict.get('parent_message_ids', []),
+            interference_hash=message_dict['interference_hash'],
+            created_at=message_dict['created_at'],
+            frames=[]
+        )
+    
     # ========================================================================
     # TOPOLOGY & STATISTICS
     # ========================================================================
@@ -671,6 +725,7 @@ class OfflineMeshTransport:
             'messages_received': self.stats.messages_received_offline,
             'messages_relayed': self.stats.messages_relayed,
             'bytes_transferred': self.stats.bytes_transferred,
+            'packets_transferred': self.stats.packets_transferred,
             'mesh_diameter': self.stats.mesh_diameter,
             'uptime_seconds': self.stats.uptime_seconds,
             'bluetooth_enabled': self.bluetooth_enabled,
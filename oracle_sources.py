@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+import threading
+import time
 import requests
 import json
 from oracle_error_handling import (
@@ -10,6 +13,10 @@ from oracle_error_handling import (
 )
 
 
+# Variables the simulation reads from oracles
+ORACLE_VARIABLES = ['H', 'M', 'D', 'E', 'C_cons', 'C_disp']
+
+
 class OracleDataPoint:
     def __init__(self, timestamp: datetime, variable: str, value: float, metadata: Optional[Dict] = None):
         self.timestamp = timestamp
@@ -49,6 +56,10 @@ class OracleDataSource(ABC):
     @abstractmethod
     def get_status(self) -> Dict[str, Any]:
         pass
+    
+    def provides(self, variable: str) -> bool:
+        """Whether fetch_data serves this variable; None for it counts as a failure"""
+        return True
 
 
 class RestAPIOracle(OracleDataSource):
@@ -122,6 +133,9 @@ class RestAPIOracle(OracleDataSource):
     def disconnect(self):
         self.is_connected = False
     
+    def provides(self, variable: str) -> bool:
+        return bool(self.variable_endpoints.get(variable))
+    
     def fetch_data(self, variable: str) -> Optional[OracleDataPoint]:
         """Fetch data with retry logic, circuit breaker, and graceful degradation"""
         if not self.is_connected:
@@ -220,6 +234,9 @@ class StaticDataOracle(OracleDataSource):
     def disconnect(self):
         self.is_connected = False
     
+    def provides(self, variable: str) -> bool:
+        return self.data_values.get(variable) is not None
+    
     def fetch_data(self, variable: str) -> Optional[OracleDataPoint]:
         if not self.is_connected:
             return None
@@ -269,6 +286,9 @@ class MockEnvironmentalOracle(OracleDataSource):
     def disconnect(self):
         self.is_connected = False
     
+    def provides(self, variable: str) -> bool:
+        return variable in self.base_values
+    
     def fetch_data(self, variable: str) -> Optional[OracleDataPoint]:
         if not self.is_connected:
             return None
@@ -306,8 +326,50 @@ class MockEnvironmentalOracle(OracleDataSource):
 
 
 class OracleManager:
-    def __init__(self):
+    """
+    Registry of oracle data sources with concurrent fetching.
+    
+    fetch_all fans every (source, variable) fetch out to a thread pool and
+    waits on each source only until its deadline, so a refresh takes as long
+    as the slowest healthy source instead of the sum of all of them. Each
+    source sits behind a circuit breaker (exceptions and missed deadlines
+    count as failures), and data points are cached stale-while-revalidate:
+    fresh points come from cache, stale points are returned immediately while
+    a background refresh runs, and a stale point stands in when a fetch fails
+    or misses its deadline.
+    """
+    
+    def __init__(self, max_workers: int = 32, source_deadline: float = 5.0,
+                 fresh_ttl: float = 10.0, stale_ttl: float = 300.0,
+                 failure_threshold: int = 3, circuit_timeout: int = 30,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize OracleManager.
+        
+        Args:
+            max_workers: Thread pool size for concurrent fetches
+            source_deadline: Seconds to wait on a source unless its config sets 'deadline'
+            fresh_ttl: Seconds a cached data point is served without refetching
+            stale_ttl: Seconds a cached data point may still be served while refreshing
+            failure_threshold: Failures before a source's circuit opens
+            circuit_timeout: Seconds before an open circuit lets a probe through
+            clock: Monotonic clock used for cache ages
+        """
         self.sources: Dict[str, OracleDataSource] = {}
+        self.max_workers = max_workers
+        self.source_deadline = source_deadline
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.failure_threshold = failure_threshold
+        self.circuit_timeout = circuit_timeout
+        self.clock = clock
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        
+        # (source name, variable) -> (fetched at, data point) / running fetch
+        self._cache: Dict[Tuple[str, str], Tuple[float, OracleDataPoint]] = {}
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def add_source(self, source: OracleDataSource):
         self.sources[source.name] = source
@@ -316,6 +378,10 @@ class OracleManager:
         if name in self.sources:
             self.sources[name].disconnect()
             del self.sources[name]
+            with self._lock:
+                self.breakers.pop(name, None)
+                for key in [key for key in self._cache if key[0] == name]:
+                    del self._cache[key]
     
     def get_source(self, name: str) -> Optional[OracleDataSource]:
         return self.sources.get(name)
@@ -324,33 +390,130 @@ class OracleManager:
         return list(self.sources.values())
     
     def connect_all(self) -> Dict[str, bool]:
+        """Connect all sources concurrently; a source missing its deadline counts as failed."""
+        started = time.monotonic()
+        futures = {name: self._get_executor().submit(source.connect)
+                   for name, source in self.sources.items()}
+        
         results = {}
-        for name, source in self.sources.items():
-            results[name] = source.connect()
+        for name, future in futures.items():
+            source = self.sources[name]
+            try:
+                results[name] = bool(future.result(timeout=self._remaining(source, started)))
+                self._record(name, success=True)
+            except FuturesTimeoutError:
+                source.error_message = f"Connection exceeded {self._deadline(source):.1f}s deadline"
+                results[name] = False
+                self._record(name, success=False)
+            except Exception as e:
+                source.error_message = handle_oracle_error(e, "connecting to oracle")
+                results[name] = False
+                self._record(name, success=False)
         return results
     
     def disconnect_all(self):
         for source in self.sources.values():
             source.disconnect()
     
+    def shutdown(self):
+        """Stop the fetch thread pool without waiting for fetches still running."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
     def fetch_variable(self, variable: str, source_name: Optional[str] = None) -> Optional[OracleDataPoint]:
-        if source_name:
-            source = self.sources.get(source_name)
-            if source:
-                return source.fetch_data(variable)
-            return None
+        """
+        Fetch one variable, from the named source or the first source that has it.
         
-        for source in self.sources.values():
-            if source.is_connected:
-                data = source.fetch_data(variable)
-                if data is not None:
-                    return data
+        Without a source name all connected sources are queried concurrently
+        and the first one in registration order with a value wins.
+        """
+        if source_name and source_name not in self.sources:
+            return None
         
+        points = self.fetch_all([variable], [source_name] if source_name else None)
+        for name in self.sources:
+            point = points.get(name, {}).get(variable)
+            if point is not None:
+                return point
         return None
     
+    def fetch_all(self, variables: Optional[List[str]] = None,
+                  source_names: Optional[List[str]] = None,
+                  refresh: bool = False) -> Dict[str, Dict[str, OracleDataPoint]]:
+        """
+        Fetch variables from all connected sources concurrently.
+        
+        Args:
+            variables: Variables to fetch (default: ORACLE_VARIABLES)
+            source_names: Restrict to these sources (default: all)
+            refresh: Refetch even fresh cached points
+        
+        Returns:
+            {source name: {variable: data point}} for the points available
+            within each source's deadline (possibly stale, see class docstring)
+        """
+        variables = list(variables or ORACLE_VARIABLES)
+        names = source_names if source_names is not None else list(self.sources)
+        started = time.monotonic()
+        now = self.clock()
+        
+        results: Dict[str, Dict[str, OracleDataPoint]] = {}
+        pending = []
+        for name in names:
+            source = self.sources.get(name)
+            if source is None or not source.is_connected:
+                continue
+            results[name] = {}
+            with self._lock:
+                circuit_open = self._breaker(name).is_open()
+            
+            for variable in variables:
+                if not source.provides(variable):
+                    continue
+                cached = self._cache.get((name, variable))
+                age = now - cached[0] if cached else None
+                if cached and not refresh and age < self.fresh_ttl:
+                    results[name][variable] = cached[1]
+                    continue
+                stale = cached[1] if cached and age < self.stale_ttl else None
+                if circuit_open:
+                    if stale is not None:
+                        results[name][variable] = stale
+                    continue
+                
+                future = self._submit(source, variable)
+                if stale is not None and not refresh:
+                    # Serve the stale point now; the fetch revalidates in the background
+                    results[name][variable] = stale
+                else:
+                    pending.append((source, variable, future, stale))
+        
+        timed_out = set()
+        for source, variable, future, stale in pending:
+            try:
+                point = future.result(timeout=self._remaining(source, started))
+            except FuturesTimeoutError:
+                point = None
+                if source.name not in timed_out:
+                    # One breaker failure per source per refresh
+                    timed_out.add(source.name)
+                    source.error_message = f"Fetch exceeded {self._deadline(source):.1f}s deadline"
+                    self._record(source.name, success=False)
+            point = point or stale
+            if point is not None:
+                results[source.name][variable] = point
+        
+        return results
+    
     def get_status_all(self) -> List[Dict[str, Any]]:
         return [source.get_status() for source in self.sources.values()]
     
+    def get_circuit_status(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit breaker state per source."""
+        with self._lock:
+            return {name: self._breaker(name).get_status() for name in self.sources}
+    
     def create_source(self, oracle_type: str, name: str, config: Dict[str, Any]) -> OracleDataSource:
         if oracle_type == 'rest_api':
             return RestAPIOracle(name, config)
@@ -360,6 +523,70 @@ class OracleManager:
             return MockEnvironmentalOracle(name, config)
         else:
             raise ValueError(f"Unknown oracle type: {oracle_type}")
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='oracle-fetch')
+        return self._executor
+    
+    def _deadline(self, source: OracleDataSource) -> float:
+        return float(source.config.get('deadline', self.source_deadline))
+    
+    def _remaining(self, source: OracleDataSource, started: float) -> float:
+        return max(0.0, started + self._deadline(source) - time.monotonic())
+    
+    def _breaker(self, name: str) -> CircuitBreaker:
+        # Caller holds self._lock
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.circuit_timeout)
+            self.breakers[name] = breaker
+        return breaker
+    
+    def _record(self, name: str, success: bool):
+        with self._lock:
+            breaker = self._breaker(name)
+            if success:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+    
+    def _submit(self, source: OracleDataSource, variable: str) -> Future:
+        """Start a fetch, or join the one already running for this key."""
+        key = (source.name, variable)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._get_executor().submit(self._fetch, source, variable)
+                self._inflight[key] = future
+            return future
+    
+    def _fetch(self, source: OracleDataSource, variable: str) -> Optional[OracleDataPoint]:
+        """Worker: fetch one point and update cache and circuit breaker."""
+        key = (source.name, variable)
+        started = time.monotonic()
+        try:
+            point = source.fetch_data(variable)
+        except Exception as e:
+            source.error_message = handle_oracle_error(e, f"fetching {variable}")
+            with self._lock:
+                self._inflight.pop(key, None)
+                self._breaker(source.name).record_failure()
+            return None
+        
+        with self._lock:
+            self._inflight.pop(key, None)
+            # A late answer was already counted as a failure by the waiter;
+            # sources report errors (e.g. REST failures) by returning None
+            if time.monotonic() - started <= self._deadline(source):
+                if point is not None:
+                    self._breaker(source.name).record_success()
+                else:
+                    self._breaker(source.name).record_failure()
+            if point is not None:
+                self._cache[key] = (self.clock(), point)
+        return point
 
 
 def get_default_oracle_configs() -> List[Dict[str, Any]]:
@@ -393,6 +393,70 @@ class OrbitalTransitionEngine:
         
         return transition, nxt_units
     
+    def execute_transitions(
+        self,
+        requests: List[Tuple[TransitionType, str, int]],
+        block_height: Optional[int] = None
+    ) -> List[Tuple[OrbitalTransition, int]]:
+        """
+        Batch form of execute_transition (also stateless w.r.t. reserves).
+        
+        Builds one OrbitalTransition per distinct transition type and shares
+        it across every request of that type; ledger entries and history are
+        still recorded per request, in order.
+        
+        Args:
+            requests: (transition_type, user_address, reserve_balance_before) tuples
+            block_height: Optional blockchain height
+        
+        Returns:
+            (OrbitalTransition, NXT units to transfer) per request
+        """
+        transitions: Dict[TransitionType, OrbitalTransition] = {}
+        results: List[Tuple[OrbitalTransition, int]] = []
+        
+        for transition_type, user_address, reserve_balance_before in requests:
+            trans_data = self.transition_rates[transition_type]
+            transition = transitions.get(transition_type)
+            if transition is None:
+                n_upper = int(trans_data['n_upper'])
+                n_lower = int(trans_data['n_lower'])
+                transition = OrbitalTransition(
+                    transition_type=transition_type,
+                    n_initial=n_upper,
+                    n_final=n_lower,
+                    delta_e_joules=trans_data['delta_e_joules'],
+                    delta_e_nxt=trans_data['delta_e_nxt'],
+                    wavelength_nm=trans_data['wavelength_nm'],
+                    spectral_region=trans_data['spectral_region'],
+                    quantum_level_initial=QuantumLevel.from_quantum_number(n_upper),
+                    quantum_level_final=QuantumLevel.from_quantum_number(n_lower)
+                )
+                transitions[transition_type] = transition
+            
+            nxt_units = int(trans_data['delta_e_units'])
+            if transition.is_emission:
+                reserve_after = reserve_balance_before + nxt_units
+            elif reserve_balance_before >= nxt_units:
+                reserve_after = reserve_balance_before - nxt_units
+            else:
+                nxt_units = int(reserve_balance_before)
+                reserve_after = 0
+            
+            self.ledger.append(TransitionLedgerEntry(
+                entry_id=f"TXN-{len(self.ledger)+1:08d}",
+                user_address=user_address,
+                transition=transition,
+                nxt_units_transferred=int(nxt_units),
+                reserve_balance_before=reserve_balance_before,
+                reserve_balance_after=reserve_after,
+                block_height=block_height
+            ))
+            self.transition_history.append(transition)
+            results.append((transition, nxt_units))
+        
+        return results
+    
     def get_transition_cost(self, transition_type: TransitionType) -> Dict[str, Any]:
         """
         Get the cost (in NXT) for a specific transition type.
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Shared PostgreSQL Connection Pool for WNSP P2P Hub
+GPL v3.0 License
+
+Process-wide psycopg2 ThreadedConnectionPool per database URL, server-side
+prepared statements cached per connection, and a small TTL read-through
+cache for hot lookups (e.g. contact -> device_id). Flask routes and
+SocketIO handlers borrow connections instead of opening one per event.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import ThreadedConnectionPool
+
+PG_POOL_MIN = int(os.environ.get('PG_POOL_MIN', '1'))
+PG_POOL_MAX = int(os.environ.get('PG_POOL_MAX', '10'))
+
+
+class PreparingConnection(extensions.connection):
+    """psycopg2 connection that remembers which statements it has prepared"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+
+_pools: Dict[str, ThreadedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pg_pool(database_url: Optional[str] = None) -> ThreadedConnectionPool:
+    """Get (or lazily create) the shared pool for a database URL"""
+    database_url = database_url or os.environ.get('DATABASE_URL')
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+
+    pool = _pools.get(database_url)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(database_url)
+            if pool is None:
+                pool = _pools[database_url] = ThreadedConnectionPool(
+                    PG_POOL_MIN, PG_POOL_MAX, database_url,
+                    connection_factory=PreparingConnection
+                )
+    return pool
+
+
+@contextmanager
+def pooled_connection(database_url: Optional[str] = None, pool=None):
+    """
+    Borrow a connection from the shared pool
+
+    Any transaction left open (e.g. after an exception) is rolled back;
+    broken connections are discarded instead of being returned to the pool.
+    """
+    pool = pool or get_pg_pool(database_url)
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        # Never hand an open transaction to the next borrower
+        if not conn.closed and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                conn.close()
+        pool.putconn(conn, close=bool(conn.closed))
+
+
+def close_pg_pools():
+    """Close every shared pool (tests, process shutdown)"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
+
+
+def execute_prepared(cursor, name: str, sql: str, params: Sequence[Any] = ()):
+    """
+    Execute a server-side prepared statement, preparing it on first use
+
+    Args:
+        cursor: Cursor of a PreparingConnection (plain connections prepare
+            on every call)
+        name: Statement name (SQL identifier)
+        sql: Statement body using $1..$n placeholders
+        params: Positional parameters
+    """
+    prepared = getattr(cursor.connection, 'prepared', None)
+    if prepared is None or name not in prepared:
+        cursor.execute(f"PREPARE {name} AS {sql}")
+        if prepared is not None:
+            prepared.add(name)
+
+    if params:
+        placeholders = ', '.join(['%s'] * len(params))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", tuple(params))
+    else:
+        cursor.execute(f"EXECUTE {name}")
+
+
+class ReadThroughCache:
+    """
+    Small thread-safe TTL + LRU cache in front of a loader function
+
+    None results are not cached so that newly created records are seen on
+    the next lookup.
+    """
+
+    def __init__(self, loader: Callable[[Hashable], Any], max_entries: int = 1024,
+                 ttl_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.loader = loader
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = self.loader(key)
+        if value is not None:
+            with self._lock:
+                self._entries[key] = (value, now + self.ttl_seconds)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
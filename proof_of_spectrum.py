@@ -13,6 +13,7 @@ Physical Basis: Electromagnetic spectrum (380-750nm) mapped to cryptographic pri
 
 import hashlib
 import json
+import threading
 import time
 from typing import List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass, field
@@ -167,11 +168,88 @@ class SpectralBlock:
         return hashlib.sha256(f"{block_data}:{interference_hash}".encode()).hexdigest()
 
 
+class RegionStakeIndex:
+    """
+    Stake-weighted sampler over the validators of one spectral region
+    
+    Stakes are kept in a Fenwick (binary indexed) tree, so registering a
+    validator, changing a stake and drawing a stake-weighted validator are
+    all O(log V).
+    """
+    
+    def __init__(self):
+        self.validators: List[SpectralValidator] = []
+        self.stakes: List[float] = []
+        self._tree: List[float] = [0.0]  # 1-based partial sums
+    
+    def __len__(self) -> int:
+        return len(self.validators)
+    
+    def _prefix(self, i: int) -> float:
+        """Sum of the first i stakes"""
+        total = 0.0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+    
+    @property
+    def total_stake(self) -> float:
+        return self._prefix(len(self.stakes))
+    
+    def append(self, validator: SpectralValidator) -> int:
+        """Add a validator; returns its position in the region"""
+        n = len(self.stakes) + 1
+        self.validators.append(validator)
+        self.stakes.append(validator.stake)
+        # Node n covers stakes (n - lowbit(n), n]
+        self._tree.append(validator.stake + self._prefix(n - 1) - self._prefix(n - (n & -n)))
+        return n - 1
+    
+    def update(self, position: int, stake: float):
+        """Set the stake of the validator at position"""
+        delta = stake - self.stakes[position]
+        self.stakes[position] = stake
+        i = position + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+    
+    def sample(self, u: float) -> Optional[SpectralValidator]:
+        """
+        Stake-weighted draw for a uniform u in [0, 1)
+        
+        Returns:
+            The validator whose cumulative stake interval contains
+            u * total_stake, or None if the region has no stake
+        """
+        n = len(self.stakes)
+        total = self._prefix(n)
+        if n == 0 or total <= 0:
+            return None
+        
+        remaining = u * total
+        position = 0
+        step = 1 << (n.bit_length() - 1)
+        while step:
+            candidate = position + step
+            if candidate <= n and self._tree[candidate] <= remaining:
+                position = candidate
+                remaining -= self._tree[candidate]
+            step >>= 1
+        return self.validators[min(position, n - 1)]
+
+
 class ProofOfSpectrumConsensus:
     """
     Proof of Spectrum Consensus Engine
     
     Revolutionary Feature: Eliminates 51% attacks through spectral diversity requirement
+    
+    Validators are indexed per region as they register (RegionStakeIndex),
+    so block selection costs O(regions * log V) instead of rebuilding the
+    distribution and stake arrays every block. Stake changes must go through
+    update_validator_stake to reach the index.
     """
     
     def __init__(
@@ -186,19 +264,42 @@ class ProofOfSpectrumConsensus:
         # Calculate required regions based on coverage
         total_regions = len(SpectralRegion)
         self.required_region_count = int(np.ceil(total_regions * required_spectral_coverage))
+        
+        # Per-region stake index and validator_id -> [(region, position)]
+        self.region_index: Dict[SpectralRegion, RegionStakeIndex] = {
+            region: RegionStakeIndex() for region in SpectralRegion
+        }
+        self._positions: Dict[str, List[Tuple[SpectralRegion, int]]] = {}
+        self._lock = threading.Lock()
     
     def register_validator(self, validator: SpectralValidator):
         """Register a new validator in the network"""
-        self.validators.append(validator)
+        with self._lock:
+            self.validators.append(validator)
+            region = validator.spectral_region
+            position = self.region_index[region].append(validator)
+            self._positions.setdefault(validator.validator_id, []).append((region, position))
+    
+    def update_validator_stake(self, validator_id: str, stake: float) -> bool:
+        """
+        Change a registered validator's stake
+        
+        Returns:
+            False if no validator has this ID
+        """
+        with self._lock:
+            positions = self._positions.get(validator_id)
+            if not positions:
+                return False
+            for region, position in positions:
+                index = self.region_index[region]
+                index.validators[position].stake = stake
+                index.update(position, stake)
+            return True
     
     def get_spectral_distribution(self) -> Dict[SpectralRegion, List[SpectralValidator]]:
         """Get validator distribution across spectral regions"""
-        distribution = {region: [] for region in SpectralRegion}
-        
-        for validator in self.validators:
-            distribution[validator.spectral_region].append(validator)
-        
-        return distribution
+        return {region: list(index.validators) for region, index in self.region_index.items()}
     
     def select_validators_for_block(self, block_data: str, seed: int = None) -> List[SpectralValidator]:
         """
@@ -206,48 +307,40 @@ class ProofOfSpectrumConsensus:
         
         Key Algorithm: Must include validators from different spectral regions
         This prevents any single entity from controlling consensus
-        """
-        distribution = self.get_spectral_distribution()
         
-        # Ensure we have validators in enough regions
-        populated_regions = [
-            region for region, vals in distribution.items()
-            if len(vals) >= self.min_validators_per_region
-        ]
-        
-        if len(populated_regions) < self.required_region_count:
-            raise ValueError(
-                f"Insufficient spectral coverage: need {self.required_region_count} regions, "
-                f"have {len(populated_regions)}"
-            )
-        
-        # Select validators from different regions
-        # Use deterministic selection based on block data
-        selected = []
-        
-        if seed is None:
-            seed = int(hashlib.sha256(block_data.encode()).hexdigest(), 16)
-        
-        np.random.seed(seed % (2**32))
-        
-        # Randomly select regions to ensure diversity
-        selected_regions = np.random.choice(
-            populated_regions,
-            size=self.required_region_count,
-            replace=False
-        )
-        
-        # Select validators from each chosen region
-        for region in selected_regions:
-            region_validators = distribution[region]
-            # Weight by stake
-            stakes = np.array([v.stake for v in region_validators])
-            if stakes.sum() > 0:
-                probabilities = stakes / stakes.sum()
-                chosen = np.random.choice(region_validators, p=probabilities)
-                selected.append(chosen)
-        
-        return selected
+        Draws come from a Generator seeded by the block data (or seed), so
+        selection is reproducible and never touches global NumPy state.
+        """
+        with self._lock:
+            # Ensure we have validators in enough regions
+            populated_regions = [
+                region for region, index in self.region_index.items()
+                if len(index) >= self.min_validators_per_region
+            ]
+            
+            if len(populated_regions) < self.required_region_count:
+                raise ValueError(
+                    f"Insufficient spectral coverage: need {self.required_region_count} regions, "
+                    f"have {len(populated_regions)}"
+                )
+            
+            # Select validators from different regions
+            # Use deterministic selection based on block data
+            if seed is None:
+                seed = int(hashlib.sha256(block_data.encode()).hexdigest(), 16)
+            rng = np.random.default_rng(seed)
+            
+            # Randomly select regions to ensure diversity
+            region_picks = rng.choice(len(populated_regions), size=self.required_region_count, replace=False)
+            
+            # Select a stake-weighted validator from each chosen region
+            selected = []
+            for pick in region_picks:
+                chosen = self.region_index[populated_regions[pick]].sample(rng.random())
+                if chosen is not None:
+                    selected.append(chosen)
+            
+            return selected
     
     def create_interference_pattern(
         self,
@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from collections import deque, defaultdict
 import threading
+import numpy as np
 
 # Active intervention integration
 try:
@@ -121,6 +122,48 @@ class RateLimiter:
             
             return True, None
     
+    def check_rate_limit_batch(
+        self,
+        address: str,
+        operation: str,
+        count: int
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Check `count` back-to-back requests from one address in a single lock.
+        
+        Equivalent to calling check_rate_limit `count` times at the same
+        instant: the first requests are admitted while the window has room
+        and every refused one counts as a violation.
+        
+        Returns:
+            (granted: number of leading requests allowed, reason for refusing the rest)
+        """
+        with self.lock:
+            if count <= 0 or operation not in self.limits:
+                return max(count, 0), None
+            
+            max_requests, window_seconds = self.limits[operation]
+            history = self.request_history[f"{address}:{operation}"]
+            
+            current_time = time.time()
+            cutoff_time = current_time - window_seconds
+            while history and history[0] < cutoff_time:
+                history.popleft()
+            
+            granted = max(0, min(count, max_requests - len(history)))
+            history.extend([current_time] * granted)
+            
+            denied = count - granted
+            if denied == 0:
+                return granted, None
+            
+            self.violations[address] += denied
+            self.violation_timestamps[address] = current_time
+            backoff_multiplier = min(2 ** self.violations[address], 64)
+            retry_after = window_seconds * backoff_multiplier
+            
+            return granted, f"Rate limit exceeded. {len(history)}/{max_requests} requests in {window_seconds}s. Retry after {retry_after:.0f}s"
+    
     def reset_violations(self, address: str):
         """Reset violation count for address (e.g., after successful behavior)"""
         with self.lock:
@@ -372,39 +415,175 @@ class DEXMEVProtection:
             return False, None
 
 
+class PriceFeedBuffer:
+    """
+    Fixed-size ring buffer of one asset's accepted oracle prices
+    
+    Columns (price, timestamp, oracle weight, oracle index) are NumPy arrays
+    written twice, at slot i and i + capacity, so the live entries are always
+    one contiguous slice, oldest first. Each entry also stores the running
+    price-time integral up to its timestamp, which turns a TWAP over any
+    window into one searchsorted plus two lookups.
+    """
+    
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.prices = np.zeros(2 * capacity)
+        self.timestamps = np.zeros(2 * capacity)
+        self.weights = np.zeros(2 * capacity)
+        self.oracle_indices = np.full(2 * capacity, -1, dtype=np.int32)
+        self.integrals = np.zeros(2 * capacity)
+        self.start = 0
+        self.count = 0
+        self.lock = threading.Lock()
+        
+        # Cached weighted median, valid until the oldest windowed entry expires
+        self._consensus: Optional[float] = None
+        self._consensus_since = float('inf')
+        self._consensus_until = float('-inf')
+    
+    def append(self, price: float, timestamp: float, weight: float, oracle_index: int) -> float:
+        """
+        Append a price, evicting the oldest when full
+        
+        Returns:
+            timestamp actually stored (clamped so timestamps never decrease)
+        """
+        if self.count:
+            last = self.start + self.count - 1
+            timestamp = max(timestamp, self.timestamps[last])
+            integral = self.integrals[last] + self.prices[last] * (timestamp - self.timestamps[last])
+        else:
+            integral = 0.0
+        
+        if self.count < self.capacity:
+            slot = (self.start + self.count) % self.capacity
+            self.count += 1
+        else:
+            slot = self.start
+            self.start = (self.start + 1) % self.capacity
+        
+        for column, value in ((self.prices, price), (self.timestamps, timestamp),
+                              (self.weights, weight), (self.oracle_indices, oracle_index),
+                              (self.integrals, integral)):
+            column[slot] = value
+            column[slot + self.capacity] = value
+        
+        self._consensus_until = float('-inf')
+        return timestamp
+    
+    def _window(self, cutoff: float) -> slice:
+        """Slice of live entries with timestamp > cutoff"""
+        end = self.start + self.count
+        first = self.start + int(np.searchsorted(self.timestamps[self.start:end], cutoff, side='right'))
+        return slice(first, end)
+    
+    def recent_prices(self, cutoff: float) -> np.ndarray:
+        """Prices with timestamp > cutoff, oldest first"""
+        return self.prices[self._window(cutoff)]
+    
+    def set_oracle_weight(self, oracle_index: int, weight: float):
+        """Re-weight every stored price from one oracle"""
+        self.weights[self.oracle_indices == oracle_index] = weight
+        self._consensus_until = float('-inf')
+    
+    def weighted_median(self, now: float, max_age: float) -> Optional[float]:
+        """
+        Weighted median of prices newer than now - max_age
+        
+        Cached between appends until the oldest price in the window ages
+        out, so repeated queries are O(1).
+        """
+        if self._consensus_since <= now < self._consensus_until:
+            return self._consensus
+        
+        window = self._window(now - max_age)
+        prices = self.prices[window]
+        if len(prices) == 0:
+            result, until = None, float('inf')
+        else:
+            order = np.argsort(prices, kind='stable')
+            cumulative = np.cumsum(self.weights[window][order])
+            median_at = int(np.argmax(cumulative >= cumulative[-1] / 2))
+            result = float(prices[order[median_at]])
+            until = self.timestamps[window.start] + max_age
+        
+        self._consensus, self._consensus_since, self._consensus_until = result, now, until
+        return result
+    
+    def twap(self, now: float, window_seconds: float) -> Optional[float]:
+        """Time-weighted average of prices newer than now - window_seconds"""
+        window = self._window(now - window_seconds)
+        if window.start >= window.stop:
+            return None
+        
+        first, last = window.start, window.stop - 1
+        total_time = now - self.timestamps[first]
+        if total_time <= 0:
+            return None
+        weighted = (self.integrals[last] - self.integrals[first]
+                    + self.prices[last] * (now - self.timestamps[last]))
+        return float(weighted / total_time)
+
+
 class MultiOracleSystem:
     """
     Multi-oracle consensus system with outlier detection
     
     Prevents single-oracle manipulation by requiring consensus across
-    multiple independent data sources
+    multiple independent data sources. Each asset has its own
+    PriceFeedBuffer and lock, so DEX and reserve queries for different
+    assets do not contend.
     """
     
-    def __init__(self):
-        # Oracle sources (oracle_id -> weight)
+    def __init__(self, capacity: int = 100):
+        # Oracle sources (oracle_id -> weight) and their buffer column index
         self.oracles: Dict[str, float] = {}
+        self.oracle_indices: Dict[str, int] = {}
         
-        # Price feeds (asset -> deque of (oracle_id, price, timestamp))
-        self.price_feeds: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        # Price feeds (asset -> ring buffer of accepted prices)
+        self.capacity = capacity
+        self.price_feeds: Dict[str, PriceFeedBuffer] = {}
         
         # Time-weighted average prices
         self.twap_window = 3600  # 1 hour
         
+        # Consensus and outlier detection look at the last 5 minutes
+        self.consensus_window = 300
+        
         # Outlier detection threshold (z-score)
         self.outlier_threshold = 2.5
         
+        # Guards the oracle registry and feed creation
         self.lock = threading.Lock()
     
     def register_oracle(self, oracle_id: str, weight: float = 1.0):
-        """Register an oracle data source"""
+        """Register an oracle data source (re-registering updates its weight)"""
         with self.lock:
             self.oracles[oracle_id] = weight
+            if oracle_id not in self.oracle_indices:
+                self.oracle_indices[oracle_id] = len(self.oracle_indices)
+                return
+            feeds = list(self.price_feeds.values())
+        
+        index = self.oracle_indices[oracle_id]
+        for feed in feeds:
+            with feed.lock:
+                feed.set_oracle_weight(index, weight)
+    
+    def _get_feed(self, asset: str) -> PriceFeedBuffer:
+        feed = self.price_feeds.get(asset)
+        if feed is None:
+            with self.lock:
+                feed = self.price_feeds.setdefault(asset, PriceFeedBuffer(self.capacity))
+        return feed
     
     def submit_price(
         self,
         oracle_id: str,
         asset: str,
-        price: float
+        price: float,
+        timestamp: Optional[float] = None
     ) -> bool:
         """
         Submit price from oracle
@@ -412,129 +591,92 @@ class MultiOracleSystem:
         Returns:
             accepted: bool (False if outlier detected)
         """
-        with self.lock:
-            if oracle_id not in self.oracles:
-                return False
-            
-            timestamp = time.time()
-            
-            # Get recent prices for outlier detection
-            recent_prices = [
-                p for oid, p, t in self.price_feeds[asset]
-                if t > timestamp - 300  # Last 5 minutes
-            ]
+        if oracle_id not in self.oracles:
+            return False
+        
+        timestamp = time.time() if timestamp is None else timestamp
+        feed = self._get_feed(asset)
+        with feed.lock:
+            return self._submit_locked(feed, oracle_id, price, timestamp)
+    
+    def submit_prices(
+        self,
+        oracle_id: str,
+        prices: Dict[str, float],
+        timestamp: Optional[float] = None
+    ) -> Dict[str, bool]:
+        """
+        Submit one oracle's prices for many assets at once
+        
+        Returns:
+            asset -> accepted
+        """
+        if oracle_id not in self.oracles:
+            return {asset: False for asset in prices}
+        
+        timestamp = time.time() if timestamp is None else timestamp
+        accepted = {}
+        for asset, price in prices.items():
+            feed = self._get_feed(asset)
+            with feed.lock:
+                accepted[asset] = self._submit_locked(feed, oracle_id, price, timestamp)
+        return accepted
+    
+    def _submit_locked(self, feed: PriceFeedBuffer, oracle_id: str, price: float, timestamp: float) -> bool:
+        # Get recent prices for outlier detection
+        recent_prices = feed.recent_prices(timestamp - self.consensus_window)
+        
+        # Outlier detection with ACTIVE INTERVENTION
+        if len(recent_prices) >= 3:
+            mean_price = recent_prices.mean()
+            std_price = recent_prices.std()
             
-            # Outlier detection with ACTIVE INTERVENTION
-            if len(recent_prices) >= 3:
-                import numpy as np
-                
-                mean_price = np.mean(recent_prices)
-                std_price = np.std(recent_prices)
+            if std_price > 0:
+                z_score = abs((price - mean_price) / std_price)
                 
-                if std_price > 0:
-                    z_score = abs((price - mean_price) / std_price)
+                if z_score > self.outlier_threshold:
+                    # 🛡️ ACTIVE INTERVENTION: Auto-blacklist manipulated oracle
+                    deviation = abs((price - mean_price) / mean_price)
+                    
+                    if get_intervention_engine:
+                        intervention_engine = get_intervention_engine()
+                        intervention_engine.detect_and_intervene(
+                            threat_type="oracle_price_deviation",
+                            entity=oracle_id,
+                            metric_value=deviation,
+                            evidence=f"Price ${price:.2f} deviates {deviation*100:.1f}% from mean ${mean_price:.2f} (z-score: {z_score:.2f})"
+                        )
                     
-                    if z_score > self.outlier_threshold:
-                        # 🛡️ ACTIVE INTERVENTION: Auto-blacklist manipulated oracle
-                        deviation = abs((price - mean_price) / mean_price)
-                        
-                        if get_intervention_engine:
-                            intervention_engine = get_intervention_engine()
-                            intervention_engine.detect_and_intervene(
-                                threat_type="oracle_price_deviation",
-                                entity=oracle_id,
-                                metric_value=deviation,
-                                evidence=f"Price ${price:.2f} deviates {deviation*100:.1f}% from mean ${mean_price:.2f} (z-score: {z_score:.2f})"
-                            )
-                        
-                        # Reject outlier
-                        return False
-            
-            # Accept price
-            self.price_feeds[asset].append((oracle_id, price, timestamp))
-            
-            return True
+                    # Reject outlier
+                    return False
+        
+        # Accept price
+        feed.append(price, timestamp, self.oracles[oracle_id], self.oracle_indices[oracle_id])
+        return True
     
-    def get_consensus_price(self, asset: str) -> Optional[float]:
+    def get_consensus_price(self, asset: str, now: Optional[float] = None) -> Optional[float]:
         """
         Get consensus price from multiple oracles
         
         Uses weighted median to be robust against outliers
         """
-        with self.lock:
-            if asset not in self.price_feeds:
-                return None
-            
-            # Get recent prices (last 5 minutes)
-            current_time = time.time()
-            cutoff = current_time - 300
-            
-            recent = [
-                (oracle_id, price)
-                for oracle_id, price, t in self.price_feeds[asset]
-                if t > cutoff
-            ]
-            
-            if not recent:
-                return None
-            
-            # Weighted median
-            prices_with_weights = [
-                (price, self.oracles.get(oracle_id, 1.0))
-                for oracle_id, price in recent
-            ]
-            
-            prices_with_weights.sort(key=lambda x: x[0])
-            
-            total_weight = sum(w for _, w in prices_with_weights)
-            cumulative_weight = 0
-            
-            for price, weight in prices_with_weights:
-                cumulative_weight += weight
-                if cumulative_weight >= total_weight / 2:
-                    return price
-            
-            return prices_with_weights[0][0] if prices_with_weights else None
+        feed = self.price_feeds.get(asset)
+        if feed is None:
+            return None
+        
+        now = time.time() if now is None else now
+        with feed.lock:
+            return feed.weighted_median(now, self.consensus_window)
     
-    def get_twap(self, asset: str) -> Optional[float]:
+    def get_twap(self, asset: str, now: Optional[float] = None) -> Optional[float]:
         """Get Time-Weighted Average Price"""
-        with self.lock:
-            if asset not in self.price_feeds:
-                return None
-            
-            current_time = time.time()
-            cutoff = current_time - self.twap_window
-            
-            # Get all prices in window
-            prices_in_window = [
-                (price, t)
-                for _, price, t in self.price_feeds[asset]
-                if t > cutoff
-            ]
-            
-            if not prices_in_window:
-                return None
-            
-            # Calculate time-weighted average
-            total_weight = 0
-            weighted_sum = 0
-            
-            for i in range(len(prices_in_window)):
-                price, timestamp = prices_in_window[i]
-                
-                # Time weight = duration this price was "active"
-                if i < len(prices_in_window) - 1:
-                    duration = prices_in_window[i + 1][1] - timestamp
-                else:
-                    duration = current_time - timestamp
-                
-                weighted_sum += price * duration
-                total_weight += duration
-            
-            if total_weight > 0:
-                return weighted_sum / total_weight
-            
+        feed = self.price_feeds.get(asset)
+        if feed is None:
             return None
+        
+        now = time.time() if now is None else now
+        with feed.lock:
+            return feed.twap(now, self.twap_window)
 
 
 # Singleton instances
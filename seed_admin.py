@@ -10,8 +10,7 @@ Usage:
 """
 
 import sys
-from sqlalchemy.orm import sessionmaker
-from database import init_db, get_engine
+from database import init_db, get_session_factory
 from auth import bootstrap_admin, init_roles
 
 def main():
@@ -27,8 +26,7 @@ def main():
             print("Please check your DATABASE_URL environment variable")
             sys.exit(1)
         
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
+        db = get_session_factory()()
         
         try:
             init_roles(db)
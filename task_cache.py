@@ -0,0 +1,298 @@
+"""
+Task Result Cache for NexusOS DAG Orchestration
+
+Content-addressed memoisation of task outputs. A task's cache key is the
+SHA-256 of its task type, operation, parameters and the result hashes of its
+upstream dependencies, so a cached output is only reused when nothing that
+could influence it has changed.
+
+Features:
+1. In-memory LRU index with optional on-disk persistence (one pickle per entry)
+2. LRU eviction applied to both memory and disk
+3. Hit/miss statistics for dashboards
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import pickle
+import struct
+import threading
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+_NOT_LOADED = object()
+
+
+class UncacheableValue(TypeError):
+    """Raised when a value has no stable content hash"""
+
+
+def _feed(h, value: Any):
+    """
+    Write an unambiguous, content-complete encoding of value into hash h
+
+    Plain JSON values, containers, NumPy arrays and pandas objects are
+    encoded structurally; anything else is hashed by its pickle bytes.
+    Values that cannot be pickled raise UncacheableValue.
+    """
+    def tag(name: str, payload: bytes = b''):
+        h.update(name.encode('ascii') + struct.pack('<Q', len(payload)) + payload)
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        tag('json', json.dumps(value).encode('utf-8'))
+    elif isinstance(value, dict):
+        items = sorted((_digest(k), v) for k, v in value.items())
+        tag('dict', struct.pack('<Q', len(items)))
+        for key_digest, item in items:
+            h.update(key_digest)
+            _feed(h, item)
+    elif isinstance(value, (list, tuple)):
+        tag(type(value).__name__, struct.pack('<Q', len(value)))
+        for item in value:
+            _feed(h, item)
+    elif isinstance(value, (set, frozenset)):
+        digests = sorted(_digest(item) for item in value)
+        tag('set', b''.join(digests))
+    elif pd is not None and isinstance(value, pd.DataFrame):
+        tag('dataframe', struct.pack('<QQ', *value.shape))
+        _feed(h, [str(dtype) for dtype in value.dtypes])
+        _feed(h, list(value.columns))
+        _feed(h, _pandas_rows(value))
+    elif pd is not None and isinstance(value, pd.Series):
+        tag('series', str(value.dtype).encode('utf-8'))
+        _feed(h, value.name)
+        _feed(h, _pandas_rows(value))
+    elif np is not None and isinstance(value, np.ndarray):
+        tag('ndarray', f"{value.dtype.str}{value.shape}".encode('utf-8'))
+        if value.dtype.hasobject:
+            _feed(h, value.ravel().tolist())
+        else:
+            h.update(np.ascontiguousarray(value).tobytes())
+    elif np is not None and isinstance(value, np.generic):
+        tag('scalar', value.dtype.str.encode('utf-8') + value.tobytes())
+    else:
+        try:
+            payload = pickle.dumps(value, protocol=4)
+        except Exception as e:
+            raise UncacheableValue(f"cannot hash {type(value).__name__}: {e}") from e
+        tag('pickle', payload)
+
+
+def _pandas_rows(value: Any):
+    """Per-row hashes (index included) for a DataFrame or Series"""
+    try:
+        return pd.util.hash_pandas_object(value, index=True).to_numpy()
+    except TypeError as e:
+        raise UncacheableValue(f"cannot hash {type(value).__name__}: {e}") from e
+
+
+def _digest(value: Any) -> bytes:
+    h = hashlib.sha256()
+    _feed(h, value)
+    return h.digest()
+
+
+def hash_output(output: Any) -> Optional[str]:
+    """
+    Content hash of a task output
+
+    Returns:
+        Hex SHA-256, or None when the output has no stable hash (such
+        outputs are never cached and make their dependents uncacheable)
+    """
+    try:
+        return _digest(output).hex()
+    except UncacheableValue:
+        return None
+
+
+def make_cache_key(task_type: str, operation: str, parameters: Dict[str, Any],
+                   upstream_hashes: Dict[str, Optional[str]]) -> Optional[str]:
+    """
+    Build the memoisation key for a task invocation
+
+    Args:
+        task_type: Task type (e.g. 'data')
+        operation: Operation name (e.g. 'transform')
+        parameters: Task parameters
+        upstream_hashes: Mapping of dependency task ID to its result hash
+            (None when the dependency's output is unhashable or unknown)
+
+    Returns:
+        Hex SHA-256 cache key, or None when the invocation cannot be keyed
+    """
+    if any(not result_hash for result_hash in upstream_hashes.values()):
+        return None
+    try:
+        return _digest({
+            'type': task_type,
+            'operation': operation,
+            'parameters': parameters,
+            'upstream': sorted(upstream_hashes.items()),
+        }).hex()
+    except UncacheableValue:
+        return None
+
+
+class TaskResultCache:
+    """
+    LRU cache of task outputs keyed by content hash
+
+    When cache_dir is given, entries are written through to disk and the
+    index is rebuilt from the directory (oldest access first) on startup,
+    so results survive dashboard reruns and process restarts.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 1024):
+        """
+        Initialize result cache.
+
+        Args:
+            cache_dir: Directory for persisted entries (None = memory only)
+            max_entries: Maximum number of cached results before LRU eviction
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._load_index()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _load_index(self):
+        """Rebuild the LRU index from persisted entries"""
+        files = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                path = os.path.join(self.cache_dir, name)
+                files.append((os.path.getmtime(path), name[:-4]))
+
+        for _, key in sorted(files):
+            self._entries[key] = _NOT_LOADED
+
+        while len(self._entries) > self.max_entries:
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        key, _ = self._entries.popitem(last=False)
+        self.evictions += 1
+        if self.cache_dir:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached output
+
+        Returns:
+            (hit, output) tuple
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False, None
+
+            value = self._entries[key]
+            if value is _NOT_LOADED:
+                try:
+                    with open(self._path(key), 'rb') as f:
+                        value = pickle.load(f)
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    del self._entries[key]
+                    self.misses += 1
+                    return False, None
+                self._entries[key] = value
+
+            self._entries.move_to_end(key)
+            if self.cache_dir:
+                try:
+                    os.utime(self._path(key))
+                except OSError:
+                    pass
+
+            self.hits += 1
+            return True, value
+
+    def put(self, key: str, output: Any):
+        """Store a task output, evicting least recently used entries"""
+        with self._lock:
+            self._entries[key] = output
+            self._entries.move_to_end(key)
+
+            if self.cache_dir:
+                tmp_path = self._path(key) + '.tmp'
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(tmp_path, self._path(key))
+                except (OSError, pickle.PicklingError, TypeError, AttributeError):
+                    # Unpicklable outputs stay memory-only
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest()
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            while self._entries:
+                self._evict_oldest()
+            self.hits = self.misses = self.evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'persistent': bool(self.cache_dir),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared_cache: Optional[TaskResultCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_result_cache() -> TaskResultCache:
+    """
+    Process-wide cache used by domain workflows
+
+    Persists to NEXUS_TASK_CACHE_DIR when that environment variable is set.
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = TaskResultCache(
+                cache_dir=os.environ.get('NEXUS_TASK_CACHE_DIR'),
+                max_entries=int(os.environ.get('NEXUS_TASK_CACHE_SIZE', '1024'))
+            )
+        return _shared_cache
@@ -13,8 +13,7 @@ from typing import Dict, Any, Optional
 import os
 import json
 from datetime import datetime
-from database import get_engine, User, Role
-from sqlalchemy.orm import sessionmaker
+from database import get_session_factory, User, Role
 
 
 # ============================================================================
@@ -36,9 +35,7 @@ class AdminTaskHandlers:
         """
         from auth import create_user
         
-        engine = get_engine()
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
+        db = get_session_factory()()
         
         try:
             user = create_user(
@@ -65,9 +62,7 @@ class AdminTaskHandlers:
             user_id: User ID
             roles: List of role names
         """
-        engine = get_engine()
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
+        db = get_session_factory()()
         
         try:
             user = db.query(User).filter(User.id == params['user_id']).first()
@@ -123,9 +118,7 @@ class AdminTaskHandlers:
         """
         from database import SimulationRun
         
-        engine = get_engine()
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
+        db = get_session_factory()()
         
         try:
             sim_run = db.query(SimulationRun).filter(
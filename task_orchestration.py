@@ -14,14 +14,28 @@ Key Features:
 3. Error Handling: Retry logic, fallback strategies, error propagation
 4. Monitoring: Task status tracking, execution metrics, audit logging
 5. Async Support: Background task execution for long-running operations
+6. Concurrent Execution: Ready tasks dispatched to thread/process pools or asyncio,
+   with per-task timeouts, exponential retry backoff and a priority ready queue
+7. Result Caching: Content-hash memoisation (see task_cache) and incremental
+   re-execution of only the subgraph invalidated by a parameter change
 """
 
-from typing import Dict, List, Any, Optional, Callable, Set
+from typing import Dict, List, Any, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 from collections import defaultdict, deque
+from concurrent.futures import (
+    Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+)
+import asyncio
+import heapq
 import json
+import os
+import threading
+import time
+
+from task_cache import hash_output, make_cache_key
 
 
 class TaskStatus(Enum):
@@ -42,6 +56,13 @@ class TaskPriority(Enum):
     CRITICAL = 4
 
 
+class ExecutionMode(Enum):
+    """Where a task handler is dispatched"""
+    THREAD = "thread"      # I/O-bound handlers (webhooks, email, API calls)
+    PROCESS = "process"    # CPU-bound handlers (must be picklable)
+    ASYNC = "async"        # Coroutine handlers on a shared event loop
+
+
 @dataclass
 class TaskResult:
     """Result of task execution"""
@@ -68,6 +89,8 @@ class Task:
         max_retries: Maximum retry attempts on failure
         timeout: Task timeout in seconds
         handler: Function to execute the task
+        cacheable: Whether the output may be served from a result cache
+            (False for side-effecting tasks and sources that can change)
     """
     task_id: str
     task_type: str
@@ -80,6 +103,7 @@ class Task:
     handler: Optional[Callable] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    cacheable: bool = True
 
 
 class TaskOrchestrationDAG:
@@ -90,14 +114,32 @@ class TaskOrchestrationDAG:
     tasks in optimal order with error handling and monitoring.
     """
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None,
+                 retry_base_delay: float = 0.05, retry_max_delay: float = 10.0,
+                 result_cache=None):
+        """
+        Initialize orchestration DAG.
+        
+        Args:
+            max_workers: Thread pool size for concurrent execution (None = CPU-based default)
+            retry_base_delay: Base retry delay in seconds (doubled on each attempt)
+            retry_max_delay: Maximum delay between retries in seconds
+            result_cache: Optional TaskResultCache for memoising task outputs
+        """
         self.tasks: Dict[str, Task] = {}
         self.task_results: Dict[str, TaskResult] = {}
         self.dependencies: Dict[str, Set[str]] = defaultdict(set)
         self.reverse_dependencies: Dict[str, Set[str]] = defaultdict(set)
         self.task_handlers: Dict[str, Callable] = {}
+        self.handler_modes: Dict[str, ExecutionMode] = {}
+        self.max_workers = max_workers
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.result_cache = result_cache
+        self._dirty_tasks: Set[str] = set()
     
-    def register_task_handler(self, task_type: str, operation: str, handler: Callable):
+    def register_task_handler(self, task_type: str, operation: str, handler: Callable,
+                              mode: Optional[ExecutionMode] = None):
         """
         Register a handler function for a specific task type and operation
         
@@ -105,9 +147,29 @@ class TaskOrchestrationDAG:
             task_type: Type of task (e.g., 'admin', 'communication')
             operation: Specific operation (e.g., 'send_email', 'create_user')
             handler: Callable function to execute the task
+            mode: Where to dispatch the handler (None = coroutine functions run on
+                asyncio, everything else on the thread pool)
         """
         key = f"{task_type}.{operation}"
         self.task_handlers[key] = handler
+        if mode is not None:
+            self.handler_modes[key] = mode
+        else:
+            self.handler_modes.pop(key, None)
+    
+    def get_execution_mode(self, task: Task) -> ExecutionMode:
+        """Resolve the execution mode for a task's handler"""
+        key = f"{task.task_type}.{task.operation}"
+        if key in self.handler_modes:
+            return self.handler_modes[key]
+        if asyncio.iscoroutinefunction(self.task_handlers.get(key)):
+            return ExecutionMode.ASYNC
+        return ExecutionMode.THREAD
+    
+    def get_retry_delay(self, attempt: int) -> float:
+        """Calculate delay before retry attempt using exponential backoff"""
+        delay = self.retry_base_delay * (2 ** attempt)
+        return min(delay, self.retry_max_delay)
     
     def add_task(self, task: Task) -> str:
         """
@@ -124,6 +186,7 @@ class TaskOrchestrationDAG:
             self.task_handlers[key] = task.handler
         
         self.tasks[task.task_id] = task
+        self._dirty_tasks.add(task.task_id)
         
         for dep_id in task.dependencies:
             self.dependencies[task.task_id].add(dep_id)
@@ -143,6 +206,51 @@ class TaskOrchestrationDAG:
             del self.tasks[task_id]
             del self.dependencies[task_id]
             del self.reverse_dependencies[task_id]
+            self.task_results.pop(task_id, None)
+            self._dirty_tasks.discard(task_id)
+    
+    def update_task_parameters(self, task_id: str, parameters: Dict[str, Any]):
+        """
+        Replace a task's parameters and invalidate it for incremental execution
+        
+        Args:
+            task_id: Task to update
+            parameters: New operation parameters
+        """
+        if task_id not in self.tasks:
+            raise KeyError(f"Task {task_id} not in DAG")
+        self.tasks[task_id].parameters = parameters
+        self._dirty_tasks.add(task_id)
+    
+    def invalidate(self, task_id: str):
+        """Mark a task for re-execution on the next incremental run"""
+        if task_id in self.tasks:
+            self._dirty_tasks.add(task_id)
+    
+    def get_invalidated_subgraph(self) -> Set[str]:
+        """
+        Tasks an incremental run must execute
+        
+        Returns:
+            Invalidated tasks, tasks without a completed result, and everything
+            downstream of them
+        """
+        stale = set(self._dirty_tasks)
+        stale.update(
+            tid for tid in self.tasks
+            if tid not in self.task_results
+            or self.task_results[tid].status != TaskStatus.COMPLETED
+        )
+        
+        queue = deque(stale)
+        while queue:
+            task_id = queue.popleft()
+            for dependent_id in self.reverse_dependencies[task_id]:
+                if dependent_id in self.tasks and dependent_id not in stale:
+                    stale.add(dependent_id)
+                    queue.append(dependent_id)
+        
+        return stale
     
     def topological_sort(self) -> List[List[str]]:
         """
@@ -187,72 +295,39 @@ class TaskOrchestrationDAG:
         Returns:
             TaskResult with execution outcome
         """
-        key = f"{task.task_type}.{task.operation}"
-        handler = self.task_handlers.get(key)
-        
-        if not handler:
-            return TaskResult(
-                status=TaskStatus.FAILED,
-                error=f"No handler registered for {key}"
-            )
-        
-        retry_count = 0
-        start_time = datetime.utcnow()
-        
-        while retry_count <= task.max_retries:
-            try:
-                output = handler(task.parameters)
-                
-                execution_time = (datetime.utcnow() - start_time).total_seconds()
-                
-                return TaskResult(
-                    status=TaskStatus.COMPLETED,
-                    output=output,
-                    execution_time=execution_time,
-                    retry_count=retry_count
-                )
-            
-            except Exception as e:
-                retry_count += 1
-                
-                if retry_count > task.max_retries:
-                    execution_time = (datetime.utcnow() - start_time).total_seconds()
-                    return TaskResult(
-                        status=TaskStatus.FAILED,
-                        error=str(e),
-                        execution_time=execution_time,
-                        retry_count=retry_count - 1
-                    )
-        
-        return TaskResult(status=TaskStatus.FAILED, error="Max retries exceeded")
-    
-    def execute_all(self) -> Dict[str, TaskResult]:
+        return ConcurrentTaskExecutor(self, max_workers=1).run([task.task_id])[task.task_id]
+    
+    def execute_all(self, max_workers: Optional[int] = None,
+                    incremental: bool = False) -> Dict[str, TaskResult]:
         """
         Execute all tasks in the DAG in dependency order
         
+        Ready tasks run concurrently; a task starts as soon as its own
+        dependencies complete rather than waiting for its whole level.
+        
+        Args:
+            max_workers: Override the DAG's thread pool size for this run
+            incremental: Only execute the invalidated subgraph, keeping
+                previous results for everything else
+        
         Returns:
             Dictionary mapping task IDs to execution results
         """
         levels = self.topological_sort()
         
-        for level in levels:
-            for task_id in level:
-                task = self.tasks[task_id]
-                
-                should_execute = True
-                for dep_id in task.dependencies:
-                    if dep_id in self.task_results:
-                        if self.task_results[dep_id].status != TaskStatus.COMPLETED:
-                            should_execute = False
-                            self.task_results[task_id] = TaskResult(
-                                status=TaskStatus.CANCELLED,
-                                error=f"Dependency {dep_id} failed"
-                            )
-                            break
-                
-                if should_execute:
-                    result = self._execute_task(task)
-                    self.task_results[task_id] = result
+        task_ids = None
+        if incremental:
+            stale = self.get_invalidated_subgraph()
+            task_ids = [tid for level in levels for tid in level if tid in stale]
+        
+        executor = ConcurrentTaskExecutor(
+            self,
+            max_workers=max_workers or self.max_workers,
+            result_cache=self.result_cache
+        )
+        results = executor.run(task_ids)
+        self.task_results.update(results)
+        self._dirty_tasks.difference_update(results)
         
         return self.task_results
     
@@ -289,6 +364,320 @@ class TaskOrchestrationDAG:
         self.task_results.clear()
 
 
+class ConcurrentTaskExecutor:
+    """
+    Event-driven executor for a TaskOrchestrationDAG
+    
+    Ready tasks are held in a priority queue and dispatched to a thread pool,
+    a process pool or a shared asyncio loop according to their ExecutionMode.
+    Dependents are released as soon as their own dependencies complete.
+    Failed attempts are retried with exponential backoff, and attempts that
+    run longer than Task.timeout after they start are abandoned and counted
+    as failures. An abandoned thread or process cannot be interrupted, so it
+    keeps its worker slot until it actually returns. With a result
+    cache, a task whose parameters and upstream result hashes match a cached
+    entry completes without invoking its handler.
+    """
+    
+    def __init__(self, dag: TaskOrchestrationDAG, max_workers: Optional[int] = None,
+                 max_process_workers: Optional[int] = None, max_async_tasks: int = 100,
+                 result_cache=None):
+        """
+        Initialize executor.
+        
+        Args:
+            dag: DAG whose tasks and handlers to execute
+            max_workers: Concurrent thread-mode tasks
+            max_process_workers: Concurrent process-mode tasks
+            max_async_tasks: Concurrent coroutine tasks
+            result_cache: Optional TaskResultCache for memoised outputs
+        """
+        self.dag = dag
+        self.result_cache = result_cache
+        self.capacity = {
+            ExecutionMode.THREAD: max_workers or min(32, (os.cpu_count() or 1) + 4),
+            ExecutionMode.PROCESS: max_process_workers or (os.cpu_count() or 1),
+            ExecutionMode.ASYNC: max_async_tasks,
+        }
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+    
+    def run(self, task_ids: Optional[List[str]] = None) -> Dict[str, TaskResult]:
+        """
+        Execute tasks until every one has completed, failed or been cancelled
+        
+        Args:
+            task_ids: Subset of tasks to run (None = all tasks). Dependencies
+                outside the subset are treated as already satisfied by their
+                existing results in the DAG.
+        
+        Returns:
+            Dictionary mapping task IDs to execution results
+        """
+        dag = self.dag
+        selected = list(dag.tasks) if task_ids is None else list(task_ids)
+        selected_set = set(selected)
+        order = {tid: i for i, tid in enumerate(selected)}
+        
+        results: Dict[str, TaskResult] = {}
+        remaining = {
+            tid: {d for d in dag.dependencies[tid] if d in selected_set}
+            for tid in selected
+        }
+        attempts: Dict[str, int] = defaultdict(int)
+        started: Dict[str, float] = {}
+        cache_keys: Dict[str, Optional[str]] = {}
+        cache = self.result_cache
+        
+        ready: List[Tuple[int, int, str]] = []
+        delayed: List[Tuple[float, int, str]] = []
+        # Each running attempt carries a stamp list its worker fills with the start time
+        running: Dict[Future, Tuple[str, ExecutionMode, List[float]]] = {}
+        abandoned: Dict[Future, ExecutionMode] = {}  # Timed out, still occupying a slot
+        in_flight = defaultdict(int)
+        
+        def deadline(tid: str, stamp: List[float]) -> Optional[float]:
+            timeout = dag.tasks[tid].timeout
+            return stamp[0] + timeout if timeout and stamp else None
+        
+        def push_ready(tid: str):
+            heapq.heappush(ready, (-dag.tasks[tid].priority.value, order[tid], tid))
+        
+        def finish(tid: str, result: TaskResult):
+            results[tid] = result
+            dependents = (d for d in dag.reverse_dependencies[tid] if d in selected_set)
+            for dependent_id in sorted(dependents, key=order.__getitem__):
+                if dependent_id in results:
+                    continue
+                if result.status != TaskStatus.COMPLETED:
+                    finish(dependent_id, TaskResult(
+                        status=TaskStatus.CANCELLED,
+                        error=f"Dependency {tid} failed"
+                    ))
+                    continue
+                remaining[dependent_id].discard(tid)
+                if not remaining[dependent_id]:
+                    push_ready(dependent_id)
+        
+        def lookup_cache(tid: str) -> bool:
+            task = dag.tasks[tid]
+            upstream = {}
+            for dep_id in dag.dependencies[tid]:
+                dep_result = results.get(dep_id) or dag.task_results.get(dep_id)
+                upstream[dep_id] = dep_result.metadata.get('result_hash') if dep_result else None
+            key = make_cache_key(task.task_type, task.operation, task.parameters, upstream) \
+                if task.cacheable else None
+            cache_keys[tid] = key
+            if key is None:
+                return False
+            hit, output = cache.get(key)
+            if hit:
+                finish(tid, TaskResult(
+                    status=TaskStatus.COMPLETED,
+                    output=output,
+                    metadata={'cache_hit': True, 'cache_key': key,
+                              'result_hash': hash_output(output)}
+                ))
+            return hit
+        
+        def attempt_failed(tid: str, error: str):
+            task = dag.tasks[tid]
+            elapsed = time.monotonic() - started[tid]
+            if attempts[tid] > task.max_retries:
+                finish(tid, TaskResult(
+                    status=TaskStatus.FAILED,
+                    error=error,
+                    execution_time=elapsed,
+                    retry_count=attempts[tid] - 1
+                ))
+                return
+            dag.task_results[tid] = TaskResult(
+                status=TaskStatus.RETRYING,
+                error=error,
+                execution_time=elapsed,
+                retry_count=attempts[tid]
+            )
+            ready_at = time.monotonic() + dag.get_retry_delay(attempts[tid] - 1)
+            heapq.heappush(delayed, (ready_at, order[tid], tid))
+        
+        for tid in selected:
+            if not remaining[tid]:
+                push_ready(tid)
+        
+        try:
+            while ready or delayed or running:
+                now = time.monotonic()
+                while delayed and delayed[0][0] <= now:
+                    _, _, tid = heapq.heappop(delayed)
+                    push_ready(tid)
+                
+                deferred = []
+                while ready:
+                    entry = heapq.heappop(ready)
+                    tid = entry[2]
+                    task = dag.tasks[tid]
+                    key = f"{task.task_type}.{task.operation}"
+                    handler = dag.task_handlers.get(key)
+                    if not handler:
+                        finish(tid, TaskResult(
+                            status=TaskStatus.FAILED,
+                            error=f"No handler registered for {key}"
+                        ))
+                        continue
+                    if cache is not None and tid not in cache_keys and lookup_cache(tid):
+                        continue
+                    mode = dag.get_execution_mode(task)
+                    if in_flight[mode] >= self.capacity[mode]:
+                        deferred.append(entry)
+                        continue
+                    
+                    attempts[tid] += 1
+                    started.setdefault(tid, time.monotonic())
+                    stamp: List[float] = []
+                    future = self._submit(mode, handler, task, stamp)
+                    running[future] = (tid, mode, stamp)
+                    in_flight[mode] += 1
+                for entry in deferred:
+                    heapq.heappush(ready, entry)
+                
+                wake_times = []
+                for tid, _, stamp in running.values():
+                    if dag.tasks[tid].timeout:
+                        # Poll a timed task that has not started until its worker stamps it
+                        wake_times.append(deadline(tid, stamp) if stamp else time.monotonic() + 0.01)
+                if delayed:
+                    wake_times.append(delayed[0][0])
+                timeout = max(0.0, min(wake_times) - time.monotonic()) if wake_times else None
+                
+                if running or abandoned:
+                    done, _ = wait(list(running) + list(abandoned), timeout=timeout,
+                                   return_when=FIRST_COMPLETED)
+                elif timeout is not None:
+                    time.sleep(timeout)
+                    done = set()
+                else:
+                    continue
+                
+                for future in done:
+                    if future in abandoned:
+                        # A timed-out attempt finally returned; its result is discarded
+                        in_flight[abandoned.pop(future)] -= 1
+                        continue
+                    tid, mode, _ = running.pop(future)
+                    in_flight[mode] -= 1
+                    try:
+                        output = future.result()
+                    except Exception as e:
+                        attempt_failed(tid, str(e) or type(e).__name__)
+                        continue
+                    metadata = {}
+                    if cache is not None:
+                        key, result_hash = cache_keys.get(tid), hash_output(output)
+                        metadata = {'cache_hit': False, 'cache_key': key, 'result_hash': result_hash}
+                        if key is not None and result_hash is not None:
+                            cache.put(key, output)
+                    finish(tid, TaskResult(
+                        status=TaskStatus.COMPLETED,
+                        output=output,
+                        execution_time=time.monotonic() - started[tid],
+                        retry_count=attempts[tid] - 1,
+                        metadata=metadata
+                    ))
+                
+                now = time.monotonic()
+                for future, (tid, mode, stamp) in list(running.items()):
+                    expires = deadline(tid, stamp)
+                    if expires is not None and now >= expires:
+                        del running[future]
+                        # Coroutines cancel; running threads and processes cannot, so
+                        # their slot stays taken until the attempt really finishes
+                        if future.cancel():
+                            in_flight[mode] -= 1
+                        else:
+                            abandoned[future] = mode
+                        attempt_failed(tid, f"Task timed out after {dag.tasks[tid].timeout}s")
+        finally:
+            self._shutdown()
+        
+        return results
+    
+    def _submit(self, mode: ExecutionMode, handler: Callable, task: Task,
+                stamp: List[float]) -> Future:
+        """
+        Dispatch one handler invocation to the pool for its mode
+        
+        Args:
+            mode: Execution mode of the task
+            handler: Task handler
+            task: Task to run
+            stamp: Receives the monotonic time the attempt starts running
+        
+        Returns:
+            Future for the handler's output
+        """
+        if mode == ExecutionMode.ASYNC:
+            loop = self._get_loop()
+            return asyncio.run_coroutine_threadsafe(
+                self._run_coroutine(handler, task.parameters, task.timeout, stamp), loop
+            )
+        if mode == ExecutionMode.PROCESS:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.capacity[ExecutionMode.PROCESS]
+                )
+            # A child process cannot write the stamp back. Slots of abandoned
+            # processes stay counted, so a submitted task always has a free
+            # process and starts on submission.
+            stamp.append(time.monotonic())
+            return self._process_pool.submit(handler, task.parameters)
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.capacity[ExecutionMode.THREAD],
+                thread_name_prefix="nexus-task"
+            )
+        return self._thread_pool.submit(self._call_stamped, handler, task.parameters, stamp)
+    
+    @staticmethod
+    def _call_stamped(handler: Callable, parameters: Dict[str, Any], stamp: List[float]) -> Any:
+        """Worker-thread entry point: record the start time, then run the handler"""
+        stamp.append(time.monotonic())
+        return handler(parameters)
+    
+    @staticmethod
+    async def _run_coroutine(handler: Callable, parameters: Dict[str, Any],
+                             timeout: Optional[float], stamp: List[float]) -> Any:
+        """Await a coroutine handler, cancelling it if it exceeds its timeout"""
+        stamp.append(time.monotonic())
+        return await asyncio.wait_for(handler(parameters), timeout=timeout)
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the shared event loop thread on first use"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="nexus-task-loop", daemon=True
+            )
+            self._loop_thread.start()
+        return self._loop
+    
+    def _shutdown(self):
+        """Release pools; abandoned (timed-out) threads are not waited on"""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+
+
 class TaskBuilder:
     """
     Fluent builder for creating tasks
@@ -314,6 +703,7 @@ class TaskBuilder:
         self._timeout = None
         self._handler = None
         self._metadata = {}
+        self._cacheable = True
     
     def type(self, task_type: str):
         """Set task type"""
@@ -355,6 +745,11 @@ class TaskBuilder:
         self._handler = handler
         return self
     
+    def cacheable(self, cacheable: bool = True):
+        """Allow or forbid serving this task from a result cache"""
+        self._cacheable = cacheable
+        return self
+    
     def meta(self, key: str, value: Any):
         """Add metadata"""
         self._metadata[key] = value
@@ -372,5 +767,6 @@ class TaskBuilder:
             max_retries=self._max_retries,
             timeout=self._timeout,
             handler=self._handler,
-            metadata=self._metadata
+            metadata=self._metadata,
+            cacheable=self._cacheable
         )
@@ -0,0 +1,65 @@
+"""
+Benchmark script for NexusOS launcher startup
+
+Compares a cold import of app.py (lazy dashboard registry) with eagerly
+importing every dashboard module, and reports the most expensive dashboards
+using -X importtime. Each measurement runs in a fresh interpreter.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from dashboard_registry import DASHBOARD_MODULES, profile_import
+
+
+def time_cold_import(statement: str, num_runs: int = 3) -> float:
+    """Best-of-N wall time (seconds) to run an import statement in a fresh interpreter"""
+    best = float('inf')
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=REPO_ROOT,
+                       capture_output=True, check=False)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks():
+    """Run launcher startup benchmarks"""
+    print("=" * 80)
+    print("NexusOS Launcher Startup Benchmark")
+    print("=" * 80)
+
+    baseline = time_cold_import("pass")
+    lazy = time_cold_import("import app")
+    eager_statement = "; ".join(
+        f"import {module}" for module, _ in dict.fromkeys(DASHBOARD_MODULES.values())
+    )
+    eager = time_cold_import(eager_statement, num_runs=1)
+
+    print(f"Interpreter startup:        {baseline * 1000:10.1f} ms")
+    print(f"Lazy launcher (import app): {lazy * 1000:10.1f} ms")
+    print(f"Eager dashboard imports:    {eager * 1000:10.1f} ms")
+    if lazy > baseline:
+        print(f"Speedup (excluding interpreter): {(eager - baseline) / (lazy - baseline):.1f}x")
+
+    print("-" * 80)
+    print(f"{'Dashboard':<40} {'Module':<32} {'Cold import (ms)':>16}")
+    print("-" * 80)
+    profiles = []
+    for label, (module, _) in DASHBOARD_MODULES.items():
+        profile = profile_import(module, top=3)
+        profiles.append((profile['total_us'], label, module, profile['ok']))
+    for total_us, label, module, ok in sorted(profiles, reverse=True):
+        status = "" if ok else "  (import failed)"
+        print(f"{label:<40} {module:<32} {total_us / 1000:>16.1f}{status}")
+
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    run_benchmarks()
@@ -0,0 +1,257 @@
+"""
+Unit tests for BlockchainSimulator mempool and block assembly
+
+Tests fee-priority ordering with per-sender nonce order, duplicate
+rejection, cached stake-weighted proposer selection, and the vectorised
+execution engine against one-by-one transaction processing.
+"""
+
+import hashlib
+import random
+import time
+import numpy as np
+import pytest
+from blockchain_sim import (
+    AccountState, Block, BlockchainSimulator, ConsensusType, Mempool,
+    Transaction, ValidatorStatus, merkle_root
+)
+
+
+def make_tx(tx_id, sender, fee, nonce=None, amount=1.0, recipient='bob'):
+    return Transaction(
+        tx_id=tx_id, sender=sender, recipient=recipient, amount=amount,
+        fee=fee, timestamp=0.0, nonce=nonce
+    )
+
+
+def reference_execute(accounts, txs):
+    """Original per-transaction dict update; returns applied flags"""
+    applied = []
+    for tx in txs:
+        ok = tx.sender in accounts and accounts[tx.sender] >= (tx.amount + tx.fee)
+        if ok:
+            accounts[tx.sender] -= (tx.amount + tx.fee)
+            if tx.recipient not in accounts:
+                accounts[tx.recipient] = 0
+            accounts[tx.recipient] += tx.amount
+        applied.append(ok)
+    return applied
+
+
+def random_block(rng, addresses, size):
+    """Transfers with overspends, self-transfers, unknown senders and new recipients"""
+    txs = []
+    for i in range(size):
+        sender = rng.choice(addresses + ['ghost', f'new{rng.randrange(5)}'])
+        recipient = rng.choice(addresses + [f'new{rng.randrange(5)}', sender])
+        amount = rng.choice([rng.uniform(0.1, 20), rng.uniform(50, 200)])
+        txs.append(make_tx(f'{i}', sender, amount * 0.001, amount=amount, recipient=recipient))
+    return txs
+
+
+class TestMempool:
+    """Tests for fee-priority ordering and deduplication"""
+    
+    def test_highest_fee_first(self):
+        """Test blocks take the highest-fee transactions across senders"""
+        pool = Mempool()
+        for i, fee in enumerate([0.1, 0.5, 0.3, 0.9]):
+            pool.add(make_tx(f'tx{i}', f'sender{i}', fee))
+        
+        assert [tx.fee for tx in pool.pop_batch(3)] == [0.9, 0.5, 0.3]
+        assert len(pool) == 1
+    
+    def test_sender_order_preserved(self):
+        """Test a high-fee transaction waits behind its sender's earlier nonces"""
+        pool = Mempool()
+        pool.add(make_tx('a1', 'alice', 0.1, nonce=1))
+        pool.add(make_tx('a0', 'alice', 0.2, nonce=0))
+        pool.add(make_tx('a2', 'alice', 5.0, nonce=2))
+        pool.add(make_tx('b0', 'bob', 1.0, nonce=0))
+        
+        assert [tx.tx_id for tx in pool.pop_batch(10)] == ['b0', 'a0', 'a1', 'a2']
+    
+    def test_matches_reference_order(self):
+        """Test random workloads pop in the same order as a greedy scan over sender heads"""
+        rng = random.Random(4)
+        pool = Mempool()
+        queues = {}
+        for i in range(500):
+            sender = f's{rng.randrange(20)}'
+            tx = make_tx(f'tx{i}', sender, round(rng.uniform(0, 1), 3))
+            pool.add(tx)
+            queues.setdefault(sender, []).append((i, tx))
+        
+        expected = []
+        while any(queues.values()):
+            sender = max(
+                (s for s in queues if queues[s]),
+                key=lambda s: (queues[s][0][1].fee, -queues[s][0][0])
+            )
+            expected.append(queues[sender].pop(0)[1].tx_id)
+        
+        popped = []
+        while len(pool):
+            popped.extend(tx.tx_id for tx in pool.pop_batch(rng.randint(1, 50)))
+        assert popped == expected
+    
+    def test_duplicates_rejected(self):
+        """Test the same transaction is refused while pending and after inclusion"""
+        pool = Mempool()
+        tx = make_tx('tx', 'alice', 0.1)
+        assert pool.add(tx)
+        assert not pool.add(make_tx('tx', 'alice', 0.1))
+        
+        pool.pop_batch(1)
+        assert not pool.add(make_tx('tx', 'alice', 0.1))
+        assert len(pool) == 0
+
+
+class TestSimulator:
+    """Tests for block assembly and proposer selection"""
+    
+    def test_duplicate_not_included_twice(self):
+        """Test add_transaction refuses a resubmitted transaction"""
+        sim = BlockchainSimulator(num_validators=5)
+        tx = sim.generate_transaction()
+        
+        assert sim.add_transaction(tx)
+        assert not sim.add_transaction(tx)
+        assert sim.get_network_health()['mempool_size'] == 1
+    
+    def test_run_simulation_without_delay(self):
+        """Test a delay-free run produces every block within the size limit"""
+        sim = BlockchainSimulator(num_validators=10)
+        sim.run_simulation(num_blocks=20, transactions_per_block=200, block_delay=0)
+        
+        assert len(sim.chain) == 21
+        assert sim.total_transactions + len(sim.mempool) <= 20 * 200
+        assert all(len(block.transactions) <= 200 for block in sim.chain)
+    
+    def test_proposer_follows_stake(self):
+        """Test PoS selection frequency tracks stake share"""
+        sim = BlockchainSimulator(num_validators=4)
+        for validator, stake in zip(sim.validators.values(), [1.0, 1.0, 1.0, 7.0]):
+            validator.stake = stake
+        sim.invalidate_validator_cache()
+        heavy = list(sim.validators.values())[3]
+        
+        np.random.seed(0)
+        picks = [sim.select_block_proposer() for _ in range(5000)]
+        
+        assert picks.count(heavy) / len(picks) == pytest.approx(0.7, abs=0.03)
+    
+    def test_status_change_updates_candidates(self):
+        """Test offline validators stop being proposed"""
+        sim = BlockchainSimulator(num_validators=6, consensus_type=ConsensusType.DELEGATED_POS)
+        sim.select_block_proposer()
+        offline = list(sim.validators)[:5]
+        for address in offline:
+            sim.set_validator_status(address, ValidatorStatus.OFFLINE)
+        
+        proposers = {sim.select_block_proposer().address for _ in range(20)}
+        assert proposers == set(sim.validators) - set(offline)
+        
+        for address in offline:
+            sim.set_validator_status(address, ValidatorStatus.ACTIVE)
+        sim.total_blocks = 0
+        assert sim.select_block_proposer().stake == max(v.stake for v in sim.validators.values())
+
+
+
+class TestExecution:
+    """Tests for vectorised block execution"""
+    
+    @pytest.mark.parametrize('seed', [1, 2, 3, 4])
+    def test_matches_sequential(self, seed):
+        """Test balances, applied set and account order match one-by-one execution"""
+        rng = random.Random(seed)
+        addresses = [f'acct{i}' for i in range(rng.choice([3, 40, 400]))]
+        reference = {a: rng.choice([0.0, 5.0, rng.uniform(10, 500)]) for a in addresses}
+        state = AccountState(capacity=4)
+        for address, balance in reference.items():
+            state[address] = balance
+        
+        for _ in range(5):
+            txs = random_block(rng, addresses + [a for a in reference if a.startswith('new')], 300)
+            expected = reference_execute(reference, txs)
+            assert state.apply_transfers(txs).tolist() == expected
+        
+        assert list(state) == list(reference)
+        assert [state[a] for a in reference] == pytest.approx(list(reference.values()), abs=1e-9)
+    
+    def test_sender_created_in_block(self):
+        """Test an account credited earlier in a block can spend later in it"""
+        reference = {'A': 10.0, 'B': 0.0}
+        state = AccountState()
+        for address, balance in reference.items():
+            state[address] = balance
+        txs = [make_tx('0', 'NEW', 0.0, amount=0.0, recipient='B'),
+               make_tx('1', 'A', 0.1, amount=5.0, recipient='NEW'),
+               make_tx('2', 'NEW', 0.1, amount=2.0, recipient='B'),
+               make_tx('3', 'LATER', 0.0, amount=0.0, recipient='B'),
+               make_tx('4', 'B', 0.0, amount=0.0, recipient='LATER')]
+        expected = reference_execute(reference, txs)
+        
+        assert state.apply_transfers(txs).tolist() == expected == [False, True, True, False, True]
+        assert list(state) == list(reference)
+        assert [state[a] for a in reference] == pytest.approx(list(reference.values()))
+    
+    def test_metrics_match_sequential(self):
+        """Test fee burn, value transferred and transaction counts follow applied transfers"""
+        sim = BlockchainSimulator(num_validators=5)
+        reference = dict(sim.accounts)
+        txs = random_block(random.Random(9), list(reference), 500)
+        expected = reference_execute(reference, txs)
+        block = Block(height=1, timestamp=time.time(), transactions=txs,
+                      previous_hash=sim.chain[-1].hash, proposer='genesis')
+        
+        sim.execute_block(block)
+        
+        applied = [tx for tx, ok in zip(txs, expected) if ok]
+        assert sim.total_transactions == len(applied)
+        assert sim.total_fees_burned == pytest.approx(sum(tx.fee for tx in applied))
+        assert sim.total_value_transferred == pytest.approx(sum(tx.amount for tx in applied))
+        assert sim.get_chain_stats()['total_supply'] == pytest.approx(sum(reference.values()))
+    
+    def test_large_block(self):
+        """Test a 10k-transaction block executes quickly"""
+        sim = BlockchainSimulator(num_validators=21)
+        for _ in range(10_000):
+            sim.add_transaction(sim.generate_transaction())
+        block = sim.create_block(max_transactions=10_000)
+        expected = reference_execute(dict(sim.accounts), block.transactions)
+        
+        started = time.perf_counter()
+        sim.execute_block(block)
+        
+        assert time.perf_counter() - started < 1.0
+        assert block.gas_used == 10_000 * 21000
+        assert sim.total_transactions == sum(expected)
+
+
+class TestMerkleRoot:
+    """Tests for the transaction Merkle root"""
+    
+    def test_known_roots(self):
+        """Test empty, single, and odd-sized trees"""
+        h = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(3)]
+        pair = lambda a, b: hashlib.sha256(bytes.fromhex(a) + bytes.fromhex(b)).hexdigest()
+        
+        assert merkle_root([]) == hashlib.sha256(b"").hexdigest()
+        assert merkle_root(h[:1]) == h[0]
+        assert merkle_root(h) == pair(pair(h[0], h[1]), pair(h[2], h[2]))
+    
+    def test_block_hash_commits_to_transactions(self):
+        """Test changing any transaction changes the block hash"""
+        txs = [make_tx(f'tx{i}', 'alice', 0.1) for i in range(5)]
+        block = Block(height=1, timestamp=0.0, transactions=txs, previous_hash='0', proposer='v')
+        original = block.calculate_hash()
+        
+        block.transactions = txs[:4] + [make_tx('tx9', 'alice', 0.1)]
+        assert block.calculate_hash() != original
+        assert block.tx_root == merkle_root([tx.get_hash() for tx in block.transactions])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,118 @@
+"""
+Unit tests for the compiled CivilizationSimulator kernel
+
+Tests that simulate_days reproduces day-by-day simulate_day exactly, and
+that ensembles are reproducible, sampled consistently and leave the
+simulator untouched.
+"""
+
+import numpy as np
+import pytest
+from civilization_simulator import (
+    CivilizationSimulator, STATE_FIELDS, ensemble_bands, trajectories_to_dataframe
+)
+
+
+def state_tuple(state):
+    return tuple(getattr(state, name) for name in STATE_FIELDS)
+
+
+class TestSimulateDays:
+    """Tests for the single-path kernel behind simulate_days"""
+    
+    def test_matches_simulate_day(self):
+        """Test history, final state and PID state equal the scalar loop"""
+        scalar, compiled = CivilizationSimulator(), CivilizationSimulator()
+        np.random.seed(3)
+        for _ in range(400):
+            scalar.simulate_day()
+        next_scalar = np.random.random()
+        np.random.seed(3)
+        compiled.simulate_days(400)
+        
+        assert [state_tuple(s) for s in compiled.history] == [state_tuple(s) for s in scalar.history]
+        assert isinstance(compiled.current_state.population, int)
+        assert compiled.nexus_engine.integral_error == scalar.nexus_engine.integral_error
+        assert np.random.random() == next_scalar
+    
+    def test_continues_after_scalar_days(self):
+        """Test kernel runs pick up from states and PID left by simulate_day"""
+        scalar, mixed = CivilizationSimulator(), CivilizationSimulator()
+        np.random.seed(8)
+        for _ in range(60):
+            scalar.simulate_day()
+        np.random.seed(8)
+        for _ in range(10):
+            mixed.simulate_day()
+        mixed.simulate_days(30)
+        for _ in range(20):
+            mixed.simulate_day()
+        
+        assert state_tuple(mixed.current_state) == state_tuple(scalar.current_state)
+
+
+class TestEnsemble:
+    """Tests for simulate_ensemble"""
+    
+    def test_paths_match_single_runs(self):
+        """Test each path equals simulate_days fed the same noise"""
+        draws = []
+        for seed in range(3):
+            np.random.seed(seed)
+            draws.append(np.random.standard_normal((90, 2)))
+        noise = (np.stack([d[:, 0] for d in draws]), np.stack([d[:, 1] for d in draws]))
+        
+        trajectories = CivilizationSimulator().simulate_ensemble(3, 90, noise=noise)
+        
+        for seed in range(3):
+            single = CivilizationSimulator()
+            np.random.seed(seed)
+            single.simulate_days(90)
+            assert [tuple(row) for row in trajectories[seed].tolist()] == [state_tuple(s) for s in single.history]
+    
+    def test_reproducible_and_stateless(self):
+        """Test a seed fixes the ensemble and the simulator is not advanced"""
+        sim = CivilizationSimulator()
+        first = sim.simulate_ensemble(20, 400, seed=5, chunk_days=64)
+        second = sim.simulate_ensemble(20, 400, seed=5, chunk_days=64)
+        
+        assert np.array_equal(first, second)
+        assert len(sim.history) == 1
+        assert sim.nexus_engine.integral_error == 0.0
+        assert len({tuple(row) for row in first['stability_index'].tolist()}) == 20
+    
+    def test_sampling_matches_full_trajectory(self):
+        """Test sample_every keeps every n-th day plus the final day"""
+        sim = CivilizationSimulator()
+        full = sim.simulate_ensemble(4, 100, seed=2)
+        sampled = sim.simulate_ensemble(4, 100, seed=2, sample_every=30)
+        
+        assert sampled['time_days'][0].tolist() == [0, 30, 60, 90, 100]
+        assert np.array_equal(sampled, full[:, [0, 30, 60, 90, 100]])
+    
+    def test_bad_noise_shape(self):
+        """Test mismatched noise arrays are rejected"""
+        with pytest.raises(ValueError):
+            CivilizationSimulator().simulate_ensemble(2, 10, noise=(np.zeros((2, 10)), np.zeros((2, 9))))
+
+
+class TestFrames:
+    """Tests for DataFrame and band helpers"""
+    
+    def test_dataframe_and_bands(self):
+        """Test long format and quantile bands line up with the trajectories"""
+        trajectories = CivilizationSimulator().simulate_ensemble(50, 60, seed=1, sample_every=10)
+        
+        df = trajectories_to_dataframe(trajectories)
+        bands = ensemble_bands(trajectories, 'stability_index', quantiles=(0.1, 0.5, 0.9))
+        
+        assert len(df) == 50 * 7
+        assert list(df.columns) == ['path'] + STATE_FIELDS
+        assert list(bands.index) == [0, 10, 20, 30, 40, 50, 60]
+        assert list(bands.columns) == ['mean', 'q0.1', 'q0.5', 'q0.9']
+        assert (bands['q0.1'] <= bands['q0.5']).all() and (bands['q0.5'] <= bands['q0.9']).all()
+        assert bands['mean'].iloc[-1] == pytest.approx(trajectories['stability_index'][:, -1].mean())
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -195,6 +195,19 @@ class TestETLPipeline:
         assert len(results) == 4
         assert all(r.status == TaskStatus.COMPLETED for r in results.values())
     
+    def test_rerun_always_extracts_and_loads(self):
+        """Test sources and sinks run on every rerun while pure stages hit the cache"""
+        from task_cache import TaskResultCache
+        domain = DataProcessingDomain(result_cache=TaskResultCache())
+        
+        domain.create_etl_pipeline().execute_all()
+        results = domain.create_etl_pipeline().execute_all()
+        
+        hits = {tid: r.metadata['cache_hit'] for tid, r in results.items()}
+        assert hits == {'extract-data': False, 'validate-data': True,
+                        'transform-data': True, 'load-data': False}
+        assert results['load-data'].metadata['cache_key'] is None
+    
     def test_etl_dependencies(self):
         """Test ETL task dependencies"""
         domain = DataProcessingDomain()
@@ -0,0 +1,78 @@
+"""
+Unit tests for the lazy dashboard registry
+
+Tests that dashboards are imported only on selection, that import costs
+are recorded, and that every navigation entry points at a real function.
+"""
+
+import ast
+import os
+import sys
+import pytest
+from dashboard_registry import DASHBOARD_MODULES, LazyDashboardRegistry, profile_import
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def fake_dashboard(tmp_path, monkeypatch):
+    """A throwaway dashboard module on sys.path"""
+    (tmp_path / "fake_dash_module.py").write_text(
+        "CALLS = []\n"
+        "def render():\n"
+        "    CALLS.append(1)\n"
+        "    return 'rendered'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "fake_dash_module"
+    sys.modules.pop("fake_dash_module", None)
+
+
+class TestLazyDashboardRegistry:
+    """Tests for lazy dashboard resolution"""
+
+    def test_import_deferred_until_selected(self, fake_dashboard):
+        """Test constructing the registry imports nothing"""
+        registry = LazyDashboardRegistry({"Fake": (fake_dashboard, "render")})
+
+        assert fake_dashboard not in sys.modules
+        assert registry.render("Fake") == 'rendered'
+        assert fake_dashboard in sys.modules
+
+    def test_import_stats_recorded_once(self, fake_dashboard):
+        """Test import cost is measured on first resolve only"""
+        registry = LazyDashboardRegistry({"Fake": (fake_dashboard, "render")})
+
+        first = registry.resolve("Fake")
+        assert registry.resolve("Fake") is first
+
+        report = registry.get_import_report()
+        assert len(report) == 1
+        assert report[0]['label'] == "Fake"
+        assert report[0]['module'] == fake_dashboard
+        assert report[0]['import_ms'] >= 0
+
+    def test_unknown_label(self):
+        """Test unknown navigation entries raise KeyError"""
+        with pytest.raises(KeyError):
+            LazyDashboardRegistry({}).resolve("Nope")
+
+    def test_navigation_targets_exist(self):
+        """Test every registered callable is defined in its module (without importing it)"""
+        for label, (module, attr) in DASHBOARD_MODULES.items():
+            with open(os.path.join(REPO_ROOT, module + ".py"), encoding="utf-8") as f:
+                tree = ast.parse(f.read())
+            functions = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+            assert attr in functions, f"{label}: {module}.{attr} not found"
+
+    def test_profile_import_parses_importtime(self):
+        """Test -X importtime output is parsed into totals"""
+        profile = profile_import("json", top=3)
+
+        assert profile['ok']
+        assert profile['total_us'] > 0
+        assert len(profile['top']) <= 3
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -5,6 +5,7 @@ Tests CRUD operations, foreign key constraints, cascading deletes,
 and data integrity for all SQLAlchemy models.
 """
 
+import time
 import pytest
 from datetime import datetime, timedelta
 from sqlalchemy import create_engine
@@ -12,7 +13,9 @@ from sqlalchemy.orm import sessionmaker
 from database import (
     Base, SimulationConfig, SimulationRun, User, Role, UserRole,
     Session, MonitoringSnapshot, AlertRule, AlertEvent,
-    OptimizationRun, OptimizationIteration
+    OptimizationRun, OptimizationIteration,
+    InstrumentedQueuePool, get_engine, get_session_factory, session_scope,
+    get_pool_metrics, init_db, dispose_engines
 )
 
 
@@ -608,5 +611,94 @@ class TestDataIntegrity:
         assert retrieved.signal_config is None
 
 
+@pytest.fixture
+def sqlite_url(tmp_path):
+    """File-backed SQLite URL registered in the engine registry"""
+    url = f"sqlite:///{tmp_path / 'registry.db'}"
+    yield url
+    dispose_engines()
+
+
+class TestEngineRegistry:
+    """Tests for the shared engine/session registry"""
+    
+    def test_engine_reused_per_url(self, sqlite_url, monkeypatch):
+        """Test repeated lookups share one engine and session factory"""
+        monkeypatch.setenv('DATABASE_URL', sqlite_url)
+        
+        assert get_engine() is get_engine(sqlite_url)
+        assert get_session_factory() is get_session_factory(sqlite_url)
+        assert get_session_factory(expire_on_commit=False) is not get_session_factory()
+    
+    def test_missing_url_raises(self, monkeypatch):
+        """Test an unset DATABASE_URL is reported"""
+        monkeypatch.delenv('DATABASE_URL', raising=False)
+        
+        with pytest.raises(ValueError):
+            get_engine()
+    
+    def test_session_scope_commits_and_rolls_back(self, sqlite_url):
+        """Test session_scope commits on success and rolls back on error"""
+        assert init_db(sqlite_url) is get_engine(sqlite_url)
+        
+        with session_scope(sqlite_url) as session:
+            session.add(Role(name='viewer'))
+        
+        with pytest.raises(RuntimeError):
+            with session_scope(sqlite_url) as session:
+                session.add(Role(name='admin'))
+                raise RuntimeError("boom")
+        
+        with session_scope(sqlite_url) as session:
+            assert [r.name for r in session.query(Role).all()] == ['viewer']
+    
+    def test_pool_metrics(self, sqlite_url):
+        """Test metrics report checked-out connections"""
+        engine = get_engine(sqlite_url)
+        with engine.connect():
+            metrics = get_pool_metrics(sqlite_url)
+        
+        assert metrics['checked_out'] == 1
+        assert get_pool_metrics(sqlite_url)['checked_out'] == 0
+    
+    def test_instrumented_pool_records_waits(self, tmp_path):
+        """Test the instrumented pool counts checkouts and timeouts"""
+        from sqlalchemy.exc import TimeoutError as SATimeoutError
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1, max_overflow=0, pool_timeout=0.05
+        )
+        
+        with engine.connect():
+            with pytest.raises(SATimeoutError):
+                engine.connect()
+        
+        assert engine.pool.checkouts == 1
+        assert engine.pool.timeouts == 1
+        engine.dispose()
+    
+    def test_instrumented_pool_concurrent_checkouts(self, tmp_path):
+        """Test checkout counts and waits stay exact under concurrent checkouts"""
+        from concurrent.futures import ThreadPoolExecutor
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=2, max_overflow=0, pool_timeout=10
+        )
+        
+        def checkout(_):
+            with engine.connect():
+                time.sleep(0.001)
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(checkout, range(200)))
+        
+        assert engine.pool.checkouts == 200
+        assert engine.pool.timeouts == 0
+        assert 0 < engine.pool.max_wait_seconds <= engine.pool.total_wait_seconds
+        engine.dispose()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,176 @@
+"""
+Unit tests for running governance tallies and the all-pairs collusion scan
+
+Checks CivicGovernance proposal and campaign tallies against recounts of
+the stored votes, and ValidatorCollisionDetection.scan_voting_collusion
+against detect_voting_collusion over every pair.
+"""
+
+import itertools
+import random
+import time
+import pytest
+from civic_governance import (
+    Campaign, CivicGovernance, Proposal, ProposalType, SpectralRegion, VoteChoice
+)
+from governance_security import ValidatorCollisionDetection
+
+
+def recount(gov, proposal_id):
+    """Per-region counts rebuilt from the stored vote list"""
+    counts = {region.value: {"APPROVE": 0, "REJECT": 0, "ABSTAIN": 0} for region in SpectralRegion}
+    for vote in gov.votes[proposal_id]:
+        counts[vote.spectral_region.value][vote.choice.name] += 1
+    return counts
+
+
+def make_governance(rng, per_region=3):
+    gov = CivicGovernance()
+    for region in SpectralRegion:
+        for i in range(per_region):
+            gov.register_validator(f"VAL-{region.name}-{i}", region, stake_amount=rng.uniform(1000, 5000))
+    return gov
+
+
+class TestProposalTallies:
+    """Tests for running proposal tallies"""
+    
+    @pytest.mark.parametrize('seed', [1, 2, 3])
+    def test_tallies_match_recount(self, seed):
+        """Test status, region counts and outcomes agree with a recount after every vote"""
+        rng = random.Random(seed)
+        gov = make_governance(rng)
+        validators = list(gov.validators)
+        
+        for p in range(6):
+            proposal_type = rng.choice([ProposalType.POLICY, ProposalType.CONSTITUTIONAL])
+            gov.submit_proposal(Proposal(f"P{p}", "t", "d", proposal_type, "CIT"))
+            for validator_id in rng.sample(validators, rng.randint(1, len(validators))):
+                if gov.proposals[f"P{p}"].status != "OPEN":
+                    break
+                gov.cast_vote(validator_id, f"P{p}", rng.choice(list(VoteChoice)))
+                
+                status = gov.get_proposal_status(f"P{p}")
+                counts = recount(gov, f"P{p}")
+                approving = sum(1 for c in counts.values() if c["APPROVE"] > 0)
+                rejecting = sum(1 for c in counts.values() if c["REJECT"] > 0)
+                assert status["votes_by_region"] == counts
+                assert status["regions_approved"] == approving
+                if approving >= gov.proposals[f"P{p}"].required_approvals:
+                    assert status["status"] == "APPROVED"
+                elif rejecting > 8 - gov.proposals[f"P{p}"].required_approvals:
+                    assert status["status"] == "REJECTED"
+        
+        stats = gov.get_governance_stats()
+        decided = [p.status for p in gov.proposals.values()]
+        assert stats["approved_proposals"] == decided.count("APPROVED")
+        assert stats["rejected_proposals"] == decided.count("REJECTED")
+    
+    def test_double_vote_rejected(self):
+        """Test a validator cannot vote twice on a proposal"""
+        gov = make_governance(random.Random(0))
+        gov.submit_proposal(Proposal("P", "t", "d", ProposalType.POLICY, "CIT"))
+        gov.cast_vote("VAL-UV-0", "P", VoteChoice.ABSTAIN)
+        
+        with pytest.raises(ValueError):
+            gov.cast_vote("VAL-UV-0", "P", VoteChoice.APPROVE)
+        assert gov.get_proposal_status("P")["total_votes"] == 1
+
+
+class TestCampaignTallies:
+    """Tests for campaign voter tracking"""
+    
+    def test_campaign_votes(self):
+        """Test duplicate voters are refused and totals follow the vote lists"""
+        gov = make_governance(random.Random(1))
+        for c in range(3):
+            gov.create_campaign(Campaign(f"C{c}", "t", "d", "i", "VAL-UV-0", nxt_burned=150.0))
+        for i in range(60):
+            gov.submit_community_vote(f"citizen{i}", f"C{i % 3}", VoteChoice.APPROVE if i % 4 else VoteChoice.REJECT)
+        
+        with pytest.raises(ValueError):
+            gov.submit_community_vote("citizen0", "C0", VoteChoice.APPROVE)
+        
+        status = gov.get_campaign_status("C0")
+        assert status["total_voters"] == status["total_votes_cast"] == 20
+        assert status["votes_reject"] == sum(1 for v in gov.community_votes["C0"] if v.choice == VoteChoice.REJECT)
+        assert gov.get_campaign_stats()["total_community_votes"] == 60
+
+
+class TestCollusionScan:
+    """Tests for the sparse all-pairs collusion scan"""
+    
+    def random_detector(self, seed, num_validators=60, num_proposals=40):
+        """Random voters plus a few planted blocs that copy a leader"""
+        rng = random.Random(seed)
+        detector = ValidatorCollisionDetection()
+        validators = [f"val{i}" for i in range(num_validators)]
+        leaders = {v: rng.choice(validators[:5]) for v in validators[5:20]}
+        for p in range(num_proposals):
+            directions = {}
+            for validator in validators:
+                if rng.random() < 0.6:
+                    directions[validator] = rng.choice(["for", "against", "abstain"])
+            for follower, leader in leaders.items():
+                if leader in directions and rng.random() < 0.9:
+                    directions[follower] = directions[leader]
+            for validator, direction in directions.items():
+                detector.record_vote(validator, f"P{p}", direction)
+        # A changed vote: the last one counts
+        detector.record_vote("val0", "P0", "against")
+        return detector, validators
+    
+    @pytest.mark.parametrize('seed', [1, 2])
+    def test_matches_pairwise(self, seed):
+        """Test the scan returns exactly the flagged pairs of the pairwise check"""
+        detector, _ = self.random_detector(seed)
+        validators = list(detector.voting_patterns)  # Scan order
+        expected = []
+        for v1, v2 in itertools.combinations(validators, 2):
+            is_collusion, correlation = detector.detect_voting_collusion(v1, v2)
+            if is_collusion:
+                common = len({p for p, _ in detector.voting_patterns[v1]} & {p for p, _ in detector.voting_patterns[v2]})
+                expected.append((v1, v2, correlation, common))
+        expected.sort(key=lambda row: (-row[2], -row[3], validators.index(row[0]), validators.index(row[1])))
+        
+        result = detector.scan_voting_collusion(top_k=len(validators) ** 2, block_size=7)
+        
+        assert len(expected) > 5
+        assert result == expected
+        assert detector.scan_voting_collusion(top_k=5, block_size=16) == expected[:5]
+    
+    def test_thresholds_and_subset(self):
+        """Test custom threshold, minimum overlap and validator subsets"""
+        detector, validators = self.random_detector(3)
+        subset = validators[:10]
+        
+        result = detector.scan_voting_collusion(top_k=1000, validators=subset, threshold=0.0, min_common_votes=3)
+        
+        assert len(result) == sum(
+            1 for v1, v2 in itertools.combinations(subset, 2)
+            if len({p for p, _ in detector.voting_patterns[v1]} & {p for p, _ in detector.voting_patterns[v2]}) >= 3
+        )
+        assert detector.scan_voting_collusion(validators=["val0"]) == []
+        assert detector.scan_voting_collusion(top_k=0) == []
+    
+    def test_large_validator_set(self):
+        """Test ten thousand validators scan quickly and find the planted pair"""
+        rng = random.Random(5)
+        detector = ValidatorCollisionDetection()
+        for i in range(10_000):
+            for p in rng.sample(range(500), 8):
+                detector.record_vote(f"val{i}", f"P{p}", rng.choice(["for", "against"]))
+        for p in range(20):
+            detector.record_vote("mole_a", f"P{p}", "for")
+            detector.record_vote("mole_b", f"P{p}", "for")
+        
+        started = time.perf_counter()
+        result = detector.scan_voting_collusion(top_k=10, threshold=0.5, min_common_votes=2)
+        
+        assert time.perf_counter() - started < 10.0
+        assert result[0] == ("mole_a", "mole_b", 1.0, 20)
+        assert len(result) == 10
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,138 @@
+"""
+Unit tests for LongTermTokenomicsSimulator.simulate_grid
+
+Tests the vectorised scenario x burn-parameter grid against the annual
+simulate() loop and a scalar reference for the balancing mechanisms.
+"""
+
+import numpy as np
+import pytest
+from longterm_tokenomics_simulation import (
+    AdoptionScenario, BurnParameters, EconomicBalancingMechanism,
+    LongTermTokenomicsSimulator, GRID_METRICS
+)
+
+
+def reference_balanced(sim, years, scenario, max_burn_pct):
+    """Scalar annual loop with dynamic burns, validator inflation and a burn cap"""
+    supply, burned, rows = sim.GENESIS_SUPPLY, 0.0, []
+    for year in range(1, years + 1):
+        messages = sim.estimate_daily_messages(sim.estimate_active_users(year, scenario))
+        rate = EconomicBalancingMechanism.dynamic_burn_adjustment(
+            sim.calculate_daily_burn(messages), supply, sim.INITIAL_SUPPLY
+        )
+        rate = EconomicBalancingMechanism.apply_annual_burn_cap(rate * 365, supply, max_burn_pct) / 365
+        supply -= rate * 365
+        burned += rate * 365
+        supply += supply * EconomicBalancingMechanism.calculate_validator_inflation(year - 1) / 100
+        rows.append((supply, burned, rate))
+    return np.array(rows)
+
+
+class TestMatchesAnnualLoop:
+    """Tests against the one-scenario-at-a-time simulate()"""
+    
+    @pytest.mark.parametrize('scenario', list(AdoptionScenario))
+    def test_annual_steps_match_simulate(self, scenario):
+        """Test every metric agrees up to depletion, then supply holds at zero"""
+        sim = LongTermTokenomicsSimulator()
+        result = sim.simulate_grid(100, steps_per_year=1)
+        run = list(AdoptionScenario).index(scenario)
+        metrics = LongTermTokenomicsSimulator().simulate(100, scenario)
+        
+        for name in GRID_METRICS:
+            expected = [getattr(m, name) for m in metrics]
+            assert result.metrics[name][run, :len(metrics)] == pytest.approx(expected, rel=1e-9, abs=1e-9)
+        if metrics[-1].circulating_supply <= 0:
+            assert result.depletion_year[run] == metrics[-1].year
+            assert (result.metrics['circulating_supply'][run, len(metrics):] == 0).all()
+            assert result.metrics['total_burned'][run, len(metrics):] == pytest.approx(metrics[-1].total_burned, rel=1e-9)
+        else:
+            assert np.isnan(result.depletion_year[run])
+    
+    def test_grid_rows_match_single_parameter_sets(self):
+        """Test each grid run equals simulate() with that BurnParameters"""
+        grid = {'message_burn': [1e-5, 5.7e-5, 2e-4], 'video_ratio': [0.05, 0.1]}
+        result = LongTermTokenomicsSimulator().simulate_grid(
+            60, scenarios=[AdoptionScenario.AGGRESSIVE], burn_grid=grid, steps_per_year=1
+        )
+        
+        assert result.num_runs == 6
+        for run in range(result.num_runs):
+            params = BurnParameters(message_burn=result.burn_params['message_burn'][run],
+                                    video_ratio=result.burn_params['video_ratio'][run])
+            metrics = LongTermTokenomicsSimulator(params).simulate(60, AdoptionScenario.AGGRESSIVE)
+            supply = [m.circulating_supply for m in metrics]
+            assert result.metrics['circulating_supply'][run, :len(supply)] == pytest.approx(supply, rel=1e-9)
+
+
+class TestDailyResolution:
+    """Tests for daily steps and the balancing path"""
+    
+    def test_closed_form_matches_step_loop(self):
+        """Test the cumulative path agrees with the per-step loop when balancing is a no-op"""
+        sim = LongTermTokenomicsSimulator()
+        grid = {'message_burn': np.linspace(1e-5, 3e-4, 7)}
+        closed = sim.simulate_grid(40, burn_grid=grid, sample_every=30)
+        stepped = sim.simulate_grid(40, burn_grid=grid, sample_every=30, max_burn_pct=1e12)
+        
+        for name in GRID_METRICS:
+            assert closed.metrics[name] == pytest.approx(stepped.metrics[name], rel=1e-9, abs=1e-9)
+        assert np.array_equal(np.isnan(closed.depletion_year), np.isnan(stepped.depletion_year))
+        assert closed.depletion_year[~np.isnan(closed.depletion_year)] == pytest.approx(
+            stepped.depletion_year[~np.isnan(stepped.depletion_year)], abs=1 / 365
+        )
+    
+    def test_daily_burns_sit_between_annual_bounds(self):
+        """Test daily supply tracks the annual model, which front-loads each year's user count"""
+        sim = LongTermTokenomicsSimulator()
+        daily = sim.simulate_grid(15, scenarios=[AdoptionScenario.MODERATE])
+        annual = sim.simulate_grid(15, scenarios=[AdoptionScenario.MODERATE], steps_per_year=1)
+        
+        assert daily.years.tolist() == annual.years.tolist() == list(range(1, 16))
+        assert (daily.metrics['total_burned'] <= annual.metrics['total_burned'] + 1e-9).all()
+        assert daily.metrics['total_burned'][0, -1] == pytest.approx(annual.metrics['total_burned'][0, -1], rel=0.1)
+    
+    @pytest.mark.parametrize('scenario', [AdoptionScenario.MODERATE, AdoptionScenario.VIRAL])
+    def test_balancing_matches_scalar_reference(self, scenario):
+        """Test dynamic burns, burn cap and validator inflation agree with a scalar loop"""
+        sim = LongTermTokenomicsSimulator()
+        result = sim.simulate_grid(
+            80, scenarios=[scenario], steps_per_year=1,
+            dynamic_burn=True, validator_inflation=True, max_burn_pct=5.0
+        )
+        expected = reference_balanced(sim, 80, scenario, 5.0)
+        
+        assert result.metrics['circulating_supply'][0] == pytest.approx(expected[:, 0], rel=1e-9)
+        assert result.metrics['total_burned'][0] == pytest.approx(expected[:, 1], rel=1e-9)
+        assert result.metrics['burn_rate_daily'][0] == pytest.approx(expected[:, 2], rel=1e-9)
+
+
+class TestGridResult:
+    """Tests for grid expansion and columnar output"""
+    
+    def test_unknown_parameter(self):
+        """Test grid keys must be BurnParameters fields"""
+        with pytest.raises(ValueError):
+            LongTermTokenomicsSimulator().simulate_grid(10, burn_grid={'mesage_burn': [1.0]})
+    
+    def test_dataframe_and_surface(self):
+        """Test long format and a sensitivity surface over two parameters"""
+        grid = {'message_burn': [1e-5, 5e-5, 1e-4], 'link_burn': [1e-5, 3e-5]}
+        result = LongTermTokenomicsSimulator().simulate_grid(20, burn_grid=grid, sample_every=90)
+        
+        df = result.to_dataframe()
+        surface = result.surface('circulating_supply', 'message_burn', 'link_burn', AdoptionScenario.VIRAL)
+        
+        assert result.num_runs == 4 * 6
+        assert len(df) == result.num_runs * len(result.years)
+        assert result.years[-1] == 20
+        assert surface.shape == (3, 2)
+        assert surface.loc[1e-4, 1e-5] < surface.loc[1e-5, 1e-5]
+        run = int(np.flatnonzero((result.scenarios == 'viral') & (result.burn_params['message_burn'] == 1e-4)
+                                 & (result.burn_params['link_burn'] == 1e-5))[0])
+        assert surface.loc[1e-4, 1e-5] == result.metrics['circulating_supply'][run, -1]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,136 @@
+"""
+Unit tests for MessagingFlowController.process_message_burns
+
+Runs the same messages through the batch API and through one
+process_message_burn call per message, each against its own token system,
+ledger and rate limiter, and checks that every outcome and aggregate agrees.
+"""
+
+import random
+import pytest
+import native_token
+from economic_loop_controller import MessagingFlowController, TransitionReserveLedger
+from native_token import NativeTokenSystem
+from orbital_transition_engine import orbital_engine
+from security_framework import RateLimiter
+
+
+def make_controller(monkeypatch, balances):
+    limiter = RateLimiter()
+    monkeypatch.setattr(native_token, 'get_rate_limiter', lambda: limiter)
+    token_system = NativeTokenSystem()
+    for address, balance in balances.items():
+        token_system.create_account(address, initial_balance=balance)
+    return MessagingFlowController(token_system, TransitionReserveLedger()), limiter
+
+
+def random_messages(rng, senders, count):
+    """Mixed message types, unknown senders and some oversized burns"""
+    messages = []
+    for i in range(count):
+        sender = rng.choice(senders + ['ghost'])
+        burn = rng.choice([0.000057, 0.0000285, 0.000114, 0.5])
+        message_type = rng.choice(['standard', 'link', 'image', 'video', 'Video', 'unknown'])
+        messages.append((sender, f'msg_{i}', burn, 656.4, message_type))
+    return messages
+
+
+def run_both(monkeypatch, balances, messages):
+    """Returns (controller, limiter, results, engine ledger slice) for sequential then batch"""
+    runs = []
+    for batched in (False, True):
+        controller, limiter = make_controller(monkeypatch, balances)
+        start = len(orbital_engine.ledger)
+        if batched:
+            results = controller.process_message_burns(messages)
+        else:
+            results = [controller.process_message_burn(*message) for message in messages]
+        runs.append((controller, limiter, results, orbital_engine.ledger[start:]))
+    return runs
+
+
+class TestMatchesPerMessagePath:
+    """Tests that the batch agrees with per-message processing"""
+    
+    @pytest.mark.parametrize('seed', [1, 2, 3])
+    def test_random_batch(self, monkeypatch, seed):
+        """Test outcomes, balances, token records, ledgers and events agree"""
+        rng = random.Random(seed)
+        senders = [f'user{i}' for i in range(6)]
+        balances = {sender: rng.choice([0, 20_000, 10 ** 9]) for sender in senders}
+        messages = random_messages(rng, senders, 80)
+        
+        (seq, seq_limiter, seq_results, seq_engine), (bat, bat_limiter, bat_results, bat_engine) = \
+            run_both(monkeypatch, balances, messages)
+        
+        assert [ok for ok, _, _ in bat_results] == [ok for ok, _, _ in seq_results]
+        assert any(ok for ok, _, _ in bat_results) and not all(ok for ok, _, _ in bat_results)
+        for (ok, msg, _), (_, seq_msg, _) in zip(bat_results, seq_results):
+            if 'Rate limit' not in seq_msg:
+                assert msg == seq_msg
+        assert seq_limiter.violations == bat_limiter.violations
+        
+        seq_tokens, bat_tokens = seq.token_system, bat.token_system
+        assert {a: (acct.balance, acct.nonce) for a, acct in bat_tokens.accounts.items()} == \
+            {a: (acct.balance, acct.nonce) for a, acct in seq_tokens.accounts.items()}
+        assert [(tx.tx_id, tx.from_address, tx.to_address, tx.amount, tx.fee, tx.data) for tx in bat_tokens.transactions] == \
+            [(tx.tx_id, tx.from_address, tx.to_address, tx.amount, tx.fee, tx.data) for tx in seq_tokens.transactions]
+        
+        assert bat.ledger.get_reserve_balance() == seq.ledger.get_reserve_balance()
+        assert bat.ledger.get_spectral_energy_distribution() == seq.ledger.get_spectral_energy_distribution()
+        assert [(e.sender_address, e.message_id, e.transition_type, e.entry_id.split('_')[-1]) for e in bat.ledger.entries] == \
+            [(e.sender_address, e.message_id, e.transition_type, e.entry_id.split('_')[-1]) for e in seq.ledger.entries]
+        
+        engine_row = lambda e: (e.user_address, e.transition.transition_type, e.nxt_units_transferred,
+                                e.reserve_balance_before, e.reserve_balance_after)
+        assert [engine_row(e) for e in bat_engine] == [engine_row(e) for e in seq_engine]
+        
+        event_row = lambda e: (e.sender, e.reserve_entry_id.split('_')[-1], e.event_id.split('_')[-1],
+                               e.spectral_region, e.energy_joules, e.energy_nxt_units)
+        assert [event_row(e) for e in bat.get_recent_events()] == [event_row(e) for e in seq.get_recent_events()]
+        assert bat.total_events == seq.total_events
+    
+    def test_reserve_as_sender(self, monkeypatch):
+        """Test senders that are also credited fall back to sequential transfers"""
+        balances = {'alice': 10 ** 9}
+        messages = [('alice', 'm0', 0.000057, 656.4), ('TRANSITION_RESERVE', 'm1', 0.000057, 656.4),
+                    ('alice', 'm2', 0.000057, 656.4, 'video')]
+        
+        (seq, _, seq_results, _), (bat, _, bat_results, _) = run_both(monkeypatch, balances, messages)
+        
+        assert [r[:2] for r in bat_results] == [r[:2] for r in seq_results]
+        assert bat.token_system.get_account('TRANSITION_RESERVE').balance == \
+            seq.token_system.get_account('TRANSITION_RESERVE').balance
+
+
+class TestBatchShape:
+    """Tests for shared work within a batch"""
+    
+    def test_one_transition_per_type(self, monkeypatch):
+        """Test messages of the same type share one transition and one timestamp"""
+        controller, _ = make_controller(monkeypatch, {f'user{i}': 10 ** 9 for i in range(5)})
+        messages = [(f'user{i % 5}', f'm{i}', 0.000057, 656.4, 'link' if i % 2 else 'standard') for i in range(10)]
+        
+        results = controller.process_message_burns(messages)
+        
+        events = [event for _, _, event in results]
+        assert len({id(e.transition) for e in events}) == 2
+        assert len({e.timestamp for e in events}) == 1
+        assert controller.token_system.get_account('TRANSITION_RESERVE').balance == 10 * 5_700
+        assert controller.process_message_burns([]) == []
+    
+    def test_rate_limit_batch_counts(self):
+        """Test a batched rate check admits the same requests as repeated single checks"""
+        single, batched = RateLimiter(), RateLimiter()
+        singles = [single.check_rate_limit('a', 'transfer')[0] for _ in range(14)]
+        
+        granted, reason = batched.check_rate_limit_batch('a', 'transfer', 14)
+        
+        assert granted == sum(singles) == 10
+        assert reason is not None
+        assert batched.violations['a'] == single.violations['a'] == 4
+        assert batched.check_rate_limit_batch('a', 'unlimited_op', 3) == (3, None)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
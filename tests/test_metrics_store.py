@@ -0,0 +1,231 @@
+"""
+Unit tests for the metrics time-series store
+
+Tests sample and rollup writes, server-side history/range queries,
+retention, and batched alert rule evaluation.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from database import Base, AlertRule, MetricRollup, User
+from metrics_store import MetricsStore, bucket_start, choose_resolution, numeric_metrics
+from alert_service import AlertService
+
+
+@pytest.fixture(scope='function')
+def engine():
+    """In-memory SQLite database shared by all sessions"""
+    engine = create_engine('sqlite://', echo=False)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(scope='function')
+def store(engine):
+    """MetricsStore writing to the test database"""
+    return MetricsStore(sessionmaker(bind=engine))
+
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+
+
+class TestMetricsStore:
+    """Tests for metric samples and rollups"""
+
+    def test_numeric_metrics_filters_values(self):
+        """Test only finite numbers become samples"""
+        values = numeric_metrics({'a': 1, 'b': 2.5, 'c': 'text', 'd': None,
+                                  'e': float('nan'), 'f': {'x': 1}, 'g': True})
+
+        assert values == {'a': 1.0, 'b': 2.5, 'g': 1.0}
+
+    def test_write_and_raw_history(self, store):
+        """Test history returns one key's samples oldest first"""
+        for i in range(5):
+            store.write({'N': float(i), 'other': 99}, BASE_TIME + timedelta(seconds=i))
+
+        history = store.get_history('N', BASE_TIME)
+
+        assert [point['value'] for point in history] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert store.get_history('N', BASE_TIME, limit=2)[0]['value'] == 3.0
+
+    def test_rollups_aggregate_buckets(self, store, engine):
+        """Test 1m/1h rollups keep count, sum, min, max and last"""
+        for i, value in enumerate([5.0, 1.0, 9.0, 3.0]):
+            store.write({'N': value}, BASE_TIME + timedelta(seconds=20 * i))
+
+        minute = store.get_history('N', BASE_TIME, resolution='1m')
+        hour = store.get_history('N', BASE_TIME, resolution='1h')
+
+        assert [p['count'] for p in minute] == [3, 1]
+        assert minute[0]['min'] == 1.0 and minute[0]['max'] == 9.0
+        assert minute[0]['value'] == pytest.approx(5.0)
+        assert hour == [{'timestamp': BASE_TIME.isoformat(), 'value': 4.5,
+                         'min': 1.0, 'max': 9.0, 'count': 4}]
+        with engine.connect() as conn:
+            last = conn.execute(MetricRollup.__table__.select().where(
+                MetricRollup.resolution == '1h')).one()
+        assert last.last == 3.0
+
+    def test_range_stats_raw_and_rollup_agree(self, store):
+        """Test SQL aggregates match across resolutions"""
+        for i in range(120):
+            store.write({'N': float(i % 7)}, BASE_TIME + timedelta(seconds=30 * i))
+
+        raw = store.get_range_stats('N', BASE_TIME, BASE_TIME + timedelta(hours=1))
+        hourly = store.get_range_stats('N', BASE_TIME, BASE_TIME + timedelta(hours=1), resolution='1h')
+
+        assert raw['count'] == hourly['count'] == 120
+        assert raw['avg'] == pytest.approx(hourly['avg'])
+        assert (raw['min'], raw['max']) == (hourly['min'], hourly['max']) == (0.0, 6.0)
+
+    def test_prune_keeps_hourly_rollups(self, store, engine):
+        """Test retention drops old raw samples and minute rollups only"""
+        store.write({'N': 1.0}, BASE_TIME)
+        store.write({'N': 2.0}, BASE_TIME + timedelta(days=10))
+
+        deleted = store.prune(now=BASE_TIME + timedelta(days=10))
+
+        assert deleted == {'raw': 1, '1m': 0}
+        assert len(store.get_history('N', BASE_TIME)) == 1
+        assert len(store.get_history('N', BASE_TIME, resolution='1h')) == 2
+
+    def test_maybe_prune_is_throttled(self, store):
+        """Test retention runs at most once per prune interval"""
+        store.write({'N': 1.0}, BASE_TIME)
+        store.write({'N': 2.0}, BASE_TIME + timedelta(days=8))
+
+        first = store.maybe_prune(now=BASE_TIME + timedelta(days=8))
+        store.write({'N': 3.0}, BASE_TIME + timedelta(days=8, minutes=1))
+        skipped = store.maybe_prune(now=BASE_TIME + timedelta(days=8, minutes=30))
+        later = store.maybe_prune(now=BASE_TIME + timedelta(days=15, hours=2))
+
+        assert first == {'raw': 1, '1m': 0}
+        assert skipped is None
+        assert later == {'raw': 2, '1m': 0}
+
+    def test_capture_snapshot_prunes(self, dashboard):
+        """Test capturing snapshots applies retention to old samples"""
+        dashboard.metrics_store.write({'N': 1.0}, datetime.utcnow() - timedelta(days=30))
+
+        dashboard.capture_snapshot({'N': 2.0})
+
+        assert [p['value'] for p in dashboard.get_metric_history('N', hours=24 * 60)] == [2.0]
+
+    def test_choose_resolution(self):
+        """Test longer spans use coarser rollups"""
+        assert choose_resolution(1) == 'raw'
+        assert choose_resolution(24) == '1m'
+        assert choose_resolution(24 * 30) == '1h'
+        assert bucket_start(datetime(2025, 1, 1, 12, 34, 56, 7), '1h') == datetime(2025, 1, 1, 12)
+
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+    """DashboardDataService on a fresh SQLite file"""
+    from database import dispose_engines, init_db
+    from dashboard_service import DashboardDataService
+    dispose_engines()
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'metrics.db'}")
+    init_db()
+    yield DashboardDataService()
+    dispose_engines()
+
+
+class TestDashboardHistory:
+    """Tests for the dashboard's metric history contract"""
+
+    def test_history_defaults_to_raw_samples(self, dashboard):
+        """Test callers get the last raw values unless they ask for rollups"""
+        for i in range(5):
+            dashboard.capture_snapshot({'N': float(i), 'label': 'x'})
+
+        history = dashboard.get_metric_history('N', limit=3)
+        minute = dashboard.get_metric_history('N', resolution='1m')
+
+        assert [point['value'] for point in history] == [2.0, 3.0, 4.0]
+        assert all(set(point) == {'timestamp', 'value'} for point in history)
+        assert sum(point['count'] for point in minute) == 5
+
+
+class TestSnapshotBackfill:
+    """Tests for seeding the store from pre-existing snapshots"""
+
+    def test_init_db_backfills_new_store_once(self, tmp_path):
+        """Test snapshots taken before the metrics tables existed stay in history"""
+        from database import MonitoringSnapshot, dispose_engines, init_db
+        dispose_engines()
+        url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        engine = create_engine(url)
+        legacy = [t for t in Base.metadata.sorted_tables
+                  if t.name not in ('metric_samples', 'metric_rollups')]
+        Base.metadata.create_all(engine, tables=legacy)
+        session = sessionmaker(bind=engine)()
+        for i in range(3):
+            session.add(MonitoringSnapshot(captured_at=BASE_TIME + timedelta(minutes=i),
+                                           metrics={'N': float(i), 'label': 'x'}, source_latency={}))
+        session.commit()
+        session.close()
+        engine.dispose()
+
+        init_db(url)
+        dispose_engines()
+        init_db(url)
+
+        store = MetricsStore(sessionmaker(bind=create_engine(url)))
+        assert [point['value'] for point in store.get_history('N', BASE_TIME)] == [0.0, 1.0, 2.0]
+        dispose_engines()
+
+
+class TestBatchedAlertEvaluation:
+    """Tests for evaluating all alert rules as one batch"""
+
+    @pytest.fixture
+    def service(self, engine):
+        session = sessionmaker(bind=engine)()
+        user = User(email='ops@example.com', password_hash='hash', is_active=True)
+        session.add(user)
+        session.commit()
+        service = AlertService(session_factory=lambda: session, test_mode=True)
+        service.user_id = user.id
+        return service
+
+    def test_batch_matches_single_rule_evaluation(self, service):
+        """Test the vectorised evaluation agrees with evaluate_rule"""
+        metrics = {'a': 10.0, 'b': None, 'c': 'bad', 'd': 5.00001, 'e': 0}
+        rules = [
+            AlertRule(metric_key=key, comparator=comparator, threshold=threshold)
+            for key in ['a', 'b', 'c', 'd', 'e', 'missing']
+            for comparator in ['gt', 'gte', 'lt', 'lte', 'eq', 'neq', 'bogus']
+            for threshold in [0.0, 5.0, 10.0]
+        ]
+
+        batch = service.evaluate_rules_batch(rules, metrics)
+
+        assert list(batch) == [service.evaluate_rule(rule, metrics) for rule in rules]
+
+    def test_single_bulk_update(self, service, engine):
+        """Test last_evaluated_at is written with one UPDATE for all rules"""
+        for i in range(20):
+            service.create_rule(f'rule {i}', f'm{i}', 'gt', 50.0, created_by=service.user_id)
+        updates = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('UPDATE alert_rules'):
+                updates.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            triggered = service.evaluate_all_rules({f'm{i}': 100.0 if i % 2 else 0.0 for i in range(20)})
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert len(triggered) == 10
+        assert len(updates) == 1
+        assert all(rule.last_evaluated_at is not None for rule in service.get_active_rules())
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
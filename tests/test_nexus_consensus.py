@@ -0,0 +1,95 @@
+"""
+Unit tests for NexusConsensusEngine contribution bookkeeping
+
+Tests running H/M/D totals and the top-contributor heap against full
+recomputation over all contribution scores.
+"""
+
+import random
+import pytest
+from nexus_consensus import NexusConsensusEngine, ContributionType
+from proof_of_spectrum import SpectralRegion, SpectralValidator
+
+
+def make_engine(num_validators=24):
+    engine = NexusConsensusEngine()
+    regions = list(SpectralRegion)
+    for i in range(num_validators):
+        engine.register_validator(SpectralValidator(
+            validator_id=f"validator_{i}", spectral_region=regions[i % len(regions)],
+            stake=1000.0, public_key=f"pubkey_{i}"
+        ))
+    return engine
+
+
+def reference_totals(engine):
+    scores = engine.contributions.values()
+    return (
+        sum(s.human_score for s in scores),
+        sum(s.machine_score for s in scores),
+        sum(s.data_score for s in scores),
+    )
+
+
+def reference_top(engine, limit):
+    ranked = sorted(engine.contributions.items(), key=lambda x: x[1].total_contribution, reverse=True)
+    return [validator_id for validator_id, _ in ranked[:limit]]
+
+
+def random_contributions(engine, rng, count):
+    types = list(ContributionType)
+    for _ in range(count):
+        engine.record_contribution(
+            f"validator_{rng.randrange(len(engine.validators))}",
+            rng.choice(types),
+            rng.choice([0.0, 0.01, 0.25, 1.0])
+        )
+
+
+class TestRunningTotals:
+    """Tests for incrementally maintained H/M/D totals"""
+    
+    def test_totals_match_recomputation(self):
+        """Test totals equal sums over all scores, including after re-registration"""
+        engine = make_engine()
+        rng = random.Random(5)
+        random_contributions(engine, rng, 500)
+        engine.register_validator(engine.validators["validator_3"])
+        random_contributions(engine, rng, 100)
+        
+        assert (engine.total_human, engine.total_machine, engine.total_data) == pytest.approx(reference_totals(engine))
+    
+    def test_totals_after_blocks(self):
+        """Test block rewards keep totals in step"""
+        engine = make_engine(12)
+        for n in range(5):
+            engine.create_block(f"block_{n}", {"n": n}, "validator_0")
+        
+        assert (engine.total_human, engine.total_machine, engine.total_data) == pytest.approx(reference_totals(engine))
+        assert engine.total_machine > 0
+
+
+class TestTopContributors:
+    """Tests for the top-contributor heap"""
+    
+    def test_matches_full_sort(self):
+        """Test top-K equals a full sort, ties in registration order"""
+        engine = make_engine()
+        rng = random.Random(9)
+        
+        assert [v for v, _ in engine.get_top_contributors(5)] == reference_top(engine, 5)
+        for _ in range(20):
+            random_contributions(engine, rng, 40)
+            for limit in (1, 5, 10, 100):
+                assert [v for v, _ in engine.get_top_contributors(limit)] == reference_top(engine, limit)
+    
+    def test_heap_stays_bounded(self):
+        """Test stale heap entries are compacted away"""
+        engine = make_engine()
+        random_contributions(engine, random.Random(1), 5000)
+        
+        assert len(engine._contributor_heap) <= 2 * len(engine.contributions) + 64
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,177 @@
+"""
+Unit tests for NexusNativeWallet unit-of-work transfers
+
+Tests idempotent send_nxt, atomic batched send_many, bulk ledger inserts
+and DAG linking against a temporary SQLite database.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import event
+from database import dispose_engines
+from nexus_native_wallet import (
+    NexusNativeWallet, DagEdge, TransactionIO, VerificationRecord,
+    WalletTransaction, UNITS_PER_NXT
+)
+
+
+@pytest.fixture
+def wallet(tmp_path):
+    """Wallet on a fresh SQLite file"""
+    dispose_engines()
+    nexus_wallet = NexusNativeWallet(f"sqlite:///{tmp_path / 'wallet.db'}")
+    yield nexus_wallet
+    dispose_engines()
+
+
+@pytest.fixture
+def funded(wallet):
+    """Address of a wallet holding 100 NXT"""
+    return wallet.create_wallet('pw', initial_balance=100)['address']
+
+
+class TestSendNxt:
+    """Tests for single transfers"""
+
+    def test_transfer_and_idempotent_retry(self, wallet, funded):
+        """Test a retried idempotency key does not transfer twice"""
+        first = wallet.send_nxt(funded, 'BOB', 2.0, 'pw', idempotency_key='k1')
+        retry = wallet.send_nxt(funded, 'BOB', 2.0, 'pw', idempotency_key='k1')
+
+        assert first['status'] == 'new_commit'
+        assert retry['status'] == 'idempotent_cached'
+        assert retry['tx_id'] == first['tx_id']
+        assert wallet.get_balance('BOB')['balance_units'] == 2 * UNITS_PER_NXT
+        assert wallet.get_balance(funded)['nonce'] == 1
+
+    def test_requires_idempotency_key(self, wallet, funded):
+        """Test transfers without an idempotency key are rejected"""
+        with pytest.raises(ValueError, match="idempotency_key"):
+            wallet.send_nxt(funded, 'BOB', 1.0, 'pw')
+
+    def test_dag_edges_never_self_referencing(self, wallet, funded):
+        """Test a transfer links to earlier transactions, not to itself"""
+        for i in range(3):
+            wallet.send_nxt(funded, 'BOB', 1.0, 'pw', idempotency_key=f'k{i}')
+
+        with wallet.read_session() as session:
+            edges = session.query(DagEdge).all()
+        assert all(edge.child_id != edge.parent_id for edge in edges)
+        assert wallet.audit_ledger_integrity()['dag_structure']['is_valid']
+
+
+class TestSendMany:
+    """Tests for batched payouts"""
+
+    def test_batch_commits_all_payouts(self, wallet, funded):
+        """Test every payout, fee and ledger row is written"""
+        payouts = [(f'PAYEE{i}', 0.5) for i in range(10)]
+
+        results = wallet.send_many(funded, payouts, 'pw', idempotency_key='batch-1')
+
+        assert [r['to_address'] for r in results] == [to for to, _ in payouts]
+        assert all(r['status'] == 'new_commit' for r in results)
+        balance = wallet.get_balance(funded)
+        assert balance['balance_units'] == 95 * UNITS_PER_NXT - 10
+        assert balance['nonce'] == 10
+        assert wallet.get_balance('VALIDATOR_POOL')['balance_units'] == 10
+        with wallet.read_session() as session:
+            assert session.query(TransactionIO).count() == 20
+            assert session.query(VerificationRecord).count() == 10
+
+    def test_batch_is_idempotent(self, wallet, funded):
+        """Test retrying a batch returns the committed payouts"""
+        payouts = [('A', 1.0), ('B', 1.0)]
+        first = wallet.send_many(funded, payouts, 'pw', idempotency_key='batch-1')
+        retry = wallet.send_many(funded, payouts, 'pw', idempotency_key='batch-1')
+
+        assert [r['tx_id'] for r in retry] == [r['tx_id'] for r in first]
+        assert all(r['status'] == 'idempotent_cached' for r in retry)
+        assert wallet.get_balance('A')['balance_nxt'] == 1.0
+
+    def test_insufficient_balance_rolls_back_whole_batch(self, wallet, funded):
+        """Test nothing is written when the batch total exceeds the balance"""
+        with pytest.raises(ValueError, match="Insufficient balance"):
+            wallet.send_many(funded, [('A', 60.0), ('B', 60.0)], 'pw', idempotency_key='too-much')
+
+        assert wallet.get_balance(funded)['balance_units'] == 100 * UNITS_PER_NXT
+        assert wallet.get_balance('A')['balance_units'] == 0
+        with wallet.read_session() as session:
+            assert session.query(WalletTransaction).count() == 0
+
+    def test_batch_payouts_chain_in_dag(self, wallet, funded):
+        """Test each payout's parents are the sender's previous transactions"""
+        results = wallet.send_many(funded, [('A', 1.0), ('B', 1.0), ('C', 1.0)], 'pw',
+                                   idempotency_key='chain')
+        tx_ids = [r['tx_id'] for r in results]
+
+        with wallet.read_session() as session:
+            parents = {
+                tx_id: {edge.parent_id for edge in session.query(DagEdge).filter_by(child_id=tx_id)}
+                for tx_id in tx_ids
+            }
+        assert parents[tx_ids[0]] == {'GENESIS'}
+        assert parents[tx_ids[1]] == {tx_ids[0]}
+        assert parents[tx_ids[2]] == {tx_ids[1], tx_ids[0]}
+
+    def test_ledger_rows_bulk_inserted(self, wallet, funded):
+        """Test ledger tables get one INSERT statement each per batch"""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('INSERT'):
+                statements.append(statement.split('(')[0].split()[-1])
+
+        event.listen(wallet.engine, 'before_cursor_execute', record)
+        try:
+            wallet.send_many(funded, [(f'P{i}', 0.1) for i in range(25)], 'pw', idempotency_key='bulk')
+        finally:
+            event.remove(wallet.engine, 'before_cursor_execute', record)
+
+        for table in ('nexus_wallet_transactions', 'nexus_transaction_io',
+                      'nexus_dag_edges', 'nexus_verification_records'):
+            assert statements.count(table) == 1
+
+    def test_empty_batch_rejected(self, wallet, funded):
+        """Test an empty payout list is rejected"""
+        with pytest.raises(ValueError):
+            wallet.send_many(funded, [], 'pw', idempotency_key='empty')
+
+
+class TestSessions:
+    """Tests for per-request sessions"""
+
+    def test_concurrent_reads_share_wallet(self, wallet, funded):
+        """Test one wallet instance serves several threads"""
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            balances = list(pool.map(lambda _: wallet.get_balance(funded)['balance_nxt'], range(20)))
+
+        assert balances == [100.0] * 20
+
+    def test_locked_balance_update(self, wallet, funded):
+        """Test a row-locked read-modify-write commits with its unit of work"""
+        with wallet._session_scope() as session:
+            account = wallet._get_or_create_token_account(funded, session=session, lock=True)
+            account.balance -= 40 * UNITS_PER_NXT
+            created = wallet._get_or_create_token_account('NEW', session=session, lock=True)
+            created.balance += 40 * UNITS_PER_NXT
+
+        assert wallet.get_balance(funded)['balance_nxt'] == 60.0
+        assert wallet.get_balance('NEW')['balance_nxt'] == 40.0
+
+    def test_read_session_returns_connection(self, wallet, funded):
+        """Test ad-hoc reads hand their connection back and see later writes"""
+        pool = wallet.engine.pool
+        with wallet.read_session() as session:
+            before = session.query(WalletTransaction).count()
+        checked_out = pool.checkedout()
+
+        wallet.send_nxt(funded, 'BOB', 1.0, 'pw', idempotency_key='fresh')
+
+        with wallet.read_session() as session:
+            assert session.query(WalletTransaction).count() == before + 1
+        assert pool.checkedout() == checked_out == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
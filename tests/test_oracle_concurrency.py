@@ -0,0 +1,282 @@
+"""
+Unit tests for concurrent oracle fetching
+
+Tests thread-pool fan-out across sources, per-source deadlines, circuit
+breakers and stale-while-revalidate caching in OracleManager, using a local
+mock HTTP server for the REST oracles.
+"""
+
+import json
+import threading
+import time
+import pytest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from oracle_sources import (
+    OracleDataPoint, OracleDataSource, OracleManager, RestAPIOracle,
+    StaticDataOracle, ORACLE_VARIABLES
+)
+
+
+class MockOracleHandler(BaseHTTPRequestHandler):
+    """Serves {'value': ...} per path with a configurable delay and status"""
+    
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            route = dict(server.routes.get(self.path, {'status': 404}))
+        time.sleep(route.get('delay', 0.0))
+        
+        status = route.get('status', 200)
+        body = json.dumps({'value': route.get('value', 0.0)}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def mock_oracle_server():
+    """Local HTTP server; tests register routes with server.route(path, ...)"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockOracleHandler)
+    server.block_on_close = False
+    server.lock = threading.Lock()
+    server.routes = {}
+    server.hits = {}
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    
+    def route(path, value=0.0, delay=0.0, status=200):
+        with server.lock:
+            server.routes[path] = {'value': value, 'delay': delay, 'status': status}
+    server.route = route
+    
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def rest_source(server, name, delay=0.0, deadline=5.0, value=1.0):
+    """Connected REST oracle serving every variable under /<name>/<variable>"""
+    server.route(f'/{name}/health')
+    for variable in ORACLE_VARIABLES:
+        server.route(f'/{name}/{variable}', value=value, delay=delay)
+    source = RestAPIOracle(name, {
+        'base_url': server.base_url,
+        'health_check_endpoint': f'/{name}/health',
+        'variable_endpoints': {v: f'/{name}/{v}' for v in ORACLE_VARIABLES},
+        'max_retries': 0,
+        'deadline': deadline,
+    })
+    assert source.connect()
+    return source
+
+
+class CountingOracle(OracleDataSource):
+    """In-process source whose value and latency tests can change"""
+    
+    def __init__(self, name, value=1.0):
+        super().__init__(name, {})
+        self.value = value
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+    
+    def connect(self):
+        self.is_connected = True
+        return True
+    
+    def disconnect(self):
+        self.is_connected = False
+    
+    def fetch_data(self, variable):
+        self.calls += 1
+        self.release.wait(5)
+        return OracleDataPoint(datetime.now(), variable, self.value, {'source': self.name})
+    
+    def get_status(self):
+        return {'name': self.name}
+
+
+@pytest.fixture
+def manager():
+    manager = OracleManager()
+    yield manager
+    manager.shutdown()
+
+
+class TestConcurrentFetch:
+    """Tests for thread-pool fan-out"""
+    
+    def test_latency_bounded_by_slowest_source(self, mock_oracle_server, manager):
+        """Test 3 sources x 6 variables at 0.2s each return in about 0.2s, not 3.6s"""
+        for i in range(3):
+            manager.add_source(rest_source(mock_oracle_server, f'src{i}', delay=0.2, value=float(i)))
+        
+        started = time.monotonic()
+        points = manager.fetch_all()
+        elapsed = time.monotonic() - started
+        
+        assert elapsed < 1.0
+        for i in range(3):
+            assert {v: p.value for v, p in points[f'src{i}'].items()} == {v: float(i) for v in ORACLE_VARIABLES}
+    
+    def test_connect_all_concurrent(self, mock_oracle_server, manager):
+        """Test connect_all overlaps health checks"""
+        for i in range(4):
+            mock_oracle_server.route(f'/c{i}/health', delay=0.3)
+            manager.add_source(RestAPIOracle(f'c{i}', {
+                'base_url': mock_oracle_server.base_url,
+                'health_check_endpoint': f'/c{i}/health',
+                'max_retries': 0,
+            }))
+        
+        started = time.monotonic()
+        results = manager.connect_all()
+        
+        assert time.monotonic() - started < 0.9
+        assert all(results.values())
+    
+    def test_fetch_variable_keeps_source_priority(self, manager):
+        """Test fetch_variable prefers the first registered source"""
+        manager.add_source(StaticDataOracle('first', {'data_values': {'H': 1.0}}))
+        manager.add_source(StaticDataOracle('second', {'data_values': {'H': 2.0, 'M': 3.0}}))
+        manager.connect_all()
+        
+        assert manager.fetch_variable('H').value == 1.0
+        assert manager.fetch_variable('M').value == 3.0
+        assert manager.fetch_variable('H', source_name='second').value == 2.0
+        assert manager.fetch_variable('H', source_name='missing') is None
+
+
+class TestDeadlinesAndCircuits:
+    """Tests for per-source deadlines and circuit breakers"""
+    
+    def test_slow_source_does_not_block_fast_one(self, mock_oracle_server, manager):
+        """Test a source past its deadline is dropped, the rest are returned"""
+        manager.add_source(rest_source(mock_oracle_server, 'fast', value=5.0))
+        manager.add_source(rest_source(mock_oracle_server, 'slow', delay=1.5, deadline=0.2))
+        
+        started = time.monotonic()
+        points = manager.fetch_all()
+        
+        assert time.monotonic() - started < 1.0
+        assert len(points['fast']) == len(ORACLE_VARIABLES)
+        assert points['slow'] == {}
+        assert 'deadline' in manager.get_source('slow').error_message
+        assert manager.get_circuit_status()['slow']['failure_count'] == 1
+    
+    def test_open_circuit_skips_source(self, mock_oracle_server):
+        """Test an open circuit stops requests to the source until it times out"""
+        manager = OracleManager(failure_threshold=1, circuit_timeout=60)
+        manager.add_source(rest_source(mock_oracle_server, 'slow', delay=0.5, deadline=0.1))
+        manager.fetch_all(['H'])
+        assert manager.get_circuit_status()['slow']['state'] == 'open'
+        hits = mock_oracle_server.hits['/slow/H']
+        
+        started = time.monotonic()
+        assert manager.fetch_all(['H']) == {'slow': {}}
+        assert time.monotonic() - started < 0.05
+        assert mock_oracle_server.hits['/slow/H'] == hits
+        manager.shutdown()
+    
+    def test_exception_counts_as_failure(self, manager):
+        """Test a source raising from fetch_data is reported and counted"""
+        source = CountingOracle('broken')
+        source.fetch_data = lambda variable: 1 / 0
+        manager.add_source(source)
+        manager.connect_all()
+        
+        assert manager.fetch_all(['H']) == {'broken': {}}
+        assert manager.get_circuit_status()['broken']['failure_count'] == 1
+        assert source.error_message
+    
+    def test_failed_rest_fetch_opens_circuit(self, mock_oracle_server):
+        """Test a REST source returning None for errors trips the circuit"""
+        manager = OracleManager(failure_threshold=2, circuit_timeout=60)
+        manager.add_source(rest_source(mock_oracle_server, 'api'))
+        mock_oracle_server.route('/api/H', status=500)
+        
+        manager.fetch_all(['H'], refresh=True)
+        assert manager.get_circuit_status()['api']['state'] == 'closed'
+        manager.fetch_all(['H'], refresh=True)
+        
+        assert manager.get_circuit_status()['api']['state'] == 'open'
+        assert manager.get_source('api').error_message
+        manager.shutdown()
+    
+    def test_unprovided_variables_not_fetched(self, manager):
+        """Test variables a source does not serve neither fetch nor count as failures"""
+        manager.add_source(StaticDataOracle('static', {'data_values': {'H': 3.0}}))
+        manager.connect_all()
+        
+        points = manager.fetch_all()
+        
+        assert list(points['static']) == ['H']
+        assert manager.get_circuit_status()['static']['failure_count'] == 0
+
+
+class TestStaleWhileRevalidate:
+    """Tests for cached data points"""
+    
+    def test_fresh_points_served_from_cache(self, manager):
+        """Test points younger than fresh_ttl are not refetched"""
+        source = CountingOracle('c')
+        manager.add_source(source)
+        manager.connect_all()
+        
+        manager.fetch_all(['H'])
+        manager.fetch_all(['H'])
+        assert source.calls == 1
+        
+        manager.fetch_all(['H'], refresh=True)
+        assert source.calls == 2
+    
+    def test_stale_point_served_while_refreshing(self):
+        """Test a stale point returns immediately and the refresh lands later"""
+        now = [0.0]
+        manager = OracleManager(fresh_ttl=10, stale_ttl=100, clock=lambda: now[0])
+        source = CountingOracle('c', value=1.0)
+        manager.add_source(source)
+        manager.connect_all()
+        manager.fetch_all(['H'])
+        
+        now[0] = 50.0
+        source.value = 2.0
+        source.release.clear()
+        started = time.monotonic()
+        assert manager.fetch_all(['H'])['c']['H'].value == 1.0
+        assert time.monotonic() - started < 0.1
+        
+        source.release.set()
+        deadline = time.monotonic() + 2
+        while manager._inflight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert manager.fetch_all(['H'])['c']['H'].value == 2.0
+        assert source.calls == 2
+        manager.shutdown()
+    
+    def test_stale_point_covers_failed_refresh(self, mock_oracle_server):
+        """Test a failing source still yields its last good value within stale_ttl"""
+        now = [0.0]
+        manager = OracleManager(fresh_ttl=10, stale_ttl=100, clock=lambda: now[0])
+        manager.add_source(rest_source(mock_oracle_server, 'api', value=7.0))
+        manager.fetch_all(['H'])
+        
+        mock_oracle_server.route('/api/H', status=500)
+        now[0] = 20.0
+        assert manager.fetch_all(['H'], refresh=True)['api']['H'].value == 7.0
+        
+        now[0] = 200.0
+        assert manager.fetch_all(['H'], refresh=True) == {'api': {}}
+        manager.shutdown()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
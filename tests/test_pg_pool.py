@@ -0,0 +1,176 @@
+"""
+Unit tests for the shared PostgreSQL pool helpers
+
+Tests prepared-statement reuse, the read-through cache and FriendManager
+batching against an in-process fake pool (no PostgreSQL server required).
+"""
+
+import pytest
+from datetime import datetime
+from pg_pool import ReadThroughCache, execute_prepared, pooled_connection
+from friend_manager import FriendManager
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.connection = conn
+        self.rowcount = 0
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.connection.executed.append((sql.strip(), params))
+        self._rows = self.connection.results.pop(0) if self.connection.results else []
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    closed = 0
+
+    def __init__(self):
+        self.prepared = set()
+        self.executed = []
+        self.results = []
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def get_transaction_status(self):
+        return 0  # TRANSACTION_STATUS_IDLE
+
+
+class FakePool:
+    def __init__(self):
+        self.conn = FakeConnection()
+        self.borrowed = 0
+        self.returned = 0
+
+    def getconn(self):
+        self.borrowed += 1
+        return self.conn
+
+    def putconn(self, conn, close=False):
+        self.returned += 1
+
+
+class TestPreparedStatements:
+    """Tests for per-connection statement preparation"""
+
+    def test_prepare_once_per_connection(self):
+        """Test PREPARE is only issued on first use"""
+        conn = FakeConnection()
+        cur = conn.cursor()
+
+        execute_prepared(cur, 'q', "SELECT $1", ('a',))
+        execute_prepared(cur, 'q', "SELECT $1", ('b',))
+
+        statements = [sql for sql, _ in conn.executed]
+        assert statements == ["PREPARE q AS SELECT $1", "EXECUTE q (%s)", "EXECUTE q (%s)"]
+        assert conn.executed[-1][1] == ('b',)
+
+    def test_pooled_connection_returns_connection(self):
+        """Test borrowed connections are returned even on error"""
+        pool = FakePool()
+
+        with pytest.raises(RuntimeError):
+            with pooled_connection(pool=pool):
+                raise RuntimeError("boom")
+
+        assert pool.borrowed == pool.returned == 1
+
+
+class TestReadThroughCache:
+    """Tests for the TTL read-through cache"""
+
+    def test_hits_and_expiry(self):
+        """Test values are cached until the TTL passes"""
+        now = [0.0]
+        calls = []
+
+        def loader(key):
+            calls.append(key)
+            return key.upper()
+
+        cache = ReadThroughCache(loader, ttl_seconds=10, clock=lambda: now[0])
+
+        assert cache.get('a') == 'A'
+        assert cache.get('a') == 'A'
+        now[0] = 11
+        assert cache.get('a') == 'A'
+
+        assert calls == ['a', 'a']
+        assert cache.get_stats()['hits'] == 1
+
+    def test_misses_not_cached(self):
+        """Test None results are looked up again"""
+        calls = []
+        cache = ReadThroughCache(lambda key: calls.append(key))
+
+        cache.get('x')
+        cache.get('x')
+
+        assert calls == ['x', 'x']
+
+    def test_lru_bound(self):
+        """Test the cache never exceeds max_entries"""
+        cache = ReadThroughCache(lambda key: key, max_entries=2)
+        for key in 'abc':
+            cache.get(key)
+
+        assert cache.get_stats()['entries'] == 2
+
+
+class TestFriendManagerPooling:
+    """Tests for FriendManager on a shared pool"""
+
+    def test_get_friends_many_groups_rows(self):
+        """Test the batch lookup issues one query and groups by user"""
+        pool = FakePool()
+        manager = FriendManager(pool=pool)
+        added = datetime(2025, 1, 1)
+        pool.conn.results = [[], [
+            ('alice', 1, 'Bob', '+100', 'dev-b', added),
+            ('carol', 2, 'Dan', '+200', None, added),
+            ('alice', 3, 'Eve', '+300', 'dev-e', None),
+        ]]
+
+        result = manager.get_friends_many(['alice', 'carol', 'zed', 'alice'])
+
+        assert [f['name'] for f in result['alice']] == ['Bob', 'Eve']
+        assert result['carol'][0]['added_at'] == added.isoformat()
+        assert result['zed'] == []
+        execute_calls = [p for sql, p in pool.conn.executed if sql.startswith('EXECUTE')]
+        assert execute_calls == [(['alice', 'carol', 'zed'],)]
+        assert pool.borrowed == pool.returned
+
+    def test_statements_prepared_once(self):
+        """Test repeated lookups reuse the prepared statement"""
+        pool = FakePool()
+        manager = FriendManager(pool=pool)
+
+        manager.get_friends('alice')
+        manager.get_friends('bob')
+
+        prepares = [sql for sql, _ in pool.conn.executed if sql.startswith('PREPARE')]
+        assert len(prepares) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,149 @@
+"""
+Unit tests for Proof of Spectrum validator selection
+
+Tests the per-region Fenwick stake index, reproducible selection with a
+local Generator, and incremental stake updates from NexusConsensusEngine.
+"""
+
+import bisect
+import random
+import numpy as np
+import pytest
+from proof_of_spectrum import (
+    ProofOfSpectrumConsensus, RegionStakeIndex, SpectralRegion, SpectralValidator
+)
+from nexus_consensus import NexusConsensusEngine, ContributionType
+
+
+def make_validator(i, region=SpectralRegion.RED, stake=100.0):
+    return SpectralValidator(
+        validator_id=f"validator_{i}", spectral_region=region,
+        stake=stake, public_key=f"pubkey_{i}"
+    )
+
+
+def make_network(num_validators=60):
+    consensus = ProofOfSpectrumConsensus()
+    regions = list(SpectralRegion)
+    for i in range(num_validators):
+        consensus.register_validator(make_validator(i, regions[i % len(regions)], 100.0 + 37 * i))
+    return consensus
+
+
+def reference_sample(stakes, u):
+    """Index whose cumulative-stake interval contains u * total"""
+    cumulative = np.cumsum(stakes)
+    return bisect.bisect_right(list(cumulative), u * cumulative[-1])
+
+
+class TestRegionStakeIndex:
+    """Tests for the Fenwick stake index"""
+    
+    def test_sample_matches_cumulative_intervals(self):
+        """Test draws land in the same interval as a cumsum search, before and after updates"""
+        rng = random.Random(3)
+        index = RegionStakeIndex()
+        stakes = [float(rng.randint(0, 50)) for _ in range(37)]
+        for i, stake in enumerate(stakes):
+            index.append(make_validator(i, stake=stake))
+        
+        for round_ in range(2):
+            for _ in range(500):
+                u = rng.random()
+                expected = reference_sample(stakes, u)
+                assert index.sample(u) is index.validators[expected]
+            assert index.total_stake == pytest.approx(sum(stakes))
+            
+            for _ in range(20):
+                position = rng.randrange(len(stakes))
+                stakes[position] = float(rng.randint(0, 50))
+                index.update(position, stakes[position])
+    
+    def test_zero_stake_never_chosen(self):
+        """Test validators without stake are skipped, empty regions give None"""
+        index = RegionStakeIndex()
+        assert index.sample(0.5) is None
+        for i, stake in enumerate([0.0, 5.0, 0.0]):
+            index.append(make_validator(i, stake=stake))
+        
+        assert {index.sample(u).validator_id for u in np.linspace(0, 0.999, 50)} == {"validator_1"}
+
+
+class TestSelection:
+    """Tests for select_validators_for_block"""
+    
+    def test_reproducible_and_leaves_global_state(self):
+        """Test the same block data selects the same validators without reseeding np.random"""
+        consensus = make_network()
+        np.random.seed(1234)
+        before = np.random.random()
+        np.random.seed(1234)
+        
+        first = consensus.select_validators_for_block("block-42")
+        second = consensus.select_validators_for_block("block-42")
+        
+        assert [v.validator_id for v in first] == [v.validator_id for v in second]
+        assert np.random.random() == before
+        assert len({v.spectral_region for v in first}) == consensus.required_region_count
+    
+    def test_selection_follows_stake(self):
+        """Test a validator holding most of a region's stake is picked most often"""
+        consensus = ProofOfSpectrumConsensus(required_spectral_coverage=1.0, minimum_validators_per_region=1)
+        for i, region in enumerate(SpectralRegion):
+            consensus.register_validator(make_validator(i, region, 1.0))
+        consensus.register_validator(make_validator(99, SpectralRegion.RED, 1.0))
+        consensus.update_validator_stake("validator_99", 9.0)
+        
+        picks = [
+            v.validator_id
+            for n in range(2000)
+            for v in consensus.select_validators_for_block(f"block-{n}")
+            if v.spectral_region == SpectralRegion.RED
+        ]
+        
+        assert picks.count("validator_99") / len(picks) == pytest.approx(0.9, abs=0.03)
+    
+    def test_insufficient_coverage(self):
+        """Test selection fails when too few regions are populated"""
+        consensus = ProofOfSpectrumConsensus()
+        consensus.register_validator(make_validator(0))
+        consensus.register_validator(make_validator(1))
+        
+        with pytest.raises(ValueError):
+            consensus.select_validators_for_block("block")
+    
+    def test_update_unknown_validator(self):
+        """Test updating a stake for an unregistered ID is refused"""
+        assert make_network().update_validator_stake("nobody", 5.0) is False
+
+
+class TestNexusConsensusSelection:
+    """Tests for contribution-weighted stakes in NexusConsensusEngine"""
+    
+    def test_matches_full_stake_rewrite(self):
+        """Test incremental stake updates select the same validators as rewriting every stake"""
+        engine = NexusConsensusEngine()
+        regions = list(SpectralRegion)
+        for i in range(30):
+            engine.register_validator(make_validator(i, regions[i % len(regions)], 500.0))
+        
+        rng = random.Random(11)
+        for block in range(10):
+            for _ in range(5):
+                engine.record_contribution(
+                    f"validator_{rng.randrange(30)}", ContributionType.DATA_PROVISION, rng.random()
+                )
+            selected = engine.select_block_validators(f"block-{block}")
+            
+            reference = ProofOfSpectrumConsensus()
+            for i in range(30):
+                total = engine.contributions[f"validator_{i}"].total_contribution
+                reference.register_validator(make_validator(i, regions[i % len(regions)], 100.0 + total * 1000.0))
+            
+            expected = reference.select_validators_for_block(f"block-{block}")
+            assert [v.validator_id for v in selected] == [v.validator_id for v in expected]
+            assert not engine._stale_stakes
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
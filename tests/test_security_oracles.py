@@ -0,0 +1,156 @@
+"""
+Unit tests for MultiOracleSystem price feeds
+
+Tests the NumPy ring buffers against the original list-based weighted
+median and TWAP, outlier rejection, batch submission and oracle
+re-weighting.
+"""
+
+import random
+import pytest
+from security_framework import MultiOracleSystem, PriceFeedBuffer
+
+
+def reference_consensus(feed, weights, now, max_age=300):
+    """List-based weighted median over (oracle_id, price, timestamp) tuples"""
+    recent = [(p, weights[oid]) for oid, p, t in feed if t > now - max_age]
+    if not recent:
+        return None
+    recent.sort(key=lambda x: x[0])
+    total = sum(w for _, w in recent)
+    cumulative = 0
+    for price, weight in recent:
+        cumulative += weight
+        if cumulative >= total / 2:
+            return price
+    return recent[0][0]
+
+
+def reference_twap(feed, now, window=3600):
+    """List-based TWAP: each price weighted by how long it was current"""
+    points = [(p, t) for _, p, t in feed if t > now - window]
+    if not points:
+        return None
+    weighted = total = 0
+    for i, (price, t) in enumerate(points):
+        duration = (points[i + 1][1] if i < len(points) - 1 else now) - t
+        weighted += price * duration
+        total += duration
+    return weighted / total if total > 0 else None
+
+
+@pytest.fixture
+def system():
+    system = MultiOracleSystem(capacity=16)
+    system.outlier_threshold = float('inf')
+    for oracle_id, weight in (('a', 1.0), ('b', 2.0), ('c', 0.5)):
+        system.register_oracle(oracle_id, weight)
+    return system
+
+
+class TestPriceFeedBuffer:
+    """Tests for the ring buffer itself"""
+    
+    def test_wraparound_keeps_latest_in_order(self):
+        """Test the live slice is the newest capacity entries, oldest first"""
+        feed = PriceFeedBuffer(capacity=4)
+        for i in range(10):
+            feed.append(float(i), float(i), 1.0, 0)
+        
+        assert feed.count == 4
+        assert list(feed.recent_prices(-1)) == [6.0, 7.0, 8.0, 9.0]
+        assert list(feed.recent_prices(7.5)) == [8.0, 9.0]
+    
+    def test_timestamps_never_decrease(self):
+        """Test out-of-order timestamps are clamped to the previous one"""
+        feed = PriceFeedBuffer(capacity=4)
+        feed.append(1.0, 100.0, 1.0, 0)
+        
+        assert feed.append(2.0, 90.0, 1.0, 0) == 100.0
+
+
+class TestMatchesReference:
+    """Tests that buffer results equal the list-based algorithms"""
+    
+    def test_random_feed(self, system):
+        """Test consensus and TWAP over a long random feed with eviction"""
+        rng = random.Random(7)
+        weights = dict(system.oracles)
+        feed = []
+        now = 1_000_000.0
+        
+        for _ in range(400):
+            now += rng.choice([0.0, 1.0, 15.0, 120.0, 400.0])
+            oracle_id = rng.choice('abc')
+            price = round(rng.uniform(90, 110), 2)
+            assert system.submit_price(oracle_id, 'NXT', price, timestamp=now)
+            feed = (feed + [(oracle_id, price, now)])[-16:]
+            
+            query = now + rng.choice([0.0, 30.0, 299.0, 301.0, 5000.0])
+            assert system.get_consensus_price('NXT', now=query) == reference_consensus(feed, weights, query)
+            assert system.get_twap('NXT', now=query) == pytest.approx(reference_twap(feed, query))
+    
+    def test_consensus_cache_expires(self, system):
+        """Test a cached median is recomputed once its oldest price ages out"""
+        system.submit_price('b', 'NXT', 100.0, timestamp=0.0)
+        system.submit_price('a', 'NXT', 200.0, timestamp=200.0)
+        
+        assert system.get_consensus_price('NXT', now=250.0) == 100.0
+        assert system.get_consensus_price('NXT', now=301.0) == 200.0
+        assert system.get_consensus_price('NXT', now=600.0) is None
+    
+    def test_reweighting_applies_to_stored_prices(self, system):
+        """Test re-registering an oracle changes the weight of its past prices"""
+        system.submit_price('a', 'NXT', 100.0, timestamp=0.0)
+        system.submit_price('b', 'NXT', 200.0, timestamp=1.0)
+        assert system.get_consensus_price('NXT', now=2.0) == 200.0
+        
+        system.register_oracle('a', 5.0)
+        
+        assert system.get_consensus_price('NXT', now=2.0) == 100.0
+
+
+class TestSubmission:
+    """Tests for submit_price and submit_prices"""
+    
+    def test_unregistered_oracle_rejected(self, system):
+        """Test prices from unknown oracles are refused"""
+        assert system.submit_price('mallory', 'NXT', 1.0) is False
+        assert system.submit_prices('mallory', {'NXT': 1.0}) == {'NXT': False}
+    
+    def test_outlier_rejected(self):
+        """Test a price far outside the recent distribution is refused"""
+        system = MultiOracleSystem()
+        system.register_oracle('a')
+        for i, price in enumerate([100.0, 101.0, 99.0, 100.5]):
+            assert system.submit_price('a', 'NXT', price, timestamp=float(i))
+        
+        assert system.submit_price('a', 'NXT', 150.0, timestamp=5.0) is False
+        assert system.submit_price('a', 'NXT', 100.2, timestamp=6.0) is True
+    
+    def test_batch_matches_individual(self, system):
+        """Test submit_prices gives the same feeds as one submit_price per asset"""
+        batch = MultiOracleSystem(capacity=16)
+        batch.outlier_threshold = float('inf')
+        for oracle_id, weight in system.oracles.items():
+            batch.register_oracle(oracle_id, weight)
+        
+        for step in range(20):
+            prices = {f'ASSET{i}': 100.0 + i + step % 3 for i in range(5)}
+            for asset, price in prices.items():
+                system.submit_price('abc'[step % 3], asset, price, timestamp=float(step))
+            assert all(batch.submit_prices('abc'[step % 3], prices, timestamp=float(step)).values())
+        
+        for i in range(5):
+            asset = f'ASSET{i}'
+            assert batch.get_consensus_price(asset, now=20.0) == system.get_consensus_price(asset, now=20.0)
+            assert batch.get_twap(asset, now=20.0) == system.get_twap(asset, now=20.0)
+    
+    def test_unknown_asset(self, system):
+        """Test queries for an asset without prices return None"""
+        assert system.get_consensus_price('NONE') is None
+        assert system.get_twap('NONE') is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
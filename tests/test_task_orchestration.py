@@ -452,3 +452,290 @@ class TestWorkflowScenarios:
         results = dag.execute_all()
         assert len(results) == 3
         assert all(r.status == TaskStatus.COMPLETED for r in results.values())
+
+
+class TestConcurrentExecution:
+    """Test concurrent dispatch, timeouts, backoff and priority scheduling"""
+    
+    def test_independent_io_tasks_run_in_parallel(self):
+        """Test that I/O-bound tasks overlap instead of serialising"""
+        import time
+        dag = TaskOrchestrationDAG(max_workers=8)
+        
+        def slow_io(params):
+            time.sleep(0.2)
+            return params['n']
+        
+        dag.register_task_handler('integration', 'slow', slow_io)
+        for i in range(8):
+            dag.add_task(Task(f'io-{i}', 'integration', 'slow', {'n': i}))
+        
+        start = time.monotonic()
+        results = dag.execute_all()
+        elapsed = time.monotonic() - start
+        
+        assert all(r.status == TaskStatus.COMPLETED for r in results.values())
+        assert [results[f'io-{i}'].output for i in range(8)] == list(range(8))
+        assert elapsed < 0.8
+    
+    def test_dependent_starts_before_slow_sibling_finishes(self):
+        """Test that dependents are released per-dependency, not per-level"""
+        import time
+        dag = TaskOrchestrationDAG(max_workers=4)
+        finished = {}
+        
+        def record(params):
+            time.sleep(params['delay'])
+            finished[params['name']] = time.monotonic()
+            return params['name']
+        
+        dag.register_task_handler('test', 'record', record)
+        dag.add_task(Task('fast', 'test', 'record', {'name': 'fast', 'delay': 0.0}))
+        dag.add_task(Task('slow', 'test', 'record', {'name': 'slow', 'delay': 0.3}))
+        dag.add_task(Task('after-fast', 'test', 'record',
+                          {'name': 'after-fast', 'delay': 0.0}, dependencies=['fast']))
+        
+        results = dag.execute_all()
+        
+        assert all(r.status == TaskStatus.COMPLETED for r in results.values())
+        assert finished['after-fast'] < finished['slow']
+    
+    def test_timeout_is_enforced(self):
+        """Test that tasks exceeding their timeout fail and cancel dependents"""
+        import time
+        dag = TaskOrchestrationDAG(retry_base_delay=0.0)
+        
+        def hang(params):
+            time.sleep(1.0)
+        
+        dag.register_task_handler('test', 'hang', hang)
+        register_all_handlers(dag)
+        dag.add_task(Task('hang', 'test', 'hang', {}, max_retries=0, timeout=0.1))
+        dag.add_task(Task('log', 'admin', 'log_system_event',
+                          {'event_type': 'test', 'message': 'test'}, dependencies=['hang']))
+        
+        start = time.monotonic()
+        results = dag.execute_all()
+        
+        assert time.monotonic() - start < 0.8
+        assert results['hang'].status == TaskStatus.FAILED
+        assert 'timed out' in results['hang'].error
+        assert results['log'].status == TaskStatus.CANCELLED
+    
+    def test_timed_out_worker_keeps_its_slot(self):
+        """Test a hung worker holds its slot and queued tasks' timeouts start when they run"""
+        import time
+        dag = TaskOrchestrationDAG(max_workers=1)
+        started = {}
+        
+        def work(params):
+            started[params['name']] = time.monotonic()
+            time.sleep(params['delay'])
+            return params['name']
+        
+        dag.register_task_handler('test', 'work', work)
+        dag.add_task(Task('hang', 'test', 'work', {'name': 'hang', 'delay': 0.5},
+                          priority=TaskPriority.HIGH, max_retries=0, timeout=0.1))
+        for i in range(2):
+            dag.add_task(Task(f'next-{i}', 'test', 'work', {'name': f'next-{i}', 'delay': 0.05},
+                              timeout=0.3))
+        
+        results = dag.execute_all()
+        
+        assert results['hang'].status == TaskStatus.FAILED
+        for tid in ('next-0', 'next-1'):
+            assert results[tid].status == TaskStatus.COMPLETED
+            assert results[tid].retry_count == 0
+        assert started['next-0'] - started['hang'] >= 0.45
+    
+    def test_retry_with_exponential_backoff(self):
+        """Test that failed attempts are retried after increasing delays"""
+        import time
+        dag = TaskOrchestrationDAG(retry_base_delay=0.05)
+        attempt_times = []
+        
+        def flaky(params):
+            attempt_times.append(time.monotonic())
+            if len(attempt_times) < 3:
+                raise ConnectionError("transient")
+            return 'ok'
+        
+        dag.register_task_handler('test', 'flaky', flaky)
+        dag.add_task(Task('flaky', 'test', 'flaky', {}, max_retries=3))
+        
+        results = dag.execute_all()
+        
+        assert results['flaky'].status == TaskStatus.COMPLETED
+        assert results['flaky'].retry_count == 2
+        assert attempt_times[1] - attempt_times[0] >= 0.05
+        assert attempt_times[2] - attempt_times[1] >= 0.1
+        assert dag.get_retry_delay(10) == dag.retry_max_delay
+    
+    def test_async_handler(self):
+        """Test that coroutine handlers are dispatched to asyncio"""
+        import asyncio
+        from task_orchestration import ExecutionMode
+        dag = TaskOrchestrationDAG()
+        
+        async def fetch(params):
+            await asyncio.sleep(0.01)
+            return params['value'] * 2
+        
+        dag.register_task_handler('integration', 'fetch', fetch)
+        task = Task('fetch', 'integration', 'fetch', {'value': 21})
+        dag.add_task(task)
+        
+        assert dag.get_execution_mode(task) == ExecutionMode.ASYNC
+        results = dag.execute_all()
+        assert results['fetch'].output == 42
+    
+    def test_priority_respected_in_ready_queue(self):
+        """Test that higher priority ready tasks are dispatched first"""
+        dag = TaskOrchestrationDAG(max_workers=1)
+        order = []
+        
+        dag.register_task_handler('test', 'mark', lambda params: order.append(params['name']))
+        dag.add_task(Task('low', 'test', 'mark', {'name': 'low'}, priority=TaskPriority.LOW))
+        dag.add_task(Task('normal', 'test', 'mark', {'name': 'normal'}))
+        dag.add_task(Task('critical', 'test', 'mark', {'name': 'critical'},
+                          priority=TaskPriority.CRITICAL))
+        
+        dag.execute_all()
+        
+        assert order == ['critical', 'normal', 'low']
+    
+    def test_subset_with_several_unselected_dependents(self):
+        """Test running a node whose dependents are outside the selected subset"""
+        from task_orchestration import ConcurrentTaskExecutor
+        dag = TaskOrchestrationDAG()
+        dag.register_task_handler('test', 'echo', lambda params: params['name'])
+        dag.add_task(Task('t1', 'test', 'echo', {'name': 't1'}))
+        for tid in ('t2', 't3', 't4'):
+            dag.add_task(Task(tid, 'test', 'echo', {'name': tid}, dependencies=['t1']))
+        
+        results = ConcurrentTaskExecutor(dag).run(['t1', 't3'])
+        
+        assert set(results) == {'t1', 't3'}
+        assert results['t3'].output == 't3'
+        assert dag._execute_task(dag.tasks['t1']).output == 't1'
+
+
+class TestResultCaching:
+    """Test content-hash memoisation and incremental re-execution"""
+    
+    def _pipeline(self, calls, cache=None):
+        dag = TaskOrchestrationDAG(result_cache=cache)
+        
+        def stage(params):
+            calls.append(params['name'])
+            return {'stage': params['name'], 'scale': params.get('scale', 1)}
+        
+        dag.register_task_handler('data', 'stage', stage)
+        dag.add_task(Task('extract', 'data', 'stage', {'name': 'extract'}))
+        dag.add_task(Task('transform', 'data', 'stage', {'name': 'transform'},
+                          dependencies=['extract']))
+        dag.add_task(Task('report', 'data', 'stage', {'name': 'report', 'scale': 1},
+                          dependencies=['transform']))
+        return dag
+    
+    def test_cache_key_depends_on_parameters_and_upstream(self):
+        """Test that keys change with parameters and upstream hashes"""
+        from task_cache import make_cache_key
+        base = make_cache_key('data', 'stage', {'a': 1, 'b': 2}, {'up': 'h1'})
+        
+        assert base == make_cache_key('data', 'stage', {'b': 2, 'a': 1}, {'up': 'h1'})
+        assert base != make_cache_key('data', 'stage', {'a': 2, 'b': 2}, {'up': 'h1'})
+        assert base != make_cache_key('data', 'stage', {'a': 1, 'b': 2}, {'up': 'h2'})
+        assert base != make_cache_key('data', 'other', {'a': 1, 'b': 2}, {'up': 'h1'})
+    
+    def test_rerun_hits_cache(self):
+        """Test that an unchanged pipeline is served from the cache"""
+        from task_cache import TaskResultCache
+        cache = TaskResultCache()
+        calls = []
+        
+        self._pipeline(calls, cache).execute_all()
+        results = self._pipeline(calls, cache).execute_all()
+        
+        assert calls == ['extract', 'transform', 'report']
+        assert all(r.metadata['cache_hit'] for r in results.values())
+        assert results['report'].output == {'stage': 'report', 'scale': 1}
+        assert cache.get_stats()['hits'] == 3
+    
+    def test_incremental_reruns_only_invalidated_subgraph(self):
+        """Test that changing a late stage only re-executes that stage"""
+        calls = []
+        dag = self._pipeline(calls)
+        dag.execute_all()
+        calls.clear()
+        
+        dag.update_task_parameters('report', {'name': 'report', 'scale': 2})
+        assert dag.get_invalidated_subgraph() == {'report'}
+        results = dag.execute_all(incremental=True)
+        
+        assert calls == ['report']
+        assert results['report'].output['scale'] == 2
+        assert results['extract'].status == TaskStatus.COMPLETED
+        
+        calls.clear()
+        dag.update_task_parameters('transform', {'name': 'transform', 'x': 1})
+        dag.execute_all(incremental=True)
+        assert calls == ['transform', 'report']
+    
+    def test_lru_eviction_and_disk_persistence(self, tmp_path):
+        """Test that entries persist across instances and evict LRU-first"""
+        from task_cache import TaskResultCache
+        cache = TaskResultCache(cache_dir=str(tmp_path), max_entries=2)
+        cache.put('a', {'v': 1})
+        cache.put('b', {'v': 2})
+        cache.get('a')
+        cache.put('c', {'v': 3})
+        
+        assert cache.get('b') == (False, None)
+        assert len(list(tmp_path.glob('*.pkl'))) == 2
+        
+        reloaded = TaskResultCache(cache_dir=str(tmp_path), max_entries=2)
+        assert reloaded.get('a') == (True, {'v': 1})
+        assert reloaded.get('c') == (True, {'v': 3})
+    
+    def test_output_hash_covers_full_content(self):
+        """Test that frames and arrays differing past their repr get distinct hashes"""
+        import numpy as np
+        import pandas as pd
+        from task_cache import hash_output
+        frame = pd.DataFrame({'x': np.arange(5000), 'y': np.zeros(5000)})
+        changed = frame.copy()
+        changed.loc[2500, 'y'] = 1.0
+        array = np.zeros(10_000)
+        changed_array = array.copy()
+        changed_array[5000] = 1.0
+        
+        assert repr(frame) == repr(changed)
+        assert hash_output(frame) != hash_output(changed)
+        assert hash_output(frame) == hash_output(frame.copy())
+        assert hash_output(array) != hash_output(changed_array)
+        assert hash_output({'a': 1, 'b': [1, 2]}) == hash_output({'b': [1, 2], 'a': 1})
+        assert hash_output([1, 2]) != hash_output((1, 2))
+    
+    def test_unhashable_output_not_cached(self):
+        """Test that an output with no stable hash is neither cached nor keyed downstream"""
+        import threading
+        from task_cache import TaskResultCache, hash_output
+        cache = TaskResultCache()
+        calls = []
+        
+        def build():
+            dag = TaskOrchestrationDAG(result_cache=cache)
+            dag.register_task_handler('data', 'lock', lambda params: calls.append('lock') or threading.Lock())
+            dag.register_task_handler('data', 'use', lambda params: calls.append('use') or 'done')
+            dag.add_task(Task('lock', 'data', 'lock', {}))
+            dag.add_task(Task('use', 'data', 'use', {}, dependencies=['lock']))
+            return dag
+        
+        build().execute_all()
+        results = build().execute_all()
+        
+        assert hash_output(threading.Lock()) is None
+        assert calls == ['lock', 'use', 'lock', 'use']
+        assert results['use'].metadata['cache_key'] is None
+        assert len(cache) == 0
@@ -0,0 +1,189 @@
+"""
+Unit tests for the segmented TransitionReserveLedger
+
+Tests bisect range queries against a full scan, running per-region totals,
+compaction, snapshot/restore and the bounded event history of
+MessagingFlowController.
+"""
+
+import json
+import random
+from types import SimpleNamespace
+import pytest
+import economic_loop_controller
+from economic_loop_controller import (
+    MessagingFlowController, SpectralRegion, TransitionReserveLedger
+)
+from native_token import NativeTokenSystem
+from orbital_transition_engine import TransitionType
+
+
+class FakeClock:
+    """Stands in for time.time() inside economic_loop_controller"""
+    
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(economic_loop_controller.time, 'time', clock)
+    return clock
+
+
+def make_transition(rng):
+    return SimpleNamespace(
+        transition_type=rng.choice(list(TransitionType)),
+        spectral_region=rng.choice(list(SpectralRegion)),
+        delta_e_joules=rng.uniform(1e-19, 5e-19),
+        delta_e_nxt=rng.uniform(1e-5, 1e-3),
+        wavelength_nm=rng.uniform(100, 1100),
+        n_initial=rng.randint(2, 7),
+        n_final=rng.randint(1, 4),
+    )
+
+
+def fill(ledger, clock, rng, count):
+    """Add entries at irregular times; returns the entries added"""
+    added = []
+    for i in range(count):
+        clock.now += rng.choice([0.0, 0.5, 30.0, 900.0, 7200.0])
+        added.append(ledger.add_entry(make_transition(rng), f"sender_{i % 7}", f"msg_{i}"))
+    return added
+
+
+class TestRangeQueries:
+    """Tests for segment lookups"""
+    
+    def test_matches_full_scan(self, clock):
+        """Test bisect range queries return exactly the entries a scan would"""
+        rng = random.Random(1)
+        ledger = TransitionReserveLedger(bucket_seconds=3600)
+        added = fill(ledger, clock, rng, 600)
+        assert len(ledger.segments) > 10
+        
+        for _ in range(200):
+            start = rng.uniform(added[0].timestamp - 100, added[-1].timestamp + 100)
+            end = start + rng.choice([0.0, 10.0, 3600.0, 50_000.0])
+            if rng.random() < 0.2:
+                start = end = rng.choice(added).timestamp
+            expected = [e for e in added if start <= e.timestamp <= end]
+            
+            assert ledger.get_entries_by_timerange(start, end) == expected
+            assert ledger.count_entries_by_timerange(start, end) == len(expected)
+        assert ledger.entries == added
+    
+    def test_clock_going_backwards(self, clock):
+        """Test timestamps never decrease, so entries stay in range order"""
+        ledger = TransitionReserveLedger()
+        rng = random.Random(2)
+        first = ledger.add_entry(make_transition(rng), "a")
+        clock.now -= 50
+        second = ledger.add_entry(make_transition(rng), "a")
+        
+        assert second.timestamp == first.timestamp
+        assert ledger.get_entries_by_timerange(first.timestamp, first.timestamp) == [first, second]
+
+
+class TestTotals:
+    """Tests for running totals and compaction"""
+    
+    def test_distribution_matches_sums(self, clock):
+        """Test per-region energy and counts equal sums over all entries"""
+        ledger = TransitionReserveLedger()
+        added = fill(ledger, clock, random.Random(3), 400)
+        
+        distribution = ledger.get_spectral_energy_distribution()
+        balance = ledger.get_reserve_balance()
+        for region in {e.spectral_region for e in added}:
+            in_region = [e for e in added if e.spectral_region == region]
+            assert distribution[region.name] == pytest.approx(sum(e.delta_e_nxt for e in in_region))
+            assert balance['spectral_distribution'][region.name] == len(in_region)
+        assert balance['total_entries'] == 400
+        assert balance['total_energy_nxt'] == pytest.approx(sum(e.delta_e_nxt for e in added))
+    
+    def test_compaction_keeps_totals(self, clock):
+        """Test compacted rows disappear from queries but not from totals"""
+        ledger = TransitionReserveLedger(bucket_seconds=3600)
+        added = fill(ledger, clock, random.Random(4), 300)
+        distribution = ledger.get_spectral_energy_distribution()
+        cutoff = added[150].timestamp
+        
+        dropped = ledger.compact(cutoff)
+        
+        retained = ledger.entries
+        assert dropped == 300 - len(retained) > 0
+        assert all(e.timestamp >= cutoff - 3600 for e in retained)
+        assert retained == added[300 - len(retained):]
+        assert ledger.get_entries_by_timerange(0, added[-1].timestamp) == retained
+        assert ledger.get_spectral_energy_distribution() == distribution
+        assert ledger.get_reserve_balance()['total_entries'] == 300
+        assert len(ledger) == len(retained)
+    
+    def test_compaction_spares_open_segment(self, clock):
+        """Test the segment still receiving entries is never dropped"""
+        ledger = TransitionReserveLedger(bucket_seconds=3600)
+        entry = ledger.add_entry(make_transition(random.Random(5)), "a")
+        
+        assert ledger.compact(entry.timestamp + 1) == 0
+        assert ledger.entries == [entry]
+
+
+class TestSnapshot:
+    """Tests for snapshot and restore"""
+    
+    def test_round_trip_through_json(self, clock):
+        """Test a restored ledger answers queries identically and keeps accepting entries"""
+        rng = random.Random(6)
+        ledger = TransitionReserveLedger(bucket_seconds=1800)
+        added = fill(ledger, clock, rng, 200)
+        ledger.compact(added[50].timestamp)
+        
+        restored = TransitionReserveLedger.restore(json.loads(json.dumps(ledger.snapshot())))
+        
+        assert restored.entries == ledger.entries
+        assert restored.get_reserve_balance() == ledger.get_reserve_balance()
+        assert restored.get_spectral_energy_distribution() == ledger.get_spectral_energy_distribution()
+        
+        transition = make_transition(rng)
+        clock.now += 10
+        assert restored.add_entry(transition, "b").entry_id == ledger.add_entry(transition, "b").entry_id
+        assert restored.entries == ledger.entries
+    
+    def test_unknown_version(self):
+        """Test snapshots from another format version are refused"""
+        snapshot = TransitionReserveLedger().snapshot()
+        snapshot['version'] = 99
+        with pytest.raises(ValueError):
+            TransitionReserveLedger.restore(snapshot)
+
+
+class TestFlowControllerEvents:
+    """Tests for the bounded event history"""
+    
+    def test_recent_events_bounded(self):
+        """Test only max_events are held while totals keep counting"""
+        token_system = NativeTokenSystem()
+        token_system.create_account("user", initial_balance=10 ** 12)
+        controller = MessagingFlowController(token_system, TransitionReserveLedger(), max_events=5)
+        
+        for i in range(8):
+            success, _, _ = controller.process_message_burn("user", f"msg_{i}", 0.000057, 656.4)
+            assert success
+        
+        recent = controller.get_recent_events(3)
+        stats = controller.get_flow_statistics()
+        assert len(controller.events) == 5
+        assert [e.reserve_entry_id.split('_')[-1] for e in recent] == ['5', '6', '7']
+        assert len(controller.get_recent_events(100)) == 5
+        assert controller.get_recent_events(0) == []
+        assert stats['total_events'] == 8
+        assert stats['recent_activity'] == 8
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,173 @@
+"""
+Unit tests for lazy delegator reward accounting
+
+Runs the same random staking workload through StakingEconomy and through
+an eager reference validator (per-delegation loops on every block and
+slash) and checks that rewards, stakes and claims agree.
+"""
+
+import random
+import pytest
+from validator_economics import (
+    DelegationStatus, SlashingType, StakingEconomy, ValidatorEconomics
+)
+
+
+class EagerValidator(ValidatorEconomics):
+    """Reference: updates every delegation on each block reward and slash"""
+    
+    def settle_delegation(self, delegation):
+        pass
+    
+    def distribute_rewards(self, block_reward):
+        commission = block_reward * self.commission_rate
+        self.total_commission_earned += commission
+        self.total_rewards_earned += commission
+        remaining_rewards = block_reward - commission
+        total_stake = self.get_total_stake()
+        if total_stake > 0:
+            validator_share = (self.stake / total_stake) * remaining_rewards
+            self.total_rewards_earned += validator_share
+            self.pending_rewards += validator_share
+            for delegation in self.delegations:
+                if delegation.status == DelegationStatus.ACTIVE:
+                    delegation.accumulated_rewards += (delegation.amount / total_stake) * remaining_rewards
+    
+    def slash(self, slash_type, slash_percentage, reason=""):
+        slash_amount = self.get_total_stake() * (slash_percentage / 100)
+        self.total_slashed += slash_amount
+        if self.stake >= slash_amount:
+            self.stake -= slash_amount
+            return
+        slash_amount -= self.stake
+        self.stake = 0
+        if self.total_delegated > 0:
+            slashed = 0.0
+            for delegation in self.delegations:
+                if delegation.status == DelegationStatus.ACTIVE:
+                    delegation_slash = (delegation.amount / self.total_delegated) * slash_amount
+                    delegation.amount = max(0, delegation.amount - delegation_slash)
+                    slashed += delegation_slash
+            self.total_delegated = max(0, self.total_delegated - slashed)
+
+
+def make_economies(validators):
+    lazy, eager = StakingEconomy(), StakingEconomy()
+    for address, stake in validators:
+        lazy.register_validator(address, stake)
+        eager.register_validator(address, stake)
+        eager.validators[address] = EagerValidator(address=address, stake=stake)
+    return lazy, eager
+
+
+def random_workload(rng, steps, validators, delegators):
+    """Event list shared by both economies"""
+    events = []
+    for _ in range(steps):
+        kind = rng.choices(
+            ['delegate', 'block', 'slash', 'undelegate', 'claim', 'withdraw'],
+            weights=[20, 50, 3, 8, 8, 3]
+        )[0]
+        events.append((
+            kind, rng.choice(delegators), rng.choice(validators),
+            round(rng.uniform(1, 500), 2), rng.choice(list(SlashingType))
+        ))
+    return events
+
+
+def apply(economy, event):
+    kind, delegator, validator, amount, slash_type = event
+    if kind == 'delegate':
+        return economy.delegate(delegator, validator, amount)
+    if kind == 'block':
+        return economy.distribute_block_reward(validator)
+    if kind == 'slash':
+        return economy.validators[validator].slash(slash_type, economy.slashing_params[slash_type])
+    if kind == 'undelegate':
+        return economy.undelegate(delegator, validator, amount / 4)
+    if kind == 'claim':
+        return economy.claim_rewards(delegator)[0]
+    for delegation in economy.delegations.get(delegator, []):
+        delegation.unbonding_period = 0.0
+    return economy.withdraw_delegation(delegator, validator)[:2]
+
+
+def assert_close(lazy, eager):
+    assert lazy == pytest.approx(eager, rel=1e-9, abs=1e-9)
+
+
+class TestLazyMatchesEager:
+    """Tests that lazy accounting agrees with the per-delegation loops"""
+    
+    @pytest.mark.parametrize('seed', [1, 2, 3])
+    def test_random_workload(self, seed):
+        """Test every result, delegator stat and validator stake agree"""
+        rng = random.Random(seed)
+        validators = [f'val{i}' for i in range(3)]
+        delegators = [f'del{i}' for i in range(25)]
+        lazy, eager = make_economies([(v, rng.uniform(50, 2000)) for v in validators])
+        
+        for event in random_workload(rng, 1500, validators, delegators):
+            result_lazy, result_eager = apply(lazy, event), apply(eager, event)
+            if isinstance(result_lazy, float):
+                assert_close(result_lazy, result_eager)
+            elif isinstance(result_lazy, tuple):
+                assert result_lazy[0] == result_eager[0]
+        
+        for delegator in delegators:
+            stats_lazy, stats_eager = lazy.get_delegator_stats(delegator), eager.get_delegator_stats(delegator)
+            for key in ('total_delegated', 'pending_rewards', 'total_claimed'):
+                assert_close(stats_lazy[key], stats_eager[key])
+        for address in validators:
+            v_lazy, v_eager = lazy.validators[address], eager.validators[address]
+            assert_close(
+                (v_lazy.get_total_stake(), v_lazy.total_rewards_earned, v_lazy.pending_rewards),
+                (v_eager.get_total_stake(), v_eager.total_rewards_earned, v_eager.pending_rewards)
+            )
+    
+    def test_rewards_after_full_wipe(self):
+        """Test rewards earned before a 100% slash survive it and new delegations start fresh"""
+        lazy, eager = make_economies([('val', 10.0)])
+        events = [
+            ('delegate', 'alice', 'val', 90.0, None),
+            ('block', None, 'val', 0, None),
+            ('slash', None, 'val', 0, SlashingType.NETWORK_ATTACK),
+        ]
+        for event in events:
+            apply(lazy, event), apply(eager, event)
+        lazy.validators['val'].is_jailed = eager.validators['val'].is_jailed = False
+        for event in [('delegate', 'bob', 'val', 50.0, None), ('block', None, 'val', 0, None)]:
+            apply(lazy, event), apply(eager, event)
+        
+        for delegator in ('alice', 'bob'):
+            assert_close(lazy.claim_rewards(delegator)[0], eager.claim_rewards(delegator)[0])
+        assert lazy.get_delegator_stats('alice')['total_delegated'] == 0.0
+        assert lazy.validators['val'].slash_epoch == 1
+
+
+class TestBlockCost:
+    """Tests that block distribution does not touch delegations"""
+    
+    def test_distribute_is_constant_time(self):
+        """Test a block reward leaves delegation objects untouched until settled"""
+        economy = StakingEconomy()
+        economy.register_validator('val', 100.0)
+        for i in range(1000):
+            economy.delegate(f'del{i}', 'val', 10.0)
+        
+        economy.distribute_block_reward('val')
+        
+        assert all(d.accumulated_rewards == 0.0 for d in economy.validators['val'].delegations)
+        assert economy.get_delegator_stats('del0')['pending_rewards'] == pytest.approx(2.0 * 0.9 * 10 / 10100)
+    
+    def test_rankings_limit(self):
+        """Test top-N rankings match the full sort"""
+        economy = StakingEconomy()
+        for i in range(20):
+            economy.register_validator(f'val{i}', float((i * 7) % 20))
+        
+        assert economy.get_validator_rankings(5) == economy.get_validator_rankings()[:5]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
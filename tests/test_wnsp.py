@@ -10,7 +10,15 @@ from wavelength_map import (
     get_letter_info, get_wavelength_for_letter, get_letter_for_wavelength,
     ALPHABET_MAP, LETTER_TO_SYMBOL
 )
-from wnsp_frames import WnspFrame, WnspFrameMessage, WnspEncoder, WnspDecoder
+from wnsp_frames import (
+    WnspFrame, WnspFrameMessage, WnspEncoder, WnspDecoder, WnspFrameColumns
+)
+from wnsp_protocol_v2 import (
+    WnspEncoderV2, WnspDecoderV2, REGION_CONSTANTS, WnspEncodingScheme,
+    EXTENDED_CHAR_MAP, SCIENTIFIC_CHAR_MAP, WAVELENGTH_TO_CHAR,
+    SCIENTIFIC_WAVELENGTH_TO_CHAR, decode_frames_to_text
+)
+from wavelength_validator import WavelengthValidator, SpectralRegion, ModulationType
 
 
 class TestWavelengthMapping:
@@ -274,5 +282,138 @@ class TestWnspProtocol:
         assert message.frames[2].wavelength_nm == wl_c
 
 
+class TestWnspV2Pipeline:
+    """Tests for the memoised WNSP v2.0 encode/validate pipeline"""
+    
+    def test_cost_matches_e_equals_hf(self):
+        """Test precomputed region constants reproduce E=hf pricing"""
+        encoder = WnspEncoderV2()
+        for region in SpectralRegion:
+            frequency = 3e8 / region.center_wavelength
+            energy = 6.626e-34 * frequency
+            cost = encoder._calculate_quantum_cost(None, 5000, region)
+            
+            assert cost['quantum_energy'] == energy
+            assert cost['frequency_thz'] == frequency / 1e12
+            assert cost['cost_nxt'] == max(0.01, (energy * 1e21 * 5000) / 1e6)
+            assert REGION_CONSTANTS[region]['quantum_energy'] == energy
+    
+    def test_shared_content_hash_matches_fresh_hashes(self):
+        """Test reusing a content hash context gives the same wave signature"""
+        import hashlib
+        validator = WavelengthValidator()
+        content = "ΔE = ℏω"
+        
+        fresh = validator.create_message_wave(content, SpectralRegion.IR, ModulationType.QPSK)
+        shared = validator.create_message_wave(
+            content, SpectralRegion.IR, ModulationType.QPSK,
+            content_hash=hashlib.sha256(content.encode('utf-8'))
+        )
+        
+        assert fresh == shared
+    
+    def test_encode_and_validate_batch(self):
+        """Test batch APIs agree with single-message paths"""
+        encoder = WnspEncoderV2()
+        decoder = WnspDecoderV2()
+        requests = [
+            {'content': f"MSG {i}", 'sender_id': 'alice', 'recipient_id': 'bob',
+             'spectral_region': SpectralRegion.GREEN, 'parent_message_ids': [f"p{i}"]}
+            for i in range(20)
+        ]
+        
+        messages = encoder.encode_batch(requests)
+        
+        assert [m.content for m in messages] == [r['content'] for r in requests]
+        assert decoder.validate_batch(messages) == [True] * 20
+        assert decoder.decode_batch(messages[:1]) == [("MSG 0", True)]
+        
+        messages[3].content = "TAMPERED"
+        assert decoder.validate_batch(messages)[3] is False
+
+
+class TestColumnarFrames:
+    """Tests for lookup-table frame encoding and lazy frame objects"""
+    
+    def test_v1_columns_match_per_character_frames(self):
+        """Test columnar v1 encoding reproduces the per-letter frame fields"""
+        encoder = WnspEncoder()
+        text = "Hi, there!"
+        message = encoder.encode_message(text)
+        
+        assert isinstance(message.frames, WnspFrameColumns)
+        assert not message.frames.is_materialized
+        
+        positions = [i for i, c in enumerate(text.upper()) if 'A' <= c <= 'Z']
+        for frame, i in zip(message.frames, positions):
+            letter = text.upper()[i]
+            wavelength = get_wavelength_for_letter(letter)
+            assert frame.wavelength_nm == wavelength
+            assert frame.checksum == WnspEncoder._compute_checksum(letter, wavelength)
+            assert frame.payload_bit == i % 2
+            assert frame.timestamp_ms == message.created_at + i * encoder.frame_duration_ms
+        assert len(message.frames) == len(positions)
+        assert message.frames.is_materialized
+    
+    def test_v1_decoder_matches_nearest_letter(self):
+        """Test vectorised nearest-letter decoding agrees with the scalar lookup"""
+        wavelengths = [300, 380, 387.2, 387.3, 394.4, 395, 460.9, 1000]
+        frames = [WnspFrame(0xAA, w, 7, 0, 0, 0.0) for w in wavelengths]
+        
+        expected = ''.join(get_letter_for_wavelength(w) for w in wavelengths)
+        assert WnspDecoder().decode_frames(frames) == expected
+    
+    @pytest.mark.parametrize("scheme,char_map", [
+        (WnspEncodingScheme.FULL_ALPHANUMERIC, EXTENDED_CHAR_MAP),
+        (WnspEncodingScheme.SCIENTIFIC, SCIENTIFIC_CHAR_MAP),
+    ])
+    def test_v2_columns_match_char_map(self, scheme, char_map):
+        """Test v2 lookup tables agree with the character maps"""
+        content = "E = mc² ∫ αβ é ~ 42!"
+        frames = WnspEncoderV2()._encode_content_to_frames(content, SpectralRegion.BLUE, scheme)
+        
+        expected = [(i, char_map[c]) for i, c in enumerate(content) if c in char_map]
+        assert [f.wavelength_nm for f in frames] == [w for _, w in expected]
+        assert [f.payload_bit for f in frames] == [i % 2 for i, _ in expected]
+        assert all(f.sync == 0xAA and f.intensity_level == 7 and f.checksum == 0 for f in frames)
+    
+    def test_v2_decoder_matches_reverse_maps(self):
+        """Test vectorised reverse lookup truncates and drops like the dict lookup"""
+        wavelengths = [379.9, 380, 386.7, 401, 10000, 0, -3, 530.5, 350]
+        frames = [WnspFrame(0xAA, w, 7, 0, 0, 0.0) for w in wavelengths]
+        
+        for scheme, reverse in [
+            (WnspEncodingScheme.FULL_ALPHANUMERIC, WAVELENGTH_TO_CHAR),
+            (WnspEncodingScheme.SCIENTIFIC, SCIENTIFIC_WAVELENGTH_TO_CHAR),
+        ]:
+            expected = ''.join(reverse.get(int(w), '') for w in wavelengths)
+            assert decode_frames_to_text(frames, scheme) == expected
+    
+    def test_add_frame_after_columnar_encode(self):
+        """Test appending to an encoded message keeps earlier frames"""
+        message = WnspEncoder().encode_message("AB")
+        message.add_frame(WnspFrame(0xAA, get_wavelength_for_letter('E'), 7, 0, 0, message.created_at + 500))
+        
+        assert WnspDecoder().decode_message(message) == "ABE"
+        assert message.get_duration_ms() == 500
+    
+    def test_large_document_encodes_quickly(self):
+        """Test a 1MB document round-trips through the columnar path"""
+        import time
+        content = ("THE QUICK BROWN FOX, 0123456789! " * 32000)[:1_000_000]
+        encoder = WnspEncoderV2()
+        
+        start = time.perf_counter()
+        frames = encoder._encode_content_to_frames(
+            content, SpectralRegion.GREEN, WnspEncodingScheme.FULL_ALPHANUMERIC
+        )
+        decoded = decode_frames_to_text(frames, WnspEncodingScheme.FULL_ALPHANUMERIC)
+        elapsed = time.perf_counter() - start
+        
+        assert decoded == content
+        assert not frames.is_materialized
+        assert elapsed < 1.0
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,83 @@
+"""
+Unit tests for WNSP v3.0 BINARY_FAST spectral encoding
+
+Tests the buffer-backed channel matrix, legacy chunk compatibility,
+streaming encode/decode and the throughput estimate check.
+"""
+
+import io
+import pytest
+import numpy as np
+from wnsp_adaptive_encoding import (
+    WNSPAdaptiveEncoder, BINARY_SPECTRAL_REGIONS
+)
+from wavelength_validator import SpectralRegion
+
+
+@pytest.fixture
+def encoder():
+    return WNSPAdaptiveEncoder()
+
+
+class TestSpectralBinaryEncoding:
+    """Tests for the memoryview-backed binary encoding"""
+
+    @pytest.mark.parametrize("size", [0, 1, 7, 8, 9, 1000])
+    def test_round_trip(self, encoder, size):
+        """Test decode reproduces the payload for aligned and ragged sizes"""
+        data = bytes(i % 256 for i in range(size))
+        encoding = encoder.encode_binary_spectral(data)
+
+        assert encoding.total_chunks == -(-size // 8) * 8
+        assert encoding.channels.shape == (encoding.n_symbols, 8)
+        assert encoder.decode_binary_spectral(encoding) == data
+
+    def test_aligned_channels_share_buffer(self, encoder):
+        """Test aligned payloads are viewed, not copied"""
+        data = bytearray(range(64))
+        encoding = encoder.encode_binary_spectral(data)
+
+        assert np.shares_memory(encoding.channels, np.frombuffer(data, dtype=np.uint8))
+        assert encoding.channel(SpectralRegion.VIOLET).tolist() == list(range(1, 64, 8))
+
+    def test_legacy_spectral_chunks(self, encoder):
+        """Test the (region, byte) list matches the original layout"""
+        encoding = encoder.encode_binary_spectral(b"\x05\x06\x07")
+
+        assert encoding.spectral_chunks == [
+            (BINARY_SPECTRAL_REGIONS[0], 5),
+            (BINARY_SPECTRAL_REGIONS[1], 6),
+            (BINARY_SPECTRAL_REGIONS[2], 7),
+        ] + [(SpectralRegion.IR, 0)] * 5
+
+    def test_stream_bytes(self, encoder):
+        """Test chunked encoding of a bytes payload"""
+        data = np.random.default_rng(1).integers(0, 256, 100_003, dtype=np.uint8).tobytes()
+        chunks = list(encoder.iter_encode_binary_spectral(data, chunk_size=1003))
+
+        assert all(len(c.data_bytes) == 1000 for c in chunks[:-1])
+        assert b"".join(encoder.iter_decode_binary_spectral(chunks)) == data
+
+    def test_stream_file_to_sink(self, encoder):
+        """Test file-object streaming writes decoded chunks to a sink"""
+        data = bytes(range(256)) * 400
+        sink = io.BytesIO()
+
+        for _ in encoder.iter_decode_binary_spectral(
+            encoder.iter_encode_binary_spectral(io.BytesIO(data), chunk_size=4096),
+            sink=sink
+        ):
+            pass
+
+        assert sink.getvalue() == data
+
+    def test_measured_rate_exceeds_estimate(self, encoder):
+        """Test encoding outpaces the modelled BINARY_FAST link throughput"""
+        result = encoder.measure_binary_throughput(1_000_000, chunk_size=64 * 1024)
+
+        assert result['symbols'] == 125_000
+        assert result['measured_encode_bps'] > result['estimated_throughput_bps']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,137 @@
+"""
+Unit tests for bounded WNSP message tracking
+
+Tests TTL/LRU in-flight eviction, the history ring buffer, online
+statistics and their use by the WNSP v3.0 protocol engine.
+"""
+
+import pytest
+from wnsp_message_tracking import MessageTracker
+from wnsp_protocol_v3 import WNSPProtocolV3
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def track(tracker, message_id, mode='scientific', region='VIOLET', radio='ble',
+          cost=1.0, latency=20.0):
+    tracker.track(message_id, {'id': message_id}, mode, region, radio,
+                  cost_nxt=cost, latency_ms=latency)
+
+
+class TestMessageTracker:
+    """Tests for the bounded tracking subsystem"""
+
+    def test_lru_eviction_bounds_active_table(self):
+        """Test the in-flight table never exceeds max_active"""
+        tracker = MessageTracker(max_active=3, history_size=100)
+        for i in range(10):
+            track(tracker, f"m{i}")
+
+        assert list(tracker.active) == ['m7', 'm8', 'm9']
+        assert tracker.total_evicted == 7
+
+    def test_get_refreshes_recency(self):
+        """Test touching a message protects it from LRU eviction"""
+        tracker = MessageTracker(max_active=2)
+        track(tracker, 'a')
+        track(tracker, 'b')
+        assert tracker.get('a') == {'id': 'a'}
+
+        track(tracker, 'c')
+
+        assert list(tracker.active) == ['a', 'c']
+
+    def test_ttl_expiry(self):
+        """Test in-flight messages expire after the TTL"""
+        clock = FakeClock()
+        tracker = MessageTracker(ttl_seconds=10, clock=clock)
+        track(tracker, 'old')
+        clock.now = 5
+        track(tracker, 'new')
+
+        clock.now = 12
+
+        assert tracker.get('old') is None
+        assert tracker.get('new') is not None
+        assert tracker.total_expired == 1
+
+    def test_complete_removes_message(self):
+        """Test completing a message removes it from the in-flight table"""
+        tracker = MessageTracker()
+        track(tracker, 'x')
+
+        assert tracker.complete('x') == {'id': 'x'}
+        assert tracker.complete('x') is None
+        assert tracker.active_count() == 0
+        assert tracker.get_stats()['completed'] == 1
+
+    def test_history_ring_buffer(self):
+        """Test history keeps only the most recent messages"""
+        tracker = MessageTracker(history_size=4)
+        for i in range(10):
+            track(tracker, f"m{i}")
+
+        assert [m['id'] for m in tracker.recent()] == ['m6', 'm7', 'm8', 'm9']
+        assert [m['id'] for m in tracker.recent(2)] == ['m8', 'm9']
+        assert tracker.recent(0) == []
+
+    def test_online_counters(self):
+        """Test per-dimension counters and the latency histogram"""
+        tracker = MessageTracker(max_active=1, history_size=1)
+        track(tracker, 'a', mode='scientific', radio='ble', cost=1.0, latency=3.0)
+        track(tracker, 'b', mode='binary_fast', radio='lora', cost=3.0, latency=700.0)
+        track(tracker, 'c', mode='binary_fast', radio=None, cost=5.0, latency=6000.0)
+
+        stats = tracker.get_stats()
+
+        assert stats['total_tracked'] == 3
+        assert stats['avg_cost_nxt'] == pytest.approx(3.0)
+        assert stats['by_encoding_mode']['binary_fast']['count'] == 2
+        assert stats['by_encoding_mode']['binary_fast']['avg_cost_nxt'] == pytest.approx(4.0)
+        assert stats['by_radio_protocol']['none']['count'] == 1
+        assert stats['by_spectral_region']['VIOLET']['count'] == 3
+        assert stats['latency_histogram']['<=5ms'] == 1
+        assert stats['latency_histogram']['<=1000ms'] == 1
+        assert stats['latency_histogram']['>5000ms'] == 1
+
+
+class TestProtocolV3Tracking:
+    """Tests for bounded tracking in WNSPProtocolV3"""
+
+    def test_memory_stays_bounded(self):
+        """Test message tracking stays flat as traffic grows"""
+        protocol = WNSPProtocolV3(max_active_messages=20, history_size=10)
+        for i in range(200):
+            protocol.create_message_v3("alice", "bob", f"hello {i}")
+
+        stats = protocol.get_stats()
+
+        assert stats['total_messages_v3'] == 200
+        assert stats['active_messages'] <= 20
+        assert len(protocol.message_history) == 10
+        assert protocol.message_history[-1].content == "hello 199"
+        assert stats['tracking']['total_tracked'] == 200
+        assert sum(
+            c['count'] for c in stats['tracking']['by_encoding_mode'].values()
+        ) == 200
+
+    def test_complete_message(self):
+        """Test delivered messages leave the in-flight table"""
+        protocol = WNSPProtocolV3()
+        message = protocol.create_message_v3("alice", "bob", "ping")
+
+        assert protocol.get_active_message(message.message_id) is message
+        assert protocol.complete_message(message.message_id) is message
+        assert message.message_id not in protocol.active_messages
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
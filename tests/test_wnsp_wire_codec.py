@@ -0,0 +1,178 @@
+"""
+Tests for the WNSP v2.0 binary wire codec
+
+Tests cover:
+1. Varint and ID packing primitives
+2. Lossless message round trips (derived and explicit fields)
+3. Payload size versus the legacy JSON encoding
+4. MTU-aware fragmentation and reassembly
+5. Offline mesh transport integration
+"""
+
+import json
+import pytest
+
+from wnsp_protocol_v2 import WnspEncodingScheme, WnspEncoderV2, create_wnsp_v2_message
+from wavelength_validator import SpectralRegion
+from wnsp_wire_codec import (
+    WnspWireCodec, FragmentReassembler, WireCodecError,
+    encode_varint, decode_varint, fragment_payload, is_fragment
+)
+from offline_mesh_transport import OfflineMeshTransport, TransportProtocol, TRANSPORT_MTU
+
+
+def legacy_json_size(message):
+    """Size of the previous JSON wire format for comparison"""
+    return len(json.dumps({
+        'message_id': message.message_id,
+        'sender_id': message.sender_id,
+        'recipient_id': message.recipient_id,
+        'content': message.content,
+        'spectral_region': message.spectral_region.name,
+        'modulation_type': message.modulation_type.name,
+        'frequency_thz': message.frequency_thz,
+        'quantum_energy': message.quantum_energy,
+        'cost_nxt': message.cost_nxt,
+        'parent_message_ids': message.parent_message_ids,
+        'interference_hash': message.interference_hash,
+        'created_at': message.created_at,
+        'frames': [f.__dict__ for f in message.frames]
+    }).encode('utf-8'))
+
+
+class TestPrimitives:
+    """Test varint encoding"""
+    
+    @pytest.mark.parametrize('value', [0, 1, 127, 128, 300, 2 ** 32, 2 ** 63])
+    def test_varint_round_trip(self, value):
+        encoded = encode_varint(value)
+        assert decode_varint(encoded, 0) == (value, len(encoded))
+    
+    def test_small_varints_are_one_byte(self):
+        assert len(encode_varint(127)) == 1
+        assert len(encode_varint(128)) == 2
+    
+    def test_truncated_varint_raises(self):
+        with pytest.raises(WireCodecError):
+            decode_varint(b'\x80', 0)
+
+
+class TestMessageRoundTrip:
+    """Test lossless encode/decode of WnspMessageV2"""
+    
+    def test_round_trip_preserves_message(self):
+        codec = WnspWireCodec()
+        message = create_wnsp_v2_message(
+            "HELLO WORLD 42!", parent_ids=['wnsp2_0123456789abcdef', 'genesis']
+        )
+        
+        decoded = codec.decode(codec.encode(message))
+        
+        assert decoded == message
+    
+    def test_scientific_scheme_round_trip(self):
+        codec = WnspWireCodec()
+        message = WnspEncoderV2().encode_message(
+            "E = ℏω ± Δ", "alice", "bob", SpectralRegion.IR,
+            encoding_scheme=WnspEncodingScheme.SCIENTIFIC
+        )
+        
+        assert codec.decode(codec.encode(message)) == message
+    
+    def test_explicit_fields_round_trip(self):
+        """Fields that cannot be derived are carried explicitly"""
+        codec = WnspWireCodec(compression=None)
+        message = create_wnsp_v2_message("ABC")
+        message.cost_nxt = 12.5
+        message.frames[1].checksum = 200
+        message.frames[2].payload_bit = 1
+        message.frames[2].timestamp_ms += 0.123
+        message.wave_signature.amplitude = 0.5
+        
+        assert codec.decode(codec.encode(message)) == message
+    
+    def test_rejects_unknown_version(self):
+        codec = WnspWireCodec()
+        payload = bytearray(codec.encode(create_wnsp_v2_message("HI")))
+        payload[0] = (payload[0] & 0xF0) | 0x0F
+        
+        with pytest.raises(WireCodecError):
+            codec.decode(bytes(payload))
+    
+    def test_payload_at_least_10x_smaller_than_json(self):
+        codec = WnspWireCodec()
+        for content in ["HELLO", "MEET AT THE NORTH GATE AT 9PM", "DATA " * 200]:
+            message = create_wnsp_v2_message(content)
+            assert legacy_json_size(message) >= 10 * len(codec.encode(message))
+
+
+class TestFragmentation:
+    """Test MTU-aware fragmentation and reassembly"""
+    
+    def test_small_payload_not_fragmented(self):
+        assert fragment_payload(b'\xb1' + b'x' * 10, 20) == [b'\xb1' + b'x' * 10]
+    
+    def test_fragments_respect_mtu_and_reassemble_out_of_order(self):
+        payload = bytes(range(256)) * 4
+        fragments = fragment_payload(payload, 20)
+        
+        assert all(len(f) <= 20 for f in fragments)
+        assert all(is_fragment(f) for f in fragments)
+        
+        reassembler = FragmentReassembler()
+        results = [reassembler.add_fragment(f, 'peer') for f in reversed(fragments)]
+        
+        assert results[:-1] == [None] * (len(fragments) - 1)
+        assert results[-1] == payload
+        assert reassembler.pending_count == 0
+    
+    def test_corrupted_fragment_detected(self):
+        fragments = fragment_payload(bytes(range(200)), 20)
+        fragments[3] = fragments[3][:-1] + b'\x00'
+        reassembler = FragmentReassembler()
+        
+        with pytest.raises(WireCodecError):
+            for fragment in fragments:
+                reassembler.add_fragment(fragment, 'peer')
+
+
+class TestOfflineTransportIntegration:
+    """Test binary payloads over the offline mesh transport"""
+    
+    def test_ble_packets_reassemble_into_message(self):
+        sender = OfflineMeshTransport('dev-a', 'Phone A', SpectralRegion.BLUE)
+        receiver = OfflineMeshTransport('dev-b', 'Phone B', SpectralRegion.GREEN)
+        message = create_wnsp_v2_message("PING FROM A", sender_id='dev-a', recipient_id='dev-b')
+        
+        packets = fragment_payload(
+            sender._serialize_wnsp_message(message),
+            TRANSPORT_MTU[TransportProtocol.BLUETOOTH_LE]
+        )
+        received = [receiver.receive_packet_offline(p, 'dev-a') for p in packets]
+        
+        assert received[-1] == message
+        assert all(r is None for r in received[:-1])
+        assert receiver.stats.messages_received_offline == 1
+    
+    def test_legacy_json_payload_still_accepted(self):
+        receiver = OfflineMeshTransport('dev-b', 'Phone B', SpectralRegion.GREEN)
+        message = create_wnsp_v2_message("OLD PEER", recipient_id='dev-b')
+        legacy = json.dumps({
+            'message_id': message.message_id,
+            'sender_id': message.sender_id,
+            'recipient_id': message.recipient_id,
+            'content': message.content,
+            'spectral_region': message.spectral_region.name,
+            'modulation_type': message.modulation_type.name,
+            'frequency_thz': message.frequency_thz,
+            'quantum_energy': message.quantum_energy,
+            'cost_nxt': message.cost_nxt,
+            'parent_message_ids': [],
+            'interference_hash': message.interference_hash,
+            'created_at': message.created_at,
+            'frames': []
+        }).encode('utf-8')
+        
+        decoded = receiver.receive_message_offline(legacy, 'dev-a')
+        
+        assert decoded.content == "OLD PEER"
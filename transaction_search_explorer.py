@@ -273,7 +273,8 @@ def display_transaction_details(tx_id: str, transactions: List[Dict]):
         st.markdown("**Bitcoin-style UTXO Model**")
         try:
             from nexus_native_wallet import TransactionIO
-            io_records = wallet_system.db.query(TransactionIO).filter_by(tx_id=tx_id).all()
+            with wallet_system.read_session() as session:
+                io_records = session.query(TransactionIO).filter_by(tx_id=tx_id).all()
             
             if io_records:
                 col1, col2 = st.columns(2)
@@ -308,7 +309,8 @@ def display_transaction_details(tx_id: str, transactions: List[Dict]):
         st.markdown("**Wavelength Validation Record**")
         try:
             from nexus_native_wallet import VerificationRecord
-            verification = wallet_system.db.query(VerificationRecord).filter_by(tx_id=tx_id).first()
+            with wallet_system.read_session() as session:
+                verification = session.query(VerificationRecord).filter_by(tx_id=tx_id).first()
             
             if verification:
                 col1, col2, col3 = st.columns(3)
@@ -343,7 +345,8 @@ def display_transaction_details(tx_id: str, transactions: List[Dict]):
         st.markdown("**DAG Parent Transactions**")
         try:
             from nexus_native_wallet import DagEdge
-            edges = wallet_system.db.query(DagEdge).filter_by(child_id=tx_id).all()
+            with wallet_system.read_session() as session:
+                edges = session.query(DagEdge).filter_by(child_id=tx_id).all()
             
             if edges:
                 for edge in edges:
@@ -5,6 +5,7 @@ Staking, delegation, reward distribution, slashing, and reputation system for bl
 
 import time
 import hashlib
+import heapq
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
@@ -43,6 +44,11 @@ class Delegation:
     last_reward_claim: float = field(default_factory=time.time)
     total_rewards_claimed: float = 0.0
     
+    # Validator accumulator values at the last settlement (see ValidatorEconomics)
+    reward_index: float = 0.0
+    slash_index: float = 1.0
+    slash_epoch: int = 0
+    
     def start_unbonding(self):
         """Start unbonding period"""
         self.status = DelegationStatus.UNBONDING
@@ -65,7 +71,17 @@ class Delegation:
 
 @dataclass
 class ValidatorEconomics:
-    """Extended validator with economic metrics"""
+    """
+    Extended validator with economic metrics
+    
+    Delegator rewards and slashing are accounted lazily (F1-style):
+    each block adds multiplier * remaining_reward / total_stake to
+    reward_per_stake, and slashing delegated stake multiplies
+    slash_multiplier. An active delegation's amount and accumulated_rewards
+    are exact as of its last settle_delegation call, which StakingEconomy
+    makes before claims, undelegation and stats. A slash that wipes all
+    delegated stake closes a slash epoch and resets the multiplier to 1.
+    """
     address: str
     stake: float  # Self-bonded stake
     commission_rate: float = 0.10  # 10% commission
@@ -95,6 +111,13 @@ class ValidatorEconomics:
     activated_at: float = field(default_factory=time.time)
     last_active: float = field(default_factory=time.time)
     
+    # Lazy delegator accounting
+    reward_per_stake: float = 0.0
+    slash_multiplier: float = 1.0
+    slash_epoch: int = 0
+    epoch_reward_per_stake: List[float] = field(default_factory=list)  # reward_per_stake at each epoch end
+    active_delegated: float = 0.0  # Sum of ACTIVE delegation amounts
+    
     def get_total_stake(self) -> float:
         """Get total stake (self + delegated)"""
         return self.stake + self.total_delegated
@@ -107,14 +130,51 @@ class ValidatorEconomics:
     
     def add_delegation(self, delegation: Delegation):
         """Add new delegation"""
+        delegation.reward_index = self.reward_per_stake
+        delegation.slash_index = self.slash_multiplier
+        delegation.slash_epoch = self.slash_epoch
         self.delegations.append(delegation)
         self.total_delegated += delegation.amount
+        if delegation.status == DelegationStatus.ACTIVE:
+            self.active_delegated += delegation.amount
     
     def remove_delegation(self, delegation: Delegation):
         """Remove delegation after unbonding"""
         if delegation in self.delegations:
+            self.settle_delegation(delegation)
             self.delegations.remove(delegation)
             self.total_delegated -= delegation.amount
+            if delegation.status == DelegationStatus.ACTIVE:
+                self.active_delegated -= delegation.amount
+    
+    def settle_delegation(self, delegation: Delegation):
+        """Bring an active delegation's amount and accumulated_rewards up to date"""
+        if delegation.status != DelegationStatus.ACTIVE:
+            return
+        
+        base_amount = delegation.amount / delegation.slash_index
+        if delegation.slash_epoch != self.slash_epoch:
+            # Wiped out by a slash in an earlier epoch: earned until that epoch ended
+            epoch_end = self.epoch_reward_per_stake[delegation.slash_epoch]
+            delegation.accumulated_rewards += base_amount * (epoch_end - delegation.reward_index)
+            delegation.amount = 0.0
+        else:
+            delegation.accumulated_rewards += base_amount * (self.reward_per_stake - delegation.reward_index)
+            delegation.amount = base_amount * self.slash_multiplier
+        
+        delegation.reward_index = self.reward_per_stake
+        delegation.slash_index = self.slash_multiplier
+        delegation.slash_epoch = self.slash_epoch
+    
+    def settle_delegations(self):
+        """Settle every delegation (O(delegations); for inspection and export)"""
+        for delegation in self.delegations:
+            self.settle_delegation(delegation)
+    
+    def deactivate_delegation(self, delegation: Delegation, amount: float):
+        """Take amount of an active delegation out of reward accrual (undelegation)"""
+        self.settle_delegation(delegation)
+        self.active_delegated -= amount
     
     def distribute_rewards(self, block_reward: float):
         """Distribute block rewards to validator and delegators"""
@@ -133,11 +193,8 @@ class ValidatorEconomics:
             self.total_rewards_earned += validator_share
             self.pending_rewards += validator_share
             
-            # Delegators' shares
-            for delegation in self.delegations:
-                if delegation.status == DelegationStatus.ACTIVE:
-                    delegator_share = (delegation.amount / total_stake) * remaining_rewards
-                    delegation.accumulated_rewards += delegator_share
+            # Delegators' shares: O(1) accumulator, settled per delegation on demand
+            self.reward_per_stake += self.slash_multiplier * remaining_rewards / total_stake
     
     def slash(self, slash_type: SlashingType, slash_percentage: float, reason: str = ""):
         """Apply slashing penalty"""
@@ -153,14 +210,20 @@ class ValidatorEconomics:
             slash_amount -= self.stake
             self.stake = 0
             
-            # Slash delegated stake proportionally
-            total_delegated_slashed = 0.0
+            # Slash active delegations proportionally: each loses
+            # slash_amount / total_delegated of its stake (clamped to 0)
             if self.total_delegated > 0:
-                for delegation in self.delegations:
-                    if delegation.status == DelegationStatus.ACTIVE:
-                        delegation_slash = (delegation.amount / self.total_delegated) * slash_amount
-                        delegation.amount = max(0, delegation.amount - delegation_slash)  # Clamp to 0
-                        total_delegated_slashed += delegation_slash
+                fraction = slash_amount / self.total_delegated
+                total_delegated_slashed = self.active_delegated * fraction
+                
+                if fraction >= 1:
+                    self.epoch_reward_per_stake.append(self.reward_per_stake)
+                    self.slash_epoch += 1
+                    self.slash_multiplier = 1.0
+                    self.active_delegated = 0.0
+                else:
+                    self.slash_multiplier *= 1 - fraction
+                    self.active_delegated *= 1 - fraction
                 
                 # Update total_delegated to reflect slashing
                 self.total_delegated = max(0, self.total_delegated - total_delegated_slashed)
@@ -317,6 +380,7 @@ class StakingEconomy:
         delegation = None
         for d in self.delegations[delegator]:
             if d.validator_address == validator_address and d.status == DelegationStatus.ACTIVE:
+                self._settle(d)
                 if d.amount >= amount:
                     delegation = d
                     break
@@ -324,6 +388,9 @@ class StakingEconomy:
         if not delegation:
             return False, "Insufficient delegated amount"
         
+        # Stop accruing rewards on the unbonding amount
+        self.validators[validator_address].deactivate_delegation(delegation, amount)
+        
         # If unbonding partial amount, create new delegation
         if delegation.amount > amount:
             delegation.amount -= amount
@@ -406,6 +473,7 @@ class StakingEconomy:
         claims = []
         
         for delegation in self.delegations[delegator]:
+            self._settle(delegation)
             if delegation.status == DelegationStatus.ACTIVE and delegation.accumulated_rewards > 0:
                 rewards = delegation.claim_rewards()
                 total_claimed += rewards
@@ -415,8 +483,15 @@ class StakingEconomy:
         
         return total_claimed, claims
     
-    def get_validator_rankings(self) -> List[ValidatorEconomics]:
-        """Get validators ranked by total stake"""
+    def _settle(self, delegation: Delegation):
+        validator = self.validators.get(delegation.validator_address)
+        if validator is not None:
+            validator.settle_delegation(delegation)
+    
+    def get_validator_rankings(self, limit: Optional[int] = None) -> List[ValidatorEconomics]:
+        """Get validators ranked by total stake (top limit only, via a heap, if given)"""
+        if limit is not None:
+            return heapq.nlargest(limit, self.validators.values(), key=lambda v: v.get_total_stake())
         return sorted(
             self.validators.values(),
             key=lambda v: v.get_total_stake(),
@@ -493,6 +568,7 @@ class StakingEconomy:
         delegation_list = []
         
         for delegation in self.delegations[delegator]:
+            self._settle(delegation)
             if delegation.status == DelegationStatus.ACTIVE:
                 total_delegated += delegation.amount
                 active += 1
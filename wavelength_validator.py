@@ -141,7 +141,8 @@ class WavelengthValidator:
         modulation_type: ModulationType,
         amplitude: Optional[float] = None,
         phase: Optional[float] = None,
-        polarization: Optional[float] = None
+        polarization: Optional[float] = None,
+        content_hash=None
     ) -> WaveProperties:
         """
         Convert message to electromagnetic wave representation.
@@ -153,6 +154,9 @@ class WavelengthValidator:
             amplitude: Optional override (default: based on message priority)
             phase: Optional override (default: derived from message content)
             polarization: Optional override (default: derived from metadata)
+            content_hash: Optional hashlib.sha256 context that has consumed exactly
+                the UTF-8 message bytes; it is copied, never mutated, so callers
+                can reuse it for further digests of the same content
         
         Returns:
             Complete wave characterization
@@ -160,20 +164,29 @@ class WavelengthValidator:
         # Use spectral region's center wavelength
         wavelength = spectral_region.center_wavelength
         
+        # All three derivations hash the content as a prefix, so hash it once
+        # and extend copies of the context with each suffix
+        if content_hash is None and (amplitude is None or phase is None or polarization is None):
+            content_hash = hashlib.sha256(message_data.encode())
+        
         # Derive amplitude from message priority (if not specified)
         if amplitude is None:
             # Hash message to get deterministic but content-dependent amplitude
-            message_hash = int(hashlib.sha256(message_data.encode()).hexdigest()[:8], 16)
+            message_hash = int.from_bytes(content_hash.copy().digest()[:4], 'big')
             amplitude = 0.3 + 0.7 * (message_hash % 100) / 100.0  # Range: 0.3 to 1.0
         
         # Derive phase from message content (if not specified)
         if phase is None:
-            phase_hash = int(hashlib.sha256((message_data + "phase").encode()).hexdigest()[:8], 16)
+            phase_ctx = content_hash.copy()
+            phase_ctx.update(b"phase")
+            phase_hash = int.from_bytes(phase_ctx.digest()[:4], 'big')
             phase = 2 * np.pi * (phase_hash % 360) / 360.0
         
         # Derive polarization (if not specified)
         if polarization is None:
-            pol_hash = int(hashlib.sha256((message_data + "polarization").encode()).hexdigest()[:8], 16)
+            pol_ctx = content_hash.copy()
+            pol_ctx.update(b"polarization")
+            pol_hash = int.from_bytes(pol_ctx.digest()[:4], 'big')
             polarization = np.pi * (pol_hash % 180) / 180.0
         
         return WaveProperties(
@@ -12,7 +12,7 @@ AI automatically selects encoding based on content type:
 - Validator consensus → Binary mode (throughput critical)
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Iterable, Iterator, Union, BinaryIO
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
@@ -50,13 +50,67 @@ class EncodingDecision:
     reasoning: str
 
 
+BINARY_CHANNELS = 8  # One byte per spectral region per symbol
+DEFAULT_STREAM_CHUNK_BYTES = 1 << 20  # 1 MiB (multiple of BINARY_CHANNELS)
+
+BINARY_SPECTRAL_REGIONS = (
+    SpectralRegion.UV,
+    SpectralRegion.VIOLET,
+    SpectralRegion.BLUE,
+    SpectralRegion.GREEN,
+    SpectralRegion.YELLOW,
+    SpectralRegion.ORANGE,
+    SpectralRegion.RED,
+    SpectralRegion.IR
+)
+
+
 @dataclass
 class SpectralBinaryEncoding:
-    """Binary encoding using 8 spectral regions as 8-bit channels"""
-    data_bytes: bytes
-    spectral_chunks: List[Tuple[SpectralRegion, int]]  # (region, byte_value)
-    total_chunks: int
+    """
+    Binary encoding using 8 spectral regions as 8-bit channels
+    
+    Holds a memoryview of the source bytes rather than per-byte objects. The
+    channel matrix is an (n_symbols x 8) uint8 view over that buffer; only a
+    trailing partial symbol is copied so it can be zero-padded.
+    """
+    data_bytes: memoryview
+    total_chunks: int           # Channel slots incl. padding (n_symbols * 8)
     encoding_efficiency: float  # bits per symbol
+    
+    @property
+    def n_symbols(self) -> int:
+        return self.total_chunks // BINARY_CHANNELS
+    
+    @property
+    def channels(self) -> np.ndarray:
+        """(n_symbols x 8) uint8 matrix; column j is spectral region j"""
+        data = np.frombuffer(self.data_bytes, dtype=np.uint8)
+        full = len(data) - len(data) % BINARY_CHANNELS
+        if full == len(data):
+            return data.reshape(-1, BINARY_CHANNELS)
+        padded = np.zeros(self.total_chunks, dtype=np.uint8)
+        padded[:len(data)] = data
+        return padded.reshape(-1, BINARY_CHANNELS)
+    
+    def channel(self, region: SpectralRegion) -> np.ndarray:
+        """Strided view of the bytes carried by one spectral region"""
+        return self.channels[:, BINARY_SPECTRAL_REGIONS.index(region)]
+    
+    @property
+    def spectral_chunks(self) -> List[Tuple[SpectralRegion, int]]:
+        """
+        Legacy (region, byte_value) list, padded with (IR, 0).
+        
+        Materialised on demand; avoid for large payloads.
+        """
+        data = self.data_bytes.tobytes()
+        chunks = [
+            (BINARY_SPECTRAL_REGIONS[i % BINARY_CHANNELS], byte_val)
+            for i, byte_val in enumerate(data)
+        ]
+        chunks.extend([(SpectralRegion.IR, 0)] * (self.total_chunks - len(data)))
+        return chunks
 
 
 class WNSPAdaptiveEncoder:
@@ -82,16 +136,7 @@ class WNSPAdaptiveEncoder:
         self.avg_binary_throughput_bps: float = 0.0
         
         # Spectral region assignment for binary mode
-        self.spectral_regions = [
-            SpectralRegion.UV,
-            SpectralRegion.VIOLET,
-            SpectralRegion.BLUE,
-            SpectralRegion.GREEN,
-            SpectralRegion.YELLOW,
-            SpectralRegion.ORANGE,
-            SpectralRegion.RED,
-            SpectralRegion.IR
-        ]
+        self.spectral_regions = list(BINARY_SPECTRAL_REGIONS)
     
     def analyze_content(self, content: Any) -> ContentType:
         """
@@ -208,7 +253,7 @@ class WNSPAdaptiveEncoder:
     
     def encode_binary_spectral(
         self,
-        data: bytes
+        data: Union[bytes, bytearray, memoryview]
     ) -> SpectralBinaryEncoding:
         """
         Encode binary data using 8 spectral regions as byte channels
@@ -218,31 +263,21 @@ class WNSPAdaptiveEncoder:
         - Each region transmits 1 byte per symbol
         - Throughput: 8 bytes per symbol (8x improvement over character encoding)
         
+        The data is not copied: the encoding wraps a read-only memoryview, so
+        callers must not mutate a bytearray after encoding it.
+        
         Args:
-            data: Binary data to encode
+            data: Binary data to encode (any bytes-like object)
         
         Returns:
             Spectral binary encoding
         """
-        spectral_chunks = []
-        
-        # Split data into 8-byte chunks (one per spectral region)
-        for i in range(0, len(data), 8):
-            chunk = data[i:i+8]
-            
-            # Assign each byte to a spectral region
-            for j, byte_val in enumerate(chunk):
-                if j < len(self.spectral_regions):
-                    spectral_chunks.append((self.spectral_regions[j], byte_val))
-        
-        # Pad last chunk if needed
-        while len(spectral_chunks) % 8 != 0:
-            spectral_chunks.append((SpectralRegion.IR, 0))
+        view = memoryview(data).cast('B').toreadonly()
+        n_symbols = -(-len(view) // BINARY_CHANNELS)
         
         return SpectralBinaryEncoding(
-            data_bytes=data,
-            spectral_chunks=spectral_chunks,
-            total_chunks=len(spectral_chunks),
+            data_bytes=view,
+            total_chunks=n_symbols * BINARY_CHANNELS,
             encoding_efficiency=8.0  # 8 bits per spectral symbol
         )
     
@@ -259,14 +294,106 @@ class WNSPAdaptiveEncoder:
         Returns:
             Original binary data
         """
-        # Extract bytes from spectral chunks
-        decoded_bytes = bytearray()
+        length = len(encoding.data_bytes)
+        return encoding.channels.reshape(-1)[:length].tobytes()
+    
+    def iter_encode_binary_spectral(
+        self,
+        source: Union[bytes, bytearray, memoryview, BinaryIO],
+        chunk_size: int = DEFAULT_STREAM_CHUNK_BYTES
+    ) -> Iterator[SpectralBinaryEncoding]:
+        """
+        Stream-encode a file-sized payload in symbol-aligned chunks
         
-        for region, byte_val in encoding.spectral_chunks:
-            if byte_val != 0 or len(decoded_bytes) < len(encoding.data_bytes):
-                decoded_bytes.append(byte_val)
+        Every chunk except the last holds a whole number of symbols, so
+        concatenating the decoded chunks reproduces the payload exactly.
         
-        return bytes(decoded_bytes[:len(encoding.data_bytes)])
+        Args:
+            source: Bytes-like payload (sliced without copying) or a binary
+                file object (read chunk by chunk)
+            chunk_size: Bytes per chunk, rounded down to a multiple of 8
+        
+        Yields:
+            Spectral binary encodings, one per chunk
+        """
+        chunk_size = max(BINARY_CHANNELS, chunk_size - chunk_size % BINARY_CHANNELS)
+        
+        if hasattr(source, 'read'):
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                yield self.encode_binary_spectral(chunk)
+            return
+        
+        view = memoryview(source).cast('B')
+        for start in range(0, len(view), chunk_size):
+            yield self.encode_binary_spectral(view[start:start + chunk_size])
+    
+    def iter_decode_binary_spectral(
+        self,
+        encodings: Iterable[SpectralBinaryEncoding],
+        sink: Optional[BinaryIO] = None
+    ) -> Iterator[bytes]:
+        """
+        Stream-decode chunked spectral encodings
+        
+        Args:
+            encodings: Encodings produced by iter_encode_binary_spectral
+            sink: Optional binary file object; each decoded chunk is written
+                to it as well as yielded
+        
+        Yields:
+            Decoded byte chunks in order
+        """
+        for encoding in encodings:
+            chunk = self.decode_binary_spectral(encoding)
+            if sink is not None:
+                sink.write(chunk)
+            yield chunk
+    
+    def measure_binary_throughput(
+        self,
+        data_size_bytes: int,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_BYTES
+    ) -> Dict[str, float]:
+        """
+        Measure streaming BINARY_FAST encode rate against estimate_throughput
+        
+        Encoding must comfortably outpace the modelled radio throughput or
+        the encoder, not the channel, becomes the bottleneck.
+        
+        Args:
+            data_size_bytes: Payload size to encode
+            chunk_size: Streaming chunk size
+        
+        Returns:
+            Measured and estimated throughput in bits per second
+        """
+        payload = np.random.default_rng(0).integers(
+            0, 256, size=data_size_bytes, dtype=np.uint8
+        ).tobytes()
+        
+        # Encode and read every channel back out so the timing includes the
+        # per-symbol work a transmitter does, not just building views
+        start = time.perf_counter()
+        symbols = 0
+        for encoding in self.iter_encode_binary_spectral(payload, chunk_size):
+            symbols += encoding.n_symbols
+            self.decode_binary_spectral(encoding)
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        
+        estimate = self.estimate_throughput(EncodingMode.BINARY_FAST, data_size_bytes)
+        measured_bps = data_size_bytes * 8 / elapsed
+        
+        return {
+            "data_size_bytes": data_size_bytes,
+            "symbols": symbols,
+            "elapsed_s": elapsed,
+            "measured_encode_bps": measured_bps,
+            "estimated_throughput_bps": estimate["throughput_bps"],
+            "headroom": measured_bps / estimate["throughput_bps"]
+        }
     
     def encode_scientific_wavelength(
         self,
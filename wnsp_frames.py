@@ -2,13 +2,21 @@
 Wavelength-Native Signaling Protocol (WNSP) - Frame Types and Encoding
 
 Defines frame structures, encoding, decoding, and message handling for optical signaling.
+
+Encoders produce frames in columnar form (WnspFrameColumns): wavelength,
+intensity, checksum, payload bit and timestamp held as NumPy arrays and
+filled by translating text through code-point lookup tables. WnspFrame
+objects are only materialised when a consumer (e.g. wnsp_renderer) indexes
+or iterates the frames.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Union
 from dataclasses import dataclass, field
 import time
 import hashlib
 
+import numpy as np
+
 
 @dataclass
 class WnspFrame:
@@ -28,6 +36,197 @@ class WnspFrame:
             raise ValueError(f"intensity_level must be 0-7, got {self.intensity_level}")
 
 
+class WnspFrameColumns(Sequence):
+    """
+    Columnar run of WNSP frames.
+    
+    Behaves as a read-only sequence of WnspFrame; the frame objects are built
+    once, on first index/iteration, and cached. Vectorised consumers should use
+    the arrays directly via as_frame_columns().
+    """
+    
+    def __init__(
+        self,
+        wavelength_nm: np.ndarray,
+        intensity_level: np.ndarray,
+        checksum: np.ndarray,
+        payload_bit: np.ndarray,
+        timestamp_ms: np.ndarray,
+        sync: np.ndarray
+    ):
+        self.wavelength_nm = wavelength_nm
+        self.intensity_level = intensity_level
+        self.checksum = checksum
+        self.payload_bit = payload_bit
+        self.timestamp_ms = timestamp_ms
+        self.sync = sync
+        self._frames: Optional[List[WnspFrame]] = None
+    
+    @classmethod
+    def from_frames(cls, frames: Sequence[WnspFrame]) -> 'WnspFrameColumns':
+        """Build columns from frame objects."""
+        return cls(
+            wavelength_nm=np.array([f.wavelength_nm for f in frames]),
+            intensity_level=np.array([f.intensity_level for f in frames], dtype=np.int64),
+            checksum=np.array([f.checksum for f in frames], dtype=np.int64),
+            payload_bit=np.array([f.payload_bit for f in frames], dtype=np.int64),
+            timestamp_ms=np.array([f.timestamp_ms for f in frames], dtype=np.float64),
+            sync=np.array([f.sync for f in frames], dtype=np.int64)
+        )
+    
+    @property
+    def is_materialized(self) -> bool:
+        """True once WnspFrame objects have been built (they are then authoritative)."""
+        return self._frames is not None
+    
+    def to_frames(self) -> List[WnspFrame]:
+        """Materialise (once) and return the frame objects."""
+        if self._frames is None:
+            self._frames = [
+                WnspFrame(
+                    sync=sync,
+                    wavelength_nm=wavelength,
+                    intensity_level=intensity,
+                    checksum=checksum,
+                    payload_bit=bit,
+                    timestamp_ms=timestamp
+                )
+                for sync, wavelength, intensity, checksum, bit, timestamp in zip(
+                    self.sync.tolist(),
+                    self.wavelength_nm.tolist(),
+                    self.intensity_level.tolist(),
+                    self.checksum.tolist(),
+                    self.payload_bit.tolist(),
+                    self.timestamp_ms.tolist()
+                )
+            ]
+        return self._frames
+    
+    def __len__(self) -> int:
+        return len(self.timestamp_ms)
+    
+    def __getitem__(self, index):
+        return self.to_frames()[index]
+    
+    def __iter__(self):
+        return iter(self.to_frames())
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (WnspFrameColumns, list, tuple)):
+            return len(self) == len(other) and self.to_frames() == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"WnspFrameColumns(n={len(self)})"
+
+
+def as_frame_columns(frames: Union[WnspFrameColumns, Sequence[WnspFrame]]) -> WnspFrameColumns:
+    """
+    Columnar view of frames for vectorised processing.
+    
+    Returns the columns themselves when they have not been materialised (and
+    therefore cannot have been mutated through frame objects); otherwise
+    rebuilds columns from the frame objects.
+    """
+    if isinstance(frames, WnspFrameColumns) and not frames.is_materialized:
+        return frames
+    return WnspFrameColumns.from_frames(list(frames))
+
+
+def build_codepoint_table(char_map: Dict[str, float]) -> np.ndarray:
+    """
+    Code point -> wavelength lookup table (0 marks unsupported characters).
+    
+    Args:
+        char_map: Character to wavelength mapping
+        
+    Returns:
+        Array indexed by Unicode code point
+    """
+    size = max(ord(c) for c in char_map) + 1
+    dtype = np.int64 if all(float(w).is_integer() for w in char_map.values()) else np.float64
+    table = np.zeros(size, dtype=dtype)
+    for char, wavelength in char_map.items():
+        table[ord(char)] = wavelength
+    return table
+
+
+def build_wavelength_table(char_map: Dict[str, int]) -> np.ndarray:
+    """
+    Integer wavelength -> code point lookup table (0 marks no character).
+    
+    Args:
+        char_map: Character to integer wavelength mapping
+        
+    Returns:
+        Array indexed by integer wavelength in nm
+    """
+    table = np.zeros(int(max(char_map.values())) + 1, dtype=np.uint32)
+    for char, wavelength in char_map.items():
+        table[int(wavelength)] = ord(char)
+    return table
+
+
+def text_to_codepoints(text: str) -> np.ndarray:
+    """Unicode code points of text as a uint32 array (zero-copy view of UTF-32)."""
+    return np.frombuffer(text.encode('utf-32-le', errors='surrogatepass'), dtype='<u4')
+
+
+def codepoints_to_text(codepoints: np.ndarray) -> str:
+    """Inverse of text_to_codepoints."""
+    return codepoints.astype('<u4').tobytes().decode('utf-32-le', errors='surrogatepass')
+
+
+def encode_text_columns(
+    text: str,
+    wavelength_table: np.ndarray,
+    base_time: float,
+    frame_duration_ms: float,
+    sync: int,
+    intensity: int,
+    checksum_table: Optional[np.ndarray] = None
+) -> WnspFrameColumns:
+    """
+    Translate text to frame columns through a code-point lookup table.
+    
+    Characters without a wavelength are skipped but keep their position, so
+    timestamps and payload bits match the per-character encoders.
+    
+    Args:
+        text: Text to encode
+        wavelength_table: Code point -> wavelength (0 = unsupported)
+        base_time: Timestamp of position 0 in milliseconds
+        frame_duration_ms: Frame spacing in milliseconds
+        sync: Sync pattern for every frame
+        intensity: Intensity level for every frame
+        checksum_table: Optional code point -> checksum table (default 0)
+        
+    Returns:
+        Columnar frames
+    """
+    codepoints = text_to_codepoints(text)
+    in_range = codepoints < len(wavelength_table)
+    clipped = np.where(in_range, codepoints, 0)
+    wavelengths = np.where(in_range, wavelength_table[clipped], 0)
+    positions = np.flatnonzero(wavelengths)
+    selected = clipped[positions]
+    count = len(positions)
+    
+    if checksum_table is None:
+        checksums = np.zeros(count, dtype=np.int64)
+    else:
+        checksums = checksum_table[selected]
+    
+    return WnspFrameColumns(
+        wavelength_nm=wavelengths[positions],
+        intensity_level=np.full(count, intensity, dtype=np.int64),
+        checksum=checksums,
+        payload_bit=positions % 2,
+        timestamp_ms=base_time + positions * frame_duration_ms,
+        sync=np.full(count, sync, dtype=np.int64)
+    )
+
+
 @dataclass
 class WnspFrameMessage:
     """A message is an ordered sequence of frames."""
@@ -38,12 +237,17 @@ class WnspFrameMessage:
     
     def add_frame(self, frame: WnspFrame) -> None:
         """Add a frame to the message."""
+        if isinstance(self.frames, WnspFrameColumns):
+            self.frames = list(self.frames)
         self.frames.append(frame)
     
     def get_duration_ms(self) -> float:
         """Calculate total message duration in milliseconds."""
-        if not self.frames:
+        if not len(self.frames):
             return 0.0
+        if isinstance(self.frames, WnspFrameColumns) and not self.frames.is_materialized:
+            timestamps = self.frames.timestamp_ms
+            return float(timestamps.max() - timestamps.min())
         return max(f.timestamp_ms for f in self.frames) - min(f.timestamp_ms for f in self.frames)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -121,29 +325,21 @@ class WnspEncoder:
         Returns:
             WnspFrameMessage containing encoded frames
         """
-        from wavelength_map import get_wavelength_for_letter
+        if not (0 <= intensity <= 7):
+            raise ValueError(f"intensity_level must be 0-7, got {intensity}")
         
-        frames = []
+        wavelength_table, checksum_table = _letter_tables()
         base_time = time.time() * 1000  # Current time in milliseconds
         
-        for i, char in enumerate(text.upper()):
-            if not char.isalpha() or not ('A' <= char <= 'Z'):
-                continue
-            
-            wavelength = get_wavelength_for_letter(char)
-            if wavelength is None:
-                continue
-            
-            # Create frame
-            frame = WnspFrame(
-                sync=self.SYNC_PATTERN,
-                wavelength_nm=wavelength,
-                intensity_level=intensity,
-                checksum=self._compute_checksum(char, wavelength),
-                payload_bit=i % 2,  # Alternate bits
-                timestamp_ms=base_time + (i * self.frame_duration_ms)
-            )
-            frames.append(frame)
+        frames = encode_text_columns(
+            text.upper(),
+            wavelength_table,
+            base_time,
+            self.frame_duration_ms,
+            sync=self.SYNC_PATTERN,
+            intensity=intensity,
+            checksum_table=checksum_table
+        )
         
         # Create message
         message_id = self._generate_message_id(text)
@@ -165,18 +361,24 @@ class WnspEncoder:
         Returns:
             List of timeline segments
         """
-        segments = []
+        columns = as_frame_columns(message.frames)
+        starts = columns.timestamp_ms
+        ends = starts + (self.frame_duration_ms - gap_ms)
         
-        for frame in message.frames:
-            segment = TimelineSegment(
-                t_start_ms=frame.timestamp_ms,
-                t_end_ms=frame.timestamp_ms + self.frame_duration_ms - gap_ms,
-                wavelength_nm=frame.wavelength_nm,
-                intensity_level=frame.intensity_level
+        return [
+            TimelineSegment(
+                t_start_ms=start,
+                t_end_ms=end,
+                wavelength_nm=wavelength,
+                intensity_level=intensity
             )
-            segments.append(segment)
-        
-        return segments
+            for start, end, wavelength, intensity in zip(
+                starts.tolist(),
+                ends.tolist(),
+                columns.wavelength_nm.tolist(),
+                columns.intensity_level.tolist()
+            )
+        ]
     
     @staticmethod
     def _compute_checksum(char: str, wavelength: float) -> int:
@@ -204,22 +406,32 @@ class WnspDecoder:
         """
         Decode WNSP frames back to text.
         
+        Each wavelength maps to the nearest letter (ties go to the lower
+        wavelength), matching get_letter_for_wavelength.
+        
         Args:
             message: WNSP frame message
             
         Returns:
             Decoded text message
         """
-        from wavelength_map import get_letter_for_wavelength
+        from wavelength_map import ALPHABET_MAP
         
-        decoded_chars = []
+        if not len(message.frames) or not ALPHABET_MAP:
+            return ''
         
-        for frame in message.frames:
-            letter = get_letter_for_wavelength(frame.wavelength_nm)
-            if letter:
-                decoded_chars.append(letter)
+        wavelengths = as_frame_columns(message.frames).wavelength_nm.astype(np.float64)
+        letter_wavelengths = np.array([s.wavelength_nm for s in ALPHABET_MAP], dtype=np.float64)
+        letters = np.array([ord(s.letter) for s in ALPHABET_MAP], dtype=np.uint32)
         
-        return ''.join(decoded_chars)
+        right = np.clip(np.searchsorted(letter_wavelengths, wavelengths), 0, len(letters) - 1)
+        left = np.clip(right - 1, 0, len(letters) - 1)
+        right_closer = (np.abs(letter_wavelengths[right] - wavelengths)
+                        < np.abs(letter_wavelengths[left] - wavelengths))
+        nearest = np.where(right_closer, right, left)
+        nearest = nearest[~np.isnan(wavelengths)]
+        
+        return codepoints_to_text(letters[nearest])
     
     def decode_frames(self, frames: List[WnspFrame]) -> str:
         """
@@ -254,6 +466,24 @@ class WnspDecoder:
         return frame.checksum == expected
 
 
+_LETTER_TABLES = None
+
+
+def _letter_tables():
+    """Code point tables for A-Z: (wavelength, checksum)."""
+    global _LETTER_TABLES
+    if _LETTER_TABLES is None:
+        from wavelength_map import ALPHABET_MAP
+        
+        letter_map = {s.letter: s.wavelength_nm for s in ALPHABET_MAP}
+        wavelength_table = build_codepoint_table(letter_map)
+        checksum_table = np.zeros(len(wavelength_table), dtype=np.int64)
+        for letter, wavelength in letter_map.items():
+            checksum_table[ord(letter)] = WnspEncoder._compute_checksum(letter, wavelength)
+        _LETTER_TABLES = (wavelength_table, checksum_table)
+    return _LETTER_TABLES
+
+
 def create_test_message(text: str = "HELLO") -> WnspFrameMessage:
     """
     Create a test WNSP message for demonstration.
@@ -70,6 +70,40 @@ device_to_socket = {}  # device_id -> socket_id (maps device_id to Socket.IO ses
 phone_to_socket = {}  # phone_number -> socket_id (server-verified identity)
 socket_to_phone = {}  # socket_id -> phone_number (reverse lookup)
 
+# =============================================================================
+# POOLED DATABASE ACCESS (shared pool + contact -> device_id cache)
+# =============================================================================
+DEVICE_BY_CONTACT_SQL = "SELECT device_id FROM nexus_device_wallet_mapping WHERE contact = $1"
+
+
+def _load_device_id(contact):
+    """Look up the wallet device_id registered for a contact (phone number)"""
+    from pg_pool import pooled_connection, execute_prepared
+    with pooled_connection() as conn:
+        with conn.cursor() as cur:
+            execute_prepared(cur, 'device_by_contact', DEVICE_BY_CONTACT_SQL, (contact,))
+            result = cur.fetchone()
+        conn.commit()
+    return result[0] if result else None
+
+
+def _create_device_cache():
+    try:
+        from pg_pool import ReadThroughCache
+    except ImportError:
+        return None
+    return ReadThroughCache(_load_device_id, max_entries=4096, ttl_seconds=300.0)
+
+
+device_id_cache = _create_device_cache()
+
+
+def get_device_id_for_contact(contact):
+    """Cached contact -> device_id lookup (None when no wallet is registered)"""
+    if device_id_cache is None:
+        return _load_device_id(contact)
+    return device_id_cache.get(contact)
+
 # Error handler for file too large
 @app.errorhandler(413)
 def request_entity_too_large(error):
@@ -439,10 +473,9 @@ def import_wallet():
         
         # Try to authenticate with password (verify wallet exists)
         # Note: We'll check if the address exists and has the correct password
-        import psycopg2
-        conn = psycopg2.connect(os.getenv('DATABASE_URL'))
+        from pg_pool import pooled_connection
         
-        try:
+        with pooled_connection() as conn:
             with conn.cursor() as cur:
                 # Check if wallet exists
                 cur.execute("""
@@ -469,6 +502,9 @@ def import_wallet():
                 
                 conn.commit()
             
+            if device_id_cache is not None:
+                device_id_cache.invalidate(f"{device_name}@imported")
+            
             # Get balance
             balance_result = wallet.get_balance(device_id)
             
@@ -483,8 +519,6 @@ def import_wallet():
                     'balance_nxt': balance_result.get('balance_nxt', 0.0)
                 }
             }), 201
-        finally:
-            conn.close()
             
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -492,7 +526,7 @@ def import_wallet():
 @app.route('/api/wallet/list')
 def list_wallets():
     """List all user wallets (excluding system accounts)"""
-    import psycopg2
+    from pg_pool import pooled_connection
     
     try:
         database_url = os.getenv('DATABASE_URL')
@@ -500,8 +534,7 @@ def list_wallets():
             app.logger.error("DATABASE_URL not set")
             return jsonify({'success': False, 'error': 'Database not configured'}), 500
             
-        conn = psycopg2.connect(database_url)
-        try:
+        with pooled_connection(database_url) as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT address, balance 
@@ -526,8 +559,6 @@ def list_wallets():
                     'wallets': wallets,
                     'total_wallets': len(wallets)
                 })
-        finally:
-            conn.close()
     except Exception as e:
         app.logger.error(f"Error listing wallets: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -1537,16 +1568,10 @@ def handle_start_broadcast(data):
         
         # CRITICAL: Look up the actual device_id from phone number
         # Phone number is stored as 'contact' in nexus_device_wallet_mapping
-        import psycopg2
         try:
-            conn = psycopg2.connect(os.getenv('DATABASE_URL'))
-            cursor = conn.cursor()
-            cursor.execute('SELECT device_id FROM nexus_device_wallet_mapping WHERE contact = %s', (phone_number,))
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            device_id = get_device_id_for_contact(phone_number)
             
-            if not result:
+            if not device_id:
                 emit('broadcast_started', {
                     'success': False,
                     'error': f"No wallet found for {phone_number}. Please create a wallet first."
@@ -1554,7 +1579,6 @@ def handle_start_broadcast(data):
                 print(f"❌ No wallet found for {phone_number}")
                 return
             
-            device_id = result[0]
             print(f"✅ Found wallet device_id: {device_id} for phone: {phone_number}")
         except Exception as e:
             emit('broadcast_started', {
@@ -0,0 +1,218 @@
+"""
+WNSP Message Tracking - Bounded In-Flight Tables and Online Statistics
+======================================================================
+
+Long-running gateways create messages indefinitely, so tracking must not grow
+with lifetime traffic:
+
+1. In-flight table: TTL + LRU bounded OrderedDict (expired/oldest entries
+   are evicted on insert, amortised O(1))
+2. Recent history: fixed-size ring buffer
+3. Online counters: per encoding mode, spectral region and radio protocol,
+   plus running cost/latency totals and a fixed-bucket latency histogram
+
+Statistics are maintained on write so reads are O(1) in traffic volume.
+"""
+
+from typing import Dict, List, Optional, Any, Callable
+from collections import OrderedDict, deque
+import bisect
+import time
+
+
+# Latency histogram upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0, 5000.0)
+
+
+class CategoryStats:
+    """Running count, cost and latency totals for one category value."""
+
+    __slots__ = ('count', 'total_cost_nxt', 'total_latency_ms')
+
+    def __init__(self):
+        self.count = 0
+        self.total_cost_nxt = 0.0
+        self.total_latency_ms = 0.0
+
+    def record(self, cost_nxt: float, latency_ms: float):
+        self.count += 1
+        self.total_cost_nxt += cost_nxt
+        self.total_latency_ms += latency_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        count = max(self.count, 1)
+        return {
+            'count': self.count,
+            'total_cost_nxt': self.total_cost_nxt,
+            'avg_cost_nxt': self.total_cost_nxt / count,
+            'avg_latency_ms': self.total_latency_ms / count
+        }
+
+
+class MessageTracker:
+    """
+    Bounded message tracking with O(1) statistics.
+
+    In-flight messages live in an OrderedDict ordered by last touch; entries
+    older than ttl_seconds are dropped lazily, and the least recently touched
+    entry is evicted once max_active is reached. Completed or evicted messages
+    stay visible through the history ring buffer until overwritten.
+    """
+
+    DIMENSIONS = ('encoding_mode', 'spectral_region', 'radio_protocol')
+
+    def __init__(
+        self,
+        max_active: int = 10000,
+        ttl_seconds: float = 300.0,
+        history_size: int = 1000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            max_active: Maximum in-flight messages before LRU eviction
+            ttl_seconds: Seconds after last touch before an in-flight message expires
+            history_size: Number of recent messages kept in the ring buffer
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_active = max_active
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+
+        self._active: "OrderedDict[str, Any]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        self.history: deque = deque(maxlen=history_size)
+
+        self.total_tracked = 0
+        self.total_completed = 0
+        self.total_expired = 0
+        self.total_evicted = 0
+        self._by_dimension: Dict[str, Dict[str, CategoryStats]] = {
+            dim: {} for dim in self.DIMENSIONS
+        }
+        self._latency_histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._total_cost_nxt = 0.0
+        self._total_latency_ms = 0.0
+
+    def track(
+        self,
+        message_id: str,
+        message: Any,
+        encoding_mode: str,
+        spectral_region: str,
+        radio_protocol: Optional[str],
+        cost_nxt: float = 0.0,
+        latency_ms: float = 0.0
+    ):
+        """
+        Record a newly created message.
+
+        Args:
+            message_id: Message identifier
+            message: Message object
+            encoding_mode: Encoding mode value
+            spectral_region: Spectral region value
+            radio_protocol: Radio protocol value (None when unmapped)
+            cost_nxt: Message cost
+            latency_ms: Estimated latency
+        """
+        now = self.clock()
+        self._expire(now)
+
+        if message_id in self._active:
+            self._active.move_to_end(message_id)
+        self._active[message_id] = message
+        self._touched[message_id] = now
+        while len(self._active) > self.max_active:
+            evicted_id, _ = self._active.popitem(last=False)
+            del self._touched[evicted_id]
+            self.total_evicted += 1
+
+        self.history.append(message)
+
+        self.total_tracked += 1
+        self._total_cost_nxt += cost_nxt
+        self._total_latency_ms += latency_ms
+        self._latency_histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+        values = (encoding_mode, spectral_region, radio_protocol or 'none')
+        for dim, value in zip(self.DIMENSIONS, values):
+            stats = self._by_dimension[dim].get(value)
+            if stats is None:
+                stats = self._by_dimension[dim][value] = CategoryStats()
+            stats.record(cost_nxt, latency_ms)
+
+    def get(self, message_id: str) -> Optional[Any]:
+        """Look up an in-flight message, refreshing its TTL."""
+        now = self.clock()
+        self._expire(now)
+        message = self._active.get(message_id)
+        if message is not None:
+            self._active.move_to_end(message_id)
+            self._touched[message_id] = now
+        return message
+
+    def complete(self, message_id: str) -> Optional[Any]:
+        """Remove a message from the in-flight table (e.g. once delivered)."""
+        message = self._active.pop(message_id, None)
+        if message is not None:
+            del self._touched[message_id]
+            self.total_completed += 1
+        return message
+
+    def _expire(self, now: float):
+        """Drop in-flight entries whose last touch is older than the TTL."""
+        cutoff = now - self.ttl_seconds
+        while self._active:
+            oldest_id = next(iter(self._active))
+            if self._touched[oldest_id] > cutoff:
+                break
+            self._active.popitem(last=False)
+            del self._touched[oldest_id]
+            self.total_expired += 1
+
+    @property
+    def active(self) -> "OrderedDict[str, Any]":
+        """Live in-flight table (oldest touch first); treat as read-only."""
+        self._expire(self.clock())
+        return self._active
+
+    def active_count(self) -> int:
+        """Number of unexpired in-flight messages."""
+        return len(self.active)
+
+    def recent(self, limit: Optional[int] = None) -> List[Any]:
+        """Most recent messages, oldest first."""
+        messages = list(self.history)
+        if limit is None:
+            return messages
+        return messages[-limit:] if limit > 0 else []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Aggregate statistics (independent of lifetime traffic)."""
+        total = max(self.total_tracked, 1)
+        histogram = {
+            f"<={bound:g}ms": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self._latency_histogram)
+        }
+        histogram[f">{LATENCY_BUCKETS_MS[-1]:g}ms"] = self._latency_histogram[-1]
+
+        stats = {
+            'total_tracked': self.total_tracked,
+            'active': self.active_count(),
+            'completed': self.total_completed,
+            'expired': self.total_expired,
+            'evicted': self.total_evicted,
+            'history_size': len(self.history),
+            'avg_cost_nxt': self._total_cost_nxt / total,
+            'avg_latency_ms': self._total_latency_ms / total,
+            'latency_histogram': histogram
+        }
+        for dim in self.DIMENSIONS:
+            stats[f'by_{dim}'] = {
+                value: category.to_dict()
+                for value, category in self._by_dimension[dim].items()
+            }
+        return stats
@@ -13,16 +13,22 @@ Key upgrades from v1.0:
 - Multi-wavelength modulation for higher data density
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterable, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 import time
 import hashlib
 
+import numpy as np
+
 from wavelength_validator import (
     WavelengthValidator, WaveProperties, SpectralRegion, ModulationType
 )
-from wnsp_frames import WnspFrame, WnspFrameMessage, TimelineSegment
+from wnsp_frames import (
+    WnspFrame, WnspFrameMessage, TimelineSegment, WnspFrameColumns,
+    as_frame_columns, build_codepoint_table, build_wavelength_table,
+    encode_text_columns, codepoints_to_text
+)
 
 
 class WnspEncodingScheme(Enum):
@@ -105,6 +111,41 @@ SCIENTIFIC_CHAR_MAP = {
 WAVELENGTH_TO_CHAR = {v: k for k, v in EXTENDED_CHAR_MAP.items()}
 SCIENTIFIC_WAVELENGTH_TO_CHAR = {v: k for k, v in SCIENTIFIC_CHAR_MAP.items()}
 
+# Vectorised lookups: code point -> wavelength, integer wavelength -> code point
+EXTENDED_CODEPOINT_TABLE = build_codepoint_table(EXTENDED_CHAR_MAP)
+SCIENTIFIC_CODEPOINT_TABLE = build_codepoint_table(SCIENTIFIC_CHAR_MAP)
+EXTENDED_WAVELENGTH_TABLE = build_wavelength_table(EXTENDED_CHAR_MAP)
+SCIENTIFIC_WAVELENGTH_TABLE = build_wavelength_table(SCIENTIFIC_CHAR_MAP)
+
+# E=hf pricing constants
+PLANCK = 6.626e-34  # Planck's constant (J·s)
+SPEED_OF_LIGHT = 3e8  # Speed of light (m/s)
+BASE_SCALE = 1e21
+MIN_COST_NXT = 0.01
+
+
+def _build_region_constants() -> Dict[SpectralRegion, Dict[str, float]]:
+    """
+    Precompute the per-region E=hf terms.
+    
+    Message cost depends only on spectral region and byte length, so the
+    frequency and quantum energy are computed once per region at import.
+    """
+    constants = {}
+    for region in SpectralRegion:
+        frequency = SPEED_OF_LIGHT / region.center_wavelength  # Hz
+        quantum_energy = PLANCK * frequency  # Joules
+        constants[region] = {
+            'frequency': frequency,
+            'frequency_thz': frequency / 1e12,
+            'quantum_energy': quantum_energy,
+            'scaled_energy': quantum_energy * BASE_SCALE,
+        }
+    return constants
+
+
+REGION_CONSTANTS = _build_region_constants()
+
 
 @dataclass
 class WnspMessageV2:
@@ -113,7 +154,7 @@ class WnspMessageV2:
     sender_id: str
     recipient_id: str
     content: str
-    frames: List[WnspFrame]
+    frames: Sequence[WnspFrame]
     spectral_region: SpectralRegion
     modulation_type: ModulationType
     
@@ -196,17 +237,22 @@ class WnspEncoderV2:
             encoding_scheme
         )
         
+        # Content is hashed once; the wave signature and message ID extend copies
+        content_bytes = content.encode('utf-8')
+        content_hash = hashlib.sha256(content_bytes)
+        
         # 2. Create wave signature using wavelength validator
         wave_props = self.wavelength_validator.create_message_wave(
             content,
             spectral_region,
-            modulation_type
+            modulation_type,
+            content_hash=content_hash
         )
         
         # 3. Calculate cost using E=hf quantum physics
         cost_data = self._calculate_quantum_cost(
             wave_props,
-            len(content.encode('utf-8')),
+            len(content_bytes),
             spectral_region
         )
         
@@ -218,7 +264,9 @@ class WnspEncoderV2:
         )
         
         # 5. Generate message ID
-        message_id = self._generate_message_id(content, sender_id, spectral_region)
+        message_id = self._generate_message_id(
+            content, sender_id, spectral_region, content_hash=content_hash
+        )
         
         # 6. Create enhanced message
         message = WnspMessageV2(
@@ -240,52 +288,58 @@ class WnspEncoderV2:
         
         return message
     
+    def encode_batch(self, requests: Iterable[Dict[str, Any]]) -> List[WnspMessageV2]:
+        """
+        Encode many messages with one encoder.
+        
+        Args:
+            requests: Keyword-argument dicts for encode_message (content,
+                sender_id, recipient_id, spectral_region, ...)
+            
+        Returns:
+            Encoded messages in request order
+        """
+        encode = self.encode_message
+        return [encode(**request) for request in requests]
+    
     def _encode_content_to_frames(
         self,
         content: str,
         spectral_region: SpectralRegion,
         encoding_scheme: WnspEncodingScheme
-    ) -> List[WnspFrame]:
+    ) -> WnspFrameColumns:
         """
         Encode content to WNSP frames using extended character map.
         
+        The whole content is translated in one pass through a code-point
+        lookup table; unsupported characters are skipped but keep their slot
+        in the frame timing.
+        
         Args:
             content: Message content
             spectral_region: Spectral region for encoding
             encoding_scheme: Character encoding scheme
             
         Returns:
-            List of WNSP frames
+            Columnar WNSP frames
         """
-        frames = []
         base_time = time.time() * 1000
         
-        # Select character map based on encoding scheme
+        # Select character table based on encoding scheme
         if encoding_scheme == WnspEncodingScheme.SCIENTIFIC:
-            char_map = SCIENTIFIC_CHAR_MAP
+            table = SCIENTIFIC_CODEPOINT_TABLE
         else:
-            char_map = EXTENDED_CHAR_MAP
+            table = EXTENDED_CODEPOINT_TABLE
         
-        for i, char in enumerate(content):
-            # Get wavelength for character
-            wavelength = char_map.get(char)
-            
-            if wavelength is None:
-                # Skip unsupported characters
-                continue
-            
-            # Create frame with quantum-enhanced parameters
-            frame = WnspFrame(
-                sync=0xAA,  # Sync pattern
-                wavelength_nm=wavelength,
-                intensity_level=7,  # Max intensity
-                checksum=0,  # Will be replaced by interference validation
-                payload_bit=i % 2,
-                timestamp_ms=base_time + (i * self.frame_duration_ms)
-            )
-            frames.append(frame)
-        
-        return frames
+        # Checksum stays 0: replaced by interference validation
+        return encode_text_columns(
+            content,
+            table,
+            base_time,
+            self.frame_duration_ms,
+            sync=0xAA,
+            intensity=7
+        )
     
     def _calculate_quantum_cost(
         self,
@@ -304,28 +358,20 @@ class WnspEncoderV2:
         Returns:
             Dictionary with cost breakdown
         """
-        PLANCK = 6.626e-34  # Planck's constant (J·s)
-        SPEED_OF_LIGHT = 3e8  # Speed of light (m/s)
-        
-        # Calculate frequency from wavelength
-        frequency = SPEED_OF_LIGHT / spectral_region.center_wavelength  # Hz
+        region = REGION_CONSTANTS[spectral_region]
         
-        # Quantum energy cost (E = hf)
-        quantum_energy = PLANCK * frequency  # Joules
-        
-        # Scale to NXT
-        BASE_SCALE = 1e21
-        quantum_base_nxt = (quantum_energy * BASE_SCALE * message_bytes) / 1e6
-        total_cost_nxt = max(0.01, quantum_base_nxt)
+        # Scale to NXT (E = hf precomputed per region)
+        quantum_base_nxt = (region['scaled_energy'] * message_bytes) / 1e6
+        total_cost_nxt = max(MIN_COST_NXT, quantum_base_nxt)
         
         return {
             'cost_nxt': total_cost_nxt,
-            'quantum_energy': quantum_energy,
-            'frequency_thz': frequency / 1e12
+            'quantum_energy': region['quantum_energy'],
+            'frequency_thz': region['frequency_thz']
         }
     
+    @staticmethod
     def _generate_interference_hash(
-        self,
         wave_props: WaveProperties,
         content: str,
         parent_message_ids: List[str]
@@ -362,12 +408,52 @@ class WnspEncoderV2:
         self,
         content: str,
         sender_id: str,
-        spectral_region: SpectralRegion
+        spectral_region: SpectralRegion,
+        content_hash=None
     ) -> str:
-        """Generate unique message ID."""
+        """
+        Generate unique message ID.
+        
+        Args:
+            content_hash: Optional sha256 context over the content bytes; a
+                copy is extended so the content is not hashed again
+        """
         timestamp = str(time.time())
-        data = f"{content}{sender_id}{spectral_region.display_name}{timestamp}"
-        return f"wnsp2_{hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]}"
+        suffix = f"{sender_id}{spectral_region.display_name}{timestamp}".encode('utf-8')
+        if content_hash is None:
+            id_hash = hashlib.sha256(content.encode('utf-8'))
+        else:
+            id_hash = content_hash.copy()
+        id_hash.update(suffix)
+        return f"wnsp2_{id_hash.hexdigest()[:16]}"
+
+
+def decode_frames_to_text(frames, encoding_scheme: WnspEncodingScheme) -> str:
+    """
+    Vectorised reverse lookup of frame wavelengths to text.
+    
+    Wavelengths are truncated to whole nanometres and frames that map to no
+    character are dropped.
+    
+    Args:
+        frames: WNSP frames (list or WnspFrameColumns)
+        encoding_scheme: Character encoding scheme used by the sender
+        
+    Returns:
+        Decoded text
+    """
+    if not len(frames):
+        return ''
+    
+    if encoding_scheme == WnspEncodingScheme.SCIENTIFIC:
+        table = SCIENTIFIC_WAVELENGTH_TABLE
+    else:
+        table = EXTENDED_WAVELENGTH_TABLE
+    
+    wavelengths = np.trunc(as_frame_columns(frames).wavelength_nm.astype(np.float64))
+    valid = (wavelengths >= 0) & (wavelengths < len(table))
+    codepoints = table[wavelengths[valid].astype(np.int64)]
+    return codepoints_to_text(codepoints[codepoints != 0])
 
 
 class WnspDecoderV2:
@@ -387,28 +473,33 @@ class WnspDecoderV2:
         Returns:
             Tuple of (decoded_content, validation_success)
         """
-        # Select reverse lookup map based on encoding scheme
-        if message.encoding_scheme == WnspEncodingScheme.SCIENTIFIC:
-            wavelength_to_char_map = SCIENTIFIC_WAVELENGTH_TO_CHAR
-        else:
-            wavelength_to_char_map = WAVELENGTH_TO_CHAR
-        
-        # Decode frames to text
-        decoded_chars = []
-        
-        for frame in message.frames:
-            char = wavelength_to_char_map.get(int(frame.wavelength_nm))
-            if char:
-                decoded_chars.append(char)
-        
-        decoded_text = ''.join(decoded_chars)
+        decoded_text = decode_frames_to_text(message.frames, message.encoding_scheme)
         
         # Validate interference hash (quantum verification)
         validation_success = self._validate_interference_hash(message)
         
         return decoded_text, validation_success
     
-    def _validate_interference_hash(self, message: WnspMessageV2) -> bool:
+    def decode_batch(self, messages: Iterable[WnspMessageV2]) -> List[Tuple[str, bool]]:
+        """Decode and validate many messages."""
+        decode = self.decode_message
+        return [decode(message) for message in messages]
+    
+    def validate_batch(self, messages: Iterable[WnspMessageV2]) -> List[bool]:
+        """
+        Validate interference hashes for many messages without decoding frames.
+        
+        Args:
+            messages: WNSP v2.0 messages
+            
+        Returns:
+            Validation result per message, in order
+        """
+        validate = self._validate_interference_hash
+        return [validate(message) for message in messages]
+    
+    @staticmethod
+    def _validate_interference_hash(message: WnspMessageV2) -> bool:
         """
         Validate message integrity using interference hash.
         
@@ -423,8 +514,7 @@ class WnspDecoderV2:
         
         try:
             # Regenerate interference pattern
-            encoder = WnspEncoderV2()
-            expected_hash = encoder._generate_interference_hash(
+            expected_hash = WnspEncoderV2._generate_interference_hash(
                 message.wave_signature,
                 message.content,
                 message.parent_message_ids
@@ -436,6 +526,17 @@ class WnspDecoderV2:
             return False
 
 
+_default_encoder: Optional[WnspEncoderV2] = None
+
+
+def get_default_encoder() -> WnspEncoderV2:
+    """Shared encoder instance for helpers that would otherwise build one per call."""
+    global _default_encoder
+    if _default_encoder is None:
+        _default_encoder = WnspEncoderV2()
+    return _default_encoder
+
+
 def create_wnsp_v2_message(
     content: str,
     sender_id: str = "alice",
@@ -456,7 +557,7 @@ def create_wnsp_v2_message(
     Returns:
         WNSP v2.0 message
     """
-    encoder = WnspEncoderV2()
+    encoder = get_default_encoder()
     return encoder.encode_message(
         content=content,
         sender_id=sender_id,
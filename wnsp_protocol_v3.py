@@ -36,6 +36,7 @@ from wnsp_adaptive_encoding import (
     WNSPAdaptiveEncoder, EncodingMode, ContentType,
     EncodingDecision, get_adaptive_encoder
 )
+from wnsp_message_tracking import MessageTracker
 
 
 @dataclass
@@ -104,7 +105,20 @@ class WNSPProtocolV3:
     - v2.0 compatibility
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_active_messages: int = 10000,
+        message_ttl_seconds: float = 300.0,
+        history_size: int = 1000
+    ):
+        """
+        Initialize protocol engine.
+        
+        Args:
+            max_active_messages: In-flight messages kept before LRU eviction
+            message_ttl_seconds: Seconds before an untouched in-flight message expires
+            history_size: Recent messages kept in the history ring buffer
+        """
         # Core components
         self.hal = get_wnsp_hal()
         self.adaptive_encoder = get_adaptive_encoder()
@@ -113,9 +127,12 @@ class WNSPProtocolV3:
         # v2.0 compatibility
         self.v2_encoder = WnspEncoderV2()
         
-        # Message tracking
-        self.active_messages: Dict[str, WnspMessageV3] = {}
-        self.message_history: List[WnspMessageV3] = []
+        # Message tracking (bounded: TTL/LRU in-flight table + ring buffer)
+        self.tracker = MessageTracker(
+            max_active=max_active_messages,
+            ttl_seconds=message_ttl_seconds,
+            history_size=history_size
+        )
         
         # Statistics
         self.total_messages_v3: int = 0
@@ -177,7 +194,7 @@ class WNSPProtocolV3:
             wavelength_nm = 685
         
         # Step 3: Wave properties (physics validation)
-        wave_props = self.wavelength_validator.create_wave_properties(
+        wave_props = self.wavelength_validator.create_message_wave(
             message_data=str(content)[:100],  # First 100 chars for signature
             spectral_region=spectral_region,
             modulation_type=ModulationType.PSK
@@ -224,12 +241,37 @@ class WNSPProtocolV3:
         )
         
         # Track message
-        self.active_messages[message_id] = message
-        self.message_history.append(message)
+        self.tracker.track(
+            message_id,
+            message,
+            encoding_mode=message.encoding_mode.value,
+            spectral_region=spectral_region.name,
+            radio_protocol=radio_channel.radio_protocol.value if radio_channel else None,
+            cost_nxt=message.cost_nxt,
+            latency_ms=message.estimated_latency_ms
+        )
         self.total_messages_v3 += 1
         
         return message
     
+    @property
+    def active_messages(self) -> Dict[str, WnspMessageV3]:
+        """Unexpired in-flight messages keyed by ID (read-only view)"""
+        return self.tracker.active
+    
+    @property
+    def message_history(self) -> List[WnspMessageV3]:
+        """Most recent messages, oldest first (bounded by history_size)"""
+        return self.tracker.recent()
+    
+    def get_active_message(self, message_id: str) -> Optional[WnspMessageV3]:
+        """Look up an in-flight message, refreshing its TTL"""
+        return self.tracker.get(message_id)
+    
+    def complete_message(self, message_id: str) -> Optional[WnspMessageV3]:
+        """Mark a message delivered, removing it from the in-flight table"""
+        return self.tracker.complete(message_id)
+    
     def validate_message_v3(
         self,
         message: WnspMessageV3,
@@ -300,7 +342,8 @@ class WNSPProtocolV3:
             "adaptive_encoding": self.adaptive_encoding_count,
             "hal": hal_stats,
             "encoder": encoder_stats,
-            "active_messages": len(self.active_messages)
+            "active_messages": self.tracker.active_count(),
+            "tracking": self.tracker.get_stats()
         }
 
 
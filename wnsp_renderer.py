@@ -10,7 +10,7 @@ from typing import List, Dict, Any
 import time
 
 from wavelength_map import wavelength_to_rgb, get_letter_info, encode_message_to_wavelengths
-from wnsp_frames import WnspEncoder, WnspDecoder, WnspFrameMessage, TimelineSegment
+from wnsp_frames import WnspEncoder, WnspDecoder, WnspFrameMessage, TimelineSegment, as_frame_columns
 
 
 class WnspVisualizer:
@@ -260,7 +260,7 @@ class WnspVisualizer:
             'text': text.upper(),
             'frame_count': len(message.frames),
             'duration_ms': message.get_duration_ms(),
-            'wavelengths': [f.wavelength_nm for f in message.frames],
+            'wavelengths': as_frame_columns(message.frames).wavelength_nm.tolist(),
             'message_id': message.message_id,
             'segments': [s.to_dict() for s in segments]
         }
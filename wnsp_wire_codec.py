@@ -0,0 +1,708 @@
+"""
+WNSP v2.0 Binary Wire Codec for Offline Mesh Links
+
+Compact, versioned binary encoding of WnspMessageV2 for BLE, WiFi Direct and
+NFC links, replacing per-frame JSON (100+ bytes per character frame).
+
+Wire layout (all integers are unsigned LEB128 varints unless noted):
+    byte 0      WIRE_MAGIC | WIRE_VERSION
+    byte 1      flags (body compression, derived economics/wave signature)
+    body        enum indices, packed IDs, content and column-packed frames
+                (optionally zlib/zstd compressed as a whole)
+
+Frames are stored column-wise: one wavelength-table index byte per frame,
+constant columns (sync, intensity, checksum) collapsed to a single value,
+and timestamps/payload bits expressed as an arithmetic sequence when the
+encoder produced them that way (the normal case).
+
+Economics (cost_nxt, quantum_energy, frequency_thz) and the wave signature
+are omitted when they equal the values the receiver can recompute from the
+content and spectral region.
+
+MTU-aware fragmentation splits payloads into link-sized packets with a
+5-byte header; FragmentReassembler rebuilds them on the receiving side.
+"""
+
+from typing import List, Optional, Dict, Any, Tuple, Sequence
+import re
+import struct
+import time
+import zlib
+
+from wavelength_validator import (
+    WavelengthValidator, WaveProperties, SpectralRegion, ModulationType
+)
+import numpy as np
+
+from wnsp_frames import WnspFrame, WnspFrameColumns, as_frame_columns
+from wnsp_protocol_v2 import (
+    WnspMessageV2, WnspEncoderV2, WnspEncodingScheme,
+    EXTENDED_CHAR_MAP, SCIENTIFIC_CHAR_MAP
+)
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+WIRE_MAGIC = 0xB0
+WIRE_VERSION = 1
+FRAGMENT_MAGIC = 0xC1
+FRAGMENT_HEADER_MAX = 1 + 2 + 3 + 3  # marker + tag + idx varint + total varint
+
+# Flags (byte 1)
+FLAG_ZLIB = 0x01
+FLAG_ZSTD = 0x02
+FLAG_DERIVED_COST = 0x04
+FLAG_WAVE_DERIVED = 0x08
+FLAG_WAVE_EXPLICIT = 0x10
+
+# Column modes
+COLUMN_CONSTANT = 0
+COLUMN_EXPLICIT = 1
+TIMESTAMPS_CONTIGUOUS = 0
+TIMESTAMPS_INDEXED = 1
+TIMESTAMPS_EXPLICIT = 2
+BITS_PARITY = 0
+BITS_EXPLICIT = 1
+
+# ID kinds (low 2 bits of the length varint)
+ID_UTF8 = 0
+ID_HEX = 1
+ID_PREFIXED_HEX = 2
+ID_HEX_PREFIX = "wnsp2_"
+
+WAVELENGTH_ESCAPE = 0xFF
+COMPRESSION_THRESHOLD = 64
+
+_SPECTRAL_REGIONS = list(SpectralRegion)
+_MODULATIONS = list(ModulationType)
+_SCHEMES = list(WnspEncodingScheme)
+
+_EXTENDED_TABLE = sorted(set(EXTENDED_CHAR_MAP.values()))
+_SCIENTIFIC_TABLE = sorted(set(SCIENTIFIC_CHAR_MAP.values()))
+_EXTENDED_INDEX = {w: i for i, w in enumerate(_EXTENDED_TABLE)}
+_SCIENTIFIC_INDEX = {w: i for i, w in enumerate(_SCIENTIFIC_TABLE)}
+
+_HEX_RE = re.compile(r'^(?:[0-9a-f]{2})+$')
+_F64 = struct.Struct('<d')
+
+
+class WireCodecError(ValueError):
+    """Raised when a payload cannot be decoded."""
+
+
+# ============================================================================
+# PRIMITIVES
+# ============================================================================
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as an LEB128 varint."""
+    if value < 0:
+        raise ValueError(f"varint must be non-negative, got {value}")
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def decode_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Decode an LEB128 varint, returning (value, new_position)."""
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise WireCodecError("Truncated varint")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _pack_id(value: str) -> bytes:
+    """Pack an ID string, storing hex digests as raw bytes."""
+    if value.startswith(ID_HEX_PREFIX) and _HEX_RE.match(value[len(ID_HEX_PREFIX):]):
+        raw = bytes.fromhex(value[len(ID_HEX_PREFIX):])
+        kind = ID_PREFIXED_HEX
+    elif _HEX_RE.match(value):
+        raw = bytes.fromhex(value)
+        kind = ID_HEX
+    else:
+        raw = value.encode('utf-8')
+        kind = ID_UTF8
+    return encode_varint((len(raw) << 2) | kind) + raw
+
+
+def _unpack_id(data: bytes, pos: int) -> Tuple[str, int]:
+    tag, pos = decode_varint(data, pos)
+    length, kind = tag >> 2, tag & 0x03
+    raw = data[pos:pos + length]
+    if len(raw) != length:
+        raise WireCodecError("Truncated ID")
+    pos += length
+    if kind == ID_PREFIXED_HEX:
+        return ID_HEX_PREFIX + raw.hex(), pos
+    if kind == ID_HEX:
+        return raw.hex(), pos
+    return raw.decode('utf-8'), pos
+
+
+def _read_f64(data: bytes, pos: int) -> Tuple[float, int]:
+    if pos + 8 > len(data):
+        raise WireCodecError("Truncated float")
+    return _F64.unpack_from(data, pos)[0], pos + 8
+
+
+def _read_bytes(data: bytes, pos: int) -> Tuple[bytes, int]:
+    length, pos = decode_varint(data, pos)
+    raw = data[pos:pos + length]
+    if len(raw) != length:
+        raise WireCodecError("Truncated field")
+    return raw, pos + length
+
+
+# ============================================================================
+# MESSAGE CODEC
+# ============================================================================
+
+class WnspWireCodec:
+    """
+    Binary encoder/decoder for WnspMessageV2.
+
+    Derived fields are recomputed with the same WnspEncoderV2 and
+    WavelengthValidator logic the sender used, so they cost no wire bytes.
+    """
+
+    def __init__(self, compression: Optional[str] = 'auto'):
+        """
+        Initialize codec.
+
+        Args:
+            compression: 'auto' (zstd if installed, else zlib), 'zlib', 'zstd' or None
+        """
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requested but zstandard is not installed")
+        if compression == 'auto':
+            compression = 'zstd' if ZSTD_AVAILABLE else 'zlib'
+        self.compression = compression
+        self._encoder = WnspEncoderV2()
+        self._validator = WavelengthValidator()
+
+    # ------------------------------------------------------------------ encode
+
+    def encode(self, message: WnspMessageV2) -> bytes:
+        """
+        Serialize a WNSP v2.0 message to its binary wire form.
+
+        Args:
+            message: Message to encode
+
+        Returns:
+            Wire payload bytes
+        """
+        flags = 0
+        content_bytes = message.content.encode('utf-8')
+
+        body = bytearray()
+        body += encode_varint(_SPECTRAL_REGIONS.index(message.spectral_region))
+        body += encode_varint(_MODULATIONS.index(message.modulation_type))
+        body += encode_varint(_SCHEMES.index(message.encoding_scheme))
+        body += _pack_id(message.message_id)
+        body += _pack_id(message.sender_id)
+        body += _pack_id(message.recipient_id)
+        body += _pack_id(message.interference_hash)
+        body += encode_varint(len(message.parent_message_ids))
+        for parent_id in message.parent_message_ids:
+            body += _pack_id(parent_id)
+        body += _F64.pack(message.created_at)
+
+        expected_cost = self._encoder._calculate_quantum_cost(
+            message.wave_signature, len(content_bytes), message.spectral_region
+        )
+        if (expected_cost['cost_nxt'] == message.cost_nxt
+                and expected_cost['quantum_energy'] == message.quantum_energy
+                and expected_cost['frequency_thz'] == message.frequency_thz):
+            flags |= FLAG_DERIVED_COST
+        else:
+            body += _F64.pack(message.cost_nxt)
+            body += _F64.pack(message.quantum_energy)
+            body += _F64.pack(message.frequency_thz)
+
+        wave = message.wave_signature
+        if wave is not None:
+            if wave == self._derive_wave(message.content, message.spectral_region,
+                                         message.modulation_type):
+                flags |= FLAG_WAVE_DERIVED
+            else:
+                flags |= FLAG_WAVE_EXPLICIT
+                body += _F64.pack(wave.wavelength)
+                body += _F64.pack(wave.amplitude)
+                body += _F64.pack(wave.phase)
+                body += _F64.pack(wave.polarization)
+                body += encode_varint(_SPECTRAL_REGIONS.index(wave.spectral_region))
+                body += encode_varint(_MODULATIONS.index(wave.modulation_type))
+
+        body += encode_varint(len(content_bytes))
+        body += content_bytes
+        body += self._encode_frames(message.frames, message.encoding_scheme)
+
+        body = bytes(body)
+        if self.compression and len(body) >= COMPRESSION_THRESHOLD:
+            if self.compression == 'zstd':
+                packed, flag = zstandard.ZstdCompressor(level=3).compress(body), FLAG_ZSTD
+            else:
+                packed, flag = zlib.compress(body, 6), FLAG_ZLIB
+            if len(packed) < len(body):
+                body = packed
+                flags |= flag
+
+        return bytes((WIRE_MAGIC | WIRE_VERSION, flags)) + body
+
+    def _encode_frames(self, frames: Sequence[WnspFrame], scheme: WnspEncodingScheme) -> bytes:
+        out = bytearray(encode_varint(len(frames)))
+        if not len(frames):
+            return bytes(out)
+
+        # Work from the columns so encoder output is never materialised
+        columns = as_frame_columns(frames)
+        timestamps = columns.timestamp_ms.tolist()
+
+        index = _SCIENTIFIC_INDEX if scheme == WnspEncodingScheme.SCIENTIFIC else _EXTENDED_INDEX
+        for wavelength in columns.wavelength_nm.tolist():
+            idx = index.get(wavelength)
+            if idx is None:
+                out.append(WAVELENGTH_ESCAPE)
+                out += _F64.pack(wavelength)
+            else:
+                out.append(idx)
+
+        out += self._encode_int_column(columns.sync.tolist())
+        out += self._encode_int_column(columns.intensity_level.tolist())
+        out += self._encode_int_column(columns.checksum.tolist())
+
+        positions = self._timestamp_positions(timestamps)
+        if positions is None:
+            out.append(TIMESTAMPS_EXPLICIT)
+            for timestamp in timestamps:
+                out += _F64.pack(timestamp)
+        else:
+            base, step, steps = positions
+            contiguous = all(k == i for i, k in enumerate(steps))
+            out.append(TIMESTAMPS_CONTIGUOUS if contiguous else TIMESTAMPS_INDEXED)
+            out += _F64.pack(base)
+            out += _F64.pack(step)
+            if not contiguous:
+                previous = 0
+                for k in steps:
+                    out += encode_varint(k - previous)
+                    previous = k
+
+        bits = columns.payload_bit.tolist()
+        parity = bits[0]
+        if positions is not None and all(
+            b == (k + parity) % 2 for b, k in zip(bits, positions[2])
+        ):
+            out.append(BITS_PARITY)
+            out.append(parity)
+        else:
+            out.append(BITS_EXPLICIT)
+            packed = bytearray((len(bits) + 7) // 8)
+            for i, bit in enumerate(bits):
+                if bit:
+                    packed[i >> 3] |= 1 << (i & 7)
+            out += packed
+
+        return bytes(out)
+
+    @staticmethod
+    def _encode_int_column(values: List[int]) -> bytes:
+        first = values[0]
+        if all(v == first for v in values):
+            return bytes((COLUMN_CONSTANT,)) + encode_varint(first)
+        out = bytearray((COLUMN_EXPLICIT,))
+        for v in values:
+            out += encode_varint(v)
+        return bytes(out)
+
+    @staticmethod
+    def _timestamp_positions(timestamps: List[float]) -> Optional[Tuple[float, float, List[int]]]:
+        """
+        Express timestamps as base + k*step with increasing integer k.
+
+        Returns None when the timestamps do not reproduce exactly.
+        """
+        base = timestamps[0]
+        if len(timestamps) == 1:
+            return base, 0.0, [0]
+
+        diffs = [b - a for a, b in zip(timestamps, timestamps[1:])]
+        positive = [d for d in diffs if d > 0]
+        if len(positive) != len(diffs):
+            return None
+        step = min(positive)
+
+        steps = []
+        for timestamp in timestamps:
+            k = round((timestamp - base) / step)
+            if base + k * step != timestamp:
+                return None
+            steps.append(k)
+        return base, step, steps
+
+    # ------------------------------------------------------------------ decode
+
+    def decode(self, payload: bytes) -> WnspMessageV2:
+        """
+        Deserialize a wire payload back into a WNSP v2.0 message.
+
+        Args:
+            payload: Bytes produced by encode()
+
+        Returns:
+            Reconstructed message
+
+        Raises:
+            WireCodecError: On malformed or unsupported payloads
+        """
+        if len(payload) < 2 or payload[0] & 0xF0 != WIRE_MAGIC:
+            raise WireCodecError("Not a WNSP wire payload")
+        version = payload[0] & 0x0F
+        if version != WIRE_VERSION:
+            raise WireCodecError(f"Unsupported WNSP wire version {version}")
+
+        flags = payload[1]
+        body = payload[2:]
+        try:
+            if flags & FLAG_ZSTD:
+                if not ZSTD_AVAILABLE:
+                    raise WireCodecError("Payload is zstd-compressed but zstandard is not installed")
+                body = zstandard.ZstdDecompressor().decompress(body)
+            elif flags & FLAG_ZLIB:
+                body = zlib.decompress(body)
+        except (zlib.error, getattr(zstandard, 'ZstdError', zlib.error)) as e:
+            raise WireCodecError(f"Corrupt compressed body: {e}")
+
+        try:
+            return self._decode_body(body, flags)
+        except (IndexError, ValueError, OverflowError, UnicodeDecodeError) as e:
+            if isinstance(e, WireCodecError):
+                raise
+            raise WireCodecError(f"Malformed WNSP wire payload: {e}")
+
+    def _decode_body(self, body: bytes, flags: int) -> WnspMessageV2:
+        pos = 0
+        region_idx, pos = decode_varint(body, pos)
+        modulation_idx, pos = decode_varint(body, pos)
+        scheme_idx, pos = decode_varint(body, pos)
+        spectral_region = _SPECTRAL_REGIONS[region_idx]
+        modulation_type = _MODULATIONS[modulation_idx]
+        encoding_scheme = _SCHEMES[scheme_idx]
+
+        message_id, pos = _unpack_id(body, pos)
+        sender_id, pos = _unpack_id(body, pos)
+        recipient_id, pos = _unpack_id(body, pos)
+        interference_hash, pos = _unpack_id(body, pos)
+        parent_count, pos = decode_varint(body, pos)
+        parent_ids = []
+        for _ in range(parent_count):
+            parent_id, pos = _unpack_id(body, pos)
+            parent_ids.append(parent_id)
+        created_at, pos = _read_f64(body, pos)
+
+        explicit_cost = None
+        if not flags & FLAG_DERIVED_COST:
+            cost_nxt, pos = _read_f64(body, pos)
+            quantum_energy, pos = _read_f64(body, pos)
+            frequency_thz, pos = _read_f64(body, pos)
+            explicit_cost = {'cost_nxt': cost_nxt, 'quantum_energy': quantum_energy,
+                             'frequency_thz': frequency_thz}
+
+        explicit_wave = None
+        if flags & FLAG_WAVE_EXPLICIT:
+            values = []
+            for _ in range(4):
+                value, pos = _read_f64(body, pos)
+                values.append(value)
+            wave_region, pos = decode_varint(body, pos)
+            wave_modulation, pos = decode_varint(body, pos)
+            explicit_wave = WaveProperties(
+                wavelength=values[0], amplitude=values[1], phase=values[2],
+                polarization=values[3],
+                spectral_region=_SPECTRAL_REGIONS[wave_region],
+                modulation_type=_MODULATIONS[wave_modulation]
+            )
+
+        content_raw, pos = _read_bytes(body, pos)
+        content = content_raw.decode('utf-8')
+        frames, pos = self._decode_frames(body, pos, encoding_scheme)
+
+        if flags & FLAG_WAVE_DERIVED:
+            wave = self._derive_wave(content, spectral_region, modulation_type)
+        else:
+            wave = explicit_wave
+
+        cost = explicit_cost or self._encoder._calculate_quantum_cost(
+            wave, len(content_raw), spectral_region
+        )
+
+        return WnspMessageV2(
+            message_id=message_id,
+            sender_id=sender_id,
+            recipient_id=recipient_id,
+            content=content,
+            frames=frames,
+            spectral_region=spectral_region,
+            modulation_type=modulation_type,
+            parent_message_ids=parent_ids,
+            interference_hash=interference_hash,
+            wave_signature=wave,
+            cost_nxt=cost['cost_nxt'],
+            quantum_energy=cost['quantum_energy'],
+            frequency_thz=cost['frequency_thz'],
+            created_at=created_at,
+            encoding_scheme=encoding_scheme
+        )
+
+    def _decode_frames(self, body: bytes, pos: int,
+                       scheme: WnspEncodingScheme) -> Tuple[Sequence[WnspFrame], int]:
+        count, pos = decode_varint(body, pos)
+        if count == 0:
+            return [], pos
+
+        table = _SCIENTIFIC_TABLE if scheme == WnspEncodingScheme.SCIENTIFIC else _EXTENDED_TABLE
+        wavelengths = []
+        for _ in range(count):
+            idx = body[pos]
+            pos += 1
+            if idx == WAVELENGTH_ESCAPE:
+                value, pos = _read_f64(body, pos)
+                wavelengths.append(value)
+            else:
+                wavelengths.append(table[idx])
+
+        syncs, pos = self._decode_int_column(body, pos, count)
+        intensities, pos = self._decode_int_column(body, pos, count)
+        checksums, pos = self._decode_int_column(body, pos, count)
+
+        ts_mode = body[pos]
+        pos += 1
+        steps = None
+        if ts_mode == TIMESTAMPS_EXPLICIT:
+            timestamps = []
+            for _ in range(count):
+                value, pos = _read_f64(body, pos)
+                timestamps.append(value)
+        else:
+            base, pos = _read_f64(body, pos)
+            step, pos = _read_f64(body, pos)
+            if ts_mode == TIMESTAMPS_CONTIGUOUS:
+                steps = list(range(count))
+            else:
+                steps, k = [], 0
+                for _ in range(count):
+                    delta, pos = decode_varint(body, pos)
+                    k += delta
+                    steps.append(k)
+            timestamps = [base + k * step for k in steps]
+
+        bits_mode = body[pos]
+        pos += 1
+        if bits_mode == BITS_PARITY:
+            parity = body[pos]
+            pos += 1
+            if steps is None:
+                raise WireCodecError("Parity payload bits require indexed timestamps")
+            bits = [(k + parity) % 2 for k in steps]
+        else:
+            packed = body[pos:pos + (count + 7) // 8]
+            pos += (count + 7) // 8
+            bits = [(packed[i >> 3] >> (i & 7)) & 1 for i in range(count)]
+
+        if not all(b in (0, 1) for b in bits) or not all(0 <= v <= 7 for v in intensities):
+            raise WireCodecError("Frame column out of range")
+
+        frames = WnspFrameColumns(
+            wavelength_nm=np.array(wavelengths),
+            intensity_level=np.array(intensities, dtype=np.int64),
+            checksum=np.array(checksums, dtype=np.int64),
+            payload_bit=np.array(bits, dtype=np.int64),
+            timestamp_ms=np.array(timestamps, dtype=np.float64),
+            sync=np.array(syncs, dtype=np.int64)
+        )
+        return frames, pos
+
+    @staticmethod
+    def _decode_int_column(body: bytes, pos: int, count: int) -> Tuple[List[int], int]:
+        mode = body[pos]
+        pos += 1
+        if mode == COLUMN_CONSTANT:
+            value, pos = decode_varint(body, pos)
+            return [value] * count, pos
+        values = []
+        for _ in range(count):
+            value, pos = decode_varint(body, pos)
+            values.append(value)
+        return values, pos
+
+    def _derive_wave(self, content: str, spectral_region: SpectralRegion,
+                     modulation_type: ModulationType) -> WaveProperties:
+        return self._validator.create_message_wave(content, spectral_region, modulation_type)
+
+
+_default_codec: Optional[WnspWireCodec] = None
+
+
+def _get_default_codec() -> WnspWireCodec:
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = WnspWireCodec()
+    return _default_codec
+
+
+def encode_wnsp_message(message: WnspMessageV2) -> bytes:
+    """Encode a message with the default codec."""
+    return _get_default_codec().encode(message)
+
+
+def decode_wnsp_message(payload: bytes) -> WnspMessageV2:
+    """Decode a message with the default codec."""
+    return _get_default_codec().decode(payload)
+
+
+def is_wire_payload(data: bytes) -> bool:
+    """Check whether bytes start with a WNSP wire header."""
+    return len(data) >= 2 and data[0] & 0xF0 == WIRE_MAGIC
+
+
+# ============================================================================
+# FRAGMENTATION
+# ============================================================================
+
+def is_fragment(data: bytes) -> bool:
+    """Check whether bytes are a fragment produced by fragment_payload()."""
+    return len(data) >= 5 and data[0] == FRAGMENT_MAGIC
+
+
+def fragment_payload(payload: bytes, mtu: int) -> List[bytes]:
+    """
+    Split a payload into packets no larger than the link MTU.
+
+    Payloads that already fit are returned unchanged as a single packet.
+    Otherwise each packet carries a header of marker byte, 16-bit message tag
+    (CRC32 of the payload) and varint fragment index/total.
+
+    Args:
+        payload: Encoded message
+        mtu: Maximum packet size in bytes for the link
+
+    Returns:
+        List of packets in transmission order
+    """
+    if len(payload) <= mtu:
+        return [payload]
+    if mtu <= FRAGMENT_HEADER_MAX:
+        raise ValueError(f"MTU {mtu} too small for fragmentation")
+
+    tag = (zlib.crc32(payload) & 0xFFFF).to_bytes(2, 'big')
+
+    # Header size depends on the varint width of the fragment count
+    total = 1
+    while True:
+        header_len = 1 + 2 + len(encode_varint(total - 1)) + len(encode_varint(total))
+        chunk = mtu - header_len
+        needed = -(-len(payload) // chunk)
+        if needed <= total:
+            break
+        total = needed
+
+    total_bytes = encode_varint(total)
+    fragments = []
+    for index in range(total):
+        chunk_data = payload[index * chunk:(index + 1) * chunk]
+        fragments.append(
+            bytes((FRAGMENT_MAGIC,)) + tag + encode_varint(index) + total_bytes + chunk_data
+        )
+    return fragments
+
+
+class FragmentReassembler:
+    """
+    Reassembles fragmented payloads per peer.
+
+    Incomplete messages are dropped after `timeout_seconds`, and at most
+    `max_pending` partial messages are held to bound memory on busy meshes.
+    """
+
+    def __init__(self, timeout_seconds: float = 30.0, max_pending: int = 256):
+        self.timeout_seconds = timeout_seconds
+        self.max_pending = max_pending
+        self._pending: Dict[Tuple[str, bytes, int], Dict[str, Any]] = {}
+        self.completed = 0
+        self.dropped = 0
+
+    def add_fragment(self, fragment: bytes, peer_id: str = "") -> Optional[bytes]:
+        """
+        Add one received packet.
+
+        Args:
+            fragment: Packet bytes (unfragmented payloads are returned as-is)
+            peer_id: Sending peer, so tags from different peers do not collide
+
+        Returns:
+            The complete payload once all fragments have arrived, else None
+        """
+        if not is_fragment(fragment):
+            return fragment
+
+        tag = fragment[1:3]
+        index, pos = decode_varint(fragment, 3)
+        total, pos = decode_varint(fragment, pos)
+        if index >= total:
+            raise WireCodecError(f"Fragment index {index} out of range {total}")
+
+        now = time.time()
+        self._expire(now)
+
+        key = (peer_id, tag, total)
+        entry = self._pending.get(key)
+        if entry is None:
+            if len(self._pending) >= self.max_pending:
+                oldest = min(self._pending, key=lambda k: self._pending[k]['first_seen'])
+                del self._pending[oldest]
+                self.dropped += 1
+            entry = {'parts': {}, 'first_seen': now}
+            self._pending[key] = entry
+        entry['parts'][index] = fragment[pos:]
+
+        if len(entry['parts']) < total:
+            return None
+
+        del self._pending[key]
+        payload = b''.join(entry['parts'][i] for i in range(total))
+        if (zlib.crc32(payload) & 0xFFFF).to_bytes(2, 'big') != tag:
+            self.dropped += 1
+            raise WireCodecError("Reassembled payload failed tag check")
+        self.completed += 1
+        return payload
+
+    def _expire(self, now: float):
+        expired = [k for k, v in self._pending.items()
+                   if now - v['first_seen'] > self.timeout_seconds]
+        for key in expired:
+            del self._pending[key]
+            self.dropped += 1
+
+    @property
+    def pending_count(self) -> int:
+        """Number of partially received messages."""
+        return len(self._pending)